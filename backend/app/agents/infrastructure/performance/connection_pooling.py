@@ -4,6 +4,7 @@ Optimized database connections with Supabase compatibility and pool tuning
 """
 import asyncio
 import asyncpg
+import json
 import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -137,6 +138,15 @@ class SupabaseConnectionPool:
             await connection.execute("SET statement_timeout = '30s'")  # Prevent long-running queries
             await connection.execute("SET lock_timeout = '10s'")      # Prevent lock waits
             
+            # Decode json/jsonb columns to Python values, as PostgREST does
+            for type_name in ('json', 'jsonb'):
+                await connection.set_type_codec(
+                    type_name,
+                    encoder=json.dumps,
+                    decoder=json.loads,
+                    schema='pg_catalog'
+                )
+            
             # Run custom init hooks
             for hook in self.init_hooks:
                 await hook(connection)
@@ -379,18 +389,13 @@ async def get_connection_pool() -> SupabaseConnectionPool:
     global _connection_pool
     
     if _connection_pool is None:
-        from ...config.production_config import get_config
-        config = get_config()
-        
-        # Configure pool based on environment
-        if config.is_production():
-            min_size, max_size = 10, 50  # Production settings
-        else:
-            min_size, max_size = 5, 20   # Development settings
+        from app.config.core.settings import get_settings
+        settings = get_settings()
         
         _connection_pool = SupabaseConnectionPool(
-            min_size=min_size,
-            max_size=max_size,
+            database_url=settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
             command_timeout=30.0
         )
         
@@ -2,7 +2,7 @@
 Unified timeblocks API - centralized calendar view.
 Merges PulsePlan tasks with external calendar events.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional
 from datetime import datetime, timezone
 from pydantic import BaseModel
@@ -62,6 +62,22 @@ class TimeblockResponse(BaseModel):
     items: List[TimeblockItem]
 
 
+def _feed_etag(version: int, start: datetime, end: datetime) -> str:
+    """ETag of a feed version for one requested range."""
+    return f'"{version}-{int(start.timestamp())}-{int(end.timestamp())}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
 class SetPrimaryWriteRequest(BaseModel):
     """Request to set primary write calendar."""
     calendarId: str
@@ -85,6 +101,8 @@ class UnlinkTaskRequest(BaseModel):
 
 @router.get("", response_model=TimeblockResponse)
 async def get_timeblocks(
+    request: Request,
+    response: Response,
     from_dt: str = Query(..., alias="from", description="Start datetime (ISO format)"),
     to_dt: str = Query(..., alias="to", description="End datetime (ISO format)"),
     current_user: CurrentUser = Depends(get_current_user),
@@ -93,16 +111,20 @@ async def get_timeblocks(
     """
     Get unified timeblocks (tasks + calendar events + busy blocks) for the specified time range.
 
-    Uses optimized v_timeblocks VIEW with efficient range queries.
+    Served from the user's materialized timeblock feed where possible. Feed
+    responses carry an ETag; a request whose If-None-Match still matches gets
+    304 Not Modified without a body.
 
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         from_dt: Start datetime in ISO format
         to_dt: End datetime in ISO format
         current_user: Current authenticated user
         service: TimeblockService instance
 
     Returns:
-        TimeblockResponse with all items in the time range
+        TimeblockResponse with all items in the time range, or 304
     """
     try:
         # Parse and validate datetimes with user timezone normalization
@@ -130,7 +152,14 @@ async def get_timeblocks(
             raise HTTPException(status_code=400, detail="'from' must be before 'to'")
 
         # Get enriched timeblocks from service
-        enriched_items = await service.get_timeblocks(user_id, start_time, end_time)
+        enriched_items, version = await service.get_timeblock_feed(user_id, start_time, end_time)
+
+        if version is not None:
+            etag = _feed_etag(version, start_time, end_time)
+            cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=cache_headers)
+            response.headers.update(cache_headers)
 
         # Convert to TimeblockItem objects
         items = [TimeblockItem(**item) for item in enriched_items]
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 
 from app.database.repositories.user_repositories.user_repository import get_user_repository
 from app.services.infrastructure.cache_service import get_cache_service
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.config.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -117,6 +118,7 @@ async def revenuecat_webhook(
         if success:
             # Invalidate cache
             await cache_service.invalidate_user_data(app_user_id)
+            await get_timeblock_feed_store().mark_changed(app_user_id, everything=True)
             logger.info(
                 f"Updated subscription for user {app_user_id}: "
                 f"{subscription_status} (event: {event_type})"
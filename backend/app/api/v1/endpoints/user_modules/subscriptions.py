@@ -11,6 +11,7 @@ import httpx
 from app.core.auth import get_current_user
 from app.config.database.supabase import get_supabase_client
 from app.services.infrastructure.cache_service import get_cache_service
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.config.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -147,6 +148,7 @@ class ApplePayService:
             if response.data:
                 # Invalidate user cache
                 await self.cache_service.invalidate_user_data(user_id)
+                await get_timeblock_feed_store().mark_changed(user_id, everything=True)
                 logger.info(f"Updated subscription for user {user_id}: {status}")
                 return True
             else:
@@ -209,6 +209,12 @@ class RedisClient:
             raise RuntimeError("Redis client not initialized")
         return await self._client.setex(key, time, value)
     
+    async def mget(self, *keys: str) -> List[Optional[str]]:
+        """Get several string values in one atomic read"""
+        if not self._client:
+            raise RuntimeError("Redis client not initialized")
+        return await self._client.mget(*keys)
+    
     async def delete(self, *keys: str) -> int:
         """Delete keys"""
         if not self._client:
@@ -252,6 +258,12 @@ class RedisClient:
             raise RuntimeError("Redis client not initialized")
         return self._client.pipeline()
     
+    def register_script(self, script: str):
+        """Register a Lua script; the returned callable takes keys= and args="""
+        if not self._client:
+            raise RuntimeError("Redis client not initialized")
+        return self._client.register_script(script)
+    
     async def lrange(self, key: str, start: int, end: int):
         """Get a range of list elements"""
         if not self._client:
@@ -339,6 +351,12 @@ class RedisClient:
         if not self._client:
             raise RuntimeError("Redis client not initialized")
         return await self._client.sismember(key, value)
+
+    async def srem(self, key: str, *values: str) -> int:
+        """Remove values from set"""
+        if not self._client:
+            raise RuntimeError("Redis client not initialized")
+        return await self._client.srem(key, *values)
     
     # Hash operations
     async def hset(self, key: str, mapping: Dict[str, str]) -> int:
@@ -55,6 +55,13 @@ class Settings(BaseSettings):
     # Database Configuration (Supabase)
     SUPABASE_URL: str = Field(..., description="Supabase URL")
     SUPABASE_SERVICE_KEY: str = Field(..., description="Supabase service key for server-side operations")
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = 50
+    SUPABASE_HTTP_MAX_KEEPALIVE: int = 20
+    SUPABASE_HTTP_TIMEOUT_SECONDS: float = 10.0
+    DATABASE_URL: Optional[str] = Field(None, description="Direct Postgres URL for the asyncpg read fast path")
+    DB_FAST_READS_ENABLED: bool = True
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
     
     # Redis Configuration (Unified Upstash + Redis)
     REDIS_URL: Optional[str] = Field(None, description="Primary Redis URL")
@@ -69,6 +76,10 @@ class Settings(BaseSettings):
     REDIS_SOCKET_KEEPALIVE: bool = True
     REDIS_RETRY_ON_TIMEOUT: bool = True
     REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    TIMEBLOCK_FEED_ENABLED: bool = True
+    TIMEBLOCK_FEED_TTL_SECONDS: int = 900
+    TIMEBLOCK_FEED_PAST_DAYS: int = 31
+    TIMEBLOCK_FEED_FUTURE_DAYS: int = 90
     
     # Rate Limiting Configuration
     ENABLE_RATE_LIMITING: bool = True
@@ -9,12 +9,18 @@ This module contains database-related configuration including:
 
 from .supabase import (
     SupabaseClient,
+    AsyncSupabaseClient,
     get_supabase,
-    get_supabase_client
+    get_supabase_client,
+    get_async_supabase,
+    close_async_supabase
 )
 
 __all__ = [
     "SupabaseClient",
     "get_supabase",
     "get_supabase_client",
+    "AsyncSupabaseClient",
+    "get_async_supabase",
+    "close_async_supabase",
 ]
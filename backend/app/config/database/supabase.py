@@ -1,3 +1,8 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+from postgrest import AsyncPostgrestClient
 from supabase import create_client, Client
 from app.config.core.settings import settings
 import logging
@@ -45,3 +50,101 @@ def get_supabase() -> Client:
 def get_supabase_client() -> Client:
     """Backward compatibility alias for get_supabase()"""
     return get_supabase()
+
+
+class _PooledPostgrestClient(AsyncPostgrestClient):
+    """PostgREST client whose HTTP session keeps a bounded keep-alive pool"""
+
+    def __init__(self, base_url: str, headers: Dict[str, str], limits: httpx.Limits, timeout: float):
+        self._limits = limits
+        super().__init__(base_url, headers=headers, timeout=timeout)
+
+    def create_session(self, base_url, headers, timeout):
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=self._limits,
+        )
+
+
+class AsyncSupabaseClient:
+    """
+    Non-blocking Supabase data access.
+
+    Exposes the same ``table(...).select(...).eq(...).execute()`` chain as the
+    supabase-py client, but ``execute()`` is awaitable and every query shares one
+    pooled HTTP connection set instead of blocking the event loop.
+    """
+
+    def __init__(self):
+        self._client: Optional[_PooledPostgrestClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_client(self) -> _PooledPostgrestClient:
+        """Create the PostgREST client for the running event loop"""
+        if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_KEY:
+            raise RuntimeError("Supabase client not available")
+
+        key = settings.SUPABASE_SERVICE_KEY
+        return _PooledPostgrestClient(
+            f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+            },
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE,
+            ),
+            timeout=settings.SUPABASE_HTTP_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def client(self) -> _PooledPostgrestClient:
+        """Client bound to the running event loop (pooled connections cannot cross loops)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._client is None or (loop is not None and loop is not self._loop):
+            self._client = self._build_client()
+            self._loop = loop
+            logger.info("Async Supabase client initialized")
+        return self._client
+
+    def table(self, table_name: str):
+        """Start a query on a table"""
+        return self.client.from_(table_name)
+
+    def from_(self, table_name: str):
+        """Alias for table()"""
+        return self.table(table_name)
+
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None):
+        """Call a Postgres function"""
+        return self.client.rpc(fn, params or {})
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            finally:
+                self._client = None
+                self._loop = None
+
+
+# Global async Supabase client instance
+async_supabase_client = AsyncSupabaseClient()
+
+
+def get_async_supabase() -> AsyncSupabaseClient:
+    """Get the shared non-blocking Supabase client"""
+    return async_supabase_client
+
+
+async def close_async_supabase():
+    """Close the shared non-blocking Supabase client"""
+    await async_supabase_client.aclose()
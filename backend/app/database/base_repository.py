@@ -2,15 +2,33 @@
 Base Repository
 Standardized database access layer with CRUD operations
 """
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, TypeVar
 from abc import ABC, abstractmethod
 
-from app.config.database.supabase import get_supabase
+from app.config.database.supabase import get_supabase, get_async_supabase
+from app.database.dataloader import DataLoader
 from app.core.utils.error_handlers import RepositoryError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Keys per in_() filter / rows per bulk write, to keep request URLs and bodies bounded
+BATCH_SIZE = 200
+
+
+async def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking call (e.g. a sync supabase-py ``.execute()``) off the event loop
+
+    Compatibility shim for code that still uses the synchronous client; prefer
+    ``await get_async_supabase().table(...)...execute()`` for new queries.
+    """
+    return await asyncio.to_thread(functools.partial(fn, *args, **kwargs))
+
 
 class BaseRepository(ABC):
     """
@@ -21,16 +39,33 @@ class BaseRepository(ABC):
     """
 
     def __init__(self):
-        """Initialize repository with Supabase client"""
+        """Initialize repository with Supabase clients"""
         self._supabase = None
+        self._db = None
+
+    @property
+    def db(self):
+        """Lazy-loaded non-blocking Supabase client (``await ....execute()``)"""
+        if self._db is None:
+            self._db = get_async_supabase()
+        return self._db
 
     @property
     def supabase(self):
-        """Lazy-loaded Supabase client"""
+        """
+        Lazy-loaded synchronous Supabase client
+
+        Only for APIs the async client does not cover (e.g. auth admin); wrap
+        its calls in ``run_blocking`` so they do not block the event loop.
+        """
         if self._supabase is None:
             self._supabase = get_supabase()
         return self._supabase
 
+    async def run_blocking(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking call in a worker thread"""
+        return await run_blocking(fn, *args, **kwargs)
+
     @property
     @abstractmethod
     def table_name(self) -> str:
@@ -51,7 +86,7 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name).select("*").eq("id", id).execute()
+            response = await self.db.table(self.table_name).select("*").eq("id", id).execute()
 
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -81,7 +116,7 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name).select("*")
+            query = self.db.table(self.table_name).select("*")
 
             # Apply filters if provided
             if filters:
@@ -92,7 +127,7 @@ class BaseRepository(ABC):
             if limit:
                 query = query.limit(limit)
 
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
 
         except Exception as e:
@@ -118,7 +153,7 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name).insert(data).execute()
+            response = await self.db.table(self.table_name).insert(data).execute()
 
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -138,6 +173,115 @@ class BaseRepository(ABC):
                 details={"data": data}
             )
 
+    async def get_many(
+        self,
+        values: List[Any],
+        field: str = "id",
+        columns: str = "*",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Get records whose field matches any of the given values, one in_() query per batch
+
+        Args:
+            values: Values to match (duplicates are ignored)
+            field: Column to match against
+            columns: Columns to select; the match column is always included
+            filters: Optional dictionary of additional field:value filters
+
+        Returns:
+            Mapping of field value -> record (first match per value)
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        keys = list(dict.fromkeys(v for v in values if v is not None))
+        if not keys:
+            return {}
+
+        if columns != "*" and field not in [c.strip() for c in columns.split(",")]:
+            columns = f"{field},{columns}"
+
+        try:
+            records: Dict[Any, Dict[str, Any]] = {}
+            for i in range(0, len(keys), BATCH_SIZE):
+                query = self.db.table(self.table_name).select(columns).in_(field, keys[i:i + BATCH_SIZE])
+                for key, value in (filters or {}).items():
+                    query = query.eq(key, value)
+
+                response = await query.execute()
+                for row in response.data or []:
+                    records.setdefault(row.get(field), row)
+            return records
+
+        except Exception as e:
+            logger.error(f"Error fetching many from {self.table_name} by {field}: {e}", exc_info=True)
+            raise RepositoryError(
+                message=str(e),
+                table=self.table_name,
+                operation="get_many",
+                details={"field": field, "count": len(keys), "filters": filters}
+            )
+
+    async def upsert_many(
+        self,
+        records: List[Dict[str, Any]],
+        on_conflict: str = "id",
+        ignore_duplicates: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Insert or update many records, one request per batch
+
+        Args:
+            records: Record dictionaries (all with the same keys)
+            on_conflict: Comma-separated unique columns that identify existing rows
+            ignore_duplicates: Keep existing rows instead of updating them
+
+        Returns:
+            Upserted record dictionaries
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        if not records:
+            return []
+
+        try:
+            upserted: List[Dict[str, Any]] = []
+            for i in range(0, len(records), BATCH_SIZE):
+                response = await self.db.table(self.table_name).upsert(
+                    records[i:i + BATCH_SIZE],
+                    on_conflict=on_conflict,
+                    ignore_duplicates=ignore_duplicates
+                ).execute()
+                upserted.extend(response.data or [])
+            return upserted
+
+        except Exception as e:
+            logger.error(f"Error upserting many into {self.table_name}: {e}", exc_info=True)
+            raise RepositoryError(
+                message=str(e),
+                table=self.table_name,
+                operation="upsert_many",
+                details={"count": len(records), "on_conflict": on_conflict}
+            )
+
+    def loader(
+        self,
+        field: str = "id",
+        columns: str = "*",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> DataLoader:
+        """
+        Request-scoped loader that batches single-record lookups into get_many calls
+
+        Create one per request or job; see DataLoader.
+        """
+        return DataLoader(
+            lambda keys: self.get_many(keys, field=field, columns=columns, filters=filters),
+            max_batch_size=BATCH_SIZE
+        )
+
     async def update(self, id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Update a record by ID
@@ -153,7 +297,7 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name).update(data).eq("id", id).execute()
+            response = await self.db.table(self.table_name).update(data).eq("id", id).execute()
 
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -182,7 +326,7 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name).delete().eq("id", id).execute()
+            response = await self.db.table(self.table_name).delete().eq("id", id).execute()
 
             return response.data is not None and len(response.data) > 0
 
@@ -209,14 +353,14 @@ class BaseRepository(ABC):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name).select("id", count="exact")
+            query = self.db.table(self.table_name).select("id", count="exact")
 
             # Apply filters if provided
             if filters:
                 for key, value in filters.items():
                     query = query.eq(key, value)
 
-            response = query.execute()
+            response = await query.execute()
             return response.count or 0
 
         except Exception as e:
@@ -263,7 +407,7 @@ class BaseRepository(ABC):
         """
         try:
             # Perform a minimal query (select id limit 1) to test connectivity
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id")\
                 .limit(1)\
                 .execute()
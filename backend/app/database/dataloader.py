@@ -0,0 +1,99 @@
+"""
+DataLoader
+Request-scoped batching of per-key lookups into single queries
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Set, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Collects the keys requested within one event-loop tick and resolves them
+    with a single batch call, then fans the results back out to each caller.
+
+    Create one loader per request or job: results are cached for the
+    loader's lifetime, so a long-lived loader would serve stale rows.
+
+    Example:
+        loader = task_repo.loader()
+        tasks = await asyncio.gather(*(loader.load(task_id) for task_id in ids))
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 200
+    ):
+        """
+        Args:
+            batch_fn: Loads many keys at once, returning a key -> value mapping;
+                keys missing from the mapping resolve to None
+            max_batch_size: Largest number of keys passed to one batch call
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+
+        self._futures: Dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+        self._running: Set[asyncio.Task] = set()
+        self.batches = 0
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load one key, batched with every other key requested this tick."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        return await future
+
+    async def load_many(self, keys: Sequence[K]) -> List[Optional[V]]:
+        """Load several keys; duplicates and already loaded keys are not re-queried."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: Optional[V]):
+        """Seed the cache with a value loaded some other way."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K):
+        """Drop a cached key, e.g. after the row was written."""
+        self._futures.pop(key, None)
+
+    def _dispatch(self):
+        """Resolve everything queued this tick in batches of max_batch_size."""
+        queue, self._queue = self._queue, []
+        for i in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(queue[i:i + self.max_batch_size]))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, keys: List[K]):
+        futures = [self._futures.get(key) for key in keys]
+
+        self.batches += 1
+        try:
+            results = await self.batch_fn(keys)
+        except Exception as e:
+            logger.debug(f"DataLoader batch of {len(keys)} keys failed: {e}")
+            for key, future in zip(keys, futures):
+                # Failed keys are retried by the next load
+                self._futures.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in zip(keys, futures):
+            if future is not None and not future.done():
+                future.set_result(results.get(key))
@@ -0,0 +1,193 @@
+"""
+Fast Reads
+Hot read queries as prepared statements over the asyncpg pool
+"""
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.config.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# json/jsonb columns read on the fast path; decoded here too in case a
+# connection comes without the pool's json codecs
+JSON_COLUMNS = frozenset({
+    "pinned_slots", "preferred_windows", "avoid_windows", "prerequisites", "metadata",
+})
+
+# Seconds to stay on the REST path after the pool fails
+RETRY_AFTER_SECONDS = 60.0
+
+TIMEBLOCKS_SQL = """
+    SELECT * FROM get_timeblocks_for_user($1::uuid, $2::timestamptz, $3::timestamptz)
+"""
+
+PENDING_TASKS_SQL = """
+    SELECT * FROM tasks
+    WHERE user_id = ANY($1::uuid[])
+      AND status = 'pending'
+      AND due_date <= $2
+"""
+
+CALENDAR_BUSY_SQL = """
+    SELECT * FROM calendar_events
+    WHERE user_id = ANY($1::uuid[])
+      AND start_time >= $2
+      AND end_time <= $3
+"""
+
+TASK_EVENTS_SQL = """
+    SELECT * FROM tasks
+    WHERE user_id = ANY($1::uuid[])
+      AND task_type = 'event'
+      AND start_date >= $2
+      AND end_date <= $3
+"""
+
+COMPLETIONS_SQL = """
+    SELECT * FROM task_completions
+    WHERE user_id = ANY($1::uuid[])
+      AND completed_at >= $2
+      AND completed_at <= $3
+"""
+
+
+def _utc(value: datetime) -> datetime:
+    """Timestamps from datetime.utcnow() are naive; asyncpg needs them aware"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _row(record, iso_timestamps: bool = False) -> Dict[str, Any]:
+    """
+    Convert an asyncpg record to a dict shaped like a PostgREST row
+
+    UUIDs become strings and JSON text is decoded; timestamps stay datetimes
+    unless iso_timestamps is set (for callers that consume the REST JSON
+    shape unchanged).
+    """
+    row = dict(record)
+    for key, value in row.items():
+        if isinstance(value, UUID):
+            row[key] = str(value)
+        elif key in JSON_COLUMNS and isinstance(value, str):
+            row[key] = json.loads(value)
+        elif iso_timestamps and isinstance(value, datetime):
+            row[key] = value.isoformat()
+    return row
+
+
+class FastReadBackend:
+    """
+    Runs the hottest read paths directly against Postgres
+
+    Statements are fixed SQL strings, so asyncpg prepares each one once per
+    connection and reuses it; rows are decoded from the binary protocol with
+    no JSON round trip. Every method returns None when the fast path is
+    unavailable (no DATABASE_URL, pool down, query error) so callers fall back
+    to their PostgREST query.
+    """
+
+    def __init__(self):
+        self._retry_at = 0.0
+        self.queries = 0
+        self.fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        settings = get_settings()
+        return bool(settings.DB_FAST_READS_ENABLED and settings.DATABASE_URL)
+
+    async def _fetch(self, name: str, sql: str, *args) -> Optional[list]:
+        """Run a statement on the pool, or return None to signal fallback"""
+        if not self.enabled or time.monotonic() < self._retry_at:
+            return None
+
+        start = time.perf_counter()
+        try:
+            from app.agents.infrastructure.performance.connection_pooling import get_connection_pool
+
+            pool = await get_connection_pool()
+            records = await pool.execute_query(sql, *args)
+        except Exception as e:
+            logger.warning(f"Fast read {name} failed, falling back to REST: {e}")
+            self._retry_at = time.monotonic() + RETRY_AFTER_SECONDS
+            self.fallbacks += 1
+            return None
+
+        self.queries += 1
+        logger.debug(f"Fast read {name}: {len(records)} rows in {(time.perf_counter() - start) * 1000:.1f}ms")
+        return records
+
+    async def fetch_timeblocks(
+        self,
+        user_id: str,
+        dt_from: datetime,
+        dt_to: datetime
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Timeblock feed rows, in the same JSON shape as the get_timeblocks_for_user RPC"""
+        records = await self._fetch("timeblocks", TIMEBLOCKS_SQL, user_id, _utc(dt_from), _utc(dt_to))
+        if records is None:
+            return None
+        return [_row(record, iso_timestamps=True) for record in records]
+
+    async def fetch_pending_tasks(
+        self,
+        user_ids: Sequence[str],
+        due_before: datetime
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Pending (unscheduled) task rows due before a cutoff"""
+        records = await self._fetch("pending_tasks", PENDING_TASKS_SQL, list(user_ids), _utc(due_before))
+        if records is None:
+            return None
+        return [_row(record) for record in records]
+
+    async def fetch_busy_events(
+        self,
+        user_ids: Sequence[str],
+        start: datetime,
+        end: datetime
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Calendar event rows and event-type task rows within a range"""
+        calendar_records = await self._fetch("calendar_busy", CALENDAR_BUSY_SQL, list(user_ids), _utc(start), _utc(end))
+        if calendar_records is None:
+            return None
+        task_records = await self._fetch("task_events", TASK_EVENTS_SQL, list(user_ids), _utc(start), _utc(end))
+        if task_records is None:
+            return None
+        return [_row(record) for record in calendar_records], [_row(record) for record in task_records]
+
+    async def fetch_completions(
+        self,
+        user_ids: Sequence[str],
+        start: datetime,
+        end: datetime
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Task completion rows within a range"""
+        records = await self._fetch("completions", COMPLETIONS_SQL, list(user_ids), _utc(start), _utc(end))
+        if records is None:
+            return None
+        return [_row(record) for record in records]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "queries": self.queries,
+            "fallbacks": self.fallbacks,
+            "backing_off": time.monotonic() < self._retry_at,
+        }
+
+
+# Global fast read backend instance
+_fast_reads: Optional[FastReadBackend] = None
+
+
+def get_fast_reads() -> FastReadBackend:
+    """Get the shared fast read backend"""
+    global _fast_reads
+    if _fast_reads is None:
+        _fast_reads = FastReadBackend()
+    return _fast_reads
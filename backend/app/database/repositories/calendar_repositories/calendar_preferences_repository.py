@@ -33,7 +33,7 @@ class CalendarPreferencesRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(preferences_data, on_conflict="user_id")\
                 .execute()
             
@@ -68,7 +68,7 @@ class CalendarPreferencesRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("user_id, sync_frequency_minutes, updated_at")\
                 .eq("auto_sync_enabled", True)\
                 .execute()
@@ -23,7 +23,7 @@ class CalendarLinkRepository(BaseRepository):
     async def get_by_user_id(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all calendar links for a user"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .execute()
@@ -42,7 +42,7 @@ class CalendarLinkRepository(BaseRepository):
     async def get_by_task_id(self, task_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get calendar link by task ID"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("task_id", task_id)\
                 .eq("user_id", user_id)\
@@ -77,7 +77,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def get_primary_write_calendar(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get the primary write calendar for a user"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id, provider_calendar_id")\
                 .eq("user_id", user_id)\
                 .eq("is_primary_write", True)\
@@ -99,7 +99,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def get_by_user_id(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all calendars for a user"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .execute()
@@ -122,7 +122,7 @@ class CalendarCalendarRepository(BaseRepository):
     ) -> List[Dict[str, Any]]:
         """Get active calendars for a user by provider"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id")\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -150,7 +150,7 @@ class CalendarCalendarRepository(BaseRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get calendar by Google watch channel details"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("watch_channel_id", channel_id)\
                 .eq("watch_resource_id", resource_id)\
@@ -175,7 +175,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def unset_primary_write(self, user_id: str) -> None:
         """Unset all primary write calendars for a user"""
         try:
-            self.supabase.table(self.table_name)\
+            await self.db.table(self.table_name)\
                 .update({"is_primary_write": False})\
                 .eq("user_id", user_id)\
                 .eq("is_primary_write", True)\
@@ -193,7 +193,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def set_primary_write(self, calendar_id: str) -> None:
         """Set a calendar as primary write"""
         try:
-            self.supabase.table(self.table_name)\
+            await self.db.table(self.table_name)\
                 .update({"is_primary_write": True})\
                 .eq("id", calendar_id)\
                 .execute()
@@ -210,7 +210,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def deactivate_all(self, user_id: str) -> None:
         """Deactivate all calendars for a user"""
         try:
-            self.supabase.table(self.table_name)\
+            await self.db.table(self.table_name)\
                 .update({"is_active": False})\
                 .eq("user_id", user_id)\
                 .execute()
@@ -227,7 +227,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def activate_calendar(self, calendar_id: str, user_id: str) -> None:
         """Activate a specific calendar"""
         try:
-            self.supabase.table(self.table_name)\
+            await self.db.table(self.table_name)\
                 .update({"is_active": True})\
                 .eq("id", calendar_id)\
                 .eq("user_id", user_id)\
@@ -245,7 +245,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def get_all_active(self) -> List[Dict[str, Any]]:
         """Get all active calendars"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id, user_id, summary")\
                 .eq("is_active", True)\
                 .execute()
@@ -263,7 +263,7 @@ class CalendarCalendarRepository(BaseRepository):
     async def get_with_watch_channels(self) -> List[Dict[str, Any]]:
         """Get all calendars with watch channels"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id, summary, watch_expiration_at")\
                 .not_.is_("watch_channel_id", "null")\
                 .execute()
@@ -290,7 +290,7 @@ class CalendarEventRepository(BaseRepository):
     async def get_by_external_id(self, external_id: str) -> Optional[Dict[str, Any]]:
         """Get calendar event by external ID"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select(
                     "description, location, html_link, attendees, creator_email, organizer_email, "
                     "status, transparency, visibility, categories, importance, sensitivity, "
@@ -315,11 +315,11 @@ class CalendarEventRepository(BaseRepository):
     async def delete_by_filters(self, filters: Dict[str, Any]) -> bool:
         """Delete calendar events matching filters"""
         try:
-            query = self.supabase.table(self.table_name).delete()
+            query = self.db.table(self.table_name).delete()
             for key, value in filters.items():
                 query = query.eq(key, value)
             
-            response = query.execute()
+            response = await query.execute()
             return bool(response.data is not None)
         
         except Exception as e:
@@ -334,7 +334,7 @@ class CalendarEventRepository(BaseRepository):
     async def bulk_insert(self, events: List[Dict[str, Any]]) -> bool:
         """Insert multiple calendar events"""
         try:
-            response = self.supabase.table(self.table_name).insert(events).execute()
+            response = await self.db.table(self.table_name).insert(events).execute()
             return bool(response.data)
         
         except Exception as e:
@@ -349,11 +349,11 @@ class CalendarEventRepository(BaseRepository):
     async def update_by_filters(self, update_data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
         """Update calendar events matching filters"""
         try:
-            query = self.supabase.table(self.table_name).update(update_data)
+            query = self.db.table(self.table_name).update(update_data)
             for key, value in filters.items():
                 query = query.eq(key, value)
             
-            response = query.execute()
+            response = await query.execute()
             return bool(response.data)
         
         except Exception as e:
@@ -368,7 +368,7 @@ class CalendarEventRepository(BaseRepository):
     async def delete_by_id(self, event_id: str) -> bool:
         """Delete calendar event by ID"""
         try:
-            response = self.supabase.table(self.table_name).delete().eq("id", event_id).execute()
+            response = await self.db.table(self.table_name).delete().eq("id", event_id).execute()
             return bool(response.data)
         
         except Exception as e:
@@ -392,7 +392,7 @@ class CalendarSyncConflictRepository(BaseRepository):
     async def get_unresolved_by_user(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all unresolved conflicts for a user"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select(
                     "id, user_id, event1_id, event2_id, conflict_type, confidence_score, "
                     "resolution_status, detected_at, resolved_at"
@@ -415,7 +415,7 @@ class CalendarSyncConflictRepository(BaseRepository):
     async def get_by_id_and_user(self, conflict_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get conflict by ID and user"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("id", conflict_id)\
                 .eq("user_id", user_id)\
@@ -441,7 +441,7 @@ class CalendarSyncConflictRepository(BaseRepository):
             List of unique user IDs
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("user_id")\
                 .eq("resolution_status", "unresolved")\
                 .execute()
@@ -471,7 +471,7 @@ class CalendarSyncConflictRepository(BaseRepository):
             Number of conflicts deleted
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .match({"resolution_status": "resolved"})\
                 .lt("resolved_at", cutoff_datetime.isoformat())\
@@ -491,7 +491,7 @@ class CalendarSyncConflictRepository(BaseRepository):
     async def create(self, conflict_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new sync conflict"""
         try:
-            response = self.supabase.table(self.table_name).insert(conflict_data).execute()
+            response = await self.db.table(self.table_name).insert(conflict_data).execute()
             
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -516,7 +516,7 @@ class CalendarSyncConflictRepository(BaseRepository):
     async def update_by_id(self, conflict_id: str, update_data: Dict[str, Any]) -> bool:
         """Update conflict by ID"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("id", conflict_id)\
                 .execute()
@@ -548,7 +548,7 @@ class WebhookSubscriptionRepository(BaseRepository):
     ) -> Optional[str]:
         """Get user_id for a webhook subscription"""
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("user_id")\
                 .eq("subscription_id", subscription_id)\
                 .eq("provider", provider)\
@@ -33,7 +33,7 @@ class CalendarSyncStatusRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(status_data, on_conflict="user_id")\
                 .execute()
             
@@ -71,7 +71,7 @@ class CalendarSyncStatusRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .single()\
@@ -102,7 +102,7 @@ class CalendarSyncStatusRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .lt("last_sync_at", cutoff_datetime)\
                 .execute()
@@ -7,22 +7,27 @@ from datetime import datetime, timezone
 import logging
 import uuid
 
-from app.config.database.supabase import get_supabase_client
+from app.config.database.supabase import get_async_supabase
+from app.database.fast_reads import get_fast_reads
 
 logger = logging.getLogger(__name__)
 
+# IDs per IN filter, keeping request URLs well under proxy limits
+SOURCE_BATCH_SIZE = 100
+
 
 class TimeblocksRepository:
     """Repository for querying unified timeblocks view and managing timeblocks table"""
 
     def __init__(self):
-        self.supabase = get_supabase_client()
+        self.db = get_async_supabase()
 
     async def fetch_timeblocks(
         self,
         user_id: str,
         dt_from: datetime,
-        dt_to: datetime
+        dt_to: datetime,
+        strict: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Fetch timeblocks for a user within a time window
@@ -31,6 +36,8 @@ class TimeblocksRepository:
             user_id: User UUID
             dt_from: Start of time window (timezone-aware)
             dt_to: End of time window (timezone-aware)
+            strict: Raise on failure instead of returning an empty list
+                (for callers that store the result)
 
         Returns:
             List of timeblock dictionaries from v_timeblocks view
@@ -42,6 +49,11 @@ class TimeblocksRepository:
             - Time window overlap (start < to AND end > from)
         """
         try:
+            # Fast path: prepared statement over the asyncpg pool
+            rows = await get_fast_reads().fetch_timeblocks(user_id, dt_from, dt_to)
+            if rows is not None:
+                return rows
+
             # Convert to UTC ISO format
             from_str = dt_from.astimezone(timezone.utc).isoformat()
             to_str = dt_to.astimezone(timezone.utc).isoformat()
@@ -50,7 +62,7 @@ class TimeblocksRepository:
 
             # Try RPC function first
             try:
-                response = self.supabase.rpc(
+                response = await self.db.rpc(
                     'get_timeblocks_for_user',
                     {
                         'p_user_id': user_id,
@@ -69,10 +81,12 @@ class TimeblocksRepository:
                 logger.warning(f"RPC call failed: {rpc_error}, falling back to direct query")
 
             # Fallback to direct view query
-            return await self._fetch_timeblocks_direct(user_id, from_str, to_str)
+            return await self._fetch_timeblocks_direct(user_id, from_str, to_str, strict)
 
         except Exception as e:
             logger.error(f"Error fetching timeblocks: {str(e)}")
+            if strict:
+                raise
             # Return empty list instead of raising to prevent frontend errors
             return []
 
@@ -80,7 +94,8 @@ class TimeblocksRepository:
         self,
         user_id: str,
         from_str: str,
-        to_str: str
+        to_str: str,
+        strict: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Direct query fallback when RPC is not available
@@ -92,8 +107,7 @@ class TimeblocksRepository:
             logger.info(f"[Timeblocks] Using direct query fallback for user {user_id}")
             
             # Query v_timeblocks view directly
-            # Note: Supabase client is synchronous, no await needed
-            response = self.supabase.from_('v_timeblocks') \
+            response = await self.db.from_('v_timeblocks') \
                 .select('*') \
                 .eq('user_id', user_id) \
                 .lt('start_at', to_str) \
@@ -106,8 +120,46 @@ class TimeblocksRepository:
 
         except Exception as e:
             logger.error(f"Error in direct timeblocks query: {str(e)}")
+            if strict:
+                raise
             return []
 
+    async def fetch_timeblocks_for_sources(
+        self,
+        user_id: str,
+        dt_from: datetime,
+        dt_to: datetime,
+        task_ids: List[str] = (),
+        provider_event_ids: List[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the v_timeblocks rows of specific tasks and provider events
+
+        Used to refresh single entries of the materialized timeblock feed.
+        Like the direct view query this does not filter inactive calendars;
+        callers do.
+
+        Raises:
+            Exception: Query failures propagate so a partial refresh is not
+                mistaken for the rows having gone away
+        """
+        from_str = dt_from.astimezone(timezone.utc).isoformat()
+        to_str = dt_to.astimezone(timezone.utc).isoformat()
+
+        rows = []
+        for column, values in (("task_id", list(task_ids)), ("provider_event_id", list(provider_event_ids))):
+            for i in range(0, len(values), SOURCE_BATCH_SIZE):
+                response = await self.db.from_('v_timeblocks') \
+                    .select('*') \
+                    .eq('user_id', user_id) \
+                    .in_(column, values[i:i + SOURCE_BATCH_SIZE]) \
+                    .lt('start_at', to_str) \
+                    .gt('end_at', from_str) \
+                    .execute()
+                rows.extend(response.data or [])
+
+        return rows
+
     async def get_timeblocks_for_user(
         self,
         user_id: str,
@@ -139,7 +191,7 @@ class TimeblocksRepository:
             Calendar link record or None
         """
         try:
-            query = self.supabase.from_('calendar_links').select('*')
+            query = self.db.from_('calendar_links').select('*')
 
             if task_id:
                 query = query.eq('task_id', task_id)
@@ -149,7 +201,7 @@ class TimeblocksRepository:
             else:
                 return None
 
-            response = query.limit(1).execute()
+            response = await query.limit(1).execute()
 
             return response.data[0] if response.data else None
 
@@ -225,7 +277,7 @@ class TimeblocksRepository:
                 "metadata": metadata or {}
             }
 
-            response = self.supabase.table("timeblocks").insert(data).execute()
+            response = await self.db.table("timeblocks").insert(data).execute()
 
             if not response.data:
                 raise Exception("Failed to create timeblock")
@@ -253,7 +305,7 @@ class TimeblocksRepository:
             Timeblock record or None
         """
         try:
-            response = self.supabase.table("timeblocks") \
+            response = await self.db.table("timeblocks") \
                 .select("*") \
                 .eq("id", timeblock_id) \
                 .eq("user_id", user_id) \
@@ -282,7 +334,7 @@ class TimeblocksRepository:
             List of timeblock records
         """
         try:
-            response = self.supabase.table("timeblocks") \
+            response = await self.db.table("timeblocks") \
                 .select("*") \
                 .eq("task_id", task_id) \
                 .eq("user_id", user_id) \
@@ -329,7 +381,7 @@ class TimeblocksRepository:
             # Add updated_at timestamp
             updates["updated_at"] = datetime.now(timezone.utc).isoformat()
 
-            response = self.supabase.table("timeblocks") \
+            response = await self.db.table("timeblocks") \
                 .update(updates) \
                 .eq("id", timeblock_id) \
                 .eq("user_id", user_id) \
@@ -362,7 +414,7 @@ class TimeblocksRepository:
             True if deleted, False if not found
         """
         try:
-            response = self.supabase.table("timeblocks") \
+            response = await self.db.table("timeblocks") \
                 .delete() \
                 .eq("id", timeblock_id) \
                 .eq("user_id", user_id) \
@@ -419,7 +471,7 @@ class TimeblocksRepository:
             List of timeblock records
         """
         try:
-            response = self.supabase.table("timeblocks") \
+            response = await self.db.table("timeblocks") \
                 .select("*") \
                 .eq("user_id", user_id) \
                 .eq("status", status) \
@@ -454,7 +506,7 @@ class TimeblocksRepository:
             List of timeblock records
         """
         try:
-            query = self.supabase.table("timeblocks") \
+            query = self.db.table("timeblocks") \
                 .select("*") \
                 .eq("user_id", user_id)
 
@@ -481,7 +533,7 @@ class TimeblocksRepository:
             limit = filters.get("limit", 100)
             query = query.order("start_time", desc=False).limit(limit)
 
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
 
         except Exception as e:
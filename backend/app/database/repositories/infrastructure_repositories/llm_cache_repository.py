@@ -34,7 +34,7 @@ class LLMCacheRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("response")\
                 .eq("cache_key", cache_key)\
                 .gte("expires_at", datetime.utcnow().isoformat())\
@@ -68,7 +68,7 @@ class LLMCacheRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(cache_data)\
                 .execute()
             
@@ -39,14 +39,14 @@ class UserContextCacheRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)
             
             if expires_after:
                 query = query.gte("expires_at", expires_after.isoformat())
             
-            response = query.single().execute()
+            response = await query.single().execute()
             
             if response.data:
                 return response.data
@@ -96,7 +96,7 @@ class UserContextCacheRepository(BaseRepository):
             if preferences_hash:
                 cache_record["preferences_hash"] = preferences_hash
             
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(cache_record)\
                 .execute()
             
@@ -132,7 +132,7 @@ class UserContextCacheRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .eq("user_id", user_id)\
                 .execute()
@@ -33,7 +33,7 @@ class AgentTaskRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("id", task_id)\
                 .limit(1)\
@@ -73,14 +73,14 @@ class AgentTaskRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)
             
             if status_filter:
                 query = query.eq("status", status_filter)
             
-            response = query.order("created_at", desc=True).limit(limit).execute()
+            response = await query.order("created_at", desc=True).limit(limit).execute()
             return response.data or []
         
         except Exception as e:
@@ -106,7 +106,7 @@ class AgentTaskRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(task_data)\
                 .execute()
             
@@ -6,7 +6,7 @@ from typing import Optional, Dict, Any, List
 from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from app.config.database.supabase import get_supabase_client
+from app.config.database.supabase import get_async_supabase
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,7 @@ class BriefingsRepository:
     """Repository for briefing database operations"""
 
     def __init__(self):
-        self.supabase = get_supabase_client()
+        self.db = get_async_supabase()
 
     async def get_briefing_for_date(
         self,
@@ -33,7 +33,7 @@ class BriefingsRepository:
             Briefing data or None if not found
         """
         try:
-            response = self.supabase.table("briefings").select("*").eq(
+            response = await self.db.table("briefings").select("*").eq(
                 "user_id", str(user_id)
             ).eq(
                 "briefing_date", briefing_date.isoformat()
@@ -89,7 +89,7 @@ class BriefingsRepository:
             }
 
             # Use upsert to insert or update
-            response = self.supabase.table("briefings").upsert(
+            response = await self.db.table("briefings").upsert(
                 briefing_data,
                 on_conflict="user_id,briefing_date"
             ).execute()
@@ -122,7 +122,7 @@ class BriefingsRepository:
         try:
             cutoff_date = date.today() - timedelta(days=days)
 
-            response = self.supabase.table("briefings").select("*").eq(
+            response = await self.db.table("briefings").select("*").eq(
                 "user_id", str(user_id)
             ).gte(
                 "briefing_date", cutoff_date.isoformat()
@@ -150,7 +150,7 @@ class BriefingsRepository:
         try:
             cutoff_date = date.today() - timedelta(days=days)
 
-            response = self.supabase.table("briefings").delete().lt(
+            response = await self.db.table("briefings").delete().lt(
                 "briefing_date", cutoff_date.isoformat()
             ).execute()
 
@@ -178,7 +178,7 @@ class BriefingsRepository:
             True if deleted, False otherwise
         """
         try:
-            response = self.supabase.table("briefings").delete().eq(
+            response = await self.db.table("briefings").delete().eq(
                 "user_id", str(user_id)
             ).eq(
                 "briefing_date", briefing_date.isoformat()
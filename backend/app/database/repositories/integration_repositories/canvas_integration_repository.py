@@ -37,7 +37,7 @@ class CanvasIntegrationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(integration_data)\
                 .execute()
             
@@ -75,7 +75,7 @@ class CanvasIntegrationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .single()\
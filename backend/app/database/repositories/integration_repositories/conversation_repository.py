@@ -34,7 +34,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id")\
                 .eq("user_id", user_id)\
                 .eq("is_active", True)\
@@ -80,7 +80,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)
             
@@ -92,7 +92,7 @@ class ConversationRepository(BaseRepository):
             else:
                 query = query.order(order_by, desc=False)
             
-            response = query.limit(limit).execute()
+            response = await query.limit(limit).execute()
             return response.data or []
         
         except Exception as e:
@@ -118,7 +118,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id", count="exact")\
                 .eq("user_id", user_id)\
                 .eq("is_active", True)\
@@ -154,7 +154,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("id", conversation_id)\
                 .eq("user_id", user_id)\
@@ -188,7 +188,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(conversation_data)\
                 .execute()
             
@@ -230,7 +230,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(updates)\
                 .eq("id", conversation_id)\
                 .eq("user_id", user_id)\
@@ -275,7 +275,7 @@ class ConversationRepository(BaseRepository):
         """
         try:
             if soft_delete:
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .update({
                         "is_active": False,
                         "updated_at": datetime.utcnow().isoformat()
@@ -284,7 +284,7 @@ class ConversationRepository(BaseRepository):
                     .eq("user_id", user_id)\
                     .execute()
             else:
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .delete()\
                     .eq("id", conversation_id)\
                     .eq("user_id", user_id)\
@@ -316,7 +316,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table("chat_turns")\
+            response = await self.db.table("chat_turns")\
                 .insert(turn_data)\
                 .execute()
             
@@ -358,7 +358,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table("chat_turns")\
+            query = self.db.table("chat_turns")\
                 .select("*")\
                 .eq("conversation_id", conversation_id)
             
@@ -367,7 +367,7 @@ class ConversationRepository(BaseRepository):
             else:
                 query = query.order("timestamp", desc=False)
             
-            response = query.limit(limit).execute()
+            response = await query.limit(limit).execute()
             return response.data or []
         
         except Exception as e:
@@ -393,7 +393,7 @@ class ConversationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table("chat_turns")\
+            response = await self.db.table("chat_turns")\
                 .select("id", count="exact")\
                 .eq("conversation_id", conversation_id)\
                 .execute()
@@ -41,7 +41,7 @@ class EmailRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("subject, sender, priority, received_at, is_unread")\
                 .eq("user_id", user_id)\
                 .gte("received_at", since_date.isoformat())
@@ -49,7 +49,7 @@ class EmailRepository(BaseRepository):
             if limit:
                 query = query.limit(limit)
             
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
         
         except Exception as e:
@@ -47,7 +47,7 @@ class IOSDeviceRepository(BaseRepository):
                 "last_checked_at": datetime.utcnow().isoformat()
             }
             
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("device_token", device_token)\
                 .execute()
@@ -82,14 +82,14 @@ class IOSDeviceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)
             
             if active_only:
                 query = query.eq("is_active", True)
             
-            response = query.execute()
+            response = await query.execute()
             return response.data if response.data else []
         
         except Exception as e:
@@ -115,7 +115,7 @@ class IOSDeviceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("device_token", device_token)\
                 .execute()
@@ -147,7 +147,7 @@ class IOSDeviceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(device_data)\
                 .execute()
             
@@ -190,7 +190,7 @@ class IOSDeviceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("device_token", device_token)\
                 .execute()
@@ -221,7 +221,7 @@ class IOSDeviceRepository(BaseRepository):
         """
         try:
             cutoff = datetime.utcnow() - timedelta(days=days)
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("is_active", True)\
                 .lt("last_used_at", cutoff.isoformat())\
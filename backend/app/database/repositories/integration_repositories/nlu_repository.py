@@ -15,13 +15,21 @@ logger = logging.getLogger(__name__)
 class NLURepository:
     """Repository for NLU pipeline database operations using Supabase."""
 
-    def __init__(self, supabase_client=None):
+    def __init__(self, supabase_client=None, db=None):
         """
         Initialize repository.
 
         Args:
-            supabase_client: Supabase client (if None, will get from config)
+            supabase_client: Synchronous Supabase client for callers that
+                still use it directly (if None, will get from config)
+            db: Non-blocking Supabase client used by the repository's own
+                queries (if None, will get from config)
         """
+        if db is None:
+            from app.config.database.supabase import get_async_supabase
+            db = get_async_supabase()
+        self.db = db
+
         if supabase_client is None:
             from app.config.database.supabase import get_supabase_client
             self.supabase = get_supabase_client()
@@ -52,7 +60,7 @@ class NLURepository:
             "user_message": user_message
         }
 
-        response = self.supabase.table("action_records").insert(data).execute()
+        response = await self.db.table("action_records").insert(data).execute()
 
         if not response.data:
             raise Exception(f"Failed to create action record: {response}")
@@ -62,7 +70,7 @@ class NLURepository:
 
     async def get_action(self, action_id: UUID) -> Optional[Dict[str, Any]]:
         """Get action record by ID."""
-        response = self.supabase.table("action_records")\
+        response = await self.db.table("action_records")\
             .select("*")\
             .eq("id", str(action_id))\
             .execute()
@@ -78,7 +86,7 @@ class NLURepository:
 
     async def get_last_action(self, user_id: UUID) -> Optional[Dict[str, Any]]:
         """Get last action for user."""
-        response = self.supabase.table("action_records")\
+        response = await self.db.table("action_records")\
             .select("id, intent, params, status, created_at, user_message")\
             .eq("user_id", str(user_id))\
             .order("created_at", desc=True)\
@@ -107,7 +115,7 @@ class NLURepository:
         if external_refs is not None:
             update_data["external_refs"] = external_refs
 
-        self.supabase.table("action_records")\
+        await self.db.table("action_records")\
             .update(update_data)\
             .eq("id", str(action_id))\
             .execute()
@@ -119,7 +127,7 @@ class NLURepository:
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        self.supabase.table("action_records")\
+        await self.db.table("action_records")\
             .update(update_data)\
             .eq("id", str(action_id))\
             .execute()
@@ -131,7 +139,7 @@ class NLURepository:
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        self.supabase.table("action_records")\
+        await self.db.table("action_records")\
             .update(update_data)\
             .eq("id", str(action_id))\
             .execute()
@@ -158,7 +166,7 @@ class NLURepository:
         }
 
         # Use upsert to avoid duplicate key errors when the same action is processed twice
-        self.supabase.table("pending_gates").upsert(data, on_conflict="action_id").execute()
+        await self.db.table("pending_gates").upsert(data, on_conflict="action_id").execute()
         logger.debug(f"Ensured pending gate for action {action_id} (token={gate_token}) exists")
 
     async def get_pending_gate(self, user_id: UUID) -> Optional[Dict[str, Any]]:
@@ -170,7 +178,7 @@ class NLURepository:
         """
         # Get all non-expired, non-confirmed gates
         now = datetime.utcnow().isoformat()
-        response = self.supabase.table("pending_gates")\
+        response = await self.db.table("pending_gates")\
             .select("*, action_records(user_id)")\
             .is_("confirmed_at", "null")\
             .is_("cancelled_at", "null")\
@@ -187,7 +195,7 @@ class NLURepository:
 
     async def get_gate_by_token(self, gate_token: str) -> Optional[Dict[str, Any]]:
         """Get gate by token with action record info."""
-        response = self.supabase.table("pending_gates")\
+        response = await self.db.table("pending_gates")\
             .select("*, action_records(*)")\
             .eq("gate_token", gate_token)\
             .execute()
@@ -198,14 +206,14 @@ class NLURepository:
 
     async def confirm_gate(self, gate_token: str):
         """Mark gate as confirmed."""
-        self.supabase.table("pending_gates")\
+        await self.db.table("pending_gates")\
             .update({"confirmed_at": datetime.utcnow().isoformat()})\
             .eq("gate_token", gate_token)\
             .execute()
 
     async def cancel_gate(self, gate_token: str):
         """Mark gate as cancelled."""
-        self.supabase.table("pending_gates")\
+        await self.db.table("pending_gates")\
             .update({"cancelled_at": datetime.utcnow().isoformat()})\
             .eq("gate_token", gate_token)\
             .execute()
@@ -215,7 +223,7 @@ class NLURepository:
         now = datetime.utcnow().isoformat()
 
         # Get expired gates
-        response = self.supabase.table("pending_gates")\
+        response = await self.db.table("pending_gates")\
             .select("gate_token")\
             .lt("expires_at", now)\
             .is_("confirmed_at", "null")\
@@ -253,7 +261,7 @@ class NLURepository:
         }
 
         # Supabase upsert
-        self.supabase.table("idempotency_keys")\
+        await self.db.table("idempotency_keys")\
             .upsert(data, on_conflict="idempotency_key")\
             .execute()
 
@@ -264,7 +272,7 @@ class NLURepository:
         """Get result for idempotency key if exists and not expired."""
         now = datetime.utcnow().isoformat()
 
-        response = self.supabase.table("idempotency_keys")\
+        response = await self.db.table("idempotency_keys")\
             .select("*")\
             .eq("idempotency_key", idempotency_key)\
             .gt("expires_at", now)\
@@ -279,7 +287,7 @@ class NLURepository:
         now = datetime.utcnow().isoformat()
 
         # Get count first
-        response = self.supabase.table("idempotency_keys")\
+        response = await self.db.table("idempotency_keys")\
             .select("idempotency_key", count="exact")\
             .lt("expires_at", now)\
             .execute()
@@ -288,7 +296,7 @@ class NLURepository:
 
         if count > 0:
             # Delete expired keys
-            self.supabase.table("idempotency_keys")\
+            await self.db.table("idempotency_keys")\
                 .delete()\
                 .lt("expires_at", now)\
                 .execute()
@@ -306,14 +314,14 @@ class NLURepository:
         status_filter: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get user's action history."""
-        query = self.supabase.table("action_records")\
+        query = self.db.table("action_records")\
             .select("id, intent, params, status, external_refs, error_message, created_at, updated_at")\
             .eq("user_id", str(user_id))
 
         if status_filter:
             query = query.eq("status", status_filter)
 
-        response = query.order("created_at", desc=True)\
+        response = await query.order("created_at", desc=True)\
             .limit(limit)\
             .execute()
 
@@ -359,7 +367,7 @@ class NLURepository:
             "message_index": message_index
         }
 
-        response = self.supabase.table("nlu_prompt_logs").insert(data).execute()
+        response = await self.db.table("nlu_prompt_logs").insert(data).execute()
 
         if not response.data:
             raise Exception(f"Failed to log prompt: {response}")
@@ -390,7 +398,7 @@ class NLURepository:
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        self.supabase.table("nlu_prompt_logs")\
+        await self.db.table("nlu_prompt_logs")\
             .update(update_data)\
             .eq("id", str(log_id))\
             .execute()
@@ -417,7 +425,7 @@ class NLURepository:
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        self.supabase.table("nlu_prompt_logs")\
+        await self.db.table("nlu_prompt_logs")\
             .update(update_data)\
             .eq("id", str(log_id))\
             .execute()
@@ -439,7 +447,7 @@ class NLURepository:
         Returns:
             List of low-confidence prompt logs
         """
-        response = self.supabase.table("nlu_prompt_logs")\
+        response = await self.db.table("nlu_prompt_logs")\
             .select("*")\
             .lt("confidence", threshold)\
             .is_("corrected_intent", "null")\
@@ -462,7 +470,7 @@ class NLURepository:
         Returns:
             List of prompt logs with workflow failures
         """
-        response = self.supabase.table("nlu_prompt_logs")\
+        response = await self.db.table("nlu_prompt_logs")\
             .select("*")\
             .eq("was_successful", False)\
             .is_("corrected_intent", "null")\
@@ -488,7 +496,7 @@ class NLURepository:
         Returns:
             List of prompt logs suitable for retraining
         """
-        query = self.supabase.table("nlu_prompt_logs")\
+        query = self.db.table("nlu_prompt_logs")\
             .select("prompt, predicted_intent, corrected_intent, confidence")
 
         if min_date:
@@ -497,7 +505,7 @@ class NLURepository:
         # Get prompts with corrections OR high confidence (>0.85)
         # Note: Supabase doesn't support complex OR queries easily,
         # so we'll fetch and filter in Python
-        response = query.order("created_at", desc=True)\
+        response = await query.order("created_at", desc=True)\
             .limit(limit)\
             .execute()
 
@@ -520,7 +528,7 @@ class NLURepository:
         Returns:
             Total count of prompts
         """
-        response = self.supabase.table("nlu_prompt_logs").select("*", count="exact").execute()
+        response = await self.db.table("nlu_prompt_logs").select("*", count="exact").execute()
         return response.count if hasattr(response, 'count') else 0
 
     async def count_prompts_since(self, since: datetime) -> int:
@@ -533,7 +541,7 @@ class NLURepository:
         Returns:
             Count of prompts since that datetime
         """
-        response = self.supabase.table("nlu_prompt_logs")\
+        response = await self.db.table("nlu_prompt_logs")\
             .select("*", count="exact")\
             .gte("created_at", since.isoformat())\
             .execute()
@@ -549,7 +557,7 @@ class NLURepository:
         Returns:
             List of prompt logs since that datetime
         """
-        response = self.supabase.table("nlu_prompt_logs")\
+        response = await self.db.table("nlu_prompt_logs")\
             .select("*")\
             .gte("created_at", since.isoformat())\
             .execute()
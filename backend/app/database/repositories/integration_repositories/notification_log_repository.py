@@ -36,7 +36,7 @@ class NotificationLogRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(log_data)\
                 .execute()
             
@@ -39,7 +39,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .filter("expires_at", "lte", expiry_threshold.isoformat())\
                 .eq("is_active", True)\
@@ -78,7 +78,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("id", token_id)\
                 .execute()
@@ -122,7 +122,7 @@ class OAuthTokenRepository(BaseRepository):
             if reason:
                 logger.info(f"Marking token {token_id} inactive. Reason: {reason}")
             
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("id", token_id)\
                 .execute()
@@ -157,7 +157,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("is_active", True)\
@@ -166,7 +166,7 @@ class OAuthTokenRepository(BaseRepository):
             if provider:
                 query = query.eq("provider", provider)
             
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
         
         except Exception as e:
@@ -197,7 +197,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(token_data, on_conflict=conflict_columns)\
                 .execute()
             
@@ -233,7 +233,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -270,7 +270,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -309,7 +309,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -353,7 +353,7 @@ class OAuthTokenRepository(BaseRepository):
         """
         try:
             # Check if exists
-            existing = self.supabase.table(self.table_name)\
+            existing = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -362,7 +362,7 @@ class OAuthTokenRepository(BaseRepository):
             
             if existing.data:
                 # Update
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .update(token_data)\
                     .eq("id", existing.data[0]["id"])\
                     .execute()
@@ -374,7 +374,7 @@ class OAuthTokenRepository(BaseRepository):
                     "service_type": service_type,
                     **token_data
                 }
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .insert(full_data)\
                     .execute()
             
@@ -413,7 +413,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -453,7 +453,7 @@ class OAuthTokenRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id")\
                 .eq("user_id", user_id)\
                 .eq("provider", provider)\
@@ -33,7 +33,7 @@ class ScheduledNotificationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(notification_data)\
                 .execute()
             
@@ -71,7 +71,7 @@ class UserTagRepository(BaseRepository):
             Tag dictionary or None if not found
         """
         try:
-            response = self.supabase.table(self.table_name).select("*").eq("user_id", user_id).eq("name", name.lower()).execute()
+            response = await self.db.table(self.table_name).select("*").eq("user_id", user_id).eq("name", name.lower()).execute()
 
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -115,7 +115,7 @@ class UserTagRepository(BaseRepository):
             True if deleted, False if not found
         """
         try:
-            response = self.supabase.table(self.table_name).delete().eq("id", tag_id).eq("user_id", user_id).execute()
+            response = await self.db.table(self.table_name).delete().eq("id", tag_id).eq("user_id", user_id).execute()
 
             return response.data is not None and len(response.data) > 0
 
@@ -160,14 +160,14 @@ class TodoTagRepository(BaseRepository):
         """
         try:
             # First get user's todo IDs
-            user_todos_response = self.supabase.table("todos").select("id").eq("user_id", user_id).execute()
+            user_todos_response = await self.db.table("todos").select("id").eq("user_id", user_id).execute()
             todo_ids = [todo["id"] for todo in (user_todos_response.data or [])]
 
             if not todo_ids:
                 return []
 
             # Query junction table for tag usage
-            response = self.supabase.table(self.table_name).select("tag_name").in_("todo_id", todo_ids).execute()
+            response = await self.db.table(self.table_name).select("tag_name").in_("todo_id", todo_ids).execute()
 
             return response.data or []
 
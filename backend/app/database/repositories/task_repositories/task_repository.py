@@ -32,7 +32,7 @@ class TaskRepository(BaseRepository):
         try:
             if not tasks:
                 return True
-            response = self.supabase.table(self.table_name).insert(tasks).execute()
+            response = await self.db.table(self.table_name).insert(tasks).execute()
             return bool(response.data)
         except Exception as e:
             logger.error(f"Error bulk inserting tasks: {e}", exc_info=True)
@@ -66,7 +66,7 @@ class TaskRepository(BaseRepository):
         try:
             # Build query with course information
             select_query = "*,courses(id,name,color,icon,canvas_course_code)"
-            query = self.supabase.table(self.table_name).select(select_query).eq("user_id", user_id)
+            query = self.db.table(self.table_name).select(select_query).eq("user_id", user_id)
 
             # Apply filters if provided
             if filters:
@@ -104,7 +104,7 @@ class TaskRepository(BaseRepository):
             if limit:
                 query = query.limit(limit)
 
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
 
         except Exception as e:
@@ -135,7 +135,7 @@ class TaskRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name).select("id", count="exact").eq("user_id", user_id)
+            query = self.db.table(self.table_name).select("id", count="exact").eq("user_id", user_id)
 
             # Apply filters if provided
             if filters:
@@ -146,7 +146,7 @@ class TaskRepository(BaseRepository):
                 if filters.get("completed") is not None:
                     query = query.eq("completed", filters["completed"])
 
-            response = query.execute()
+            response = await query.execute()
             return response.count if hasattr(response, 'count') and response.count is not None else 0
 
         except Exception as e:
@@ -184,7 +184,7 @@ class TaskRepository(BaseRepository):
             if exact_match:
                 # Exact case-insensitive match
                 response = (
-                    self.supabase.table(self.table_name)
+                    await self.db.table(self.table_name)
                     .select("*")
                     .eq("user_id", user_id)
                     .ilike("title", title_trimmed)
@@ -193,7 +193,7 @@ class TaskRepository(BaseRepository):
             else:
                 # Partial case-insensitive match
                 response = (
-                    self.supabase.table(self.table_name)
+                    await self.db.table(self.table_name)
                     .select("*")
                     .eq("user_id", user_id)
                     .ilike("title", f"%{title_trimmed}%")
@@ -227,7 +227,7 @@ class TaskRepository(BaseRepository):
         """
         try:
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select("*")
                 .eq("id", task_id)
                 .eq("user_id", user_id)
@@ -263,7 +263,7 @@ class TaskRepository(BaseRepository):
         try:
             select_query = "*,courses(id,name,color,icon,canvas_course_code)"
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select(select_query)
                 .eq("id", task_id)
                 .execute()
@@ -307,7 +307,7 @@ class TaskRepository(BaseRepository):
             data["updated_at"] = datetime.utcnow().isoformat()
 
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .update(data)
                 .eq("id", task_id)
                 .eq("user_id", user_id)
@@ -343,7 +343,7 @@ class TaskRepository(BaseRepository):
         """
         try:
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .delete()
                 .eq("id", task_id)
                 .eq("user_id", user_id)
@@ -384,7 +384,7 @@ class TaskRepository(BaseRepository):
                 return []
 
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select("id")
                 .in_("id", prerequisite_ids)
                 .eq("user_id", user_id)
@@ -38,7 +38,7 @@ class TodoRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name).select("*").eq("user_id", user_id)
+            query = self.db.table(self.table_name).select("*").eq("user_id", user_id)
 
             # Apply filters if provided
             if filters:
@@ -52,7 +52,7 @@ class TodoRepository(BaseRepository):
             # Order by creation date (newest first)
             query = query.order("created_at", desc=True)
 
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
 
         except Exception as e:
@@ -90,7 +90,7 @@ class TodoRepository(BaseRepository):
             if exact_match:
                 # Exact case-insensitive match
                 response = (
-                    self.supabase.table(self.table_name)
+                    await self.db.table(self.table_name)
                     .select("*")
                     .eq("user_id", user_id)
                     .ilike("title", title_trimmed)
@@ -99,7 +99,7 @@ class TodoRepository(BaseRepository):
             else:
                 # Partial case-insensitive match
                 response = (
-                    self.supabase.table(self.table_name)
+                    await self.db.table(self.table_name)
                     .select("*")
                     .eq("user_id", user_id)
                     .ilike("title", f"%{title_trimmed}%")
@@ -133,7 +133,7 @@ class TodoRepository(BaseRepository):
         """
         try:
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select("*")
                 .eq("id", todo_id)
                 .eq("user_id", user_id)
@@ -178,7 +178,7 @@ class TodoRepository(BaseRepository):
             data["updated_at"] = datetime.utcnow().isoformat()
 
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .update(data)
                 .eq("id", todo_id)
                 .eq("user_id", user_id)
@@ -214,7 +214,7 @@ class TodoRepository(BaseRepository):
         """
         try:
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .delete()
                 .eq("id", todo_id)
                 .eq("user_id", user_id)
@@ -257,7 +257,7 @@ class TodoRepository(BaseRepository):
             data["updated_at"] = datetime.utcnow().isoformat()
 
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .update(data)
                 .in_("id", todo_ids)
                 .eq("user_id", user_id)
@@ -298,7 +298,7 @@ class TodoTagRepository(BaseRepository):
         """
         try:
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select("tag_name")
                 .eq("todo_id", todo_id)
                 .execute()
@@ -328,7 +328,7 @@ class TodoTagRepository(BaseRepository):
         """
         try:
             # Delete existing tags
-            self.supabase.table(self.table_name).delete().eq("todo_id", todo_id).execute()
+            await self.db.table(self.table_name).delete().eq("todo_id", todo_id).execute()
 
             # Insert new tags
             if tag_names:
@@ -336,7 +336,7 @@ class TodoTagRepository(BaseRepository):
                     {"todo_id": todo_id, "tag_name": tag_name}
                     for tag_name in tag_names
                 ]
-                self.supabase.table(self.table_name).insert(tag_records).execute()
+                await self.db.table(self.table_name).insert(tag_records).execute()
 
         except Exception as e:
             logger.error(f"Error updating tags for todo {todo_id}: {e}", exc_info=True)
@@ -370,7 +370,7 @@ class TodoTagRepository(BaseRepository):
                 return []
 
             response = (
-                self.supabase.table(self.table_name)
+                await self.db.table(self.table_name)
                 .select("todo_id")
                 .in_("todo_id", todo_ids)
                 .in_("tag_name", tag_names)
@@ -43,7 +43,7 @@ class CourseRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .order(order_by)\
@@ -79,7 +79,7 @@ class CourseRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("id", course_id)\
                 .eq("user_id", user_id)\
@@ -119,7 +119,7 @@ class CourseRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(data)\
                 .eq("id", course_id)\
                 .eq("user_id", user_id)\
@@ -160,7 +160,7 @@ class CourseRepository(BaseRepository):
         """
         try:
             # Try exact match first (case-insensitive)
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .ilike("name", course_name)\
@@ -170,7 +170,7 @@ class CourseRepository(BaseRepository):
                 return response.data[0]
             
             # Try partial match
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .ilike("name", f"%{course_name}%")\
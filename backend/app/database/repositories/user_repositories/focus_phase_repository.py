@@ -36,7 +36,7 @@ class FocusPhaseRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(phase_data)\
                 .execute()
             
@@ -74,7 +74,7 @@ class FocusPhaseRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("id", phase_id)\
                 .eq("user_id", user_id)\
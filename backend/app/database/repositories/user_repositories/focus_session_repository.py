@@ -37,7 +37,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .insert(session_data)\
                 .execute()
             
@@ -73,7 +73,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("id", session_id)\
                 .eq("user_id", user_id)\
@@ -112,7 +112,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(update_data)\
                 .eq("id", session_id)\
                 .eq("user_id", user_id)\
@@ -152,7 +152,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            query = self.supabase.table(self.table_name)\
+            query = self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)
             
@@ -170,7 +170,7 @@ class FocusSessionRepository(BaseRepository):
             # Order and limit
             query = query.order("start_time", desc=True).limit(limit)
             
-            response = query.execute()
+            response = await query.execute()
             return response.data or []
         
         except Exception as e:
@@ -196,7 +196,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("id", count="exact")\
                 .eq("user_id", user_id)\
                 .execute()
@@ -231,7 +231,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("user_id")\
                 .gte("created_at", cutoff_datetime.isoformat())\
                 .execute()
@@ -271,7 +271,7 @@ class FocusSessionRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .delete()\
                 .eq("id", session_id)\
                 .eq("user_id", user_id)\
@@ -311,7 +311,7 @@ class UserFocusProfileRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .single()\
@@ -360,7 +360,7 @@ class UserFocusProfileRepository(BaseRepository):
                 LIMIT {limit}
             """
             
-            response = self.supabase.rpc("execute_sql", {"query": query}).execute()
+            response = await self.db.rpc("execute_sql", {"query": query}).execute()
             
             if response.data:
                 return [row["user_id"] for row in response.data]
@@ -7,7 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
-from app.config.database.supabase import get_supabase
+from app.config.database.supabase import get_async_supabase
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ class HobbiesRepository:
     """Repository for user hobbies CRUD operations"""
 
     def __init__(self):
-        self.supabase = get_supabase()
+        self.db = get_async_supabase()
 
     async def get_user_hobbies(
         self,
@@ -52,12 +52,12 @@ class HobbiesRepository:
             List of user hobbies
         """
         try:
-            query = self.supabase.table('user_hobbies').select('*').eq('user_id', user_id)
+            query = self.db.table('user_hobbies').select('*').eq('user_id', user_id)
 
             if not include_inactive:
                 query = query.eq('is_active', True)
 
-            result = query.order('created_at', desc=False).execute()
+            result = await query.order('created_at', desc=False).execute()
             return result.data or []
 
         except Exception as e:
@@ -80,7 +80,7 @@ class HobbiesRepository:
             Hobby data or None
         """
         try:
-            result = self.supabase.table('user_hobbies').select('*').eq('id', hobby_id).eq('user_id', user_id).single().execute()
+            result = await self.db.table('user_hobbies').select('*').eq('id', hobby_id).eq('user_id', user_id).single().execute()
             return result.data
 
         except Exception as e:
@@ -133,7 +133,7 @@ class HobbiesRepository:
                 'is_active': True
             }
 
-            result = self.supabase.table('user_hobbies').insert(hobby_data).execute()
+            result = await self.db.table('user_hobbies').insert(hobby_data).execute()
 
             if not result.data:
                 raise Exception("Failed to create hobby")
@@ -169,7 +169,7 @@ class HobbiesRepository:
             }
             filtered_updates = {k: v for k, v in updates.items() if k in allowed_fields}
 
-            result = self.supabase.table('user_hobbies').update(filtered_updates).eq('id', hobby_id).eq('user_id', user_id).execute()
+            result = await self.db.table('user_hobbies').update(filtered_updates).eq('id', hobby_id).eq('user_id', user_id).execute()
 
             if not result.data:
                 raise Exception("Hobby not found or update failed")
@@ -199,9 +199,9 @@ class HobbiesRepository:
         """
         try:
             if soft_delete:
-                result = self.supabase.table('user_hobbies').update({'is_active': False}).eq('id', hobby_id).eq('user_id', user_id).execute()
+                result = await self.db.table('user_hobbies').update({'is_active': False}).eq('id', hobby_id).eq('user_id', user_id).execute()
             else:
-                result = self.supabase.table('user_hobbies').delete().eq('id', hobby_id).eq('user_id', user_id).execute()
+                result = await self.db.table('user_hobbies').delete().eq('id', hobby_id).eq('user_id', user_id).execute()
 
             return bool(result.data)
 
@@ -33,7 +33,7 @@ class PomodoroSettingsRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .single()\
@@ -70,7 +70,7 @@ class PomodoroSettingsRepository(BaseRepository):
         """
         try:
             data = {**settings_data, "user_id": user_id}
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .upsert(data, on_conflict="user_id")\
                 .execute()
             
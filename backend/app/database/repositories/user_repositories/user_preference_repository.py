@@ -41,7 +41,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.from_(self.table_name)\
+            response = await self.db.from_(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("category", category)\
@@ -88,7 +88,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.rpc("get_preference_value", {
+            response = await self.db.rpc("get_preference_value", {
                 "p_user_id": user_id,
                 "p_category": category,
                 "p_preference_key": preference_key
@@ -127,7 +127,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.from_(self.table_name)\
+            response = await self.db.from_(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("category", category)\
@@ -160,7 +160,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.from_(self.table_name)\
+            response = await self.db.from_(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .eq("is_active", True)\
@@ -207,7 +207,7 @@ class UserPreferenceRepository(BaseRepository):
             if existing:
                 # Update
                 update_data = {**preference_data, "updated_at": datetime.utcnow().isoformat()}
-                response = self.supabase.from_(self.table_name)\
+                response = await self.db.from_(self.table_name)\
                     .update(update_data)\
                     .eq("id", existing["id"])\
                     .execute()
@@ -219,7 +219,7 @@ class UserPreferenceRepository(BaseRepository):
                     "preference_key": preference_key,
                     **preference_data
                 }
-                response = self.supabase.from_(self.table_name)\
+                response = await self.db.from_(self.table_name)\
                     .insert(full_data)\
                     .execute()
             
@@ -258,7 +258,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.from_(self.table_name)\
+            response = await self.db.from_(self.table_name)\
                 .update({"is_active": False, "updated_at": datetime.utcnow().isoformat()})\
                 .eq("user_id", user_id)\
                 .eq("category", category)\
@@ -293,7 +293,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("*")\
                 .eq("user_id", user_id)\
                 .execute()
@@ -325,7 +325,7 @@ class UserPreferenceRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("user_id")\
                 .eq("user_id", user_id)\
                 .execute()
@@ -365,13 +365,13 @@ class UserPreferenceRepository(BaseRepository):
             
             if existing:
                 # Update existing
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .update(preferences_data)\
                     .eq("user_id", user_id)\
                     .execute()
             else:
                 # Create new
-                response = self.supabase.table(self.table_name)\
+                response = await self.db.table(self.table_name)\
                     .insert(preferences_data)\
                     .execute()
             
@@ -37,7 +37,7 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("subscription_status")\
                 .eq("id", user_id)\
                 .single()\
@@ -96,7 +96,9 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            auth_response = self.supabase.auth.admin.get_user_by_id(user_id)
+            auth_response = await self.run_blocking(
+                self.supabase.auth.admin.get_user_by_id, user_id
+            )
             
             if not auth_response.user:
                 return None
@@ -137,7 +139,7 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .update(subscription_data)\
                 .eq("id", user_id)\
                 .execute()
@@ -167,7 +169,7 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("subscription_status, apple_transaction_id, subscription_expires_at")\
                 .eq("id", user_id)\
                 .single()\
@@ -198,7 +200,7 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("full_name")\
                 .eq("id", user_id)\
                 .single()\
@@ -231,7 +233,7 @@ class UserRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            response = self.supabase.table(self.table_name)\
+            response = await self.db.table(self.table_name)\
                 .select("timezone, working_hours")\
                 .eq("id", user_id)\
                 .single()\
@@ -0,0 +1,380 @@
+"""
+Timeblock Feed
+Materialized per-user calendar feed kept in Redis
+"""
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to serve the live path after Redis fails
+RETRY_AFTER_SECONDS = 60.0
+
+# Bump when ITEM_FIELDS or the row layout changes so feeds stored by older code are rebuilt
+FEED_FORMAT = 2
+
+# Item values in the order they are stored in each row
+ITEM_FIELDS = (
+    "id", "source", "provider", "title", "start", "end", "isAllDay", "readonly", "linkId",
+    "description", "location", "color", "htmlLink", "attendees", "organizer", "creator",
+    "status", "transparency", "visibility", "categories", "importance", "sensitivity",
+    "recurrence", "hasAttachments", "priority", "taskStatus", "estimatedMinutes",
+    "schedulingRationale", "tags", "courseId", "courseName", "courseColor",
+)
+
+# Values of item fields the enrichment leaves out that are not None in the API model
+ITEM_DEFAULTS = {"isAllDay": False, "readonly": True, "hasAttachments": False}
+
+# Each row leads with start/end epoch seconds and the task and provider
+# event it was built from, followed by the ITEM_FIELDS values
+ROW_PREFIX = 4
+
+# Pending change marking the whole feed for rebuild
+ALL_CHANGED = "*"
+
+# Stores a feed only if the stored one is still the version the caller loaded
+# ('' for none). KEYS: feed, saved version. ARGV: expected version, feed JSON,
+# new version, TTL seconds.
+SAVE_SCRIPT = """
+local current = ''
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    current = redis.call('GET', KEYS[2]) or ''
+end
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[4])
+redis.call('SET', KEYS[2], ARGV[3], 'EX', ARGV[4])
+return 1
+"""
+
+
+def _timestamp(value) -> float:
+    """Epoch seconds of an ISO string or datetime (naive means UTC)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+@dataclass
+class TimeblockFeed:
+    """
+    One user's enriched timeblocks over a fixed window
+
+    Items are stored as compact arrays sorted by start. The enrichment inputs
+    (premium status, course colors, calendar links, primary write calendar)
+    are kept in context, so changed rows can be re-enriched without loading
+    them again; a change to the context itself rebuilds the feed.
+    """
+    version: int
+    window_start: float
+    window_end: float
+    context: Dict[str, Any]
+    rows: List[list] = field(default_factory=list)
+    built_at: float = field(default_factory=time.time)
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.window_start <= start.timestamp() and end.timestamp() <= self.window_end
+
+    def items(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """Items overlapping a time range"""
+        lo, hi = start.timestamp(), end.timestamp()
+        return [
+            dict(zip(ITEM_FIELDS, row[ROW_PREFIX:]))
+            for row in self.rows
+            if row[0] < hi and row[1] > lo
+        ]
+
+    def replace(
+        self,
+        task_ids: Iterable[str],
+        event_ids: Iterable[str],
+        entries: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ):
+        """
+        Swap the rows of some tasks and provider events for freshly built ones
+
+        Args:
+            task_ids: Tasks whose rows are dropped
+            event_ids: Provider event IDs whose rows are dropped
+            entries: (view row, enriched item) pairs to add
+        """
+        task_ids, event_ids = set(task_ids), set(event_ids)
+        self.rows = [
+            row for row in self.rows
+            if row[2] not in task_ids and row[3] not in event_ids
+        ]
+        self.rows.extend(self.make_row(row, item) for row, item in entries)
+        self.rows.sort(key=lambda row: row[0])
+
+    @staticmethod
+    def make_row(row: Dict[str, Any], item: Dict[str, Any]) -> list:
+        return [
+            _timestamp(item["start"]),
+            _timestamp(item["end"]),
+            row.get("task_id"),
+            row.get("provider_event_id"),
+            *(item.get(name, ITEM_DEFAULTS.get(name)) for name in ITEM_FIELDS)
+        ]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "format": FEED_FORMAT,
+            "version": self.version,
+            "window": [self.window_start, self.window_end],
+            "context": self.context,
+            "rows": self.rows,
+            "built_at": self.built_at,
+        }, separators=(",", ":"), default=str)
+
+    @classmethod
+    def from_json(cls, data: str) -> Optional["TimeblockFeed"]:
+        payload = json.loads(data)
+        if payload.get("format") != FEED_FORMAT:
+            return None
+        return cls(
+            version=payload["version"],
+            window_start=payload["window"][0],
+            window_end=payload["window"][1],
+            context=payload["context"],
+            rows=payload["rows"],
+            built_at=payload["built_at"],
+        )
+
+
+class TimeblockFeedStore:
+    """
+    Redis storage for materialized timeblock feeds
+
+    Per user there is the feed itself, the version it was saved with, a set
+    of pending changes ("task:<id>", "event:<provider event id>" or
+    ALL_CHANGED) recorded by writers, and a version counter that is bumped
+    each time the feed is rebuilt or patched. Writers only record what
+    changed; the next read applies it, so a burst of writes costs one
+    refresh. Reads that refresh concurrently race on save: only the first
+    replaces the version they loaded, and the others put their changes back.
+    No method raises: when Redis is unavailable reads return None so callers
+    serve the live path.
+    """
+
+    KEY_PREFIX = "timeblock_feed"
+
+    def __init__(self, client=None):
+        """
+        Args:
+            client: Redis client; the shared one is used when not given
+        """
+        self._client = client
+        self._retry_at = 0.0
+        # Changes may have gone unrecorded since; older feeds are not trusted
+        self._failed_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().TIMEBLOCK_FEED_ENABLED
+
+    @property
+    def ttl_seconds(self) -> int:
+        return get_settings().TIMEBLOCK_FEED_TTL_SECONDS
+
+    def window(self, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+        """Range a feed built now covers, aligned to whole UTC days"""
+        settings = get_settings()
+        today = (now or datetime.now(timezone.utc)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return (
+            today - timedelta(days=settings.TIMEBLOCK_FEED_PAST_DAYS),
+            today + timedelta(days=settings.TIMEBLOCK_FEED_FUTURE_DAYS + 1)
+        )
+
+    def _key(self, user_id: str, part: str = "") -> str:
+        return f"{self.KEY_PREFIX}:{user_id}{':' + part if part else ''}"
+
+    async def _redis(self):
+        """Redis client, or None while backing off after a failure"""
+        if not self.enabled or time.monotonic() < self._retry_at:
+            return None
+        if self._client is not None:
+            return self._client
+        try:
+            from app.config.cache.redis_client import get_redis_client
+            return await get_redis_client()
+        except Exception as e:
+            self._failed("connect", e)
+            return None
+
+    def _failed(self, operation: str, error: Exception):
+        logger.warning(f"Timeblock feed {operation} failed, serving live timeblocks: {error}")
+        self._retry_at = time.monotonic() + RETRY_AFTER_SECONDS
+        self._failed_at = time.time()
+
+    async def load(self, user_id: str) -> Tuple[Optional[TimeblockFeed], Optional[str]]:
+        """
+        Stored feed and the version to pass to save
+
+        The feed is None if missing, outdated or unreachable; the version is
+        None only when Redis is unreachable.
+        """
+        client = await self._redis()
+        if client is None:
+            return None, None
+        try:
+            data, saved_version = await client.mget(self._key(user_id), self._key(user_id, "saved"))
+        except Exception as e:
+            self._failed("load", e)
+            return None, None
+
+        if not data:
+            return None, ""
+        feed = TimeblockFeed.from_json(_text(data))
+        if feed is not None and feed.built_at <= self._failed_at:
+            feed = None
+        return feed, _text(saved_version) or ""
+
+    async def save(self, user_id: str, feed: TimeblockFeed, expected_version: Optional[str]) -> bool:
+        """
+        Store a feed unless another one was saved since it was loaded
+
+        Args:
+            user_id: Feed owner
+            feed: Rebuilt or patched feed
+            expected_version: Version returned by load with the original feed
+
+        Returns:
+            True if stored; False if another save won or Redis failed
+        """
+        client = await self._redis()
+        if client is None or expected_version is None:
+            return False
+        try:
+            save = client.register_script(SAVE_SCRIPT)
+            stored = await save(
+                keys=[self._key(user_id), self._key(user_id, "saved")],
+                args=[expected_version, feed.to_json(), str(feed.version), self.ttl_seconds]
+            )
+            return bool(stored)
+        except Exception as e:
+            self._failed("save", e)
+            return False
+
+    async def discard(self, user_id: str):
+        """Drop a feed that could not be kept up to date"""
+        client = await self._redis()
+        if client is None:
+            return
+        try:
+            await client.delete(self._key(user_id))
+        except Exception as e:
+            self._failed("discard", e)
+
+    async def next_version(self, user_id: str) -> Optional[int]:
+        """
+        Allocate the version of a rebuilt or patched feed
+
+        A counter that starts over (e.g. after a Redis flush) is seeded with
+        the clock so versions already handed out as ETags are not reused.
+        """
+        client = await self._redis()
+        if client is None:
+            return None
+        try:
+            key = self._key(user_id, "version")
+            version = await client.incr(key)
+            if version == 1:
+                version = int(time.time() * 1000)
+                await client.set(key, str(version))
+            return version
+        except Exception as e:
+            self._failed("version", e)
+            return None
+
+    async def mark_changed(
+        self,
+        user_id: str,
+        task_ids: Iterable[str] = (),
+        event_ids: Iterable[str] = (),
+        everything: bool = False
+    ):
+        """
+        Record writes the user's feed has not seen yet
+
+        Args:
+            user_id: Feed owner
+            task_ids: Tasks created, updated or deleted
+            event_ids: Provider event IDs created, updated or cancelled
+            everything: Enrichment inputs changed; rebuild the whole feed
+        """
+        if everything:
+            changes = [ALL_CHANGED]
+        else:
+            changes = [f"task:{task_id}" for task_id in task_ids if task_id]
+            changes += [f"event:{event_id}" for event_id in event_ids if event_id]
+        if not changes:
+            return
+
+        client = await self._redis()
+        if client is None:
+            return
+        try:
+            key = self._key(user_id, "changes")
+            await client.sadd(key, *changes)
+            await client.expire(key, self.ttl_seconds)
+        except Exception as e:
+            self._failed("mark_changed", e)
+
+    async def take_changes(self, user_id: str) -> Optional[Set[str]]:
+        """
+        Pending changes, removed from the set as they are taken
+
+        Only the members read are removed, so a change recorded meanwhile is
+        kept for the next read. Returns None when Redis is unavailable.
+        """
+        client = await self._redis()
+        if client is None:
+            return None
+        try:
+            key = self._key(user_id, "changes")
+            changes = {_text(change) for change in await client.smembers(key)}
+            if changes:
+                await client.srem(key, *changes)
+            return changes
+        except Exception as e:
+            self._failed("take_changes", e)
+            return None
+
+    async def restore_changes(self, user_id: str, changes: Set[str]):
+        """Put back changes taken by a read whose feed was not saved"""
+        if not changes:
+            return
+        client = await self._redis()
+        if client is None:
+            return
+        try:
+            key = self._key(user_id, "changes")
+            await client.sadd(key, *changes)
+            await client.expire(key, self.ttl_seconds)
+        except Exception as e:
+            self._failed("restore_changes", e)
+
+
+# Global feed store instance
+_feed_store: Optional[TimeblockFeedStore] = None
+
+
+def get_timeblock_feed_store() -> TimeblockFeedStore:
+    """Get the shared timeblock feed store"""
+    global _feed_store
+    if _feed_store is None:
+        _feed_store = TimeblockFeedStore()
+    return _feed_store
@@ -6,6 +6,7 @@ from .domain import Task, BusyEvent, Preferences, ScheduleSolution, ScheduleBloc
 from .service import SchedulerService
 from .config import *
 from .features import build_utilities
+from .utility_matrix import UtilityMatrix
 
 __all__ = [
     'Task',
@@ -14,5 +15,6 @@ __all__ = [
     'ScheduleSolution',
     'ScheduleBlock',
     'SchedulerService',
-    'build_utilities'
+    'build_utilities',
+    'UtilityMatrix'
 ]
\ No newline at end of file
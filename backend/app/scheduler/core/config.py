@@ -33,6 +33,17 @@ class SolverConfig:
     random_seed: int = 42
     use_hint_search: bool = True
     log_search_progress: bool = False
+    formulation: str = "slot"  # slot, interval
+    max_blocks_per_task: int = 8
+    context_switch_encoding: str = "linear"  # linear, pairwise
+    pool_enabled: bool = True
+    pool_workers: int = 0  # 0 = one worker process per CPU
+    pool_start_method: str = "spawn"  # spawn, forkserver, fork
+    warm_start_enabled: bool = True
+    warm_start_days_back: int = 7
+    incremental_replan_enabled: bool = True
+    coalesce_user_requests: bool = True  # Collapse bursts of requests for one user into the newest
+    alternatives_time_budget_seconds: float = 3.0  # Shared by the parallel what-if solves
     
     def validate(self):
         """Validate solver configuration."""
@@ -40,6 +51,20 @@ class SolverConfig:
             raise ValueError("time_limit_seconds must be between 1 and 300")
         if self.num_search_workers < 1 or self.num_search_workers > 16:
             raise ValueError("num_search_workers must be between 1 and 16")
+        if self.formulation not in ["slot", "interval"]:
+            raise ValueError("formulation must be one of: slot, interval")
+        if self.max_blocks_per_task < 1 or self.max_blocks_per_task > 64:
+            raise ValueError("max_blocks_per_task must be between 1 and 64")
+        if self.context_switch_encoding not in ["linear", "pairwise"]:
+            raise ValueError("context_switch_encoding must be one of: linear, pairwise")
+        if self.pool_workers < 0 or self.pool_workers > 256:
+            raise ValueError("pool_workers must be between 0 and 256")
+        if self.pool_start_method not in ["spawn", "forkserver", "fork"]:
+            raise ValueError("pool_start_method must be one of: spawn, forkserver, fork")
+        if self.warm_start_days_back < 0 or self.warm_start_days_back > 60:
+            raise ValueError("warm_start_days_back must be between 0 and 60")
+        if not 0 < self.alternatives_time_budget_seconds <= 60:
+            raise ValueError("alternatives_time_budget_seconds must be between 0 and 60")
 
 
 @dataclass
@@ -119,6 +144,8 @@ class TelemetryConfig:
     metrics_retention_hours: int = 24
     traces_retention_hours: int = 12
     log_level: str = "INFO"
+    lazy_explanations: bool = True  # Build explanations on first fetch instead of per request
+    precompute_explanations: bool = False  # Build lazy explanations in the background right away (always with redis)
     
     def validate(self):
         """Validate telemetry configuration."""
@@ -137,6 +164,16 @@ class CacheConfig:
     ttl_minutes: int = 60
     max_size: int = 10000
     redis_url: Optional[str] = None
+    time_index_max_entries: int = 256
+    time_index_ttl_minutes: int = 60
+    model_registry_enabled: bool = True  # Keep per-user learned models resident
+    model_registry_max_users: int = 1000
+    model_registry_memory_mb: float = 256.0
+    model_registry_revalidate_seconds: float = 60.0  # Check resident models for newer saves
+    slo_shared_state: bool = True  # Keep SLO gate state in Redis when backend is redis
+    idempotency_lock_seconds: int = 120  # Max time duplicates wait for the first solve
+    explanation_max_entries: int = 1000  # Lazy explanations kept per process, by job id
+    explanation_ttl_minutes: int = 30
     
     def validate(self):
         """Validate cache configuration."""
@@ -147,6 +184,50 @@ class CacheConfig:
             raise ValueError("redis_url is required when backend is redis")
         if self.ttl_minutes < 1:
             raise ValueError("ttl_minutes must be at least 1")
+        if self.time_index_max_entries < 1:
+            raise ValueError("time_index_max_entries must be at least 1")
+        if self.time_index_ttl_minutes < 1:
+            raise ValueError("time_index_ttl_minutes must be at least 1")
+        if self.model_registry_max_users < 1:
+            raise ValueError("model_registry_max_users must be at least 1")
+        if self.model_registry_memory_mb <= 0:
+            raise ValueError("model_registry_memory_mb must be positive")
+        if self.model_registry_revalidate_seconds < 0:
+            raise ValueError("model_registry_revalidate_seconds must be non-negative")
+        if self.idempotency_lock_seconds < 1:
+            raise ValueError("idempotency_lock_seconds must be at least 1")
+        if self.explanation_max_entries < 1:
+            raise ValueError("explanation_max_entries must be at least 1")
+        if self.explanation_ttl_minutes < 1:
+            raise ValueError("explanation_ttl_minutes must be at least 1")
+
+
+@dataclass
+class BatchConfig:
+    """Configuration for batched multi-user scheduling."""
+    enabled: bool = True
+    max_concurrency: int = 0  # 0 = one in-flight user per solver pool worker
+    per_user_timeout_seconds: float = 60.0
+    history_days: int = 60
+    replan_local_hour: int = 6  # Local hour by which morning schedules must be ready
+    replan_lead_minutes: int = 30  # How long before replan_local_hour the batch starts
+    batched_inference: bool = True  # Evaluate concurrent users' completion models together
+    inference_window_ms: float = 0.0  # 0 = batch whatever is pending on the next loop iteration
+    
+    def validate(self):
+        """Validate batch configuration."""
+        if self.max_concurrency < 0:
+            raise ValueError("max_concurrency must be non-negative")
+        if self.per_user_timeout_seconds <= 0:
+            raise ValueError("per_user_timeout_seconds must be positive")
+        if self.history_days < 1:
+            raise ValueError("history_days must be at least 1")
+        if not 0 <= self.replan_local_hour <= 23:
+            raise ValueError("replan_local_hour must be between 0 and 23")
+        if self.replan_lead_minutes < 0 or self.replan_lead_minutes > 720:
+            raise ValueError("replan_lead_minutes must be between 0 and 720")
+        if self.inference_window_ms < 0:
+            raise ValueError("inference_window_ms must be non-negative")
 
 
 @dataclass
@@ -181,6 +262,7 @@ class SchedulerConfig:
     features: FeatureConfig = field(default_factory=FeatureConfig)
     telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
     cache: CacheConfig = field(default_factory=CacheConfig)
+    batch: BatchConfig = field(default_factory=BatchConfig)
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     
     # Global settings
@@ -200,6 +282,7 @@ class SchedulerConfig:
         self.features.validate()
         self.telemetry.validate()
         self.cache.validate()
+        self.batch.validate()
         self.database.validate()
         
         # Validate global settings
@@ -239,6 +322,8 @@ class SchedulerConfig:
             config_data['telemetry'] = TelemetryConfig(**config_data['telemetry'])
         if 'cache' in config_data:
             config_data['cache'] = CacheConfig(**config_data['cache'])
+        if 'batch' in config_data:
+            config_data['batch'] = BatchConfig(**config_data['batch'])
         if 'database' in config_data:
             config_data['database'] = DatabaseConfig(**config_data['database'])
         
@@ -321,6 +406,9 @@ class ConfigManager:
             f"{env_prefix}ENVIRONMENT": "environment",
             f"{env_prefix}SOLVER_TIME_LIMIT": "solver.time_limit_seconds",
             f"{env_prefix}SOLVER_WORKERS": "solver.num_search_workers",
+            f"{env_prefix}SOLVER_FORMULATION": "solver.formulation",
+            f"{env_prefix}SOLVER_POOL_WORKERS": "solver.pool_workers",
+            f"{env_prefix}BATCH_CONCURRENCY": "batch.max_concurrency",
             f"{env_prefix}LEARNING_LR": "learning.completion_model_lr",
             f"{env_prefix}BANDIT_EXPLORATION": "learning.bandit_exploration_rate",
             f"{env_prefix}LOG_LEVEL": "telemetry.log_level",
@@ -345,6 +433,12 @@ class ConfigManager:
             f"{env_prefix}TRACING_ENABLED": "telemetry.tracing_enabled",
             f"{env_prefix}CACHE_ENABLED": "cache.enabled",
             f"{env_prefix}FALLBACK_ENABLED": "enable_fallback_solver",
+            f"{env_prefix}SOLVER_POOL_ENABLED": "solver.pool_enabled",
+            f"{env_prefix}SOLVER_WARM_START": "solver.warm_start_enabled",
+            f"{env_prefix}SOLVER_INCREMENTAL_REPLAN": "solver.incremental_replan_enabled",
+            f"{env_prefix}COALESCE_REQUESTS": "solver.coalesce_user_requests",
+            f"{env_prefix}LAZY_EXPLANATIONS": "telemetry.lazy_explanations",
+            f"{env_prefix}BATCH_ENABLED": "batch.enabled",
             f"{env_prefix}ADAPTIVE_ENABLED": "enable_adaptive_rescheduling"
         }
         
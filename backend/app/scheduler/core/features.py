@@ -4,12 +4,14 @@ Feature extraction for ML-driven scheduling optimization.
 Builds feature matrices for completion probability prediction and utility calculation.
 """
 
+import inspect
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 
 from .domain import Task, BusyEvent, Preferences, CompletionEvent
+from .utility_matrix import UtilityMatrix
 from ..optimization.time_index import TimeIndex
 from ...core.utils.timezone_utils import get_timezone_manager
 
@@ -23,6 +25,49 @@ class FeatureConfig:
     include_historical_features: bool = True
     lookback_days: int = 60
     min_historical_samples: int = 5
+    use_float32: bool = False  # Halves matrix memory for large horizons
+
+
+TASK_KINDS = ['study', 'assignment', 'exam', 'reading', 'project', 'hobby', 'admin']
+COMMON_TAGS = ['deep_work', 'shallow', 'creative', 'analytical']
+
+TIME_FEATURE_NAMES = [
+    'hour_norm', 'dow_norm', 'is_morning', 'is_afternoon',
+    'is_evening', 'is_weekend', 'dist_from_workday_start',
+    'dist_from_workday_end', 'in_workday'
+]
+TASK_FEATURE_NAMES = [
+    'duration_norm', 'weight_norm', 'min_block_norm', 'max_block_norm'
+] + [f'kind_{kind}' for kind in TASK_KINDS] + [
+    'has_deadline', 'urgency', 'has_prereqs', 'is_exam'
+] + [f'tag_{tag}' for tag in COMMON_TAGS]
+CONTEXT_FEATURE_NAMES = [
+    'is_blocked', 'in_preferred', 'in_avoided', 'in_deep_work',
+    'in_no_study', 'needs_break', 'calendar_density'
+]
+HISTORICAL_FEATURE_NAMES = [
+    'hour_completion_rate', 'dow_completion_rate',
+    'kind_completion_rate', 'recent_performance'
+]
+
+
+@dataclass
+class SlotArrays:
+    """Per-slot attributes of a time index as arrays."""
+    timestamps: np.ndarray      # epoch seconds, float64
+    hour: np.ndarray            # 0-23
+    minute_of_day: np.ndarray   # 0-1439
+    dow: np.ndarray             # Monday=0
+
+    @classmethod
+    def from_time_index(cls, time_index: TimeIndex) -> 'SlotArrays':
+        """View the arrays precomputed by the time index."""
+        return cls(
+            timestamps=time_index.slot_timestamps,
+            hour=time_index.slot_hours,
+            minute_of_day=time_index.slot_minutes_of_day,
+            dow=time_index.slot_weekdays
+        )
 
 
 class FeatureExtractor:
@@ -30,7 +75,9 @@ class FeatureExtractor:
     Extracts features for machine learning models in scheduling.
     
     Generates (task, slot) feature matrices for completion probability
-    prediction and utility calculation.
+    prediction and utility calculation. Slot and task attributes are
+    computed once as arrays and broadcast into a single preallocated
+    (n_tasks, n_slots, n_features) buffer.
     """
     
     def __init__(self, config: FeatureConfig = None):
@@ -59,47 +106,58 @@ class FeatureExtractor:
             
         Returns:
             (feature_matrix, feature_names, metadata)
-            feature_matrix shape: (n_tasks * n_slots, n_features)
+            feature_matrix shape: (n_tasks * n_slots, n_features), row
+            task_idx * n_slots + slot_idx
         """
         n_tasks = len(tasks)
         n_slots = len(time_index)
+        slot_arrays = SlotArrays.from_time_index(time_index)
         
-        # Build task lookup
-        task_lookup = {task.id: task for task in tasks}
+        # Feature groups: (array, names); arrays are (n_slots, k), (n_tasks, k)
+        # or (n_tasks, n_slots, k) and are broadcast on assembly
+        groups = []
         
-        # Initialize feature collectors
-        feature_lists = []
-        self.feature_names = []
-        
-        # Time-based features
+        # Time-based features (grid-only, shared through the time index)
         if self.config.include_time_features:
-            time_features = self._extract_time_features(time_index, prefs)
-            feature_lists.append(time_features)
+            time_features = time_index.memoize(
+                ('time_features', prefs.workday_start, prefs.workday_end),
+                lambda: self._extract_time_features(slot_arrays, prefs)
+            )
+            groups.append((time_features[np.newaxis, :, :], TIME_FEATURE_NAMES))
             
         # Task-based features  
         if self.config.include_task_features:
-            task_features = self._extract_task_features(tasks, time_index)
-            feature_lists.append(task_features)
+            groups.append((
+                self._extract_task_features(tasks, time_index)[:, np.newaxis, :],
+                TASK_FEATURE_NAMES
+            ))
             
         # Context features (calendar, preferences)
         if self.config.include_context_features:
-            context_features = self._extract_context_features(
-                tasks, time_index, prefs, busy_events
-            )
-            feature_lists.append(context_features)
+            groups.append((
+                self._extract_context_features(tasks, time_index, slot_arrays, prefs, busy_events),
+                CONTEXT_FEATURE_NAMES
+            ))
             
         # Historical features
         if self.config.include_historical_features and history:
-            hist_features = self._extract_historical_features(
-                tasks, time_index, prefs, history
-            )
-            feature_lists.append(hist_features)
+            groups.append((
+                self._extract_historical_features(tasks, slot_arrays, history),
+                HISTORICAL_FEATURE_NAMES
+            ))
         
         # Combine all features
-        if feature_lists:
-            feature_matrix = np.hstack(feature_lists)
+        dtype = np.float32 if self.config.use_float32 else np.float64
+        if groups:
+            self.feature_names = [name for _, names in groups for name in names]
+            buffer = np.empty((n_tasks, n_slots, len(self.feature_names)), dtype=dtype)
+            offset = 0
+            for values, names in groups:
+                buffer[:, :, offset:offset + len(names)] = values
+                offset += len(names)
+            feature_matrix = buffer.reshape(n_tasks * n_slots, -1)
         else:
-            feature_matrix = np.zeros((n_tasks * n_slots, 1))
+            feature_matrix = np.zeros((n_tasks * n_slots, 1), dtype=dtype)
             self.feature_names = ['bias']
             
         metadata = {
@@ -114,271 +172,126 @@ class FeatureExtractor:
     
     def _extract_time_features(
         self, 
-        time_index: TimeIndex, 
+        slot_arrays: SlotArrays, 
         prefs: Preferences
     ) -> np.ndarray:
-        """Extract time-based features for each slot."""
-        n_slots = len(time_index)
-        features = []
-        feature_names = []
-        
-        for slot_idx in range(n_slots):
-            slot_context = time_index.get_slot_context(slot_idx)
-            slot_dt = slot_context['datetime']
-            
-            slot_features = []
-            
-            # Hour of day (0-23)
-            hour = slot_context['hour']
-            slot_features.append(hour / 23.0)  # Normalized
-            
-            # Day of week (0-6, Monday=0)
-            dow = slot_context['day_of_week']
-            slot_features.append(dow / 6.0)  # Normalized
-            
-            # Time of day categories (one-hot)
-            slot_features.extend([
-                1.0 if slot_context['is_morning'] else 0.0,
-                1.0 if slot_context['is_afternoon'] else 0.0,
-                1.0 if slot_context['is_evening'] else 0.0
-            ])
-            
-            # Weekend indicator
-            slot_features.append(1.0 if slot_context['is_weekend'] else 0.0)
-            
-            # Distance from workday bounds
-            workday_start_hour = self._parse_time_hour(prefs.workday_start)
-            workday_end_hour = self._parse_time_hour(prefs.workday_end)
-            
-            # Distance from workday start/end (normalized)
-            dist_from_start = abs(hour - workday_start_hour) / 24.0
-            dist_from_end = abs(hour - workday_end_hour) / 24.0
-            slot_features.extend([dist_from_start, dist_from_end])
-            
-            # In workday hours
-            in_workday = 1.0 if workday_start_hour <= hour < workday_end_hour else 0.0
-            slot_features.append(in_workday)
-            
-            features.append(slot_features)
-        
-        # Feature names (only set once)
-        if not self.feature_names:
-            feature_names = [
-                'hour_norm', 'dow_norm', 'is_morning', 'is_afternoon', 
-                'is_evening', 'is_weekend', 'dist_from_workday_start',
-                'dist_from_workday_end', 'in_workday'
-            ]
-            self.feature_names.extend(feature_names)
-        
-        # Tile for all tasks
-        slot_features = np.array(features)  # (n_slots, n_time_features)
-        n_tasks = 1  # This will be broadcast correctly when combined
-        
-        return slot_features
+        """Extract time-based features for each slot as (n_slots, 9)."""
+        hour = slot_arrays.hour
+        
+        workday_start_hour = self._parse_time_hour(prefs.workday_start)
+        workday_end_hour = self._parse_time_hour(prefs.workday_end)
+        
+        return np.column_stack([
+            hour / 23.0,
+            slot_arrays.dow / 6.0,
+            hour < 12,
+            (hour >= 12) & (hour < 18),
+            hour >= 18,
+            slot_arrays.dow >= 5,
+            np.abs(hour - workday_start_hour) / 24.0,
+            np.abs(hour - workday_end_hour) / 24.0,
+            (hour >= workday_start_hour) & (hour < workday_end_hour)
+        ]).astype(np.float64)
     
     def _extract_task_features(
         self, 
         tasks: List[Task], 
         time_index: TimeIndex
     ) -> np.ndarray:
-        """Extract task-specific features."""
+        """Extract task-specific features as (n_tasks, 19)."""
         n_tasks = len(tasks)
-        n_slots = len(time_index)
-        features = []
-        feature_names = []
-        
-        for task in tasks:
-            task_features = []
-            
-            # Task duration (normalized by max)
-            max_duration = max(t.estimated_minutes for t in tasks) or 1
-            duration_norm = task.estimated_minutes / max_duration
-            task_features.append(duration_norm)
-            
-            # Task weight (normalized)
-            max_weight = max(t.weight for t in tasks) or 1
-            weight_norm = task.weight / max_weight
-            task_features.append(weight_norm)
-            
-            # Min/max block constraints
-            min_block_norm = task.min_block_minutes / max_duration
-            max_block_norm = task.max_block_minutes / max_duration
-            task_features.extend([min_block_norm, max_block_norm])
-            
-            # Task kind (one-hot encoding)
-            task_kinds = ['study', 'assignment', 'exam', 'reading', 'project', 'hobby', 'admin']
-            task_kind_features = [1.0 if task.kind == kind else 0.0 for kind in task_kinds]
-            task_features.extend(task_kind_features)
-            
-            # Has deadline
-            has_deadline = 1.0 if task.deadline else 0.0
-            task_features.append(has_deadline)
-            
-            # Deadline urgency (days remaining, normalized)
-            if task.deadline:
-                days_remaining = (task.deadline - time_index.start_dt).days
-                urgency = max(0, 14 - days_remaining) / 14.0  # Higher urgency = closer deadline
-            else:
-                urgency = 0.0
-            task_features.append(urgency)
-            
-            # Has prerequisites
-            has_prereqs = 1.0 if task.prerequisites else 0.0
-            task_features.append(has_prereqs)
-            
-            # Is exam (special handling)
-            is_exam = 1.0 if task.kind == 'exam' else 0.0
-            task_features.append(is_exam)
-            
-            # Tags (common ones)
-            common_tags = ['deep_work', 'shallow', 'creative', 'analytical']
-            tag_features = [1.0 if tag in task.tags else 0.0 for tag in common_tags]
-            task_features.extend(tag_features)
-            
-            features.append(task_features)
-        
-        # Feature names (only set once)
-        if 'duration_norm' not in self.feature_names:
-            feature_names = [
-                'duration_norm', 'weight_norm', 'min_block_norm', 'max_block_norm'
-            ] + [f'kind_{kind}' for kind in task_kinds] + [
-                'has_deadline', 'urgency', 'has_prereqs', 'is_exam'
-            ] + [f'tag_{tag}' for tag in common_tags]
-            self.feature_names.extend(feature_names)
-        
-        # Repeat task features for each slot
-        task_features_array = np.array(features)  # (n_tasks, n_task_features)
         
-        # Create (n_tasks * n_slots, n_task_features) by repeating each task for all slots
-        repeated_features = np.repeat(task_features_array, n_slots, axis=0)
-        
-        return repeated_features
+        duration = np.array([t.estimated_minutes for t in tasks], dtype=np.float64)
+        weight = np.array([t.weight for t in tasks], dtype=np.float64)
+        min_block = np.array([t.min_block_minutes for t in tasks], dtype=np.float64)
+        max_block = np.array([t.max_block_minutes for t in tasks], dtype=np.float64)
+        
+        # Normalizers are computed once for the whole batch
+        max_duration = (duration.max() if n_tasks else 0) or 1
+        max_weight = (weight.max() if n_tasks else 0) or 1
+        
+        kinds = np.array([t.kind for t in tasks], dtype=object)
+        kind_one_hot = kinds[:, np.newaxis] == np.array(TASK_KINDS, dtype=object)[np.newaxis, :]
+        
+        has_deadline = np.array([t.deadline is not None for t in tasks])
+        urgency = np.array([
+            max(0, 14 - (t.deadline - time_index.start_dt).days) / 14.0 if t.deadline else 0.0
+            for t in tasks
+        ])
+        has_prereqs = np.array([bool(t.prerequisites) for t in tasks])
+        tag_one_hot = np.array(
+            [[tag in t.tags for tag in COMMON_TAGS] for t in tasks], dtype=bool
+        ).reshape(n_tasks, len(COMMON_TAGS))
+        
+        return np.column_stack([
+            duration / max_duration,
+            weight / max_weight,
+            min_block / max_duration,
+            max_block / max_duration,
+            kind_one_hot.reshape(n_tasks, len(TASK_KINDS)),
+            has_deadline,
+            urgency,
+            has_prereqs,
+            kinds == 'exam',
+            tag_one_hot
+        ]).astype(np.float64)
     
     def _extract_context_features(
         self,
         tasks: List[Task],
         time_index: TimeIndex,
+        slot_arrays: SlotArrays,
         prefs: Preferences,
         busy_events: List[BusyEvent]
     ) -> np.ndarray:
-        """Extract contextual features based on calendar and preferences."""
+        """Extract contextual features as (n_tasks, n_slots, 7)."""
         n_tasks = len(tasks)
         n_slots = len(time_index)
-        features = []
+        features = np.zeros((n_tasks, n_slots, len(CONTEXT_FEATURE_NAMES)))
         
-        # Get blocked slots
-        blocked_slots = time_index.filter_busy_slots(busy_events)
+        # Slot availability
+        features[:, :, 0] = time_index.busy_mask(busy_events)
         
+        # Preferred/avoided windows for each task
         for task_idx, task in enumerate(tasks):
-            for slot_idx in range(n_slots):
-                slot_features = []
-                slot_context = time_index.get_slot_context(slot_idx)
-                
-                # Slot availability
-                is_blocked = 1.0 if slot_idx in blocked_slots else 0.0
-                slot_features.append(is_blocked)
-                
-                # Preferred/avoided windows for this task
-                in_preferred = self._is_in_time_windows(
-                    slot_context['datetime'], task.preferred_windows
-                )
-                in_avoided = self._is_in_time_windows(
-                    slot_context['datetime'], task.avoid_windows
-                )
-                slot_features.extend([
-                    1.0 if in_preferred else 0.0,
-                    1.0 if in_avoided else 0.0
-                ])
-                
-                # Deep work window alignment
-                in_deep_work = self._is_in_time_windows(
-                    slot_context['datetime'], prefs.deep_work_windows
-                )
-                slot_features.append(1.0 if in_deep_work else 0.0)
-                
-                # No study windows
-                in_no_study = self._is_in_time_windows(
-                    slot_context['datetime'], prefs.no_study_windows
-                )
-                slot_features.append(1.0 if in_no_study else 0.0)
-                
-                # Break context (time since last break would be nice, but complex)
-                needs_break = self._estimate_break_need(slot_idx, prefs)
-                slot_features.append(needs_break)
-                
-                # Calendar density (events nearby)
-                nearby_density = self._calculate_calendar_density(
-                    slot_idx, time_index, busy_events
-                )
-                slot_features.append(nearby_density)
-                
-                features.append(slot_features)
+            features[task_idx, :, 1] = self._window_mask(task.preferred_windows, slot_arrays)
+            features[task_idx, :, 2] = self._window_mask(task.avoid_windows, slot_arrays)
         
-        # Feature names (only set once)
-        if 'is_blocked' not in self.feature_names:
-            context_names = [
-                'is_blocked', 'in_preferred', 'in_avoided', 'in_deep_work',
-                'in_no_study', 'needs_break', 'calendar_density'
-            ]
-            self.feature_names.extend(context_names)
+        # Deep work and no study windows
+        features[:, :, 3] = self._window_mask(prefs.deep_work_windows, slot_arrays)
+        features[:, :, 4] = self._window_mask(prefs.no_study_windows, slot_arrays)
         
-        return np.array(features)
+        # Break context (time since last break would be nice, but complex)
+        features[:, :, 5] = self._estimate_break_need(prefs)
+        
+        # Calendar density (events nearby)
+        features[:, :, 6] = self._calculate_calendar_density(slot_arrays, busy_events)
+        
+        return features
     
     def _extract_historical_features(
         self,
         tasks: List[Task],
-        time_index: TimeIndex,
-        prefs: Preferences,
+        slot_arrays: SlotArrays,
         history: List[CompletionEvent]
     ) -> np.ndarray:
-        """Extract features based on historical completion patterns."""
+        """Extract historical completion features as (n_tasks, n_slots, 4)."""
         n_tasks = len(tasks)
-        n_slots = len(time_index)
-        features = []
+        n_slots = len(slot_arrays.hour)
+        features = np.zeros((n_tasks, n_slots, len(HISTORICAL_FEATURE_NAMES)))
         
         # Build historical completion rate by hour/day patterns
         completion_stats = self._compute_completion_stats(history)
+        hour_rates = np.array([completion_stats.get(('hour', h), 0.5) for h in range(24)])
+        dow_rates = np.array([completion_stats.get(('dow', d), 0.5) for d in range(7)])
+        kind_rates = np.array([completion_stats.get(('kind', t.kind), 0.5) for t in tasks])
         
-        for task_idx, task in enumerate(tasks):
-            for slot_idx in range(n_slots):
-                slot_features = []
-                slot_context = time_index.get_slot_context(slot_idx)
-                
-                # Historical completion rate for this hour
-                hour = slot_context['hour']
-                dow = slot_context['day_of_week']
-                
-                hour_completion_rate = completion_stats.get(
-                    ('hour', hour), 0.5
-                )
-                dow_completion_rate = completion_stats.get(
-                    ('dow', dow), 0.5  
-                )
-                slot_features.extend([hour_completion_rate, dow_completion_rate])
-                
-                # Task kind completion rate
-                kind_completion_rate = completion_stats.get(
-                    ('kind', task.kind), 0.5
-                )
-                slot_features.append(kind_completion_rate)
-                
-                # Recent performance trend
-                recent_performance = self._get_recent_performance(
-                    history, slot_context['datetime'], days_back=7
-                )
-                slot_features.append(recent_performance)
-                
-                features.append(slot_features)
-        
-        # Feature names (only set once)
-        if 'hour_completion_rate' not in self.feature_names:
-            hist_names = [
-                'hour_completion_rate', 'dow_completion_rate',
-                'kind_completion_rate', 'recent_performance'
-            ]
-            self.feature_names.extend(hist_names)
+        features[:, :, 0] = hour_rates[slot_arrays.hour]
+        features[:, :, 1] = dow_rates[slot_arrays.dow]
+        features[:, :, 2] = kind_rates[:, np.newaxis]
+        features[:, :, 3] = self._get_recent_performance(history, slot_arrays, days_back=7)
         
-        return np.array(features)
+        return features
     
     def _parse_time_hour(self, time_str: str) -> float:
         """Parse 'HH:MM' time string to hour float."""
@@ -388,77 +301,70 @@ class FeatureExtractor:
         except:
             return 12.0  # Default to noon
     
-    def _is_in_time_windows(self, dt: datetime, windows: List[Dict]) -> bool:
-        """Check if datetime falls within any of the specified windows."""
+    def _window_mask(self, windows: List[Dict], slot_arrays: SlotArrays) -> np.ndarray:
+        """Boolean mask of slots falling within any of the specified windows."""
+        mask = np.zeros(len(slot_arrays.hour), dtype=bool)
         if not windows:
-            return False
-            
+            return mask
+        
         for window in windows:
-            if self._datetime_in_window(dt, window):
-                return True
-                
-        return False
+            window_mask = np.ones_like(mask)
+            
+            # Check day of week
+            dow = window.get('dow')
+            if dow is not None:
+                window_mask &= slot_arrays.dow == dow
+            
+            # Check time range (inclusive on both ends)
+            start_time = window.get('start')
+            end_time = window.get('end')
+            if start_time and end_time:
+                start = self._parse_minute_of_day(start_time)
+                end = self._parse_minute_of_day(end_time)
+                minute_of_day = slot_arrays.minute_of_day
+                if start <= end:
+                    window_mask &= (minute_of_day >= start) & (minute_of_day <= end)
+                else:
+                    # Overnight window
+                    window_mask &= (minute_of_day >= start) | (minute_of_day <= end)
+            
+            mask |= window_mask
+        
+        return mask
     
-    def _datetime_in_window(self, dt: datetime, window: Dict) -> bool:
-        """Check if datetime is within a single time window."""
-        dow = window.get('dow')
-        start_time = window.get('start')
-        end_time = window.get('end')
-        
-        # Check day of week
-        if dow is not None and dt.weekday() != dow:
-            return False
-            
-        # Check time range
-        if start_time and end_time:
-            dt_time = dt.time()
-            start = datetime.strptime(start_time, '%H:%M').time()
-            end = datetime.strptime(end_time, '%H:%M').time()
-            
-            if start <= end:
-                return start <= dt_time <= end
-            else:
-                # Overnight window
-                return dt_time >= start or dt_time <= end
-                
-        return True
+    def _parse_minute_of_day(self, time_str: str) -> int:
+        """Parse 'HH:MM' time string to minutes since midnight."""
+        parsed = datetime.strptime(time_str, '%H:%M')
+        return parsed.hour * 60 + parsed.minute
     
-    def _estimate_break_need(self, slot_idx: int, prefs: Preferences) -> float:
+    def _estimate_break_need(self, prefs: Preferences) -> float:
         """Estimate break need based on preferences (simplified)."""
         # This is a simplified version - in practice would track work streaks
         return 0.1  # Low break need by default
     
     def _calculate_calendar_density(
         self, 
-        slot_idx: int, 
-        time_index: TimeIndex, 
+        slot_arrays: SlotArrays, 
         busy_events: List[BusyEvent],
         window_hours: int = 2
-    ) -> float:
-        """Calculate density of calendar events around a slot."""
-        slot_dt = time_index.index_to_datetime(slot_idx)
-        if not slot_dt:
-            return 0.0
-            
-        window_start = slot_dt - timedelta(hours=window_hours)
-        window_end = slot_dt + timedelta(hours=window_hours)
-        
-        nearby_events = [
-            event for event in busy_events
-            if event.start < window_end and event.end > window_start
-        ]
-        
-        # Return proportion of window occupied by events
-        total_minutes = window_hours * 2 * 60
-        occupied_minutes = sum(
-            min(event.end, window_end) - max(event.start, window_start)
-            for event in nearby_events
-        )
+    ) -> np.ndarray:
+        """Proportion of the window around each slot occupied by calendar events."""
+        n_slots = len(slot_arrays.timestamps)
+        if not busy_events:
+            return np.zeros(n_slots)
         
-        if isinstance(occupied_minutes, timedelta):
-            occupied_minutes = occupied_minutes.total_seconds() / 60
-            
-        return min(1.0, occupied_minutes / total_minutes)
+        window_seconds = window_hours * 3600
+        window_start = slot_arrays.timestamps[:, np.newaxis] - window_seconds
+        window_end = slot_arrays.timestamps[:, np.newaxis] + window_seconds
+        
+        event_start = np.array([event.start.timestamp() for event in busy_events])[np.newaxis, :]
+        event_end = np.array([event.end.timestamp() for event in busy_events])[np.newaxis, :]
+        
+        # (n_slots, n_events) overlap in seconds, zero for events outside the window
+        overlap = np.minimum(event_end, window_end) - np.maximum(event_start, window_start)
+        occupied_seconds = np.clip(overlap, 0, None).sum(axis=1)
+        
+        return np.minimum(1.0, occupied_seconds / (2 * window_seconds))
     
     def _compute_completion_stats(self, history: List[CompletionEvent]) -> Dict:
         """Compute completion rate statistics from historical data."""
@@ -500,26 +406,31 @@ class FeatureExtractor:
     def _get_recent_performance(
         self, 
         history: List[CompletionEvent], 
-        reference_dt: datetime,
+        slot_arrays: SlotArrays,
         days_back: int = 7
-    ) -> float:
-        """Get recent completion performance trend."""
-        cutoff_dt = reference_dt - timedelta(days=days_back)
+    ) -> np.ndarray:
+        """Completion rate of events scheduled since days_back before each slot."""
+        n_slots = len(slot_arrays.timestamps)
+        if not history:
+            return np.full(n_slots, 0.5)  # Neutral
         
-        recent_events = [
-            event for event in history
-            if event.scheduled_slot >= cutoff_dt
-        ]
+        scheduled = np.array([event.scheduled_slot.timestamp() for event in history])
+        completed = np.array([event.completed_at is not None for event in history], dtype=np.float64)
         
-        if not recent_events:
-            return 0.5  # Neutral
-            
-        completions = [
-            1 if event.completed_at is not None else 0
-            for event in recent_events
-        ]
+        order = np.argsort(scheduled)
+        scheduled = scheduled[order]
+        # Suffix sums of completions so each cutoff is a single lookup
+        completed_suffix = np.concatenate([np.cumsum(completed[order][::-1])[::-1], [0.0]])
+        
+        cutoffs = slot_arrays.timestamps - days_back * 86400
+        first_recent = np.searchsorted(scheduled, cutoffs, side='left')
+        n_recent = len(scheduled) - first_recent
         
-        return np.mean(completions)
+        return np.where(
+            n_recent > 0,
+            completed_suffix[first_recent] / np.maximum(n_recent, 1),
+            0.5
+        )
 
 
 async def build_utilities(
@@ -528,8 +439,9 @@ async def build_utilities(
     time_index: TimeIndex,
     prefs: Preferences,
     events: List[BusyEvent],
-    history: List[CompletionEvent]
-) -> Tuple[Dict[str, Dict[int, float]], Dict[str, Any]]:
+    history: List[CompletionEvent],
+    inference_batcher=None
+) -> Tuple[UtilityMatrix, Dict[str, Any]]:
     """
     Build utility matrix and penalty context for optimization.
     
@@ -540,10 +452,12 @@ async def build_utilities(
         prefs: User preferences
         events: Calendar events
         history: Historical completion data
+        inference_batcher: Optional CompletionInferenceBatcher that evaluates
+            this prediction together with other users'
         
     Returns:
         (utility_matrix, penalty_context)
-        utility_matrix[task_id][slot_idx] = expected utility
+        utility_matrix.values[task_idx, slot_idx] = expected utility
     """
     # Extract features
     feature_extractor = FeatureExtractor()
@@ -551,30 +465,27 @@ async def build_utilities(
         tasks, time_index, prefs, events, history
     )
     
+    n_slots = len(time_index)
+    
     # Get completion probabilities from model
     try:
-        completion_probs = model.predict(features)
+        if inference_batcher is not None:
+            completion_probs = inference_batcher.predict(model, features)
+        else:
+            completion_probs = model.predict(features)
+        if inspect.isawaitable(completion_probs):
+            completion_probs = await completion_probs
+        completion_probs = np.asarray(completion_probs, dtype=np.float64).reshape(len(tasks), n_slots)
     except:
         # Fallback to uniform probabilities
-        completion_probs = np.full(features.shape[0], 0.7)
-    
-    # Build utility matrix
-    utility_matrix = {}
-    n_slots = len(time_index)
+        completion_probs = np.full((len(tasks), n_slots), 0.7)
     
-    for task_idx, task in enumerate(tasks):
-        task_utilities = {}
-        
-        for slot_idx in range(n_slots):
-            feature_idx = task_idx * n_slots + slot_idx
-            
-            # Base utility = completion_prob * task_weight * slot_duration
-            prob = completion_probs[feature_idx]
-            base_utility = prob * task.weight * time_index.granularity_minutes
-            
-            task_utilities[slot_idx] = base_utility
-            
-        utility_matrix[task.id] = task_utilities
+    # Base utility = completion_prob * task_weight * slot_duration
+    task_weights = np.array([task.weight for task in tasks], dtype=np.float64)
+    utility_matrix = UtilityMatrix(
+        [task.id for task in tasks],
+        completion_probs * task_weights[:, np.newaxis] * time_index.granularity_minutes
+    )
     
     # Penalty context for objective function
     penalty_context = {
@@ -582,6 +493,7 @@ async def build_utilities(
         'prefs': prefs,
         'tasks': {task.id: task for task in tasks},
         'busy_events': events,
+        'utilities': utility_matrix,
         'features': features,
         'feature_names': feature_names,
         'metadata': metadata
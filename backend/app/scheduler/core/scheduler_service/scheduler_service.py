@@ -5,26 +5,45 @@ Coordinates all components to provide the primary scheduling API used by
 LangGraph tools and FastAPI endpoints.
 """
 
+import hashlib
+import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+import time
+import uuid
+from contextlib import nullcontext
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import asdict
 
 from ..domain import Task, BusyEvent, Preferences, ScheduleSolution, ScheduleBlock
+from ..utility_matrix import UtilityMatrix
 from ...optimization.time_index import TimeIndex
+from ...optimization.time_index_cache import get_time_index_cache
 from ...learning.completion_model import CompletionModel
 from ...learning.bandits import WeightTuner
+from ...learning.model_registry import ModelRegistry
+from ...learning.batch_inference import get_inference_batcher
 from ...optimization.solver import SchedulerSolver
+from ...optimization.solver_pool import SolverPool, SolveProblem, get_solver_pool, solve_problem
+from ...optimization.warm_start import build_warm_start_hints
+from ...optimization.degradation import DegradationProfile
 from ...optimization.fallback import greedy_fill
-from ...io.dto import ScheduleRequest, ScheduleResponse
+from ...io.dto import ScheduleRequest, ScheduleResponse, ScheduleBlock as ScheduleBlockDto
 from ...io.repository import Repository
-from ...io.idempotency import check_and_put
-from ...monitoring.telemetry import trace_run, emit_metrics
+from ...io.idempotency import get_idempotency_manager
+from ...monitoring.telemetry import trace_run, emit_metrics, get_metrics
 from ....core.utils.timezone_utils import get_timezone_manager, TimezoneManager
-from ...scheduling.replanning import get_replanning_controller, ReplanScope
+from ...scheduling.replanning import (
+    get_replanning_controller, ReplanScope, ReplanConstraint, IncrementalPlan
+)
+from ...utils.determinism import get_deterministic_scheduler
 from ...scheduling.fallback import get_fallback_scheduler
+from ...scheduling.coalescer import RequestCoalescer
+from ...scheduling.streaming import SolutionStream
+from ...scheduling.explanations import get_explanation_store
 from ...performance import get_slo_gate, SLOViolationError
+from ..config import get_config
 
 # Enhanced observability imports
 from ...schemas.enhanced_results import (
@@ -35,6 +54,7 @@ from ...schemas.enhanced_results import (
 from ...explanation.schedule_explainer import ScheduleExplainer
 from ...explanation.constraint_analyzer import ConstraintAnalyzer
 from ...explanation.alternative_generator import AlternativeGenerator
+from ...explanation.alternative_engine import ParallelAlternativeEngine
 from ...diagnostics.quality_analyzer import QualityAnalyzer
 
 # Safety rails imports
@@ -42,6 +62,8 @@ from ...learning.safety_integration import (
     get_safety_manager, SystemSafetyManager, SafetyLevel,
     create_safe_bandit, create_safe_model
 )
+from ...learning.safe_models import SafeCompletionModel
+from ...learning.safety_rails import SafeGuardedBandit
 
 # Import modular components
 from .context_builder import ContextBuilder
@@ -51,6 +73,9 @@ from .health_monitor import HealthMonitor
 
 logger = logging.getLogger(__name__)
 
+# Request triggers that usually disturb only a small part of the schedule
+INCREMENTAL_TRIGGERS = {'calendar_change', 'missed_task'}
+
 
 class SchedulerService:
     """
@@ -67,7 +92,8 @@ class SchedulerService:
         tuner: Optional[WeightTuner] = None,
         solver: Optional[SchedulerSolver] = None,
         safety_level: SafetyLevel = SafetyLevel.STANDARD,
-        enable_safety_rails: bool = True
+        enable_safety_rails: bool = True,
+        solver_pool: Optional[SolverPool] = None
     ):
         """
         Initialize scheduler service.
@@ -79,6 +105,7 @@ class SchedulerService:
             solver: Constraint solver (auto-created if None)
             safety_level: Safety level for ML components
             enable_safety_rails: Whether to enable ML safety monitoring
+            solver_pool: Process pool for solves (global pool if enabled in config)
         """
         # Import here to avoid circular imports
         from ...io.repository import get_repository
@@ -86,6 +113,7 @@ class SchedulerService:
         self.repo = repo or get_repository()
         self.timezone_manager = get_timezone_manager()
         self.slo_gate = get_slo_gate()
+        self.idempotency = get_idempotency_manager()
 
         # Safety configuration
         self.enable_safety_rails = enable_safety_rails
@@ -110,14 +138,61 @@ class SchedulerService:
         self.quality_analyzer = QualityAnalyzer()
 
         # Initialize solver
+        solver_config = get_config().solver
         try:
-            self.solver = solver or SchedulerSolver()
+            self.solver = solver or SchedulerSolver.from_config(solver_config)
             self.solver_available = True
         except ImportError:
             logger.warning("OR-Tools not available, using fallback scheduler only")
             self.solver = None
             self.solver_available = False
 
+        # Solves run in worker processes so they never block the event loop;
+        # without a pool they run in a thread with a per-request solver
+        if solver_pool is None and solver_config.pool_enabled and self.solver_available:
+            solver_pool = get_solver_pool()
+        self.solver_pool = solver_pool
+
+        # What-if alternatives are real solves, run side by side in the pool
+        self.alternative_engine = ParallelAlternativeEngine(
+            self.alternative_generator, solver_pool,
+            time_budget_seconds=solver_config.alternatives_time_budget_seconds
+        )
+
+        # Enhanced observability is built per job when first fetched
+        self.explanation_store = get_explanation_store()
+
+        # Time indexes only depend on timezone, horizon and granularity, so
+        # they are shared across requests together with their slot artifacts
+        self.time_index_cache = get_time_index_cache() if get_config().cache.enabled else None
+
+        # Each user's models stay resident between requests; injected models
+        # are shared by all users and guarded by a lock instead
+        cache_config = get_config().cache
+        if cache_config.model_registry_enabled and model is None and tuner is None:
+            self.model_registry = ModelRegistry(
+                model_factory=self._create_user_model,
+                tuner_factory=self._create_user_tuner,
+                max_users=cache_config.model_registry_max_users,
+                memory_budget_mb=cache_config.model_registry_memory_mb,
+                revalidate_seconds=cache_config.model_registry_revalidate_seconds
+            )
+        else:
+            self.model_registry = None
+        self._model_lock = asyncio.Lock()
+
+        # Completion predictions of concurrently scheduled users (batch
+        # replans) are evaluated together without sklearn call overhead
+        self.inference_batcher = get_inference_batcher() if get_config().batch.batched_inference else None
+
+        self.replanning_controller = get_replanning_controller()
+
+        # Bursts of requests for one user collapse into the newest one
+        self.request_coalescer = (
+            RequestCoalescer(share=_mark_coalesced)
+            if get_config().solver.coalesce_user_requests else None
+        )
+
         # Initialize modular components
         self.context_builder = ContextBuilder()
         self.explanation_builder = ExplanationBuilder()
@@ -128,34 +203,55 @@ class SchedulerService:
         )
 
     @trace_run
-    async def schedule(self, request: ScheduleRequest, enhanced_observability: bool = True) -> ScheduleResponse:
+    async def schedule(
+        self,
+        request: ScheduleRequest,
+        enhanced_observability: bool = True,
+        inputs: Optional[Tuple[List[Task], List[BusyEvent], Preferences, List]] = None
+    ) -> ScheduleResponse:
         """
         Generate optimized schedule for user tasks.
 
+        Concurrent requests for the same user and parameters are coalesced:
+        while one is being solved, only the newest of the requests arriving
+        meanwhile is solved next, and all of them receive its response.
+
         Args:
             request: Scheduling request with parameters
-            enhanced_observability: Whether to include enhanced metrics
+            enhanced_observability: Whether to include enhanced metrics (by
+                default as an explanation handle, built when first fetched)
+            inputs: Preloaded (tasks, events, prefs, history), e.g. from a batch bulk load
 
         Returns:
             Schedule response with blocks and metadata
         """
+        if self.request_coalescer is None:
+            return await self._schedule(request, enhanced_observability, inputs)
+
+        key = _coalescing_key(request, enhanced_observability)
+        return await self.request_coalescer.submit(
+            key, lambda: self._schedule(request, enhanced_observability, inputs)
+        )
+
+    async def _schedule(
+        self,
+        request: ScheduleRequest,
+        enhanced_observability: bool,
+        inputs: Optional[Tuple[List[Task], List[BusyEvent], Preferences, List]]
+    ) -> ScheduleResponse:
+        """Schedule one request (see schedule)."""
         slo_context = None
         try:
             # 0. SLO gate check and coarsening setup
             slo_context = await self.slo_gate.check_slo_before_request(request)
             coarsening_params = slo_context.get('coarsening_params', {})
 
-            # 1. Idempotency check
-            if not request.dry_run:
-                is_duplicate, cached_response = await check_and_put(request)
-                if is_duplicate and cached_response:
-                    logger.info(f"Returning cached schedule for user {request.user_id}")
-                    return cached_response
-
-            # 2. Load input data
-            tasks, events, prefs, history = await self._load_inputs(request)
+            # 1. Load input data
+            if inputs is None:
+                inputs = await self._load_inputs(request)
 
-            if not tasks:
+            if not inputs[0]:
+                self.slo_gate.release_request(slo_context['request_id'])
                 return ScheduleResponse(
                     job_id=request.job_id,
                     feasible=True,
@@ -164,57 +260,24 @@ class SchedulerService:
                     explanations={}
                 )
 
-            # 3. Prepare time grid (with potential coarsening)
-            time_index = await self._prepare_time_index(request, prefs, coarsening_params)
-
-            # 4. Load/prepare ML models with safety checks
-            await self._prepare_models_safely(request.user_id)
-
-            # 5. Build utilities and context with safety monitoring
-            util_matrix, penalty_context = await self._build_utilities_safely(
-                tasks, time_index, prefs, events, history
-            )
-
-            # 6. Get penalty weights from bandit with safety checks
-            context = self.context_builder.build_bandit_context(
-                request.user_id, request.horizon_days, prefs, time_index
-            )
-            weights = await self._suggest_weights_safely(context)
-
-            # 7. Attempt optimization (with potential coarsening)
-            solution = await self._solve_optimization(
-                tasks, events, prefs, time_index, util_matrix, penalty_context, weights, coarsening_params
+            # 2. Idempotency: requests with identical inputs are solved once,
+            # and concurrent duplicates wait for that solve
+            response = await self.idempotency.run_once(
+                request,
+                lambda: self._schedule_with_inputs(
+                    request, inputs, coarsening_params, enhanced_observability, slo_context
+                ),
+                inputs=inputs,
+                context={
+                    'coarsening': coarsening_params,
+                    'enhanced_observability': enhanced_observability
+                }
             )
-
-            # 8. Fallback if needed
-            if not solution.feasible and self.solver_available:
-                logger.warning("Optimization failed, trying fallback")
-                solution = await self._solve_fallback(
-                    tasks, events, prefs, time_index, util_matrix
-                )
-
-            # 9. Persist results
-            if not request.dry_run and solution.feasible:
-                await self._persist_results(request, solution, weights, penalty_context)
-
-            # 10. Prepare response (with enhanced observability if requested)
-            if enhanced_observability:
-                enhanced_solution = await self._build_enhanced_solution(
-                    request, solution, tasks, events, prefs, weights, penalty_context
-                )
-                response = await self._build_enhanced_response(request, enhanced_solution)
-            else:
-                response = await self._build_response(request, solution, weights, penalty_context)
-
-            # 11. Record SLO metrics
-            if slo_context:
-                await self.slo_gate.record_request_completion(
-                    slo_context['request_id'], solution, request
-                )
-
-            # 12. Emit telemetry
-            await self._emit_telemetry(request, solution, weights)
-
+            # Cached and coalesced responses did no work of their own
+            self.slo_gate.release_request(slo_context['request_id'])
+            # Without Redis, a response cached by another worker points at its own
+            # explanation store
+            self.explanation_store.drop_unknown_handle(response.metrics, request.user_id)
             return response
 
         except SLOViolationError as e:
@@ -251,6 +314,78 @@ class SchedulerService:
                 explanations={'error': f"Scheduling failed: {str(e)}"}
             )
 
+    async def _schedule_with_inputs(
+        self,
+        request: ScheduleRequest,
+        inputs: Tuple[List[Task], List[BusyEvent], Preferences, List],
+        coarsening_params: Dict[str, Any],
+        enhanced_observability: bool,
+        slo_context: Dict[str, Any]
+    ) -> ScheduleResponse:
+        """Solve, persist and build the response for loaded inputs."""
+        tasks, events, prefs, history = inputs
+
+        # 3. Prepare time grid (with potential coarsening)
+        time_index = await self._prepare_time_index(request, prefs, coarsening_params)
+
+        # 3b. Calendar-change and missed-task replans only re-solve the disrupted window
+        previous_blocks = await self._load_previous_blocks(request.user_id)
+        plan = self._plan_incremental_replan(
+            request, previous_blocks, tasks, events, prefs, time_index
+        )
+
+        if plan is None:
+            solution, weights, penalty_context = await self._optimize(
+                request, tasks, events, prefs, history, time_index,
+                coarsening_params, previous_blocks
+            )
+        else:
+            solution, weights, penalty_context = await self._solve_incremental(
+                request, plan, tasks, events, prefs, history, time_index,
+                coarsening_params, previous_blocks
+            )
+
+        # Stability relative to the schedule being replaced
+        if previous_blocks:
+            upcoming = [
+                block for block in previous_blocks
+                if block.end > time_index.start_dt and block.start < time_index.end_dt
+            ]
+            solution.diagnostics['stability'] = (
+                get_deterministic_scheduler().calculate_stability_metrics(solution, upcoming)
+            )
+
+        # 9. Persist results
+        if not request.dry_run and solution.feasible:
+            await self._persist_results(request, solution, weights, penalty_context)
+
+        # 10. Prepare response; enhanced observability is built up front only
+        # when explanations are not lazy, otherwise the response carries a handle
+        if enhanced_observability and not get_config().telemetry.lazy_explanations:
+            enhanced_solution = await self._build_enhanced_solution(
+                request, solution, tasks, events, prefs, weights, penalty_context,
+                coarsening_params
+            )
+            response = await self._build_enhanced_response(request, enhanced_solution)
+        else:
+            response = await self._build_response(request, solution, weights, penalty_context)
+            if enhanced_observability:
+                self._register_explanation(
+                    request, response, solution, tasks, events, prefs, weights,
+                    penalty_context, coarsening_params
+                )
+
+        # 11. Record SLO metrics
+        if slo_context:
+            await self.slo_gate.record_request_completion(
+                slo_context['request_id'], solution, request
+            )
+
+        # 12. Emit telemetry
+        await self._emit_telemetry(request, solution, weights)
+
+        return response
+
     async def _load_inputs(
         self, request: ScheduleRequest
     ) -> tuple[List[Task], List[BusyEvent], Preferences, List]:
@@ -299,19 +434,253 @@ class SchedulerService:
             granularity_minutes = coarsening_params['force_granularity_minutes']
             logger.info(f"Coarsening: Increased granularity from {prefs.session_granularity_minutes} to {granularity_minutes} minutes")
 
-        time_index = TimeIndex(
-            timezone=prefs.timezone,
-            start_dt=start_dt,
-            end_dt=end_dt,
-            granularity_minutes=granularity_minutes
-        )
+        if self.time_index_cache is not None:
+            time_index = self.time_index_cache.get(
+                prefs.timezone, start_dt, end_dt, granularity_minutes
+            )
+        else:
+            time_index = TimeIndex(
+                timezone=prefs.timezone,
+                start_dt=start_dt,
+                end_dt=end_dt,
+                granularity_minutes=granularity_minutes
+            )
 
         logger.debug(f"Time index: {len(time_index)} slots over {time_index.horizon_days} days")
 
         return time_index
 
-    async def _prepare_models(self, user_id: str):
-        """Load or initialize ML models for the user."""
+    async def _optimize(
+        self,
+        request: ScheduleRequest,
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        history: List,
+        time_index: TimeIndex,
+        coarsening_params: Dict[str, Any],
+        previous_blocks: List[ScheduleBlock],
+        stream: Optional[SolutionStream] = None,
+        frozen_minutes: Optional[Dict[Any, int]] = None
+    ) -> Tuple[ScheduleSolution, Dict[str, float], Dict[str, Any]]:
+        """
+        Build utilities and weights for a problem and solve it, falling back to greedy.
+
+        frozen_minutes holds the per-date work an incremental replan keeps
+        outside the problem, charged to the daily effort caps.
+        """
+        # Shared models hold one user's state at a time, so concurrent requests
+        # take turns with them; registry models are per user. Solves overlap
+        model_guard = self._model_lock if self.model_registry is None else nullcontext()
+        async with model_guard:
+            # 4. Load/prepare ML models with safety checks
+            model, tuner = await self._prepare_models_safely(request.user_id)
+
+            # 5. Build utilities and context with safety monitoring; under load
+            # shedding completion prediction is skipped, not computed and discarded
+            if DegradationProfile.from_coarsening(coarsening_params).completion_prediction:
+                util_matrix, penalty_context = await self._build_utilities_safely(
+                    model, tasks, time_index, prefs, events, history
+                )
+            else:
+                logger.info("Coarsening: Using simplified utilities instead of ML features")
+                util_matrix, penalty_context = self._build_simple_utilities_with_context(
+                    tasks, time_index
+                )
+
+            # 6. Get penalty weights from bandit with safety checks
+            context = self.context_builder.build_bandit_context(
+                request.user_id, request.horizon_days, prefs, time_index
+            )
+            weights = await self._suggest_weights_safely(tuner, context)
+
+        # Streaming clients get the greedy schedule before the search starts
+        if stream is not None:
+            stream.weights, stream.penalty_context = weights, penalty_context
+            greedy = await self._solve_fallback(tasks, events, prefs, time_index, util_matrix)
+            if greedy.feasible:
+                stream.publish(greedy, source="greedy")
+
+        # 7. Attempt optimization (with potential coarsening), warm-started from the last schedule
+        hints = self._build_warm_start_hints(
+            request.user_id, previous_blocks, tasks, events, time_index
+        )
+        solution = await self._solve_optimization(
+            tasks, events, prefs, time_index, util_matrix, weights,
+            coarsening_params, hints, on_solution=stream.publish if stream is not None else None,
+            frozen_minutes=frozen_minutes
+        )
+
+        # 8. Fallback if needed
+        if not solution.feasible and self.solver_available:
+            logger.warning("Optimization failed, trying fallback")
+            solution = await self._solve_fallback(
+                tasks, events, prefs, time_index, util_matrix
+            )
+
+        return solution, weights, penalty_context
+
+    async def _solve_incremental(
+        self,
+        request: ScheduleRequest,
+        plan: IncrementalPlan,
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        history: List,
+        time_index: TimeIndex,
+        coarsening_params: Dict[str, Any],
+        previous_blocks: List[ScheduleBlock]
+    ) -> Tuple[ScheduleSolution, Dict[str, float], Dict[str, Any]]:
+        """Re-solve the disrupted window, or the full horizon when the window cannot place all work."""
+        if plan.tasks:
+            solution, weights, penalty_context = await self._optimize(
+                request, plan.tasks, plan.busy_events, prefs, history, plan.time_index,
+                coarsening_params, previous_blocks, frozen_minutes=plan.frozen_minutes
+            )
+        else:
+            solution = ScheduleSolution(feasible=True, blocks=[], solver_status="unchanged")
+            weights, penalty_context = {}, {}
+
+        if solution.feasible and not solution.unscheduled_tasks:
+            solution = self.replanning_controller.merge_incremental_solution(plan, solution)
+            penalty_context['tasks'] = {task.id: task for task in tasks}
+            return solution, weights, penalty_context
+
+        # The window was too tight (or greedy filled it); the full horizon may still place everything
+        reason = "infeasible" if not solution.feasible else "unscheduled_tasks"
+        logger.info(f"Incremental replan left work unplaced ({reason}), solving full horizon")
+        get_metrics().counter("scheduler.incremental_replan.full_fallback")
+        solution, weights, penalty_context = await self._optimize(
+            request, tasks, events, prefs, history, time_index,
+            coarsening_params, previous_blocks
+        )
+        solution.diagnostics['incremental_fallback'] = {**plan.get_stats(), 'reason': reason}
+        return solution, weights, penalty_context
+
+    async def _load_previous_blocks(self, user_id: str) -> List[ScheduleBlock]:
+        """Load the blocks of the user's latest persisted run (recent and upcoming)."""
+        solver_config = get_config().solver
+        if not (solver_config.warm_start_enabled or solver_config.incremental_replan_enabled):
+            return []
+
+        try:
+            # Superseded runs must not leak in as frozen blocks or conflicting hints
+            return await self.repo.get_latest_schedule(
+                user_id, days_back=solver_config.warm_start_days_back
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load previous schedule for user {user_id}: {e}")
+            return []
+
+    def _plan_incremental_replan(
+        self,
+        request: ScheduleRequest,
+        previous_blocks: List[ScheduleBlock],
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        time_index: TimeIndex
+    ) -> Optional[IncrementalPlan]:
+        """Reduce the request to its disrupted window when it is an incremental replan."""
+        if not get_config().solver.incremental_replan_enabled or not previous_blocks:
+            return None
+
+        options = request.options or {}
+        if not (options.get('incremental') or options.get('trigger') in INCREMENTAL_TRIGGERS):
+            return None
+
+        try:
+            disrupted_window = None
+            if options.get('disrupted_start') and options.get('disrupted_end'):
+                disrupted_window = (
+                    self.timezone_manager.ensure_timezone_aware(
+                        datetime.fromisoformat(options['disrupted_start']), time_index.timezone
+                    ),
+                    self.timezone_manager.ensure_timezone_aware(
+                        datetime.fromisoformat(options['disrupted_end']), time_index.timezone
+                    )
+                )
+
+            custom_constraints = None
+            if request.replan_constraints:
+                dto = request.replan_constraints
+                custom_constraints = ReplanConstraint(
+                    protected_task_ids=set(dto.protected_task_ids or []),
+                    max_blocks_to_move=dto.max_blocks_to_move,
+                    max_move_distance_hours=dto.max_move_distance_hours,
+                    min_stability_ratio=dto.min_stability_ratio or 0.0
+                )
+
+            plan = self.replanning_controller.plan_incremental_replan(
+                previous_blocks, tasks, events, prefs, time_index,
+                scope=ReplanScope(request.replan_scope.value),
+                custom_constraints=custom_constraints,
+                disrupted_window=disrupted_window
+            )
+        except Exception as e:
+            logger.warning(f"Incremental replan planning failed, solving full horizon: {e}")
+            return None
+
+        if plan is not None:
+            metrics = get_metrics()
+            metrics.counter("scheduler.incremental_replan")
+            metrics.histogram("scheduler.incremental_replan.window_slots", len(plan.time_index))
+            metrics.histogram("scheduler.incremental_replan.tasks_resolved", len(plan.tasks))
+        return plan
+
+    def _build_warm_start_hints(
+        self,
+        user_id: str,
+        previous_blocks: List[ScheduleBlock],
+        tasks: List[Task],
+        events: List[BusyEvent],
+        time_index: TimeIndex
+    ) -> Optional[Dict[str, Any]]:
+        """Map the user's most recent persisted schedule onto the new time grid."""
+        if not get_config().solver.warm_start_enabled or not previous_blocks:
+            return None
+
+        try:
+
+            hints = build_warm_start_hints(previous_blocks, tasks, time_index, events)
+
+            metrics = get_metrics()
+            metrics.histogram("scheduler.warm_start.hints_kept", hints['kept'])
+            metrics.histogram("scheduler.warm_start.hints_dropped", hints['dropped'])
+
+            logger.debug(
+                f"Warm start for user {user_id}: kept {hints['kept']} blocks, "
+                f"dropped {hints['dropped']}"
+            )
+            return hints
+
+        except Exception as e:
+            logger.warning(f"Failed to build warm-start hints for user {user_id}: {e}")
+            return None
+
+    def _create_user_model(self) -> CompletionModel:
+        """Empty completion model for one user, monitored like the shared model."""
+        if self.enable_safety_rails:
+            return SafeCompletionModel(
+                safety_monitor=self.model.safety_monitor, store=self.model.store
+            )
+        return CompletionModel(store=self.model.store)
+
+    def _create_user_tuner(self) -> WeightTuner:
+        """Empty weight tuner for one user, monitored like the shared tuner."""
+        if self.enable_safety_rails:
+            return SafeGuardedBandit(
+                safety_monitor=self.tuner.safety_monitor, store=self.tuner.store
+            )
+        return WeightTuner(store=self.tuner.store)
+
+    async def _prepare_models(self, user_id: str) -> Tuple[CompletionModel, WeightTuner]:
+        """Get the user's ML models, loading them if they are not resident."""
+        if self.model_registry is not None:
+            user_models = await self.model_registry.get(user_id)
+            return user_models.model, user_models.tuner
+
         # Load completion model
         model_loaded = await self.model.load(user_id)
         if not model_loaded:
@@ -322,18 +691,22 @@ class SchedulerService:
         if not bandit_loaded:
             logger.info(f"No bandit state found for user {user_id}, using defaults")
 
+        return self.model, self.tuner
+
     async def _solve_optimization(
         self,
         tasks: List[Task],
         events: List[BusyEvent],
         prefs: Preferences,
         time_index: TimeIndex,
-        util_matrix: Dict[str, Dict[int, float]],
-        penalty_context: Dict[str, Any],
+        util_matrix: UtilityMatrix,
         weights: Dict[str, float],
-        coarsening_params: Dict[str, Any] = None
+        coarsening_params: Dict[str, Any] = None,
+        hints: Optional[Dict[str, Any]] = None,
+        on_solution: Optional[Callable[[ScheduleSolution], None]] = None,
+        frozen_minutes: Optional[Dict[Any, int]] = None
     ) -> ScheduleSolution:
-        """Attempt constraint optimization solve."""
+        """Attempt constraint optimization solve, reporting improving solutions to on_solution."""
         coarsening_params = coarsening_params or {}
 
         if not self.solver_available:
@@ -341,31 +714,36 @@ class SchedulerService:
             return ScheduleSolution(feasible=False, blocks=[], solver_status="no_solver")
 
         try:
-            # Apply coarsening to solver settings
+            # Apply coarsening to this request's solver settings only
+            solver_options = self.solver.get_options()
             if 'max_solve_time_seconds' in coarsening_params:
-                original_time_limit = self.solver.time_limit_seconds
-                self.solver.time_limit_seconds = coarsening_params['max_solve_time_seconds']
-                logger.info(f"Coarsening: Reduced solver time limit from {original_time_limit} to {self.solver.time_limit_seconds} seconds")
-
-            # Simplify features if coarsening is applied
-            if coarsening_params.get('disable_ml_features', False):
-                # Use simplified utility matrix instead of ML-based one
-                util_matrix = self.utility_calculator.build_simple_utilities(tasks, time_index)
-                logger.info("Coarsening: Using simplified utilities instead of ML features")
+                solver_options['time_limit_seconds'] = coarsening_params['max_solve_time_seconds']
+                logger.info(
+                    f"Coarsening: Reduced solver time limit from {self.solver.time_limit_seconds} "
+                    f"to {solver_options['time_limit_seconds']} seconds"
+                )
 
-            # Build learned parameters
+            # Build learned parameters; the solver drops the variable families
+            # that coarsening disables. Only keys the solver reads belong here:
+            # the whole problem is pickled to the solver pool on every solve.
             learned = {
                 'util': util_matrix,
                 'weights': weights,
-                'ctx': penalty_context,
                 'coarsening': coarsening_params
             }
+            if frozen_minutes:
+                learned['frozen_minutes'] = frozen_minutes
 
-            # Build model
-            model = self.solver.build(tasks, events, prefs, time_index, learned)
+            problem = SolveProblem.from_time_index(
+                tasks, events, prefs, time_index, learned,
+                solver_options=solver_options, hints=hints
+            )
 
-            # Solve
-            solution = self.solver.solve(model)
+            # Build and solve off the event loop
+            if self.solver_pool is not None:
+                solution = await self.solver_pool.solve(problem, on_solution=on_solution)
+            else:
+                solution = await asyncio.to_thread(solve_problem, problem, None, on_solution)
 
             logger.info(
                 f"Optimization completed: feasible={solution.feasible}, "
@@ -391,7 +769,7 @@ class SchedulerService:
         events: List[BusyEvent],
         prefs: Preferences,
         time_index: TimeIndex,
-        util_matrix: Dict[str, Dict[int, float]]
+        util_matrix: UtilityMatrix
     ) -> ScheduleSolution:
         """Use fallback greedy solver."""
         try:
@@ -452,14 +830,15 @@ class SchedulerService:
         """Build final response object."""
         # Convert schedule blocks to DTO format
         response_blocks = []
+        tasks_by_id = penalty_context.get('tasks', {})
         for block in solution.blocks:
             # Ensure timezone-aware block times for consistent API responses
             start_aware = self.timezone_manager.ensure_timezone_aware(block.start)
             end_aware = self.timezone_manager.ensure_timezone_aware(block.end)
 
-            response_blocks.append(ScheduleBlock(
+            response_blocks.append(ScheduleBlockDto(
                 task_id=block.task_id,
-                title=penalty_context.get('tasks', {}).get(block.task_id, {}).get('title', 'Unknown'),
+                title=getattr(tasks_by_id.get(block.task_id), 'title', None) or 'Unknown',
                 start=start_aware.isoformat(),
                 end=end_aware.isoformat(),
                 provider="pulse",
@@ -550,13 +929,18 @@ class SchedulerService:
             context = schedule_outcome.get('context', {})
             weights = schedule_outcome.get('weights', {})
 
-            # Update bandit
+            model, tuner = await self._prepare_models(user_id)
+
+            # Update bandit; resident models are written back in the background
             if context and weights:
-                self.tuner.update(context, weights, reward)
-                await self.tuner.save(user_id)
+                tuner.update(context, weights, reward)
+                if self.model_registry is not None:
+                    self.model_registry.mark_dirty(user_id)
+                else:
+                    await tuner.save(user_id)
 
             # Update completion model if we have completion data
-            await post_run_update(self.tuner, self.model, user_id, schedule_outcome)
+            await post_run_update(tuner, model, user_id, schedule_outcome)
 
             logger.info(f"Updated learning models for user {user_id}, reward={reward:.3f}")
 
@@ -585,6 +969,89 @@ class SchedulerService:
 
         return await self.schedule(preview_request)
 
+    async def schedule_stream(
+        self, request: ScheduleRequest
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Anytime schedule preview.
+
+        Yields a schedule as soon as one exists (the greedy result), then
+        each improved solution the solver finds, and finally the finished
+        solve. Nothing is persisted. Stopping iteration cancels the solve.
+
+        Args:
+            request: Schedule request (run as a dry run)
+
+        Yields:
+            Updates with 'event' ("solution" or "final"), 'sequence',
+            'source' ("greedy", "cp_sat" or "final") and 'response'
+        """
+        preview_request = request.model_copy(update={'dry_run': True})
+        slo_context = await self.slo_gate.check_slo_before_request(preview_request)
+        coarsening_params = slo_context.get('coarsening_params', {})
+
+        solving = None
+        try:
+            tasks, events, prefs, history = await self._load_inputs(preview_request)
+            if not tasks:
+                self.slo_gate.release_request(slo_context['request_id'])
+                yield {
+                    'event': 'final', 'sequence': 0, 'source': 'final',
+                    'response': ScheduleResponse(
+                        job_id=request.job_id, feasible=True, blocks=[],
+                        metrics={'message': 'No tasks to schedule'}, explanations={}
+                    )
+                }
+                return
+
+            time_index = await self._prepare_time_index(preview_request, prefs, coarsening_params)
+            previous_blocks = await self._load_previous_blocks(request.user_id)
+
+            stream = SolutionStream()
+
+            async def solve():
+                try:
+                    return await self._optimize(
+                        preview_request, tasks, events, prefs, history, time_index,
+                        coarsening_params, previous_blocks, stream=stream
+                    )
+                finally:
+                    stream.close()
+
+            solving = asyncio.ensure_future(solve())
+            started = time.perf_counter()
+            sequence = 0
+
+            async for source, solution in stream:
+                if sequence == 0:
+                    get_metrics().histogram(
+                        "scheduler.stream.first_solution_ms", (time.perf_counter() - started) * 1000
+                    )
+                response = await self._build_response(
+                    preview_request, solution, stream.weights, stream.penalty_context
+                )
+                yield {'event': 'solution', 'sequence': sequence, 'source': source, 'response': response}
+                sequence += 1
+
+            solution, weights, penalty_context = await solving
+            response = await self._build_response(preview_request, solution, weights, penalty_context)
+            await self.slo_gate.record_request_completion(
+                slo_context['request_id'], solution, preview_request
+            )
+            get_metrics().histogram("scheduler.stream.updates", sequence)
+            yield {'event': 'final', 'sequence': sequence, 'source': 'final', 'response': response}
+
+        except Exception as e:
+            await self.slo_gate.record_request_completion(
+                slo_context['request_id'], None, preview_request, e
+            )
+            raise
+        finally:
+            # The client went away: stop the search it was waiting for
+            if solving is not None and not solving.done():
+                solving.cancel()
+                self.slo_gate.release_request(slo_context['request_id'])
+
     async def reschedule_missed_tasks(
         self, user_id: str, horizon_days: int = 3
     ) -> ScheduleResponse:
@@ -619,35 +1086,59 @@ class SchedulerService:
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get health status of scheduler components."""
-        return self.health_monitor.get_health_status(
+        status = self.health_monitor.get_health_status(
             model=self.model,
             tuner=self.tuner,
             safety_manager=self.safety_manager,
             slo_gate=self.slo_gate
         )
+        if self.solver_pool is not None:
+            status['solver_pool'] = self.solver_pool.get_stats()
+        if self.time_index_cache is not None:
+            status['time_index_cache'] = self.time_index_cache.get_stats()
+        if self.model_registry is not None:
+            status['model_registry'] = self.model_registry.get_stats()
+        if self.request_coalescer is not None:
+            status['request_coalescer'] = self.request_coalescer.get_stats()
+        status['explanation_store'] = self.explanation_store.get_stats()
+        return status
+
+    async def get_explanation(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Enhanced observability for a scheduled job, built on first fetch.
+
+        Args:
+            job_id: Job id from the schedule response's explanation handle
+            user_id: User the job was scheduled for
 
-    async def _prepare_models_safely(self, user_id: str):
-        """Load ML models with safety monitoring."""
+        Returns:
+            Explanation result, or None if the job is unknown or expired
+        """
+        return await self.explanation_store.get(job_id, user_id)
+
+    async def _prepare_models_safely(self, user_id: str) -> Tuple[CompletionModel, WeightTuner]:
+        """Load ML models with safety monitoring; unloaded defaults when ML is blocked."""
         if not self.enable_safety_rails:
             return await self._prepare_models(user_id)
 
         # Check if ML should be used
         if not self.safety_manager.should_use_ml("completion_model", "loading"):
             logger.info("Safety manager preventing ML model loading")
-            return
+            return self.model, self.tuner
 
         # Start ML operation tracking
         operation_id = await self.safety_manager.start_ml_operation("completion_model", "loading")
         if not operation_id:
             logger.info("ML operation rejected by safety manager")
-            return
+            return self.model, self.tuner
 
         try:
             start_time = datetime.now()
-            await self._prepare_models(user_id)
+            models = await self._prepare_models(user_id)
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
 
             await self.safety_manager.finish_ml_operation(operation_id, duration_ms, success=True)
+            return models
 
         except Exception as e:
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -656,33 +1147,34 @@ class SchedulerService:
 
     async def _build_utilities_safely(
         self,
+        model: CompletionModel,
         tasks: List[Task],
         time_index: TimeIndex,
         prefs: Preferences,
         events: List[BusyEvent],
         history: List
-    ) -> Tuple[Dict[str, Dict[int, float]], Dict[str, Any]]:
+    ) -> Tuple[UtilityMatrix, Dict[str, Any]]:
         """Build utilities with safety monitoring."""
         if not self.enable_safety_rails:
             return await self.utility_calculator.build_utilities_with_ml(
-                self.model, tasks, time_index, prefs, events, history
+                model, tasks, time_index, prefs, events, history, self.inference_batcher
             )
 
         # Check if ML should be used
         if not self.safety_manager.should_use_ml("completion_model", "prediction"):
             logger.info("Using simplified utilities due to safety constraints")
-            return self.utility_calculator.build_simple_utilities(tasks, time_index), {}
+            return self._build_simple_utilities_with_context(tasks, time_index)
 
         # Start ML operation tracking
         operation_id = await self.safety_manager.start_ml_operation("completion_model", "batch_prediction")
         if not operation_id:
             logger.info("ML operation rejected, using simplified utilities")
-            return self.utility_calculator.build_simple_utilities(tasks, time_index), {}
+            return self._build_simple_utilities_with_context(tasks, time_index)
 
         try:
             start_time = datetime.now()
             util_matrix, penalty_context = await self.utility_calculator.build_utilities_with_ml(
-                self.model, tasks, time_index, prefs, events, history
+                model, tasks, time_index, prefs, events, history, self.inference_batcher
             )
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -695,12 +1187,21 @@ class SchedulerService:
             await self.safety_manager.finish_ml_operation(operation_id, duration_ms, success=False)
 
             # Return simplified utilities as fallback
-            return self.utility_calculator.build_simple_utilities(tasks, time_index), {}
-
-    async def _suggest_weights_safely(self, context: Dict[str, Any]) -> Dict[str, float]:
+            return self._build_simple_utilities_with_context(tasks, time_index)
+
+    def _build_simple_utilities_with_context(
+        self, tasks: List[Task], time_index: TimeIndex
+    ) -> Tuple[UtilityMatrix, Dict[str, Any]]:
+        """Rule-based utilities, exposed to the explainers through the penalty context."""
+        util_matrix = self.utility_calculator.build_simple_utilities(tasks, time_index)
+        return util_matrix, {'utilities': util_matrix, 'time_index': time_index}
+
+    async def _suggest_weights_safely(
+        self, tuner: WeightTuner, context: Dict[str, Any]
+    ) -> Dict[str, float]:
         """Get bandit weight suggestions with safety monitoring."""
         if not self.enable_safety_rails:
-            return self.tuner.suggest_weights(context)
+            return tuner.suggest_weights(context)
 
         # Check if ML should be used
         if not self.safety_manager.should_use_ml("bandit", "suggestion"):
@@ -715,7 +1216,7 @@ class SchedulerService:
 
         try:
             start_time = datetime.now()
-            weights = self.tuner.suggest_weights(context)
+            weights = tuner.suggest_weights(context)
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
 
             await self.safety_manager.finish_ml_operation(operation_id, duration_ms, success=True)
@@ -748,7 +1249,8 @@ class SchedulerService:
         events: List[BusyEvent],
         prefs: Preferences,
         weights: Dict[str, float],
-        penalty_context: Dict[str, Any]
+        penalty_context: Dict[str, Any],
+        coarsening_params: Optional[Dict[str, Any]] = None
     ) -> EnhancedScheduleSolution:
         """Build enhanced solution with comprehensive observability."""
         # Generate detailed explanations
@@ -766,12 +1268,17 @@ class SchedulerService:
             solution.blocks, request, solution.unscheduled_tasks, events, prefs, constraint_analysis
         )
 
-        # Generate alternative solutions
+        # Generate alternative solutions; under load shedding the extra
+        # solves are skipped
         alternatives = []
-        if solution.feasible:
-            alternatives = self.alternative_generator.generate_alternatives(
-                solution, request, events, prefs, max_alternatives=2
-            )
+        if solution.feasible and self.solver_available and not coarsening_params:
+            try:
+                alternatives = await self.alternative_engine.generate_alternatives(
+                    solution, request, tasks, events, prefs, weights, penalty_context,
+                    self.solver.get_options(), max_alternatives=2
+                )
+            except Exception as e:
+                logger.warning(f"Failed to generate alternatives: {e}")
 
         # Build performance summary
         performance_summary = PerformanceSummary(
@@ -850,6 +1357,72 @@ class SchedulerService:
 
         return enhanced_solution
 
+    def _register_explanation(
+        self,
+        request: ScheduleRequest,
+        response: ScheduleResponse,
+        solution: ScheduleSolution,
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        weights: Dict[str, float],
+        penalty_context: Dict[str, Any],
+        coarsening_params: Dict[str, Any]
+    ):
+        """Defer enhanced observability to the explanation store and hand out its handle."""
+        response.job_id = response.job_id or str(uuid.uuid4())
+
+        async def build() -> Dict[str, Any]:
+            enhanced_solution = await self._build_enhanced_solution(
+                request, solution, tasks, events, prefs, weights, penalty_context,
+                coarsening_params
+            )
+            return self._build_explanation_payload(enhanced_solution)
+
+        self.explanation_store.register(
+            response.job_id, request.user_id, build,
+            precompute=get_config().telemetry.precompute_explanations
+        )
+        response.metrics['explanation_handle'] = {
+            'job_id': response.job_id,
+            'path': f"/schedule/explanations/{response.job_id}"
+        }
+
+    def _build_explanation_payload(self, enhanced_solution: EnhancedScheduleSolution) -> Dict[str, Any]:
+        """Serializable enhanced observability served through the explanation handle."""
+        explanations = enhanced_solution.explanations
+        return {
+            "quality_summary": enhanced_solution.get_quality_summary(),
+            "explanation_summary": enhanced_solution.get_explanation_summary(),
+            "constraint_violations": len(enhanced_solution.quality_metrics.constraint_violations),
+            "optimization_efficiency": enhanced_solution.quality_metrics.optimization_efficiency,
+            "detailed_summary": explanations.summary,
+            "scheduling_rationale": explanations.scheduling_rationale,
+            "unscheduled_reasons": explanations.unscheduled_reasons,
+            "recommendations": explanations.recommendations,
+            "warnings": explanations.warnings,
+            "alternatives": [
+                {
+                    "solution_id": alternative.solution_id,
+                    "trade_off_description": alternative.trade_off_description,
+                    "quality_score": alternative.quality_metrics.quality_score,
+                    "better_at": alternative.better_at,
+                    "worse_at": alternative.worse_at,
+                    "relaxations": alternative.relaxations,
+                    "scenarios": alternative.scenarios,
+                    "blocks": [
+                        {
+                            "task_id": block.task_id,
+                            "start": block.start.isoformat(),
+                            "end": block.end.isoformat()
+                        }
+                        for block in alternative.blocks
+                    ]
+                }
+                for alternative in enhanced_solution.alternatives
+            ]
+        }
+
     async def _build_enhanced_response(
         self,
         request: ScheduleRequest,
@@ -887,6 +1460,24 @@ class SchedulerService:
         return response
 
 
+def _coalescing_key(request: ScheduleRequest, enhanced_observability: bool) -> Tuple[str, bool, str]:
+    """Requests that may share one solve: the same user with the same effective parameters."""
+    params = request.model_dump(mode='json', exclude={'job_id'})
+    serialized = json.dumps(params, sort_keys=True, default=str)
+    return (
+        request.user_id,
+        enhanced_observability,
+        hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+    )
+
+
+def _mark_coalesced(response: ScheduleResponse) -> ScheduleResponse:
+    """Copy of a response for a caller whose own request was superseded."""
+    shared = response.model_copy(deep=True)
+    shared.metrics['coalesced'] = True
+    return shared
+
+
 # Global service instance
 _scheduler_service = None
 
@@ -898,3 +1489,9 @@ def get_scheduler_service() -> SchedulerService:
         _scheduler_service = SchedulerService()
     return _scheduler_service
 
+
+
+async def flush_scheduler_models():
+    """Write back the global service's dirty resident models, if it was started."""
+    if _scheduler_service is not None and _scheduler_service.model_registry is not None:
+        await _scheduler_service.model_registry.flush()
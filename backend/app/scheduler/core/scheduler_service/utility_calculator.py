@@ -9,10 +9,13 @@ import logging
 from typing import Dict, List, Tuple, Any
 from datetime import datetime
 
+import numpy as np
+
 from ..domain import Task, BusyEvent, Preferences
 from ...optimization.time_index import TimeIndex
 from ...learning.completion_model import CompletionModel
-from ..features import build_utilities
+from ..features import build_utilities, SlotArrays
+from ..utility_matrix import UtilityMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +34,9 @@ class UtilityCalculator:
         time_index: TimeIndex,
         prefs: Preferences,
         events: List[BusyEvent],
-        history: List
-    ) -> Tuple[Dict[str, Dict[int, float]], Dict[str, Any]]:
+        history: List,
+        inference_batcher=None
+    ) -> Tuple[UtilityMatrix, Dict[str, Any]]:
         """
         Build utilities using ML-based features.
 
@@ -43,12 +47,13 @@ class UtilityCalculator:
             prefs: User preferences
             events: Busy calendar events
             history: Historical completion data
+            inference_batcher: Optional batcher shared with other users' requests
 
         Returns:
             Tuple of (utility matrix, penalty context)
         """
         util_matrix, penalty_context = await build_utilities(
-            model, tasks, time_index, prefs, events, history
+            model, tasks, time_index, prefs, events, history, inference_batcher
         )
 
         logger.debug(
@@ -60,7 +65,7 @@ class UtilityCalculator:
 
     def build_simple_utilities(
         self, tasks: List[Task], time_index: TimeIndex
-    ) -> Dict[str, Dict[int, float]]:
+    ) -> UtilityMatrix:
         """
         Build simplified utility matrix for coarsening scenarios.
 
@@ -74,48 +79,37 @@ class UtilityCalculator:
             time_index: Time discretization
 
         Returns:
-            Utility matrix mapping task_id -> {slot_idx -> utility}
+            Utility matrix over (task, slot)
         """
-        util_matrix = {}
-
-        for task in tasks:
-            task_utils = {}
-
-            # Simple utility based on deadline proximity and time of day
-            for slot_idx in range(len(time_index)):
-                slot_time = time_index.slot_to_datetime(slot_idx)
-
-                # Base utility
-                utility = 1.0
-
-                # Deadline pressure (simple linear decay)
-                if task.deadline:
-                    time_to_deadline = (task.deadline - slot_time).total_seconds() / 3600  # hours
-                    if time_to_deadline > 0:
-                        # Higher utility closer to deadline
-                        utility += min(2.0, 24.0 / max(1, time_to_deadline))
-
-                # Time of day preference (prefer working hours)
-                hour = slot_time.hour
-                if 9 <= hour <= 17:  # Working hours
-                    utility += 0.5
-                elif 8 <= hour <= 8 or 18 <= hour <= 20:  # Extended hours
-                    utility += 0.2
-
-                task_utils[slot_idx] = utility
-
-            util_matrix[task.id] = task_utils
+        slot_arrays = SlotArrays.from_time_index(time_index)
+        hours_to_deadline = self._hours_to_deadline(tasks, slot_arrays)
+
+        # Base utility
+        values = np.ones((len(tasks), len(time_index)))
+
+        # Deadline pressure (simple linear decay): higher utility closer to deadline
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deadline_bonus = np.minimum(2.0, 24.0 / np.maximum(1, hours_to_deadline))
+        values += np.where(hours_to_deadline > 0, deadline_bonus, 0.0)
+
+        # Time of day preference (prefer working hours)
+        hour = slot_arrays.hour
+        values += np.select(
+            [(hour >= 9) & (hour <= 17), (hour == 8) | ((hour >= 18) & (hour <= 20))],
+            [0.5, 0.2],
+            default=0.0
+        )
 
         logger.debug(
             f"Built simple utilities for {len(tasks)} tasks "
             f"(fallback/coarsening mode)"
         )
 
-        return util_matrix
+        return UtilityMatrix([task.id for task in tasks], values)
 
     def build_deadline_based_utilities(
         self, tasks: List[Task], time_index: TimeIndex
-    ) -> Dict[str, Dict[int, float]]:
+    ) -> UtilityMatrix:
         """
         Build utilities based primarily on deadline urgency.
 
@@ -126,45 +120,27 @@ class UtilityCalculator:
         Returns:
             Utility matrix focused on deadline proximity
         """
-        util_matrix = {}
-
-        for task in tasks:
-            task_utils = {}
-
-            for slot_idx in range(len(time_index)):
-                slot_time = time_index.slot_to_datetime(slot_idx)
-
-                # Default utility
-                utility = 0.5
-
-                if task.deadline:
-                    hours_until_deadline = (
-                        (task.deadline - slot_time).total_seconds() / 3600
-                    )
-
-                    if hours_until_deadline > 0:
-                        # Exponential urgency as deadline approaches
-                        if hours_until_deadline < 24:
-                            utility = 3.0
-                        elif hours_until_deadline < 48:
-                            utility = 2.0
-                        elif hours_until_deadline < 72:
-                            utility = 1.5
-                        else:
-                            utility = 1.0
-                    else:
-                        # Past deadline - very high urgency
-                        utility = 4.0
-
-                task_utils[slot_idx] = utility
-
-            util_matrix[task.id] = task_utils
+        slot_arrays = SlotArrays.from_time_index(time_index)
+        hours_to_deadline = self._hours_to_deadline(tasks, slot_arrays)
+
+        # Exponential urgency as deadline approaches, very high past the deadline
+        values = np.select(
+            [
+                np.isnan(hours_to_deadline),
+                hours_to_deadline <= 0,
+                hours_to_deadline < 24,
+                hours_to_deadline < 48,
+                hours_to_deadline < 72
+            ],
+            [0.5, 4.0, 3.0, 2.0, 1.5],
+            default=1.0
+        )
 
-        return util_matrix
+        return UtilityMatrix([task.id for task in tasks], values)
 
     def build_uniform_utilities(
         self, tasks: List[Task], time_index: TimeIndex, base_value: float = 1.0
-    ) -> Dict[str, Dict[int, float]]:
+    ) -> UtilityMatrix:
         """
         Build uniform utilities (all slots equal value).
 
@@ -178,14 +154,9 @@ class UtilityCalculator:
         Returns:
             Uniform utility matrix
         """
-        util_matrix = {}
-
-        for task in tasks:
-            task_utils = {
-                slot_idx: base_value
-                for slot_idx in range(len(time_index))
-            }
-            util_matrix[task.id] = task_utils
+        util_matrix = UtilityMatrix.full(
+            [task.id for task in tasks], len(time_index), base_value
+        )
 
         logger.debug(
             f"Built uniform utilities (value={base_value}) "
@@ -195,10 +166,10 @@ class UtilityCalculator:
         return util_matrix
 
     def normalize_utilities(
-        self, util_matrix: Dict[str, Dict[int, float]], method: str = "minmax"
-    ) -> Dict[str, Dict[int, float]]:
+        self, util_matrix: UtilityMatrix, method: str = "minmax"
+    ) -> UtilityMatrix:
         """
-        Normalize utility values.
+        Normalize utility values per task.
 
         Args:
             util_matrix: Raw utility matrix
@@ -207,88 +178,19 @@ class UtilityCalculator:
         Returns:
             Normalized utility matrix
         """
-        if method == "minmax":
-            return self._normalize_minmax(util_matrix)
-        elif method == "zscore":
-            return self._normalize_zscore(util_matrix)
-        elif method == "sum":
-            return self._normalize_sum(util_matrix)
-        else:
+        try:
+            return util_matrix.normalized(method)
+        except ValueError:
             logger.warning(f"Unknown normalization method: {method}")
             return util_matrix
 
-    def _normalize_minmax(
-        self, util_matrix: Dict[str, Dict[int, float]]
-    ) -> Dict[str, Dict[int, float]]:
-        """Min-max normalization to [0, 1] range."""
-        normalized = {}
-
-        for task_id, task_utils in util_matrix.items():
-            values = list(task_utils.values())
-            if not values:
-                normalized[task_id] = {}
-                continue
-
-            min_val = min(values)
-            max_val = max(values)
-            range_val = max_val - min_val
-
-            if range_val == 0:
-                # All values are the same
-                normalized[task_id] = {k: 0.5 for k in task_utils.keys()}
-            else:
-                normalized[task_id] = {
-                    k: (v - min_val) / range_val
-                    for k, v in task_utils.items()
-                }
-
-        return normalized
-
-    def _normalize_zscore(
-        self, util_matrix: Dict[str, Dict[int, float]]
-    ) -> Dict[str, Dict[int, float]]:
-        """Z-score normalization."""
-        import statistics
-
-        normalized = {}
-
-        for task_id, task_utils in util_matrix.items():
-            values = list(task_utils.values())
-            if not values or len(values) < 2:
-                normalized[task_id] = task_utils
-                continue
-
-            mean = statistics.mean(values)
-            stdev = statistics.stdev(values)
-
-            if stdev == 0:
-                normalized[task_id] = {k: 0.0 for k in task_utils.keys()}
-            else:
-                normalized[task_id] = {
-                    k: (v - mean) / stdev
-                    for k, v in task_utils.items()
-                }
-
-        return normalized
-
-    def _normalize_sum(
-        self, util_matrix: Dict[str, Dict[int, float]]
-    ) -> Dict[str, Dict[int, float]]:
-        """Normalize so each task's utilities sum to 1.0."""
-        normalized = {}
-
-        for task_id, task_utils in util_matrix.items():
-            total = sum(task_utils.values())
-
-            if total == 0:
-                normalized[task_id] = task_utils
-            else:
-                normalized[task_id] = {
-                    k: v / total
-                    for k, v in task_utils.items()
-                }
-
-        return normalized
+    def _hours_to_deadline(self, tasks: List[Task], slot_arrays: SlotArrays) -> np.ndarray:
+        """(n_tasks, n_slots) hours from each slot to the task deadline, NaN without one."""
+        deadlines = np.array(
+            [task.deadline.timestamp() if task.deadline else np.nan for task in tasks],
+            dtype=np.float64
+        )
+        return (deadlines[:, np.newaxis] - slot_arrays.timestamps[np.newaxis, :]) / 3600
 
 
 def get_utility_calculator() -> UtilityCalculator:
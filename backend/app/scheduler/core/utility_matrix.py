@@ -0,0 +1,181 @@
+"""
+Dense utility matrix for (task, slot) scoring.
+
+Replaces nested ``Dict[task_id, Dict[slot_idx, float]]`` utilities with a
+single 2-D NumPy array and a task-id to row index, so utilities are built,
+read and shipped to solver worker processes without per-entry allocations.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+
+class UtilityMatrix:
+    """
+    Utility values for every (task, slot) pair.
+
+    ``values[row, slot_idx]`` is the utility of scheduling the task with
+    ``task_ids[row]`` in slot ``slot_idx``.
+    """
+
+    def __init__(self, task_ids: List[str], values: np.ndarray):
+        """
+        Initialize utility matrix.
+
+        Args:
+            task_ids: Task identifiers in row order
+            values: Array of shape (n_tasks, n_slots)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[0] != len(task_ids):
+            raise ValueError(
+                f"values must have shape ({len(task_ids)}, n_slots), got {values.shape}"
+            )
+
+        self.task_ids = list(task_ids)
+        self.values = values
+        self.task_index = {task_id: row for row, task_id in enumerate(self.task_ids)}
+
+    @classmethod
+    def full(cls, task_ids: Iterable[str], n_slots: int, fill_value: float = 0.0) -> 'UtilityMatrix':
+        """Matrix with every entry set to fill_value."""
+        task_ids = list(task_ids)
+        return cls(task_ids, np.full((len(task_ids), n_slots), fill_value, dtype=np.float64))
+
+    @classmethod
+    def from_dict(
+        cls,
+        util: Mapping[str, Mapping[int, float]],
+        n_slots: int,
+        task_ids: Optional[Iterable[str]] = None
+    ) -> 'UtilityMatrix':
+        """
+        Build from nested task -> slot -> utility mappings.
+
+        Missing entries are zero. Slots outside [0, n_slots) are ignored.
+        """
+        task_ids = list(task_ids) if task_ids is not None else list(util.keys())
+        matrix = cls.full(task_ids, n_slots)
+
+        for row, task_id in enumerate(task_ids):
+            task_utils = util.get(task_id) or {}
+            if not task_utils:
+                continue
+            slots = np.fromiter(task_utils.keys(), dtype=np.int64, count=len(task_utils))
+            utils = np.fromiter(task_utils.values(), dtype=np.float64, count=len(task_utils))
+            in_range = (slots >= 0) & (slots < n_slots)
+            matrix.values[row, slots[in_range]] = utils[in_range]
+
+        return matrix
+
+    def to_dict(self) -> Dict[str, Dict[int, float]]:
+        """Nested task -> slot -> utility mapping."""
+        return {
+            task_id: dict(enumerate(self.values[row].tolist()))
+            for row, task_id in enumerate(self.task_ids)
+        }
+
+    @property
+    def n_tasks(self) -> int:
+        """Number of task rows."""
+        return self.values.shape[0]
+
+    @property
+    def n_slots(self) -> int:
+        """Number of slot columns."""
+        return self.values.shape[1]
+
+    def row(self, task_id: str) -> Optional[np.ndarray]:
+        """Utilities of a task across all slots (a view), or None if unknown."""
+        row = self.task_index.get(task_id)
+        return None if row is None else self.values[row]
+
+    def get(self, task_id: str, slot_idx: int, default: float = 0.0) -> float:
+        """Utility of one (task, slot) pair."""
+        row = self.task_index.get(task_id)
+        if row is None or not 0 <= slot_idx < self.n_slots:
+            return default
+        return float(self.values[row, slot_idx])
+
+    def block_utility(self, task_id: str, slot_indices: List[int]) -> float:
+        """Summed utility of a task over a set of slots."""
+        row = self.row(task_id)
+        if row is None or not slot_indices:
+            return 0.0
+        return float(row[slot_indices].sum())
+
+    def select(self, task_ids: Iterable[str]) -> 'UtilityMatrix':
+        """Matrix restricted to (and ordered by) task_ids; unknown tasks get zero rows."""
+        task_ids = list(task_ids)
+        values = np.zeros((len(task_ids), self.n_slots), dtype=np.float64)
+        for out_row, task_id in enumerate(task_ids):
+            row = self.task_index.get(task_id)
+            if row is not None:
+                values[out_row] = self.values[row]
+        return UtilityMatrix(task_ids, values)
+
+    def normalized(self, method: str = "minmax") -> 'UtilityMatrix':
+        """
+        Per-task normalized copy.
+
+        Args:
+            method: "minmax" (to [0, 1]), "zscore" or "sum" (rows sum to 1)
+        """
+        if method not in ("minmax", "zscore", "sum"):
+            raise ValueError(f"Unknown normalization method: {method}")
+
+        values = self.values
+        if self.n_slots == 0:
+            return UtilityMatrix(self.task_ids, values.copy())
+
+        if method == "minmax":
+            lo = values.min(axis=1, keepdims=True)
+            span = values.max(axis=1, keepdims=True) - lo
+            normalized = np.where(span > 0, (values - lo) / np.where(span > 0, span, 1), 0.5)
+        elif method == "zscore":
+            if self.n_slots < 2:
+                return UtilityMatrix(self.task_ids, values.copy())
+            std = values.std(axis=1, ddof=1, keepdims=True)
+            centered = values - values.mean(axis=1, keepdims=True)
+            normalized = np.where(std > 0, centered / np.where(std > 0, std, 1), 0.0)
+        else:
+            total = values.sum(axis=1, keepdims=True)
+            normalized = np.where(total != 0, values / np.where(total != 0, total, 1), values)
+
+        return UtilityMatrix(self.task_ids, normalized)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.task_index
+
+    def __len__(self) -> int:
+        return self.n_tasks
+
+    def __repr__(self) -> str:
+        return f"UtilityMatrix(tasks={self.n_tasks}, slots={self.n_slots})"
+
+
+UtilityInput = Union[UtilityMatrix, Mapping[str, Mapping[int, float]], None]
+
+
+def as_utility_matrix(util: UtilityInput, task_ids: Iterable[str], n_slots: int) -> UtilityMatrix:
+    """
+    Coerce utilities to a UtilityMatrix aligned with task_ids.
+
+    Accepts an existing matrix (returned as-is when already aligned), legacy
+    nested dicts, or None (all zeros).
+    """
+    task_ids = list(task_ids)
+    if util is None:
+        return UtilityMatrix.full(task_ids, n_slots)
+    if isinstance(util, UtilityMatrix):
+        if util.task_ids == task_ids and util.n_slots == n_slots:
+            return util
+        matrix = util.select(task_ids)
+        if matrix.n_slots != n_slots:
+            values = np.zeros((len(task_ids), n_slots), dtype=np.float64)
+            width = min(n_slots, matrix.n_slots)
+            values[:, :width] = matrix.values[:, :width]
+            matrix = UtilityMatrix(task_ids, values)
+        return matrix
+    return UtilityMatrix.from_dict(util, n_slots, task_ids)
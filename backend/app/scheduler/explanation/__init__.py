@@ -8,5 +8,6 @@ of scheduling decisions, constraint analysis, and alternative scenarios.
 from .schedule_explainer import ScheduleExplainer
 from .constraint_analyzer import ConstraintAnalyzer
 from .alternative_generator import AlternativeGenerator
+from .alternative_engine import ParallelAlternativeEngine
 
-__all__ = ['ScheduleExplainer', 'ConstraintAnalyzer', 'AlternativeGenerator']
\ No newline at end of file
+__all__ = ['ScheduleExplainer', 'ConstraintAnalyzer', 'AlternativeGenerator', 'ParallelAlternativeEngine']
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+Parallel what-if alternatives from real solver runs.
+
+Each alternative strategy is turned into a modified copy of the problem the
+main schedule was solved from (relaxed deadlines, different block sizes,
+shifted utilities or penalty weights). All of them are solved at once, in
+the solver process pool when one is available, under a single shared time
+budget and warm-started from the main solution, so the alternatives cost
+roughly the latency of one solve.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.domain import BusyEvent, Preferences, ScheduleSolution, Task
+from ..core.utility_matrix import UtilityMatrix
+from ..io.dto import ScheduleRequest
+from ..optimization.solver_pool import SolverPool, SolveProblem, solve_problem
+from ..optimization.warm_start import build_warm_start_hints
+from ..schemas.enhanced_results import AlternativeSolution
+from .alternative_generator import AlternativeGenerator, AlternativeParameters, AlternativeStrategy
+
+logger = logging.getLogger(__name__)
+
+
+# Tried after the strategies chosen for the main solution's weaknesses
+_DEFAULT_STRATEGIES = [
+    AlternativeStrategy.PREFERENCE_IGNORED,
+    AlternativeStrategy.SHORTER_BLOCKS,
+    AlternativeStrategy.MINIMAL_FRAGMENTATION,
+    AlternativeStrategy.LONGER_BLOCKS,
+    AlternativeStrategy.MAX_PRODUCTIVITY,
+    AlternativeStrategy.DEADLINE_RELAXED,
+]
+
+
+class ParallelAlternativeEngine:
+    """
+    Solves alternative strategies concurrently and ranks the results.
+
+    Strategies the solver model cannot express (weekend scheduling, which
+    the time grid never excludes) are skipped rather than simulated.
+    """
+
+    def __init__(
+        self,
+        generator: Optional[AlternativeGenerator] = None,
+        solver_pool: Optional[SolverPool] = None,
+        time_budget_seconds: float = 3.0
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            generator: Supplies strategy parameters, quality scoring and
+                trade-off descriptions
+            solver_pool: Process pool for the solves (threads if None)
+            time_budget_seconds: Wall-clock budget shared by all alternatives
+        """
+        self.generator = generator or AlternativeGenerator()
+        self.solver_pool = solver_pool
+        self.time_budget_seconds = time_budget_seconds
+
+    async def generate_alternatives(
+        self,
+        main_solution: ScheduleSolution,
+        request: ScheduleRequest,
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        weights: Dict[str, float],
+        penalty_context: Dict[str, Any],
+        solver_options: Dict[str, Any],
+        max_alternatives: int = 3
+    ) -> List[AlternativeSolution]:
+        """
+        Solve alternative strategies and rank them by quality.
+
+        Args:
+            main_solution: Schedule the alternatives are compared against
+            request: Original scheduling request
+            tasks: Tasks of the main solve
+            events: Busy events of the main solve
+            prefs: User preferences
+            weights: Penalty weights of the main solve
+            penalty_context: Context of the main solve; must carry its
+                'time_index' and 'utilities'
+            solver_options: Solver options of the main solve
+            max_alternatives: Number of strategies to solve
+
+        Returns:
+            Feasible alternatives, best quality first
+        """
+        time_index = penalty_context.get('time_index')
+        util_matrix = penalty_context.get('utilities')
+        if time_index is None or util_matrix is None or not main_solution.feasible:
+            return []
+
+        # Incremental replans solve a window; its utilities say which tasks
+        tasks = [task for task in tasks if task.id in util_matrix.task_index]
+        main_quality = self.generator._calculate_alternative_quality(
+            main_solution.blocks, request, AlternativeParameters(strategy=None), tasks=tasks
+        )
+        main_view = SimpleNamespace(blocks=main_solution.blocks, quality_metrics=main_quality)
+
+        problems: List[Tuple[AlternativeParameters, List[Task], SolveProblem]] = []
+        for strategy in self._select_strategies(main_view, request, prefs):
+            parameters = self.generator._get_strategy_parameters(strategy, main_view)
+            derived = self.derive_problem(
+                parameters, tasks, events, prefs, time_index, util_matrix, weights,
+                solver_options, main_solution
+            )
+            if derived is not None:
+                problems.append((parameters, derived[0], derived[1]))
+            if len(problems) >= max_alternatives:
+                break
+        if not problems:
+            return []
+
+        # The solves share the budget and the search workers of one solve
+        search_workers = max(1, solver_options.get('num_search_workers', 1) // len(problems))
+        for _, _, problem in problems:
+            problem.solver_options['time_limit_seconds'] = self.time_budget_seconds
+            problem.solver_options['num_search_workers'] = search_workers
+
+        started = time.perf_counter()
+        solutions = await self._solve_all([problem for _, _, problem in problems])
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        alternatives = []
+        for (parameters, alt_tasks, _), solution in zip(problems, solutions):
+            if solution is None or not solution.feasible or not solution.blocks:
+                continue
+            alternatives.append(self._describe(
+                main_view, parameters, solution, request, tasks, alt_tasks
+            ))
+
+        alternatives.sort(key=lambda alt: alt.quality_metrics.quality_score, reverse=True)
+        self._record(len(problems), len(alternatives), elapsed_ms)
+        return alternatives
+
+    def derive_problem(
+        self,
+        parameters: AlternativeParameters,
+        tasks: List[Task],
+        events: List[BusyEvent],
+        prefs: Preferences,
+        time_index,
+        util_matrix: UtilityMatrix,
+        weights: Dict[str, float],
+        solver_options: Dict[str, Any],
+        main_solution: ScheduleSolution
+    ) -> Optional[Tuple[List[Task], SolveProblem]]:
+        """
+        Modified copy of the main problem for one strategy.
+
+        Returns:
+            The strategy's tasks and problem, or None if the model cannot
+            express the strategy
+        """
+        strategy = parameters.strategy
+        weights = dict(weights)
+        solver_options = dict(solver_options)
+        coarsening: Dict[str, Any] = {}
+        values = util_matrix.values
+
+        if strategy == AlternativeStrategy.DEADLINE_RELAXED:
+            extension = timedelta(days=parameters.deadline_extension_days)
+            if not any(task.deadline for task in tasks):
+                return None
+            tasks = [
+                dataclasses.replace(task, deadline=task.deadline + extension) if task.deadline else task
+                for task in tasks
+            ]
+
+        elif strategy == AlternativeStrategy.PREFERENCE_IGNORED:
+            coarsening['disable_preference_optimization'] = True
+
+        elif strategy == AlternativeStrategy.SHORTER_BLOCKS:
+            cap = max(time_index.granularity_minutes, int(60 * parameters.time_block_size_modifier))
+            tasks = [
+                dataclasses.replace(
+                    task,
+                    max_block_minutes=min(task.max_block_minutes or cap, cap),
+                    min_block_minutes=min(task.min_block_minutes, cap)
+                )
+                for task in tasks
+            ]
+            # Only the interval formulation enforces block length caps
+            solver_options['formulation'] = 'interval'
+
+        elif strategy == AlternativeStrategy.LONGER_BLOCKS:
+            floor = parameters.modifications.get('min_block_size', 60)
+            tasks = [
+                dataclasses.replace(
+                    task,
+                    min_block_minutes=max(task.min_block_minutes, min(floor, task.estimated_minutes)),
+                    max_block_minutes=max(task.max_block_minutes or 0, int(floor * parameters.time_block_size_modifier))
+                )
+                for task in tasks
+            ]
+            solver_options['formulation'] = 'interval'
+
+        elif strategy in (
+            AlternativeStrategy.EARLY_BIRD,
+            AlternativeStrategy.NIGHT_OWL,
+            AlternativeStrategy.MAX_PRODUCTIVITY
+        ):
+            bonus = parameters.optimization_weights.get('peak_time_bonus', 1.5)
+            values = values * np.where(self._peak_mask(time_index, parameters.peak_hours), bonus, 1.0)
+            if strategy == AlternativeStrategy.NIGHT_OWL:
+                weights['late_night'] = 0.0
+
+        elif strategy == AlternativeStrategy.MINIMAL_FRAGMENTATION:
+            factor = parameters.optimization_weights.get('fragmentation_penalty', 2.0)
+            weights['fragmentation'] = weights.get('fragmentation', 1.2) * factor
+            weights['context_switch'] = weights.get('context_switch', 2.0) * factor
+
+        elif strategy == AlternativeStrategy.FLEXIBLE_DURATION:
+            keep = 1.0 - parameters.modifications.get('duration_flexibility', 0.3)
+            shortened = []
+            for task in tasks:
+                minutes = max(time_index.granularity_minutes, int(task.estimated_minutes * keep))
+                shortened.append(dataclasses.replace(
+                    task, estimated_minutes=minutes, min_block_minutes=min(task.min_block_minutes, minutes)
+                ))
+            tasks = shortened
+
+        else:
+            return None
+
+        learned = {
+            'util': UtilityMatrix(util_matrix.task_ids, values),
+            'weights': weights,
+            'coarsening': coarsening
+        }
+        hints = build_warm_start_hints(main_solution.blocks, tasks, time_index, events)
+        problem = SolveProblem.from_time_index(
+            tasks, events, prefs, time_index, learned,
+            solver_options=solver_options, hints=hints
+        )
+        return tasks, problem
+
+    def _select_strategies(
+        self,
+        main_view: Any,
+        request: ScheduleRequest,
+        prefs: Preferences
+    ) -> List[AlternativeStrategy]:
+        """Strategies for the main solution's weaknesses, then the defaults."""
+        selected = self.generator._select_strategies(main_view, request, {})
+        return selected + [strategy for strategy in _DEFAULT_STRATEGIES if strategy not in selected]
+
+    async def _solve_all(self, problems: List[SolveProblem]) -> List[Optional[ScheduleSolution]]:
+        """Solve problems concurrently; stragglers past the budget yield None."""
+        # Grace for model building and queueing on top of the search limit
+        deadline = self.time_budget_seconds * 1.5 + 1.0
+
+        if self.solver_pool is not None:
+            tasks = [
+                asyncio.ensure_future(self.solver_pool.solve(problem, timeout=deadline))
+                for problem in problems
+            ]
+            cancels = []
+        else:
+            cancels = [threading.Event() for _ in problems]
+            tasks = [
+                asyncio.ensure_future(asyncio.to_thread(solve_problem, problem, cancel))
+                for problem, cancel in zip(problems, cancels)
+            ]
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for cancel in cancels:
+            cancel.set()
+        for task in pending:
+            task.cancel()
+
+        solutions = []
+        for problem, task in zip(problems, tasks):
+            if task in done and task.exception() is None:
+                solutions.append(task.result())
+            else:
+                if task in done:
+                    logger.warning(f"Alternative solve {problem.request_id} failed: {task.exception()}")
+                solutions.append(None)
+        return solutions
+
+    def _describe(
+        self,
+        main_view: Any,
+        parameters: AlternativeParameters,
+        solution: ScheduleSolution,
+        request: ScheduleRequest,
+        tasks: List[Task],
+        alt_tasks: List[Task]
+    ) -> AlternativeSolution:
+        """
+        Score an alternative and describe its trade-offs.
+
+        Quality is measured against the original tasks, like the main
+        solution, so relaxed deadlines or shortened durations do not count
+        as met; what the strategy relaxed is reported separately.
+        """
+        generator = self.generator
+        quality = generator._calculate_alternative_quality(
+            solution.blocks, request, parameters, tasks=tasks
+        )
+        quality.objective_value = solution.objective_value
+        comparison = generator._compare_solutions(main_view, solution.blocks, quality)
+
+        return AlternativeSolution(
+            solution_id=f"alt_{parameters.strategy.value}",
+            blocks=solution.blocks,
+            quality_metrics=quality,
+            trade_off_description=generator._generate_trade_off_description(parameters.strategy, comparison),
+            scenarios=generator._identify_better_scenarios(parameters.strategy, comparison),
+            better_at=comparison.improvement_areas,
+            worse_at=comparison.degradation_areas,
+            relaxations=self._relaxations(tasks, alt_tasks)
+        )
+
+    @staticmethod
+    def _relaxations(tasks: List[Task], alt_tasks: List[Task]) -> Dict[str, List[str]]:
+        """Task fields a strategy changed, with the ids of the tasks it changed."""
+        relaxations: Dict[str, List[str]] = {}
+        for name in ('deadline', 'estimated_minutes', 'min_block_minutes', 'max_block_minutes'):
+            changed = [
+                task.id for task, alt in zip(tasks, alt_tasks)
+                if getattr(task, name) != getattr(alt, name)
+            ]
+            if changed:
+                relaxations[name] = changed
+        return relaxations
+
+    @staticmethod
+    def _peak_mask(time_index, peak_hours: List[Tuple[int, int]]) -> np.ndarray:
+        """Boolean mask of slots starting within the peak hours."""
+        hours = np.array([
+            time_index.index_to_datetime(i).hour for i in range(len(time_index))
+        ])
+        mask = np.zeros(len(hours), dtype=bool)
+        for start_hour, end_hour in peak_hours:
+            mask |= (hours >= start_hour) & (hours < end_hour)
+        return mask
+
+    def _record(self, attempted: int, produced: int, elapsed_ms: float):
+        """Export alternative generation metrics."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            metrics = get_metrics()
+            metrics.histogram("scheduler.alternatives.solve_ms", elapsed_ms)
+            metrics.histogram("scheduler.alternatives.attempted", attempted)
+            metrics.histogram("scheduler.alternatives.feasible", produced)
+        except Exception as e:
+            logger.debug(f"Failed to record alternative metrics: {e}")
@@ -325,11 +325,19 @@ class AlternativeGenerator:
         self,
         blocks: List[ScheduleBlock],
         request: ScheduleRequest,
-        parameters: AlternativeParameters
+        parameters: AlternativeParameters,
+        tasks: Optional[List[Task]] = None
     ) -> QualityMetrics:
-        """Calculate quality metrics for an alternative solution."""
+        """
+        Calculate quality metrics for an alternative solution.
 
-        tasks = self._get_all_tasks(request)
+        With the solved tasks given, coverage, deadlines and fragmentation
+        are measured from the blocks; otherwise they are estimated.
+        """
+
+        measured = tasks is not None
+        if tasks is None:
+            tasks = self._get_all_tasks(request)
         scheduled_task_ids = {block.task_id for block in blocks}
 
         # Basic metrics calculation
@@ -348,7 +356,9 @@ class AlternativeGenerator:
         # Calculate fragmentation
         fragmentation = len(blocks) / max(1, len(blocks)) * 0.1  # Simplified
 
-        if parameters.strategy == AlternativeStrategy.MINIMAL_FRAGMENTATION:
+        if measured:
+            tasks_scheduled_ratio, deadline_satisfaction, fragmentation = self._measure_blocks(blocks, tasks)
+        elif parameters.strategy == AlternativeStrategy.MINIMAL_FRAGMENTATION:
             fragmentation *= 0.3  # Much lower fragmentation
 
         # Determine overall quality
@@ -388,6 +398,32 @@ class AlternativeGenerator:
             stability_score=0.8
         )
 
+    def _measure_blocks(self, blocks: List[ScheduleBlock], tasks: List[Task]) -> Tuple[float, float, float]:
+        """Coverage, deadline satisfaction and fragmentation of solved blocks."""
+        minutes: Dict[str, int] = defaultdict(int)
+        last_end: Dict[str, datetime] = {}
+        blocks_per_task: Dict[str, int] = defaultdict(int)
+        for block in blocks:
+            minutes[block.task_id] += block.duration_minutes
+            blocks_per_task[block.task_id] += 1
+            last_end[block.task_id] = max(block.end, last_end.get(block.task_id, block.end))
+
+        covered = sum(1 for task in tasks if minutes[task.id] >= task.estimated_minutes)
+        with_deadline = [task for task in tasks if task.deadline]
+        on_time = sum(
+            1 for task in with_deadline
+            if task.id in last_end and last_end[task.id] <= task.deadline
+        )
+
+        # Extra blocks beyond one per scheduled task, relative to all blocks
+        fragmentation = (len(blocks) - len(blocks_per_task)) / max(1, len(blocks))
+
+        return (
+            covered / max(1, len(tasks)),
+            on_time / len(with_deadline) if with_deadline else 1.0,
+            fragmentation
+        )
+
     def _compare_solutions(
         self,
         main_solution: Any,
@@ -563,6 +563,11 @@ class ScheduleExplainer:
         completion_prob = getattr(block, 'estimated_completion_probability', 0.5)
         confidence += (completion_prob - 0.5) * 0.2
 
+        # Slots that rank high among the task's alternatives increase confidence
+        utility_percentile = self._utility_percentile(block, context)
+        if utility_percentile is not None:
+            confidence += (utility_percentile - 0.5) * 0.2
+
         # Clamp to valid range
         return max(0.0, min(1.0, confidence))
 
@@ -604,6 +609,11 @@ class ScheduleExplainer:
         if hasattr(block, 'utility_score'):
             factors['utility_score'] = block.utility_score
 
+        # Rank of the chosen slots within the task's utility row
+        utility_percentile = self._utility_percentile(block, context)
+        if utility_percentile is not None:
+            factors['utility_percentile'] = utility_percentile
+
         return factors
 
     def _identify_trade_offs(self, block: ScheduleBlock, task: Task, context: Dict[str, Any]) -> List[str]:
@@ -621,8 +631,31 @@ class ScheduleExplainer:
         if hasattr(task, 'max_block_minutes') and block.duration_minutes < task.estimated_minutes:
             trade_offs.append("Split into multiple sessions due to time constraints")
 
+        # Utility trade-offs
+        utility_percentile = self._utility_percentile(block, context)
+        if utility_percentile is not None and utility_percentile < 0.5:
+            trade_offs.append("Placed in a lower-value slot to satisfy other constraints")
+
         return trade_offs
 
+    def _utility_percentile(self, block: ScheduleBlock, context: Dict[str, Any]) -> Optional[float]:
+        """Share of the task's slots whose utility is at most the block's mean utility."""
+        utilities = context.get('utilities') if context else None
+        time_index = context.get('time_index') if context else None
+        if utilities is None or time_index is None:
+            return None
+
+        task_utils = utilities.row(block.task_id)
+        if task_utils is None or not len(task_utils):
+            return None
+
+        slots = [s for s in time_index.window_to_indices(block.start, block.end) if s < len(task_utils)]
+        if not slots:
+            return None
+
+        block_utility = task_utils[slots].mean()
+        return float((task_utils <= block_utility).mean())
+
     def _matches_preferred_windows(self, block: ScheduleBlock, task: Task) -> bool:
         """Check if block timing matches task's preferred windows."""
         if not task.preferred_windows:
@@ -105,6 +105,26 @@ class ScheduleResponse(BaseModel):
         return self.feasible and len(self.blocks) > 0
 
 
+class BatchScheduleRequest(BaseModel):
+    """Request schema for scheduling many users in one run."""
+
+    user_ids: List[str] = Field(..., min_items=1, max_items=1000, description="Users to schedule")
+    horizon_days: int = Field(default=7, ge=1, le=30, description="Scheduling horizon in days")
+    dry_run: bool = Field(default=False, description="Preview mode without persistence")
+    deadline: Optional[datetime] = Field(None, description="Time by which all schedules should be ready")
+    options: Dict[str, Any] = Field(default_factory=dict, description="Options applied to every user")
+
+
+class BatchScheduleResponse(BaseModel):
+    """Response schema for batched scheduling."""
+
+    feasible: Dict[str, bool] = Field(..., description="Per-user feasibility for completed users")
+    failed: List[str] = Field(default_factory=list, description="Users whose schedule failed")
+    timed_out: List[str] = Field(default_factory=list, description="Users that exceeded their time budget")
+    skipped: List[str] = Field(default_factory=list, description="Users not started before the deadline")
+    metrics: Dict[str, Any] = Field(..., description="Run-level metrics including users_per_second")
+
+
 class TaskUpdateRequest(BaseModel):
     """Request schema for updating task scheduling parameters."""
     
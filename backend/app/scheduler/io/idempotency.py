@@ -1,14 +1,20 @@
 """
 Idempotency handling for scheduler operations.
 
-Ensures that repeated scheduling requests with identical parameters
-return consistent results without recomputation.
+Ensures that repeated scheduling requests with identical parameters and
+inputs return consistent results without recomputation, including retries
+that land on another worker.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+import time
+import uuid
+import zlib
+from dataclasses import asdict, is_dataclass
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 
 from .dto import ScheduleRequest, ScheduleResponse
@@ -20,26 +26,62 @@ class IdempotencyManager:
     """
     Manages idempotency for scheduling operations.
     
-    Uses content-based hashing to detect duplicate requests and
-    caches responses for a configurable time period.
+    Uses content-based hashing of the request and its effective inputs to
+    detect duplicate requests, and caches compressed responses for a
+    configurable time period. Identical requests that arrive while the
+    first is still being solved wait for its response instead of solving
+    again: within a process through a shared future, and across workers
+    through a Redis lock when a Redis client is configured.
     """
     
-    def __init__(self, cache_ttl_minutes: int = 60):
+    def __init__(
+        self,
+        cache_ttl_minutes: int = 60,
+        redis_client=None,
+        lock_timeout_seconds: int = 120,
+        key_prefix: str = "scheduler:idem"
+    ):
         """
         Initialize idempotency manager.
         
         Args:
             cache_ttl_minutes: Cache time-to-live in minutes
+            redis_client: redis.asyncio client (bytes responses); responses
+                are kept in process memory if None
+            lock_timeout_seconds: How long a solve may hold the single-flight
+                lock, and how long duplicates wait for it
+            key_prefix: Prefix of Redis keys
         """
         self.cache_ttl_minutes = cache_ttl_minutes
-        self.cache = {}  # In-memory cache for development
-        
-    def generate_effect_hash(self, request: ScheduleRequest) -> str:
+        self.redis = redis_client
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.key_prefix = key_prefix
+
+        self.cache: Dict[str, Tuple[float, bytes]] = {}  # In-memory cache without Redis
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._release_lock = (
+            redis_client.register_script(_RELEASE_LOCK_SCRIPT) if redis_client is not None else None
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        
+    def generate_effect_hash(
+        self,
+        request: ScheduleRequest,
+        inputs: Optional[Tuple] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Generate a hash representing the scheduling request effect.
         
         Args:
             request: Scheduling request
+            inputs: Loaded (tasks, events, prefs, history); when given, task
+                and event versions and the preferences are part of the hash,
+                so any input change produces a new schedule
+            context: Other settings the result depends on (e.g. SLO coarsening)
             
         Returns:
             Hash string uniquely identifying the request
@@ -52,6 +94,19 @@ class IdempotencyManager:
             'lock_existing': request.lock_existing,
             'options': request.options
         }
+
+        if inputs is not None:
+            tasks, events, prefs = inputs[:3]
+            hash_input['tasks'] = sorted(
+                (task.id, str(task.updated_at)) for task in tasks
+            )
+            hash_input['events'] = sorted(
+                (event.id, str(event.start), str(event.end), event.hard, event.movable)
+                for event in events
+            )
+            hash_input['preferences'] = _preferences_hash(prefs)
+        if context:
+            hash_input['context'] = context
         
         # Add timestamp bucketing to allow for some temporal variation
         # Bucket requests by hour to balance idempotency with freshness
@@ -64,12 +119,108 @@ class IdempotencyManager:
         hash_obj = hashlib.sha256(serialized.encode('utf-8'))
         
         return hash_obj.hexdigest()[:16]  # Use first 16 chars for brevity
+
+    async def run_once(
+        self,
+        request: ScheduleRequest,
+        compute: Callable[[], Awaitable[ScheduleResponse]],
+        inputs: Optional[Tuple] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> ScheduleResponse:
+        """
+        Produce the response for a request at most once per effect hash.
+        
+        Returns a cached response when one exists; otherwise the first caller
+        runs ``compute`` and concurrent identical callers wait for its result.
+        Dry runs are always computed.
+        
+        Args:
+            request: Scheduling request
+            compute: Produces the response when it is not cached
+            inputs: Loaded inputs, see generate_effect_hash
+            context: Other settings the result depends on
+            
+        Returns:
+            Schedule response
+        """
+        if request.dry_run:
+            # Never cache dry runs
+            return await compute()
+
+        effect_hash = self.generate_effect_hash(request, inputs, context)
+
+        while True:
+            cached = await self.get_cached(effect_hash)
+            if cached is not None:
+                self.hits += 1
+                self._record("hit")
+                logger.info(f"Returning cached response for hash {effect_hash}")
+                return cached
+
+            inflight = self._inflight.get(effect_hash)
+            if inflight is None:
+                break
+
+            # Identical request in progress in this process
+            response = await asyncio.shield(inflight)
+            if response is not None:
+                self.coalesced += 1
+                self._record("coalesced")
+                return response.model_copy(deep=True)
+            # The first request failed; try ourselves
+
+        self.misses += 1
+        self._record("miss")
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[effect_hash] = future
+        response = None
+        try:
+            response = await self._run_single_flight(effect_hash, compute)
+            return response
+        finally:
+            self._inflight.pop(effect_hash, None)
+            future.set_result(response)
+
+    async def get_cached(self, effect_hash: str) -> Optional[ScheduleResponse]:
+        """Cached response for an effect hash, if any."""
+        if self.redis is None:
+            entry = self.cache.get(effect_hash)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                # Cache expired, remove entry
+                del self.cache[effect_hash]
+                return None
+            return _decode_response(payload)
+
+        try:
+            payload = await self.redis.get(self._response_key(effect_hash))
+        except Exception as e:
+            logger.warning(f"Idempotency cache lookup failed: {e}")
+            return None
+        return _decode_response(payload) if payload is not None else None
+
+    async def put(self, effect_hash: str, response: ScheduleResponse):
+        """Cache a response under an effect hash."""
+        payload = _encode_response(response)
+        ttl_seconds = self.cache_ttl_minutes * 60
+
+        if self.redis is None:
+            self.cache[effect_hash] = (time.monotonic() + ttl_seconds, payload)
+            await self._cleanup_cache()
+            return
+
+        try:
+            await self.redis.set(self._response_key(effect_hash), payload, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Failed to cache response for hash {effect_hash}: {e}")
     
     async def check_and_put(
         self, request: ScheduleRequest
     ) -> Tuple[bool, Optional[ScheduleResponse]]:
         """
-        Check for existing response and mark request as in-progress.
+        Check for an existing response to an identical request.
         
         Args:
             request: Scheduling request
@@ -80,34 +231,9 @@ class IdempotencyManager:
         if request.dry_run:
             # Never cache dry runs
             return False, None
-            
-        effect_hash = self.generate_effect_hash(request)
-        
-        # Check cache
-        cached_entry = self.cache.get(effect_hash)
-        
-        if cached_entry:
-            # Check if cache entry is still valid
-            cached_at = cached_entry.get('cached_at')
-            if cached_at:
-                cache_age = datetime.now() - cached_at
-                if cache_age < timedelta(minutes=self.cache_ttl_minutes):
-                    response = cached_entry.get('response')
-                    if response:
-                        logger.info(f"Returning cached response for hash {effect_hash}")
-                        return True, response
-                else:
-                    # Cache expired, remove entry
-                    del self.cache[effect_hash]
-        
-        # Mark as in-progress
-        self.cache[effect_hash] = {
-            'status': 'in_progress',
-            'started_at': datetime.now(),
-            'request': request
-        }
-        
-        return False, None
+
+        cached = await self.get_cached(self.generate_effect_hash(request))
+        return cached is not None, cached
     
     async def store_response(
         self, request: ScheduleRequest, response: ScheduleResponse
@@ -123,60 +249,161 @@ class IdempotencyManager:
             return  # Don't cache dry runs
             
         effect_hash = self.generate_effect_hash(request)
-        
-        # Store response in cache
-        self.cache[effect_hash] = {
-            'status': 'completed',
-            'cached_at': datetime.now(),
-            'request': request,
-            'response': response
-        }
-        
-        # Clean up old cache entries
-        await self._cleanup_cache()
-        
+        await self.put(effect_hash, response)
         logger.debug(f"Cached response for hash {effect_hash}")
+
+    async def _run_single_flight(
+        self, effect_hash: str, compute: Callable[[], Awaitable[ScheduleResponse]]
+    ) -> ScheduleResponse:
+        """Compute under the cross-worker lock, or wait for the worker holding it."""
+        if self.redis is None:
+            return await self._compute_and_store(effect_hash, compute)
+
+        lock_key = self._lock_key(effect_hash)
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.set(
+                lock_key, token, nx=True, ex=self.lock_timeout_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Idempotency lock unavailable, solving without it: {e}")
+            return await self._compute_and_store(effect_hash, compute)
+
+        if acquired:
+            try:
+                return await self._compute_and_store(effect_hash, compute)
+            finally:
+                try:
+                    await self._release_lock(keys=[lock_key], args=[token])
+                except Exception as e:
+                    logger.warning(f"Failed to release idempotency lock {lock_key}: {e}")
+
+        # Another worker is solving the same request
+        response = await self._wait_for_response(effect_hash, lock_key)
+        if response is not None:
+            self.coalesced += 1
+            self._record("coalesced")
+            return response
+
+        # It failed, or is taking longer than the lock timeout
+        return await self._compute_and_store(effect_hash, compute)
+
+    async def _wait_for_response(self, effect_hash: str, lock_key: str) -> Optional[ScheduleResponse]:
+        """Poll for another worker's response until its lock is gone."""
+        deadline = time.monotonic() + self.lock_timeout_seconds
+        delay = 0.05
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+            response = await self.get_cached(effect_hash)
+            if response is not None:
+                return response
+            try:
+                if not await self.redis.exists(lock_key):
+                    # Released without a cacheable response; one last look
+                    return await self.get_cached(effect_hash)
+            except Exception as e:
+                logger.warning(f"Idempotency lock check failed: {e}")
+                return None
+        return None
+
+    async def _compute_and_store(
+        self, effect_hash: str, compute: Callable[[], Awaitable[ScheduleResponse]]
+    ) -> ScheduleResponse:
+        """Compute a response and cache it when it is a successful schedule."""
+        response = await compute()
+        if response.feasible and 'error' not in response.metrics:
+            await self.put(effect_hash, response)
+        return response
+
+    def _response_key(self, effect_hash: str) -> str:
+        return f"{self.key_prefix}:resp:{effect_hash}"
+
+    def _lock_key(self, effect_hash: str) -> str:
+        return f"{self.key_prefix}:lock:{effect_hash}"
     
     async def _cleanup_cache(self):
         """Remove expired cache entries."""
-        cutoff_time = datetime.now() - timedelta(minutes=self.cache_ttl_minutes * 2)
-        
-        expired_keys = []
-        for key, entry in self.cache.items():
-            cached_at = entry.get('cached_at') or entry.get('started_at')
-            if cached_at and cached_at < cutoff_time:
-                expired_keys.append(key)
+        now = time.monotonic()
+        expired_keys = [key for key, (expires_at, _) in self.cache.items() if expires_at <= now]
         
         for key in expired_keys:
             del self.cache[key]
         
         if expired_keys:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+
+    def _record(self, outcome: str):
+        """Count a lookup outcome."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            get_metrics().counter(f"scheduler.idempotency.{outcome}")
+        except Exception as e:
+            logger.debug(f"Failed to record idempotency metric: {e}")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring."""
-        total_entries = len(self.cache)
-        completed_entries = sum(1 for entry in self.cache.values() 
-                               if entry.get('status') == 'completed')
-        in_progress_entries = sum(1 for entry in self.cache.values() 
-                                 if entry.get('status') == 'in_progress')
-        
         return {
-            'total_entries': total_entries,
-            'completed_entries': completed_entries,
-            'in_progress_entries': in_progress_entries,
+            'backend': 'redis' if self.redis is not None else 'memory',
+            'total_entries': len(self.cache),
+            'in_progress_entries': len(self._inflight),
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
             'cache_ttl_minutes': self.cache_ttl_minutes
         }
 
 
+# Delete the lock only if this worker still holds it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _preferences_hash(prefs) -> str:
+    """Stable hash of a user's preferences."""
+    data = asdict(prefs) if is_dataclass(prefs) else prefs
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+
+
+def _encode_response(response: ScheduleResponse) -> bytes:
+    """Compressed JSON encoding of a response."""
+    return zlib.compress(response.model_dump_json().encode('utf-8'), 6)
+
+
+def _decode_response(payload: bytes) -> ScheduleResponse:
+    """Decode a response stored by _encode_response."""
+    return ScheduleResponse.model_validate_json(zlib.decompress(payload))
+
+
 # Global idempotency manager
 _idempotency_manager = None
 
 def get_idempotency_manager() -> IdempotencyManager:
-    """Get global idempotency manager instance."""
+    """Get global idempotency manager, shared through Redis when the cache backend is redis."""
     global _idempotency_manager
     if _idempotency_manager is None:
-        _idempotency_manager = IdempotencyManager()
+        from ..core.config import get_config
+        cache_config = get_config().cache
+
+        redis_client = None
+        if cache_config.backend == "redis":
+            try:
+                import redis.asyncio as redis
+                redis_client = redis.from_url(cache_config.redis_url)
+            except Exception as e:
+                logger.warning(f"Redis idempotency store unavailable, using process memory: {e}")
+
+        _idempotency_manager = IdempotencyManager(
+            cache_ttl_minutes=cache_config.ttl_minutes,
+            redis_client=redis_client,
+            lock_timeout_seconds=cache_config.idempotency_lock_seconds
+        )
     return _idempotency_manager
 
 
@@ -6,7 +6,7 @@ Defines abstract interfaces for data persistence operations.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ...core.domain import (
@@ -16,6 +16,42 @@ from ...core.domain import (
 
 logger = logging.getLogger(__name__)
 
+# Users per bulk query; keeps PostgREST `in` filters well under URL limits
+DB_BATCH_SIZE = 200
+
+# Rows per PostgREST page; matches Supabase's default max-rows, above which
+# responses are truncated without an error
+DB_PAGE_SIZE = 1000
+
+
+def parse_db_timestamp(value) -> datetime:
+    """Parse a timestamp from a PostgREST (ISO string) or asyncpg (datetime) row."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+async def fetch_all_rows(build_query: Callable[[], Any], page_size: int = DB_PAGE_SIZE) -> List[Dict[str, Any]]:
+    """
+    Every row of a PostgREST select, read page by page in id order.
+
+    Args:
+        build_query: Returns a fresh filtered select for each page
+        page_size: Rows per page
+
+    Returns:
+        All matching rows
+    """
+    rows: List[Dict[str, Any]] = []
+    while True:
+        response = await build_query().order("id").range(
+            len(rows), len(rows) + page_size - 1
+        ).execute()
+        page = response.data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+
 
 class BaseTaskRepository(ABC):
     """Abstract interface for task data access."""
@@ -34,6 +70,22 @@ class BaseTaskRepository(ABC):
         """
         pass
 
+    async def load_tasks_many(self, user_ids: List[str], horizon_days: int) -> Dict[str, List[Task]]:
+        """
+        Load tasks for several users.
+
+        Backends that can query users in bulk override this; the default
+        loads one user at a time.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days ahead to consider
+
+        Returns:
+            Mapping of user_id to tasks
+        """
+        return {user_id: await self.load_tasks(user_id, horizon_days) for user_id in user_ids}
+
     @abstractmethod
     async def update_task(self, user_id: str, task_id: str, updates: Dict[str, Any]):
         """
@@ -64,6 +116,23 @@ class BaseEventRepository(ABC):
         """
         pass
 
+    async def load_calendar_busy_many(
+        self, user_ids: List[str], horizon_days: int
+    ) -> Dict[str, List[BusyEvent]]:
+        """
+        Load busy calendar events for several users.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days ahead to consider
+
+        Returns:
+            Mapping of user_id to busy events
+        """
+        return {
+            user_id: await self.load_calendar_busy(user_id, horizon_days) for user_id in user_ids
+        }
+
 
 class BasePreferencesRepository(ABC):
     """Abstract interface for preferences data access."""
@@ -81,6 +150,18 @@ class BasePreferencesRepository(ABC):
         """
         pass
 
+    async def load_preferences_many(self, user_ids: List[str]) -> Dict[str, Preferences]:
+        """
+        Load preferences for several users.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Mapping of user_id to preferences
+        """
+        return {user_id: await self.load_preferences(user_id) for user_id in user_ids}
+
     @abstractmethod
     async def update_preferences(self, user_id: str, updates: Dict[str, Any]):
         """
@@ -124,6 +205,21 @@ class BaseHistoryRepository(ABC):
         """
         pass
 
+    async def load_history_many(
+        self, user_ids: List[str], horizon_days: int = 60
+    ) -> Dict[str, List[CompletionEvent]]:
+        """
+        Load completion history for several users.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days back to load history
+
+        Returns:
+            Mapping of user_id to completion events
+        """
+        return {user_id: await self.load_history(user_id, horizon_days) for user_id in user_ids}
+
     @abstractmethod
     async def record_completion(
         self, user_id: str, task_id: str, scheduled_slot: datetime,
@@ -183,7 +279,7 @@ class BaseScheduleRepository(ABC):
 
     @abstractmethod
     async def get_recent_schedules(
-        self, user_id: str, days_back: int = 7
+        self, user_id: str, days_back: int = 7, include_upcoming: bool = False
     ) -> List[ScheduleBlock]:
         """
         Get recently scheduled blocks for a user.
@@ -191,8 +287,24 @@ class BaseScheduleRepository(ABC):
         Args:
             user_id: User identifier
             days_back: Days back to retrieve
+            include_upcoming: Also return blocks that end in the future
 
         Returns:
             List of recent schedule blocks
         """
         pass
+
+    async def get_latest_schedule(self, user_id: str, days_back: int = 7) -> List[ScheduleBlock]:
+        """
+        Get the blocks of the user's most recent persisted run.
+
+        Backends that keep only one run per user can rely on this default.
+
+        Args:
+            user_id: User identifier
+            days_back: Days back to retrieve
+
+        Returns:
+            Blocks of the latest run, including upcoming ones
+        """
+        return await self.get_recent_schedules(user_id, days_back, include_upcoming=True)
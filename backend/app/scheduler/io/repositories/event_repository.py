@@ -5,10 +5,10 @@ Handles loading calendar events and busy periods from various storage backends.
 """
 
 import logging
-from typing import List
+from typing import Any, Dict, List, Tuple
 from datetime import datetime, timedelta
 
-from .base_repository import BaseEventRepository
+from .base_repository import DB_BATCH_SIZE, BaseEventRepository, fetch_all_rows, parse_db_timestamp
 from ...core.domain import BusyEvent
 
 logger = logging.getLogger(__name__)
@@ -49,6 +49,57 @@ class EventRepository(BaseEventRepository):
             logger.error(f"Failed to load events for user {user_id}: {e}")
             return []
 
+    async def load_calendar_busy_many(
+        self, user_ids: List[str], horizon_days: int
+    ) -> Dict[str, List[BusyEvent]]:
+        """
+        Load busy events for several users, one query per source table and
+        DB_BATCH_SIZE users on the database backend.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days ahead to consider
+
+        Returns:
+            Mapping of user_id to busy events (empty list for users without events).
+            Users whose batch failed to load are left out.
+        """
+        if self.storage.backend_type != "database":
+            return await super().load_calendar_busy_many(user_ids, horizon_days)
+
+        events_by_user: Dict[str, List[BusyEvent]] = {}
+        start_date = datetime.utcnow()
+        end_date = start_date + timedelta(days=horizon_days)
+        n_rows = 0
+
+        for i in range(0, len(user_ids), DB_BATCH_SIZE):
+            batch = user_ids[i:i + DB_BATCH_SIZE]
+            try:
+                calendar_rows, task_rows = await self._fetch_busy_rows(batch, start_date, end_date)
+                loaded: Dict[str, List[BusyEvent]] = {user_id: [] for user_id in batch}
+                for event_data in calendar_rows:
+                    user_id = event_data["user_id"]
+                    loaded.setdefault(user_id, []).append(
+                        self._event_from_calendar_row(event_data, user_id)
+                    )
+                for event_data in task_rows:
+                    user_id = event_data["user_id"]
+                    loaded.setdefault(user_id, []).append(
+                        self._event_from_task_row(event_data, user_id)
+                    )
+            except Exception as e:
+                logger.error(f"Failed to bulk load events from database for {len(batch)} users: {e}")
+                continue
+
+            events_by_user.update(loaded)
+            n_rows += len(calendar_rows) + len(task_rows)
+
+        logger.info(
+            f"Loaded {n_rows} calendar events from database "
+            f"for {len(events_by_user)}/{len(user_ids)} users"
+        )
+        return events_by_user
+
     async def _load_events_from_memory(self, user_id: str, horizon_days: int) -> List[BusyEvent]:
         """Load events from memory storage."""
         events = self.storage.get_events(user_id)
@@ -69,69 +120,21 @@ class EventRepository(BaseEventRepository):
     async def _load_events_from_db(self, user_id: str, horizon_days: int) -> List[BusyEvent]:
         """Load events from database."""
         try:
-            from app.config.database.supabase import get_supabase
-
-            supabase = get_supabase()
-
             # Calculate date range
             start_date = datetime.utcnow()
             end_date = start_date + timedelta(days=horizon_days)
 
-            # Query calendar events from database - first check calendar_events table, then tasks table for events
-            calendar_response = supabase.table("calendar_events").select("*").eq(
-                "user_id", user_id
-            ).gte("start_time", start_date.isoformat()).lte(
-                "end_time", end_date.isoformat()
-            ).execute()
+            # Calendar events, plus events from the consolidated tasks table
+            calendar_rows, task_rows = await self._fetch_busy_rows([user_id], start_date, end_date)
 
-            # Also get events from consolidated tasks table
-            tasks_response = supabase.table("tasks").select("*").eq(
-                "user_id", user_id
-            ).eq("task_type", "event").gte(
-                "start_date", start_date.isoformat()
-            ).lte("end_date", end_date.isoformat()).execute()
-
-            events = []
-
-            # Process calendar_events table data
-            for event_data in calendar_response.data:
-                # Convert database event to scheduler BusyEvent
-                start_time = datetime.fromisoformat(event_data["start_time"].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(event_data["end_time"].replace('Z', '+00:00'))
-
-                event = BusyEvent(
-                    id=event_data["id"],
-                    user_id=user_id,
-                    title=event_data.get("title", "Calendar Event"),
-                    start=start_time,
-                    end=end_time,
-                    source=event_data.get("provider", "calendar"),
-                    hard=True,
-                    location=event_data.get("location", ""),
-                    metadata={"original_table": "calendar_events"}
-                )
-                events.append(event)
-
-            # Process tasks table events
-            for event_data in tasks_response.data:
-                # Convert task event to scheduler BusyEvent
-                start_time = datetime.fromisoformat(event_data["start_date"].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(
-                    event_data["end_date"].replace('Z', '+00:00')
-                ) if event_data.get("end_date") else start_time + timedelta(hours=1)
-
-                event = BusyEvent(
-                    id=event_data["id"],
-                    user_id=user_id,
-                    title=event_data.get("title", "Event"),
-                    start=start_time,
-                    end=end_time,
-                    source=event_data.get("sync_source", "pulse"),
-                    hard=True,
-                    location=event_data.get("location", ""),
-                    metadata={"original_table": "tasks", "task_type": event_data.get("task_type")}
-                )
-                events.append(event)
+            events = [
+                self._event_from_calendar_row(event_data, user_id)
+                for event_data in calendar_rows
+            ]
+            events.extend(
+                self._event_from_task_row(event_data, user_id)
+                for event_data in task_rows
+            )
 
             logger.info(f"Loaded {len(events)} calendar events from database for user {user_id}")
             return events
@@ -139,3 +142,68 @@ class EventRepository(BaseEventRepository):
         except Exception as e:
             logger.error(f"Failed to load events from database: {e}")
             return []
+
+    async def _fetch_busy_rows(
+        self, user_ids: List[str], start_date: datetime, end_date: datetime
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Calendar and event-task rows in range, over asyncpg when available, else PostgREST."""
+        from app.database.fast_reads import get_fast_reads
+
+        rows = await get_fast_reads().fetch_busy_events(user_ids, start_date, end_date)
+        if rows is not None:
+            return rows
+
+        from app.config.database.supabase import get_async_supabase
+
+        supabase = get_async_supabase()
+        calendar_rows = await fetch_all_rows(
+            lambda: supabase.table("calendar_events").select("*").in_(
+                "user_id", user_ids
+            ).gte("start_time", start_date.isoformat()).lte(
+                "end_time", end_date.isoformat()
+            )
+        )
+
+        task_rows = await fetch_all_rows(
+            lambda: supabase.table("tasks").select("*").in_(
+                "user_id", user_ids
+            ).eq("task_type", "event").gte(
+                "start_date", start_date.isoformat()
+            ).lte("end_date", end_date.isoformat())
+        )
+
+        return calendar_rows, task_rows
+
+    def _event_from_calendar_row(self, event_data: Dict[str, Any], user_id: str) -> BusyEvent:
+        """Convert a calendar_events row to a scheduler BusyEvent."""
+        start_time = parse_db_timestamp(event_data["start_time"])
+        end_time = parse_db_timestamp(event_data["end_time"])
+
+        return BusyEvent(
+            id=event_data["id"],
+            title=event_data.get("title", "Calendar Event"),
+            start=start_time,
+            end=end_time,
+            source=event_data.get("provider", "calendar"),
+            hard=True,
+            location=event_data.get("location", ""),
+            metadata={"original_table": "calendar_events", "user_id": user_id}
+        )
+
+    def _event_from_task_row(self, event_data: Dict[str, Any], user_id: str) -> BusyEvent:
+        """Convert an event row from the consolidated tasks table to a scheduler BusyEvent."""
+        start_time = parse_db_timestamp(event_data["start_date"])
+        end_time = parse_db_timestamp(
+            event_data["end_date"]
+        ) if event_data.get("end_date") else start_time + timedelta(hours=1)
+
+        return BusyEvent(
+            id=event_data["id"],
+            title=event_data.get("title", "Event"),
+            start=start_time,
+            end=end_time,
+            source=event_data.get("sync_source", "pulse"),
+            hard=True,
+            location=event_data.get("location", ""),
+            metadata={"original_table": "tasks", "task_type": event_data.get("task_type"), "user_id": user_id}
+        )
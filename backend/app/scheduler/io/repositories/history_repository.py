@@ -5,10 +5,10 @@ Handles loading and recording task completion history from various storage backe
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from .base_repository import BaseHistoryRepository
+from .base_repository import DB_BATCH_SIZE, BaseHistoryRepository, fetch_all_rows, parse_db_timestamp
 from ...core.domain import CompletionEvent
 
 logger = logging.getLogger(__name__)
@@ -81,6 +81,51 @@ class HistoryRepository(BaseHistoryRepository):
         except Exception as e:
             logger.error(f"Failed to record completion for task {task_id}, user {user_id}: {e}")
 
+    async def load_history_many(
+        self, user_ids: List[str], horizon_days: int = 60
+    ) -> Dict[str, List[CompletionEvent]]:
+        """
+        Load completion history for several users, one query per DB_BATCH_SIZE
+        users on the database backend.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days back to load history
+
+        Returns:
+            Mapping of user_id to completion events. Users whose batch failed
+            to load are left out.
+        """
+        if self.storage.backend_type != "database":
+            return await super().load_history_many(user_ids, horizon_days)
+
+        history_by_user: Dict[str, List[CompletionEvent]] = {}
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=horizon_days)
+        n_rows = 0
+
+        for i in range(0, len(user_ids), DB_BATCH_SIZE):
+            batch = user_ids[i:i + DB_BATCH_SIZE]
+            try:
+                rows = await self._fetch_completion_rows(batch, start_date, end_date)
+                loaded: Dict[str, List[CompletionEvent]] = {user_id: [] for user_id in batch}
+                for completion_data in rows:
+                    loaded.setdefault(completion_data["user_id"], []).append(
+                        self._completion_from_row(completion_data)
+                    )
+            except Exception as e:
+                logger.error(f"Failed to bulk load history from database for {len(batch)} users: {e}")
+                continue
+
+            history_by_user.update(loaded)
+            n_rows += len(rows)
+
+        logger.info(
+            f"Loaded {n_rows} completion events from database "
+            f"for {len(history_by_user)}/{len(user_ids)} users"
+        )
+        return history_by_user
+
     async def _load_history_from_memory(self, user_id: str, horizon_days: int) -> List[CompletionEvent]:
         """Load history from memory storage."""
         history = self.storage.get_history(user_id)
@@ -98,40 +143,14 @@ class HistoryRepository(BaseHistoryRepository):
     async def _load_history_from_db(self, user_id: str, horizon_days: int) -> List[CompletionEvent]:
         """Load history from database."""
         try:
-            from app.config.database.supabase import get_supabase
-
-            supabase = get_supabase()
-
             # Calculate date range (look back from current time)
             end_date = datetime.utcnow()
             start_date = end_date - timedelta(days=horizon_days)
 
             # Query completed tasks/task completions from database
-            response = supabase.table("task_completions").select("*").eq(
-                "user_id", user_id
-            ).gte("completed_at", start_date.isoformat()).lte(
-                "completed_at", end_date.isoformat()
-            ).execute()
-
-            history = []
-            for completion_data in response.data:
-                # Convert database completion to scheduler CompletionEvent
-                completion_time = datetime.fromisoformat(
-                    completion_data["completed_at"].replace('Z', '+00:00')
-                )
-
-                completion = CompletionEvent(
-                    task_id=completion_data["task_id"],
-                    title=completion_data.get("task_title", "Completed Task"),
-                    completed_at=completion_time,
-                    actual_minutes=completion_data.get("actual_minutes", 60),
-                    planned_minutes=completion_data.get("planned_minutes", 60),
-                    quality_rating=completion_data.get("quality_rating", 5),
-                    focus_rating=completion_data.get("focus_rating", 5),
-                    difficulty_rating=completion_data.get("difficulty_rating", 3),
-                    notes=completion_data.get("notes", "")
-                )
-                history.append(completion)
+            rows = await self._fetch_completion_rows([user_id], start_date, end_date)
+
+            history = [self._completion_from_row(completion_data) for completion_data in rows]
 
             logger.info(f"Loaded {len(history)} completion events from database for user {user_id}")
             return history
@@ -140,6 +159,53 @@ class HistoryRepository(BaseHistoryRepository):
             logger.error(f"Failed to load history from database: {e}")
             return []
 
+    async def _fetch_completion_rows(
+        self, user_ids: List[str], start_date: datetime, end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """Completion rows in range, over asyncpg when available, else PostgREST."""
+        from app.database.fast_reads import get_fast_reads
+
+        rows = await get_fast_reads().fetch_completions(user_ids, start_date, end_date)
+        if rows is not None:
+            return rows
+
+        from app.config.database.supabase import get_async_supabase
+
+        supabase = get_async_supabase()
+        return await fetch_all_rows(
+            lambda: supabase.table("task_completions").select("*").in_(
+                "user_id", user_ids
+            ).gte("completed_at", start_date.isoformat()).lte(
+                "completed_at", end_date.isoformat()
+            )
+        )
+
+    def _completion_from_row(self, completion_data: Dict[str, Any]) -> CompletionEvent:
+        """Convert a task_completions row to a scheduler CompletionEvent."""
+        completion_time = parse_db_timestamp(completion_data["completed_at"])
+
+        scheduled_slot = parse_db_timestamp(
+            completion_data["scheduled_slot"]
+        ) if completion_data.get("scheduled_slot") else completion_time
+
+        return CompletionEvent(
+            task_id=completion_data["task_id"],
+            scheduled_slot=scheduled_slot,
+            completed_at=completion_time,
+            skipped=completion_data.get("skipped", False),
+            delay_minutes=completion_data.get("delay_minutes", 0),
+            rescheduled_count=completion_data.get("rescheduled_count", 0),
+            metadata={
+                "title": completion_data.get("task_title", "Completed Task"),
+                "actual_minutes": completion_data.get("actual_minutes", 60),
+                "planned_minutes": completion_data.get("planned_minutes", 60),
+                "quality_rating": completion_data.get("quality_rating", 5),
+                "focus_rating": completion_data.get("focus_rating", 5),
+                "difficulty_rating": completion_data.get("difficulty_rating", 3),
+                "notes": completion_data.get("notes", "")
+            }
+        )
+
     async def _record_completion_in_memory(self, user_id: str, event: CompletionEvent):
         """Record completion in memory storage."""
         history = self.storage.get_history(user_id)
@@ -5,11 +5,11 @@ Handles loading and updating user scheduling preferences from various storage ba
 """
 
 import logging
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import asdict
 
-from .base_repository import BasePreferencesRepository
+from .base_repository import DB_BATCH_SIZE, BasePreferencesRepository
 from ...core.domain import Preferences
 from ....core.utils.timezone_utils import get_timezone_manager
 
@@ -99,6 +99,55 @@ class PreferencesRepository(BasePreferencesRepository):
             now = datetime.now()
             return now, now + timedelta(days=horizon_days)
 
+    async def load_preferences_many(self, user_ids: List[str]) -> Dict[str, Preferences]:
+        """
+        Load preferences for several users, with two queries per DB_BATCH_SIZE
+        users on the database backend.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Mapping of user_id to preferences (defaults for users without any).
+            Users whose batch failed to load are left out.
+        """
+        if self.storage.backend_type != "database":
+            return await super().load_preferences_many(user_ids)
+
+        from app.config.database.supabase import get_async_supabase
+
+        supabase = get_async_supabase()
+        prefs_by_user: Dict[str, Preferences] = {}
+
+        for i in range(0, len(user_ids), DB_BATCH_SIZE):
+            batch = user_ids[i:i + DB_BATCH_SIZE]
+            try:
+                prefs_response = await supabase.table("user_preferences").select("*").in_(
+                    "user_id", batch
+                ).execute()
+                users_response = await supabase.table("users").select("id, timezone").in_(
+                    "id", batch
+                ).execute()
+
+                rows_by_user: Dict[str, List[Dict[str, Any]]] = {user_id: [] for user_id in batch}
+                for pref in prefs_response.data:
+                    rows_by_user.setdefault(pref["user_id"], []).append(pref)
+                timezones = {
+                    user["id"]: user.get("timezone") or "UTC" for user in users_response.data
+                }
+                loaded = {
+                    user_id: self._preferences_from_rows(rows, timezones.get(user_id, "UTC"))
+                    for user_id, rows in rows_by_user.items()
+                }
+            except Exception as e:
+                logger.error(f"Failed to bulk load preferences from database for {len(batch)} users: {e}")
+                continue
+
+            prefs_by_user.update(loaded)
+
+        logger.info(f"Loaded preferences from database for {len(prefs_by_user)}/{len(user_ids)} users")
+        return prefs_by_user
+
     async def _load_preferences_from_memory(self, user_id: str) -> Preferences:
         """Load preferences from memory storage."""
         prefs = self.storage.get_preferences(user_id)
@@ -117,33 +166,18 @@ class PreferencesRepository(BasePreferencesRepository):
     async def _load_preferences_from_db(self, user_id: str) -> Preferences:
         """Load preferences from database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
 
-            supabase = get_supabase()
+            supabase = get_async_supabase()
 
             # Query user preferences from database
-            response = supabase.table("user_preferences").select("*").eq("user_id", user_id).execute()
-
-            prefs = {}
-            for pref in response.data:
-                key = pref["preference_key"]
-                value = pref["value"]
-                prefs[key] = value
+            response = await supabase.table("user_preferences").select("*").eq("user_id", user_id).execute()
 
             # Get user timezone from users table
-            user_response = supabase.table("users").select("timezone").eq("id", user_id).single().execute()
+            user_response = await supabase.table("users").select("timezone").eq("id", user_id).single().execute()
             timezone = user_response.data.get("timezone", "UTC") if user_response.data else "UTC"
 
-            # Create Preferences object with database data
-            preferences = Preferences(
-                timezone=timezone,
-                working_hours_start=prefs.get("working_hours_start", 9),
-                working_hours_end=prefs.get("working_hours_end", 17),
-                break_duration_minutes=prefs.get("break_duration_minutes", 15),
-                max_daily_work_hours=prefs.get("max_daily_work_hours", 8),
-                preferred_work_days=prefs.get("preferred_work_days", [1, 2, 3, 4, 5]),  # Mon-Fri
-                focus_time_blocks=prefs.get("focus_time_blocks", True)
-            )
+            preferences = self._preferences_from_rows(response.data, timezone)
 
             logger.info(f"Loaded preferences from database for user {user_id}")
             return preferences
@@ -152,6 +186,25 @@ class PreferencesRepository(BasePreferencesRepository):
             logger.error(f"Failed to load preferences from database: {e}")
             return Preferences(timezone="UTC")
 
+    def _preferences_from_rows(self, rows: List[Dict[str, Any]], timezone: str) -> Preferences:
+        """Build Preferences from user_preferences key/value rows."""
+        prefs = {}
+        for pref in rows:
+            key = pref["preference_key"]
+            value = pref["value"]
+            prefs[key] = value
+
+        # Create Preferences object with database data
+        return Preferences(
+            timezone=timezone,
+            working_hours_start=prefs.get("working_hours_start", 9),
+            working_hours_end=prefs.get("working_hours_end", 17),
+            break_duration_minutes=prefs.get("break_duration_minutes", 15),
+            max_daily_work_hours=prefs.get("max_daily_work_hours", 8),
+            preferred_work_days=prefs.get("preferred_work_days", [1, 2, 3, 4, 5]),  # Mon-Fri
+            focus_time_blocks=prefs.get("focus_time_blocks", True)
+        )
+
     async def _update_preferences_in_memory(self, user_id: str, updates: Dict[str, Any]):
         """Update preferences in memory storage."""
         current_prefs = self.storage.get_preferences(user_id)
@@ -60,6 +60,10 @@ class Repository:
         """Load tasks for scheduling within the horizon."""
         return await self.tasks.load_tasks(user_id, horizon_days)
 
+    async def load_tasks_many(self, user_ids: List[str], horizon_days: int) -> Dict[str, List[Task]]:
+        """Load tasks for several users in bulk."""
+        return await self.tasks.load_tasks_many(user_ids, horizon_days)
+
     async def update_task(self, user_id: str, task_id: str, updates: Dict[str, Any]):
         """Update task parameters."""
         return await self.tasks.update_task(user_id, task_id, updates)
@@ -69,11 +73,21 @@ class Repository:
         """Load busy calendar events within the horizon."""
         return await self.events.load_calendar_busy(user_id, horizon_days)
 
+    async def load_calendar_busy_many(
+        self, user_ids: List[str], horizon_days: int
+    ) -> Dict[str, List[BusyEvent]]:
+        """Load busy calendar events for several users in bulk."""
+        return await self.events.load_calendar_busy_many(user_ids, horizon_days)
+
     # Preferences operations
     async def load_preferences(self, user_id: str) -> Preferences:
         """Load user preferences for scheduling."""
         return await self.preferences.load_preferences(user_id)
 
+    async def load_preferences_many(self, user_ids: List[str]) -> Dict[str, Preferences]:
+        """Load preferences for several users in bulk."""
+        return await self.preferences.load_preferences_many(user_ids)
+
     async def update_preferences(self, user_id: str, updates: Dict[str, Any]):
         """Update user preferences."""
         return await self.preferences.update_preferences(user_id, updates)
@@ -87,6 +101,12 @@ class Repository:
         """Load historical completion data for learning."""
         return await self.history.load_history(user_id, horizon_days)
 
+    async def load_history_many(
+        self, user_ids: List[str], horizon_days: int = 60
+    ) -> Dict[str, List[CompletionEvent]]:
+        """Load completion history for several users in bulk."""
+        return await self.history.load_history_many(user_ids, horizon_days)
+
     async def record_completion(
         self, user_id: str, task_id: str, scheduled_slot: datetime,
         completed_at: Optional[datetime] = None, skipped: bool = False
@@ -117,10 +137,14 @@ class Repository:
         return await self.schedules.persist_run_summary(user_id, solution, weights, context)
 
     async def get_recent_schedules(
-        self, user_id: str, days_back: int = 7
+        self, user_id: str, days_back: int = 7, include_upcoming: bool = False
     ) -> List[ScheduleBlock]:
         """Get recently scheduled blocks for a user."""
-        return await self.schedules.get_recent_schedules(user_id, days_back)
+        return await self.schedules.get_recent_schedules(user_id, days_back, include_upcoming)
+
+    async def get_latest_schedule(self, user_id: str, days_back: int = 7) -> List[ScheduleBlock]:
+        """Get the blocks of the user's most recent persisted run."""
+        return await self.schedules.get_latest_schedule(user_id, days_back)
 
 
 # Global repository instance
@@ -89,7 +89,7 @@ class ScheduleRepository(BaseScheduleRepository):
             logger.error(f"Failed to persist run summary for user {user_id}: {e}")
 
     async def get_recent_schedules(
-        self, user_id: str, days_back: int = 7
+        self, user_id: str, days_back: int = 7, include_upcoming: bool = False
     ) -> List[ScheduleBlock]:
         """
         Get recently scheduled blocks for a user.
@@ -97,15 +97,20 @@ class ScheduleRepository(BaseScheduleRepository):
         Args:
             user_id: User identifier
             days_back: Days back to retrieve
+            include_upcoming: Also return blocks that end in the future
 
         Returns:
             List of recent schedule blocks
         """
         try:
             if self.storage.backend_type == "memory":
-                return await self._get_recent_schedules_from_memory(user_id, days_back)
+                return await self._get_recent_schedules_from_memory(
+                    user_id, days_back, include_upcoming
+                )
             elif self.storage.backend_type == "database":
-                return await self._get_recent_schedules_from_db(user_id, days_back)
+                return await self._get_recent_schedules_from_db(
+                    user_id, days_back, include_upcoming
+                )
             else:
                 return []
 
@@ -113,6 +118,36 @@ class ScheduleRepository(BaseScheduleRepository):
             logger.error(f"Failed to get recent schedules for user {user_id}: {e}")
             return []
 
+    async def get_latest_schedule(self, user_id: str, days_back: int = 7) -> List[ScheduleBlock]:
+        """
+        Get the blocks of the user's most recent persisted run.
+
+        Unlike get_recent_schedules this never mixes runs: on the database
+        backend, where every run appends its blocks, only the newest run's
+        job is returned (including upcoming blocks).
+
+        Args:
+            user_id: User identifier
+            days_back: Days back to retrieve
+
+        Returns:
+            Blocks of the latest run
+        """
+        try:
+            if self.storage.backend_type == "memory":
+                # Each persist replaces the stored blocks
+                return await self._get_recent_schedules_from_memory(
+                    user_id, days_back, include_upcoming=True
+                )
+            elif self.storage.backend_type == "database":
+                return await self._get_latest_schedule_from_db(user_id, days_back)
+            else:
+                return []
+
+        except Exception as e:
+            logger.error(f"Failed to get latest schedule for user {user_id}: {e}")
+            return []
+
     async def _persist_schedule_to_memory(self, user_id: str, solution: ScheduleSolution):
         """Persist schedule to memory storage."""
         self.storage.set_schedules(user_id, solution.blocks)
@@ -123,9 +158,14 @@ class ScheduleRepository(BaseScheduleRepository):
     ):
         """Persist schedule to database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
 
-            supabase = get_supabase()
+            supabase = get_async_supabase()
+
+            # Every block of a run carries the run's job id, so the latest run
+            # can be read back on its own
+            created_at = datetime.utcnow().isoformat()
+            run_id = job_id or f"schedule_{user_id}_{int(datetime.utcnow().timestamp())}"
 
             # Prepare schedule blocks for database storage
             blocks = []
@@ -133,14 +173,14 @@ class ScheduleRepository(BaseScheduleRepository):
                 block_data = {
                     "id": f"{user_id}_{block.task_id}_{int(block.start.timestamp())}",
                     "user_id": user_id,
-                    "job_id": job_id,
+                    "job_id": run_id,
                     "task_id": block.task_id,
-                    "task_title": block.title,
+                    "task_title": getattr(block, 'title', None),
                     "start_time": block.start.isoformat(),
                     "end_time": block.end.isoformat(),
                     "duration_minutes": int((block.end - block.start).total_seconds() / 60),
                     "block_type": "task",
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": created_at,
                     "metadata": {
                         "solution_score": solution.objective_value if hasattr(solution, 'objective_value') else None,
                         "job_id": job_id
@@ -148,24 +188,24 @@ class ScheduleRepository(BaseScheduleRepository):
                 }
                 blocks.append(block_data)
 
-            # Insert schedule blocks into database
+            # Blocks kept from an earlier run reuse their id; they move to this run
             if blocks:
-                response = supabase.table("schedule_blocks").insert(blocks).execute()
+                await supabase.table("schedule_blocks").upsert(blocks, on_conflict="id").execute()
                 logger.info(f"Persisted {len(blocks)} schedule blocks to database for user {user_id}")
 
             # Also persist schedule summary
             schedule_summary = {
-                "id": job_id or f"schedule_{user_id}_{int(datetime.utcnow().timestamp())}",
+                "id": run_id,
                 "user_id": user_id,
                 "job_id": job_id,
                 "total_blocks": len(solution.blocks),
                 "total_tasks": len(set(block.task_id for block in solution.blocks)),
                 "objective_value": solution.objective_value if hasattr(solution, 'objective_value') else None,
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": created_at,
                 "metadata": solution.metadata if hasattr(solution, 'metadata') else {}
             }
 
-            supabase.table("schedules").insert(schedule_summary).execute()
+            await supabase.table("schedules").insert(schedule_summary).execute()
             logger.info(f"Persisted schedule summary to database for user {user_id}")
 
         except Exception as e:
@@ -184,9 +224,9 @@ class ScheduleRepository(BaseScheduleRepository):
     async def _persist_run_to_db(self, run: SchedulerRun):
         """Persist run summary to database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
 
-            supabase = get_supabase()
+            supabase = get_async_supabase()
 
             # Prepare run data for database storage
             run_data = {
@@ -211,60 +251,52 @@ class ScheduleRepository(BaseScheduleRepository):
             }
 
             # Insert run summary into database
-            supabase.table("scheduler_runs").insert(run_data).execute()
+            await supabase.table("scheduler_runs").insert(run_data).execute()
             logger.info(f"Persisted scheduler run {run.run_id} to database")
 
         except Exception as e:
             logger.error(f"Failed to persist run to database: {e}")
 
     async def _get_recent_schedules_from_memory(
-        self, user_id: str, days_back: int
+        self, user_id: str, days_back: int, include_upcoming: bool = False
     ) -> List[ScheduleBlock]:
         """Get recent schedules from memory storage."""
         blocks = self.storage.get_schedules(user_id)
 
-        # Filter to recent blocks
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        recent_blocks = [
-            block for block in blocks
-            if block.start >= cutoff_date
-        ]
+        # Filter to recent blocks, comparing in each block's own timezone
+        recent_blocks = []
+        for block in blocks:
+            now = datetime.now(block.start.tzinfo)
+            if block.start < now - timedelta(days=days_back):
+                continue
+            if not include_upcoming and block.end > now:
+                continue
+            recent_blocks.append(block)
 
         return recent_blocks
 
     async def _get_recent_schedules_from_db(
-        self, user_id: str, days_back: int
+        self, user_id: str, days_back: int, include_upcoming: bool = False
     ) -> List[ScheduleBlock]:
         """Get recent schedules from database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
 
-            supabase = get_supabase()
+            supabase = get_async_supabase()
 
             # Calculate date range
             end_date = datetime.utcnow()
             start_date = end_date - timedelta(days=days_back)
 
             # Query recent schedule blocks from database
-            response = supabase.table("schedule_blocks").select("*").eq(
+            query = supabase.table("schedule_blocks").select("*").eq(
                 "user_id", user_id
-            ).gte("start_time", start_date.isoformat()).lte(
-                "end_time", end_date.isoformat()
-            ).order("start_time").execute()
+            ).gte("start_time", start_date.isoformat())
+            if not include_upcoming:
+                query = query.lte("end_time", end_date.isoformat())
+            response = await query.order("start_time").execute()
 
-            blocks = []
-            for block_data in response.data:
-                # Convert database block to scheduler ScheduleBlock
-                start_time = datetime.fromisoformat(block_data["start_time"].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(block_data["end_time"].replace('Z', '+00:00'))
-
-                block = ScheduleBlock(
-                    task_id=block_data["task_id"],
-                    title=block_data["task_title"],
-                    start=start_time,
-                    end=end_time
-                )
-                blocks.append(block)
+            blocks = [self._block_from_row(block_data) for block_data in response.data]
 
             logger.info(f"Loaded {len(blocks)} recent schedule blocks from database for user {user_id}")
             return blocks
@@ -272,3 +304,34 @@ class ScheduleRepository(BaseScheduleRepository):
         except Exception as e:
             logger.error(f"Failed to load recent schedules from database: {e}")
             return []
+
+    async def _get_latest_schedule_from_db(self, user_id: str, days_back: int) -> List[ScheduleBlock]:
+        """Get the latest run's blocks from database."""
+        from app.config.database.supabase import get_async_supabase
+
+        supabase = get_async_supabase()
+
+        latest = await supabase.table("schedule_blocks").select("job_id").eq(
+            "user_id", user_id
+        ).order("created_at", desc=True).limit(1).execute()
+        if not latest.data:
+            return []
+
+        start_date = datetime.utcnow() - timedelta(days=days_back)
+        response = await supabase.table("schedule_blocks").select("*").eq(
+            "user_id", user_id
+        ).eq("job_id", latest.data[0]["job_id"]).gte(
+            "start_time", start_date.isoformat()
+        ).order("start_time").execute()
+
+        blocks = [self._block_from_row(block_data) for block_data in response.data]
+        logger.info(f"Loaded {len(blocks)} blocks of the latest schedule for user {user_id}")
+        return blocks
+
+    def _block_from_row(self, block_data: Dict[str, Any]) -> ScheduleBlock:
+        """Convert a schedule_blocks row to a scheduler ScheduleBlock."""
+        return ScheduleBlock(
+            task_id=block_data["task_id"],
+            start=datetime.fromisoformat(block_data["start_time"].replace('Z', '+00:00')),
+            end=datetime.fromisoformat(block_data["end_time"].replace('Z', '+00:00'))
+        )
@@ -9,7 +9,7 @@ from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from dataclasses import asdict
 
-from .base_repository import BaseTaskRepository
+from .base_repository import DB_BATCH_SIZE, BaseTaskRepository, fetch_all_rows, parse_db_timestamp
 from ...core.domain import Task
 
 logger = logging.getLogger(__name__)
@@ -71,6 +71,46 @@ class TaskRepository(BaseTaskRepository):
         except Exception as e:
             logger.error(f"Failed to update task {task_id} for user {user_id}: {e}")
 
+    async def load_tasks_many(self, user_ids: List[str], horizon_days: int) -> Dict[str, List[Task]]:
+        """
+        Load tasks for several users, one query per DB_BATCH_SIZE users on the database backend.
+
+        Args:
+            user_ids: User identifiers
+            horizon_days: Days ahead to consider
+
+        Returns:
+            Mapping of user_id to tasks (empty list for users without tasks).
+            Users whose batch failed to load are left out.
+        """
+        if self.storage.backend_type != "database":
+            return await super().load_tasks_many(user_ids, horizon_days)
+
+        tasks_by_user: Dict[str, List[Task]] = {}
+        end_date = datetime.utcnow() + timedelta(days=horizon_days)
+        n_rows = 0
+
+        for i in range(0, len(user_ids), DB_BATCH_SIZE):
+            batch = user_ids[i:i + DB_BATCH_SIZE]
+            try:
+                rows = await self._fetch_pending_rows(batch, end_date)
+                loaded: Dict[str, List[Task]] = {user_id: [] for user_id in batch}
+                for task_data in rows:
+                    loaded.setdefault(task_data["user_id"], []).append(
+                        self._task_from_row(task_data)
+                    )
+            except Exception as e:
+                logger.error(f"Failed to bulk load tasks from database for {len(batch)} users: {e}")
+                continue
+
+            tasks_by_user.update(loaded)
+            n_rows += len(rows)
+
+        logger.info(
+            f"Loaded {n_rows} tasks from database for {len(tasks_by_user)}/{len(user_ids)} users"
+        )
+        return tasks_by_user
+
     async def _load_tasks_from_memory(self, user_id: str, horizon_days: int) -> List[Task]:
         """Load tasks from memory storage."""
         tasks = self.storage.get_tasks(user_id)
@@ -90,49 +130,13 @@ class TaskRepository(BaseTaskRepository):
     async def _load_tasks_from_db(self, user_id: str, horizon_days: int) -> List[Task]:
         """Load tasks from database."""
         try:
-            from app.config.database.supabase import get_supabase
-
-            supabase = get_supabase()
-
             # Calculate date range
             end_date = datetime.utcnow() + timedelta(days=horizon_days)
 
             # Query tasks from database
-            response = supabase.table("tasks").select("*").eq(
-                "user_id", user_id
-            ).eq("status", "pending").lte(
-                "due_date", end_date.isoformat()
-            ).execute()
-
-            tasks = []
-            for task_data in response.data:
-                # Convert database task to scheduler Task
-                task = Task(
-                    id=task_data["id"],
-                    user_id=task_data["user_id"],
-                    title=task_data["title"],
-                    kind=task_data.get("kind", "task"),
-                    estimated_minutes=task_data.get("estimated_minutes", 60),
-                    min_block_minutes=task_data.get("min_block_minutes", 30),
-                    max_block_minutes=task_data.get("max_block_minutes", 120),
-                    deadline=datetime.fromisoformat(
-                        task_data["due_date"].replace('Z', '+00:00')
-                    ) if task_data.get("due_date") else None,
-                    earliest_start=datetime.fromisoformat(
-                        task_data["earliest_start"].replace('Z', '+00:00')
-                    ) if task_data.get("earliest_start") else None,
-                    preferred_windows=task_data.get("preferred_windows", []),
-                    avoid_windows=task_data.get("avoid_windows", []),
-                    fixed=task_data.get("fixed", False),
-                    parent_task_id=task_data.get("parent_task_id"),
-                    prerequisites=task_data.get("prerequisites", []),
-                    weight=task_data.get("weight", 1.0),
-                    course_id=task_data.get("course_id"),
-                    must_finish_before=task_data.get("must_finish_before"),
-                    tags=task_data.get("tags", []),
-                    pinned_slots=task_data.get("pinned_slots", [])
-                )
-                tasks.append(task)
+            rows = await self._fetch_pending_rows([user_id], end_date)
+
+            tasks = [self._task_from_row(task_data) for task_data in rows]
 
             logger.info(f"Loaded {len(tasks)} tasks from database for user {user_id}")
             return tasks
@@ -141,6 +145,54 @@ class TaskRepository(BaseTaskRepository):
             logger.error(f"Failed to load tasks from database: {e}")
             return []
 
+    async def _fetch_pending_rows(self, user_ids: List[str], end_date: datetime) -> List[Dict[str, Any]]:
+        """Pending task rows due by end_date, over asyncpg when available, else PostgREST."""
+        from app.database.fast_reads import get_fast_reads
+
+        rows = await get_fast_reads().fetch_pending_tasks(user_ids, end_date)
+        if rows is not None:
+            return rows
+
+        from app.config.database.supabase import get_async_supabase
+
+        supabase = get_async_supabase()
+        return await fetch_all_rows(
+            lambda: supabase.table("tasks").select("*").in_(
+                "user_id", user_ids
+            ).eq("status", "pending").lte("due_date", end_date.isoformat())
+        )
+
+    def _task_from_row(self, task_data: Dict[str, Any]) -> Task:
+        """Convert a database task row to a scheduler Task."""
+        return Task(
+            id=task_data["id"],
+            user_id=task_data["user_id"],
+            title=task_data["title"],
+            kind=task_data.get("kind", "task"),
+            estimated_minutes=task_data.get("estimated_minutes", 60),
+            min_block_minutes=task_data.get("min_block_minutes", 30),
+            max_block_minutes=task_data.get("max_block_minutes", 120),
+            deadline=parse_db_timestamp(
+                task_data["due_date"]
+            ) if task_data.get("due_date") else None,
+            earliest_start=parse_db_timestamp(
+                task_data["earliest_start"]
+            ) if task_data.get("earliest_start") else None,
+            preferred_windows=task_data.get("preferred_windows", []),
+            avoid_windows=task_data.get("avoid_windows", []),
+            fixed=task_data.get("fixed", False),
+            parent_task_id=task_data.get("parent_task_id"),
+            prerequisites=task_data.get("prerequisites", []),
+            weight=task_data.get("weight", 1.0),
+            course_id=task_data.get("course_id"),
+            must_finish_before=task_data.get("must_finish_before"),
+            tags=task_data.get("tags", []),
+            pinned_slots=task_data.get("pinned_slots", []),
+            # Row versions feed the idempotency hash; the defaults would be "now"
+            created_at=parse_db_timestamp(task_data["created_at"]),
+            updated_at=parse_db_timestamp(task_data["updated_at"])
+        )
+
     async def _update_task_in_memory(self, user_id: str, task_id: str, updates: Dict[str, Any]):
         """Update task in memory storage."""
         tasks = self.storage.get_tasks(user_id)
@@ -114,6 +114,7 @@ class WeightTuner:
         
         # Algorithm-specific state
         self.algorithm_state = {}
+        self.revision = 0  # Saves of the stored state this state descends from
         
         # Initialize default arms
         self._initialize_arms()
@@ -413,6 +414,7 @@ class WeightTuner:
                 },
                 'weight_names': self.weight_names,
                 'recent_rewards': self.reward_history[-100:],  # Last 100 rewards
+                'revision': self.revision + 1
             }
             
             metadata = {
@@ -428,6 +430,7 @@ class WeightTuner:
             )
             
             if success:
+                self.revision += 1
                 logger.info(f"Bandit state saved for user {user_id}")
             
             return success
@@ -445,30 +448,7 @@ class WeightTuner:
                 logger.info(f"No saved bandit state found for user {user_id}")
                 return False
             
-            # Restore arms
-            self.arms = []
-            for arm_data in bandit_state['arms']:
-                arm = BanditArm(
-                    weights=arm_data['weights'],
-                    num_pulls=arm_data['num_pulls'],
-                    total_reward=arm_data['total_reward'],
-                    reward_variance=arm_data['reward_variance']
-                )
-                if arm_data['last_pulled']:
-                    arm.last_pulled = datetime.fromisoformat(arm_data['last_pulled'])
-                self.arms.append(arm)
-            
-            # Restore algorithm state
-            self.algorithm_state = bandit_state.get('algorithm_state', {})
-            
-            # Restore configuration
-            config_data = bandit_state.get('config', {})
-            self.config.algorithm = BanditAlgorithm(config_data.get('algorithm', 'thompson'))
-            self.config.exploration_rate = config_data.get('exploration_rate', 0.1)
-            
-            # Restore other data
-            self.weight_names = bandit_state.get('weight_names', self.weight_names)
-            self.reward_history = bandit_state.get('recent_rewards', [])
+            self.restore(bandit_state)
             
             logger.info(f"Bandit state loaded for user {user_id}")
             return True
@@ -476,6 +456,39 @@ class WeightTuner:
         except Exception as e:
             logger.error(f"Error loading bandit state for user {user_id}: {e}")
             return False
+    
+    def restore(self, bandit_state: Dict[str, Any]):
+        """
+        Restore bandit state from saved parameters.
+        
+        Args:
+            bandit_state: State as returned by ModelStore
+        """
+        # Restore arms
+        self.arms = []
+        for arm_data in bandit_state['arms']:
+            arm = BanditArm(
+                weights=arm_data['weights'],
+                num_pulls=arm_data['num_pulls'],
+                total_reward=arm_data['total_reward'],
+                reward_variance=arm_data['reward_variance']
+            )
+            if arm_data['last_pulled']:
+                arm.last_pulled = datetime.fromisoformat(arm_data['last_pulled'])
+            self.arms.append(arm)
+        
+        # Restore algorithm state
+        self.algorithm_state = bandit_state.get('algorithm_state', {})
+        
+        # Restore configuration
+        config_data = bandit_state.get('config', {})
+        self.config.algorithm = BanditAlgorithm(config_data.get('algorithm', 'thompson'))
+        self.config.exploration_rate = config_data.get('exploration_rate', 0.1)
+        
+        # Restore other data
+        self.weight_names = bandit_state.get('weight_names', self.weight_names)
+        self.reward_history = bandit_state.get('recent_rewards', [])
+        self.revision = bandit_state.get('revision', 0)
 
 
 def compute_reward(
@@ -65,6 +65,7 @@ class CompletionModel:
         self.is_fitted = False
         self.feature_names = []
         self.training_history = []
+        self.revision = 0  # Saves of the stored model this state descends from
         
     async def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -298,16 +299,17 @@ class CompletionModel:
                 logger.warning(f"Model not fitted, cannot save for user {user_id}")
                 return False
             
-            # Prepare model state
+            # Prepare model state; arrays are stored packed as float32
             model_params = {
-                'model_coef': self.model.coef_.tolist(),
-                'model_intercept': self.model.intercept_.tolist(),
+                'model_coef': self.model.coef_,
+                'model_intercept': self.model.intercept_,
                 'model_classes': self.model.classes_.tolist(),
-                'scaler_mean': self.scaler.mean_.tolist(),
-                'scaler_scale': self.scaler.scale_.tolist(),
+                'scaler_mean': self.scaler.mean_,
+                'scaler_scale': self.scaler.scale_,
                 'feature_names': self.feature_names,
                 'is_fitted': self.is_fitted,
                 'training_history': self.training_history[-10:],  # Recent history only
+                'revision': self.revision + 1,
                 'hyperparams': {
                     'learning_rate': self.learning_rate,
                     'regularization': self.regularization,
@@ -317,17 +319,18 @@ class CompletionModel:
             
             metadata = {
                 'model_type': 'completion',
-                'version': '1.0',
+                'version': '1.1',
                 'saved_at': datetime.now().isoformat(),
                 'n_features': len(self.feature_names),
                 'total_updates': len(self.training_history)
             }
             
-            success = await self.store.save_model_params(
+            success = await self.store.save_packed_params(
                 user_id, 'completion', model_params, metadata
             )
             
             if success:
+                self.revision += 1
                 logger.info(f"Completion model saved for user {user_id}")
             else:
                 logger.error(f"Failed to save completion model for user {user_id}")
@@ -355,24 +358,7 @@ class CompletionModel:
                 logger.info(f"No saved completion model found for user {user_id}")
                 return False
             
-            # Restore model state
-            self.model.coef_ = np.array(model_params['model_coef'])
-            self.model.intercept_ = np.array(model_params['model_intercept'])
-            self.model.classes_ = np.array(model_params['model_classes'])
-            
-            # Restore scaler
-            self.scaler.mean_ = np.array(model_params['scaler_mean'])
-            self.scaler.scale_ = np.array(model_params['scaler_scale'])
-            
-            # Restore metadata
-            self.feature_names = model_params['feature_names']
-            self.is_fitted = model_params['is_fitted']
-            self.training_history = model_params.get('training_history', [])
-            
-            # Restore hyperparameters if available
-            hyperparams = model_params.get('hyperparams', {})
-            self.learning_rate = hyperparams.get('learning_rate', self.learning_rate)
-            self.regularization = hyperparams.get('regularization', self.regularization)
+            self.restore(model_params)
             
             logger.info(f"Completion model loaded for user {user_id}")
             return True
@@ -381,6 +367,35 @@ class CompletionModel:
             logger.error(f"Error loading completion model for user {user_id}: {e}")
             return False
     
+    def restore(self, model_params: Dict[str, Any]):
+        """
+        Restore model state from saved parameters.
+        
+        Accepts both packed (array) and legacy JSON (list) parameters.
+        
+        Args:
+            model_params: Parameters as returned by ModelStore
+        """
+        # Copy out of the (possibly memory-mapped) float32 buffers
+        self.model.coef_ = np.array(model_params['model_coef'], dtype=np.float64)
+        self.model.intercept_ = np.array(model_params['model_intercept'], dtype=np.float64)
+        self.model.classes_ = np.array(model_params['model_classes'])
+        
+        # Restore scaler
+        self.scaler.mean_ = np.array(model_params['scaler_mean'], dtype=np.float64)
+        self.scaler.scale_ = np.array(model_params['scaler_scale'], dtype=np.float64)
+        
+        # Restore metadata
+        self.feature_names = model_params['feature_names']
+        self.is_fitted = model_params['is_fitted']
+        self.training_history = model_params.get('training_history', [])
+        self.revision = model_params.get('revision', 0)
+        
+        # Restore hyperparameters if available
+        hyperparams = model_params.get('hyperparams', {})
+        self.learning_rate = hyperparams.get('learning_rate', self.learning_rate)
+        self.regularization = hyperparams.get('regularization', self.regularization)
+    
     def get_feature_importance(self) -> Optional[Dict[str, float]]:
         """
         Get feature importance scores.
@@ -0,0 +1,96 @@
+"""
+Compact binary encoding for model parameters.
+
+Array-valued parameters are stored as packed little-endian float32 data
+behind a small JSON header holding the format version, array layout and the
+remaining scalar/list parameters (feature names, hyperparameters, history).
+Decoding is zero-copy: arrays are read-only views into the source buffer,
+which may be a memory-mapped file.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Union
+
+import numpy as np
+
+MAGIC = b"TPMP"
+FORMAT_VERSION = 1
+
+# magic, format version, header length
+_PREAMBLE = struct.Struct("<4sHI")
+_ALIGNMENT = 8
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def is_packed(buffer: Buffer) -> bool:
+    """Whether a buffer holds packed model parameters."""
+    return len(buffer) >= _PREAMBLE.size and bytes(buffer[:len(MAGIC)]) == MAGIC
+
+
+def pack_params(params: Dict[str, Any]) -> bytes:
+    """
+    Encode model parameters.
+
+    NumPy arrays are packed as float32; every other value must be JSON
+    serializable and is kept in the header.
+
+    Args:
+        params: Parameter name to value mapping
+
+    Returns:
+        Packed bytes
+    """
+    fields = {}
+    layout = []
+    chunks = []
+    offset = 0
+
+    for name, value in params.items():
+        if not isinstance(value, np.ndarray):
+            fields[name] = value
+            continue
+
+        data = np.ascontiguousarray(value, dtype='<f4').tobytes()
+        layout.append({'name': name, 'shape': list(value.shape), 'offset': offset})
+        padding = -len(data) % _ALIGNMENT
+        chunks.append(data + b"\0" * padding)
+        offset += len(data) + padding
+
+    header = json.dumps(
+        {'version': FORMAT_VERSION, 'arrays': layout, 'fields': fields},
+        separators=(',', ':'), default=str
+    ).encode()
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+
+    return b"".join([_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)), header, *chunks])
+
+
+def unpack_params(buffer: Buffer) -> Dict[str, Any]:
+    """
+    Decode packed model parameters.
+
+    Args:
+        buffer: Packed bytes or any buffer over them (e.g. an mmap)
+
+    Returns:
+        Parameter mapping with arrays as read-only float32 views into buffer
+    """
+    magic, version, header_len = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a packed model parameter buffer")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported packed model format version {version}")
+
+    header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_len]))
+    data_start = _PREAMBLE.size + header_len
+
+    params = dict(header['fields'])
+    for spec in header['arrays']:
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        array = np.frombuffer(
+            buffer, dtype='<f4', count=count, offset=data_start + spec['offset']
+        )
+        params[spec['name']] = array.reshape(spec['shape'])
+    return params
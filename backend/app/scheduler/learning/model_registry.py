@@ -0,0 +1,416 @@
+"""
+Per-user registry of learned models.
+
+Keeps each active user's fitted CompletionModel and WeightTuner resident in
+memory so scheduling requests do not reload them from the ModelStore, and
+concurrent requests for different users never share parameters. Residency
+is bounded by a user count and an approximate memory budget with LRU
+eviction; dirty models are written back asynchronously.
+
+Other workers may update the same user's models. Resident models are
+revalidated against the store's revision after a while, and a write-back
+whose stored model has a newer revision than the one it was loaded from is
+skipped in favor of the stored model, so one worker's stale copy never
+overwrites another's update.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .bandits import WeightTuner
+from .completion_model import CompletionModel
+
+logger = logging.getLogger(__name__)
+
+# Rough per-instance overhead of the sklearn estimator, scaler and bandit arms
+_BASE_MODEL_BYTES = 4096
+_BASE_TUNER_BYTES = 2048
+
+
+@dataclass
+class UserModels:
+    """One user's resident models."""
+    user_id: str
+    model: CompletionModel
+    tuner: WeightTuner
+    size_bytes: int = 0
+    dirty: bool = False
+    last_used: float = 0.0
+    validated_at: float = 0.0  # When the models were last checked against the store
+
+
+def estimate_size_bytes(model: CompletionModel, tuner: WeightTuner) -> int:
+    """Approximate resident memory of a user's models."""
+    size = _BASE_MODEL_BYTES + _BASE_TUNER_BYTES
+
+    if getattr(model, 'is_fitted', False):
+        for array in (
+            getattr(model.model, 'coef_', None), getattr(model.model, 'intercept_', None),
+            getattr(model.scaler, 'mean_', None), getattr(model.scaler, 'scale_', None)
+        ):
+            size += getattr(array, 'nbytes', 0)
+    size += 256 * len(getattr(model, 'training_history', []))
+
+    size += 64 * len(tuner.weight_names) * len(tuner.arms)
+    size += 8 * len(tuner.reward_history)
+    size += 512 * len(tuner.context_history)
+    return size
+
+
+class ModelRegistry:
+    """
+    LRU registry of per-user models.
+
+    Models are created by the given factories and loaded from their store
+    on a miss; concurrent misses for the same user share one load.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], CompletionModel],
+        tuner_factory: Callable[[], WeightTuner],
+        max_users: int = 1000,
+        memory_budget_mb: float = 256.0,
+        writeback_delay_seconds: float = 5.0,
+        revalidate_seconds: float = 60.0
+    ):
+        """
+        Initialize model registry.
+
+        Args:
+            model_factory: Creates an empty completion model
+            tuner_factory: Creates an empty weight tuner
+            max_users: Maximum number of resident users
+            memory_budget_mb: Approximate memory budget for resident models
+            writeback_delay_seconds: Delay before dirty models are saved, so
+                bursts of updates are written once
+            revalidate_seconds: How long resident models are served before
+                they are checked for newer revisions saved by other workers
+        """
+        self.model_factory = model_factory
+        self.tuner_factory = tuner_factory
+        self.max_users = max_users
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.writeback_delay_seconds = writeback_delay_seconds
+        self.revalidate_seconds = revalidate_seconds
+
+        self._entries: "OrderedDict[str, UserModels]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._writebacks: Dict[str, asyncio.Task] = {}
+        self._writeback_now: Dict[str, asyncio.Event] = {}
+        self._resident_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.refreshes = 0
+        self.conflicts = 0
+
+    async def get(self, user_id: str) -> UserModels:
+        """
+        Get a user's resident models, loading them on a miss.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            The user's models (shared with concurrent requests for the same user)
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            self._entries.move_to_end(user_id)
+            entry.last_used = time.monotonic()
+            self.hits += 1
+            self._record("hit")
+            # Dirty models are checked by their write-back instead
+            if (not entry.dirty and user_id not in self._writebacks and
+                    entry.last_used - entry.validated_at >= self.revalidate_seconds):
+                entry.validated_at = entry.last_used
+                self._adopt_newer(entry, *await self._load_stored(entry))
+            return entry
+
+        loading = self._loading.get(user_id)
+        if loading is None:
+            self.misses += 1
+            self._record("miss")
+            loading = asyncio.ensure_future(self._load(user_id))
+            self._loading[user_id] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(user_id, None))
+        return await asyncio.shield(loading)
+
+    async def preload(self, user_ids: Iterable[str]) -> int:
+        """
+        Make many users' models resident with bulk store loads.
+
+        Used by batch jobs and after deploys so each user does not pay a
+        separate store round trip on first use.
+
+        Args:
+            user_ids: Users to load; resident or loading users are skipped
+
+        Returns:
+            Number of users loaded
+        """
+        missing = [
+            user_id for user_id in dict.fromkeys(user_ids)
+            if user_id not in self._entries and user_id not in self._loading
+        ][:self.max_users]
+        if not missing:
+            return 0
+
+        models = {user_id: self.model_factory() for user_id in missing}
+        tuners = {user_id: self.tuner_factory() for user_id in missing}
+        sample = missing[0]
+        model_params, tuner_states = await asyncio.gather(
+            models[sample].store.load_many(missing, 'completion'),
+            tuners[sample].store.load_many(missing, 'bandit')
+        )
+
+        loaded = 0
+        for user_id in missing:
+            # A concurrent get() may have loaded the user meanwhile
+            if user_id in self._entries:
+                continue
+
+            model, tuner = models[user_id], tuners[user_id]
+            try:
+                if user_id in model_params:
+                    model.restore(model_params[user_id])
+                if user_id in tuner_states:
+                    tuner.restore(tuner_states[user_id])
+            except Exception as e:
+                logger.warning(f"Failed to restore models for user {user_id}, using defaults: {e}")
+                model, tuner = self.model_factory(), self.tuner_factory()
+
+            now = time.monotonic()
+            entry = UserModels(user_id=user_id, model=model, tuner=tuner, last_used=now, validated_at=now)
+            entry.size_bytes = estimate_size_bytes(model, tuner)
+            self._entries[user_id] = entry
+            self._resident_bytes += entry.size_bytes
+            loaded += 1
+
+        self.misses += loaded
+        self._enforce_limits(keep=missing[-1])
+        logger.info(f"Preloaded models for {loaded} users")
+        return loaded
+
+    def mark_dirty(self, user_id: str):
+        """Flag a user's models as modified and schedule a write-back."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return
+
+        entry.dirty = True
+        self._resize(entry)
+        if user_id not in self._writebacks:
+            self._schedule_writeback(entry, self.writeback_delay_seconds)
+
+    def evict(self, user_id: str):
+        """Drop a user's models, writing them back first if dirty."""
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return
+
+        self._resident_bytes -= entry.size_bytes
+        self.evictions += 1
+        self._record("eviction")
+        if entry.dirty:
+            self._expedite_writeback(entry)
+
+    async def flush(self):
+        """Save every dirty model and wait for pending write-backs."""
+        for entry in list(self._entries.values()):
+            if entry.dirty and entry.user_id not in self._writebacks:
+                self._schedule_writeback(entry, 0.0)
+        # Includes write-backs of already evicted users
+        for now in self._writeback_now.values():
+            now.set()
+        if self._writebacks:
+            await asyncio.gather(*list(self._writebacks.values()), return_exceptions=True)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from resident models."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            'resident_users': len(self._entries),
+            'resident_bytes': self._resident_bytes,
+            'max_users': self.max_users,
+            'memory_budget_bytes': self.memory_budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'writebacks': self.writebacks,
+            'refreshes': self.refreshes,
+            'conflicts': self.conflicts,
+            'pending_writebacks': len(self._writebacks),
+            'hit_rate': self.hit_rate
+        }
+
+    async def _load(self, user_id: str) -> UserModels:
+        """Create and load a user's models, then make them resident."""
+        model = self.model_factory()
+        tuner = self.tuner_factory()
+
+        model_loaded, tuner_loaded = await asyncio.gather(model.load(user_id), tuner.load(user_id))
+        if not model_loaded:
+            logger.info(f"No completion model found for user {user_id}, using defaults")
+        if not tuner_loaded:
+            logger.info(f"No bandit state found for user {user_id}, using defaults")
+
+        now = time.monotonic()
+        entry = UserModels(user_id=user_id, model=model, tuner=tuner, last_used=now, validated_at=now)
+        entry.size_bytes = estimate_size_bytes(model, tuner)
+
+        self._entries[user_id] = entry
+        self._resident_bytes += entry.size_bytes
+        self._enforce_limits(keep=user_id)
+        return entry
+
+    async def _load_stored(self, entry: UserModels) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """The user's stored completion and bandit parameters."""
+        return await asyncio.gather(
+            entry.model.store.load_model_params(entry.user_id, 'completion'),
+            entry.tuner.store.load_model_params(entry.user_id, 'bandit')
+        )
+
+    def _adopt_newer(
+        self,
+        entry: UserModels,
+        model_params: Optional[Dict[str, Any]],
+        tuner_state: Optional[Dict[str, Any]]
+    ) -> Tuple[bool, bool]:
+        """Restore the models whose stored revision is newer than the resident one."""
+        model_newer = bool(model_params) and model_params.get('revision', 0) > entry.model.revision
+        tuner_newer = bool(tuner_state) and tuner_state.get('revision', 0) > entry.tuner.revision
+        if not (model_newer or tuner_newer):
+            return False, False
+
+        try:
+            if model_newer:
+                entry.model.restore(model_params)
+            if tuner_newer:
+                entry.tuner.restore(tuner_state)
+        except Exception as e:
+            logger.warning(f"Failed to restore newer models for user {entry.user_id}: {e}")
+        self.refreshes += 1
+        self._record("refresh")
+        self._resize(entry)
+        return model_newer, tuner_newer
+
+    def _resize(self, entry: UserModels):
+        """Re-estimate an entry after its models changed."""
+        size = estimate_size_bytes(entry.model, entry.tuner)
+        self._resident_bytes += size - entry.size_bytes
+        entry.size_bytes = size
+        self._enforce_limits(keep=entry.user_id)
+
+    def _enforce_limits(self, keep: str):
+        """Evict least recently used users until within both limits."""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_users or self._resident_bytes > self.memory_budget_bytes
+        ):
+            user_id = next(iter(self._entries))
+            if user_id == keep:
+                self._entries.move_to_end(user_id)
+                user_id = next(iter(self._entries))
+            self.evict(user_id)
+
+        self._publish_residency()
+
+    def _schedule_writeback(self, entry: UserModels, delay: float):
+        """Save an entry's models in the background after a delay."""
+        user_id = entry.user_id
+        now = asyncio.Event()
+        if delay <= 0:
+            now.set()
+        task = asyncio.ensure_future(self._writeback(entry, delay, now))
+        self._writebacks[user_id] = task
+        self._writeback_now[user_id] = now
+
+        def _done(_):
+            self._writebacks.pop(user_id, None)
+            self._writeback_now.pop(user_id, None)
+        task.add_done_callback(_done)
+
+    def _expedite_writeback(self, entry: UserModels):
+        """Save an entry now, cutting short any pending delay."""
+        now = self._writeback_now.get(entry.user_id)
+        if now is not None:
+            now.set()
+        else:
+            self._schedule_writeback(entry, 0.0)
+
+    async def _writeback(self, entry: UserModels, delay: float, now: asyncio.Event):
+        """Save a dirty entry; failed saves leave it dirty for the next attempt."""
+        try:
+            await asyncio.wait_for(now.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        if not entry.dirty:
+            return
+
+        entry.dirty = False
+        try:
+            # Another worker saved since these models were loaded: its update wins
+            model_newer, tuner_newer = self._adopt_newer(entry, *await self._load_stored(entry))
+            if model_newer or tuner_newer:
+                self.conflicts += 1
+                self._record("conflict")
+                logger.warning(f"Models of user {entry.user_id} were updated elsewhere, keeping the stored ones")
+            entry.validated_at = time.monotonic()
+
+            saves = {}
+            if not model_newer:
+                saves['model'] = entry.model.save(entry.user_id)
+            if not tuner_newer:
+                saves['tuner'] = entry.tuner.save(entry.user_id)
+            saved = dict(zip(saves, await asyncio.gather(*saves.values())))
+            model_saved, tuner_saved = saved.get('model', True), saved.get('tuner', True)
+
+            # An unfitted completion model is never saved; that is not a failure
+            if not tuner_saved or (entry.model.is_fitted and not model_saved):
+                entry.dirty = True
+                logger.warning(f"Write-back incomplete for user {entry.user_id}")
+            else:
+                self.writebacks += 1
+                self._record("writeback")
+        except Exception as e:
+            entry.dirty = True
+            logger.error(f"Write-back failed for user {entry.user_id}: {e}")
+
+    def _record(self, outcome: str):
+        """Export a registry event to scheduler telemetry."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            metrics = get_metrics()
+            metrics.counter(f"scheduler.model_registry.{outcome}")
+            metrics.gauge("scheduler.model_registry.hit_rate", self.hit_rate)
+        except Exception as e:
+            logger.debug(f"Failed to publish model registry metrics: {e}")
+
+    def _publish_residency(self):
+        """Export resident user count and memory."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            metrics = get_metrics()
+            metrics.gauge("scheduler.model_registry.resident_users", len(self._entries))
+            metrics.gauge("scheduler.model_registry.resident_bytes", self._resident_bytes)
+        except Exception as e:
+            logger.debug(f"Failed to publish model registry metrics: {e}")
+
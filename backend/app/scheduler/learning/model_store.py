@@ -4,7 +4,10 @@ Model persistence for learning components.
 Handles storage and retrieval of model parameters and bandit state.
 """
 
+import base64
 import json
+import mmap
+import os
 import pickle
 import logging
 from datetime import datetime
@@ -13,15 +16,21 @@ from pathlib import Path
 import asyncio
 from contextlib import asynccontextmanager
 
+from .model_codec import pack_params, unpack_params
+
 logger = logging.getLogger(__name__)
 
+# Keys per bulk query against the learning_data table
+DB_BATCH_SIZE = 200
+
 
 class ModelStore:
     """
     Persistent storage for machine learning model parameters.
     
-    Supports both JSON (for simple parameters) and pickle (for complex objects)
-    with database and file system backends.
+    Supports JSON (for simple parameters), packed float32 arrays (for fitted
+    coefficients) and pickle (for complex objects) with database and file
+    system backends.
     """
     
     def __init__(self, backend: str = "db", base_path: Optional[str] = None):
@@ -82,6 +91,51 @@ class ModelStore:
             logger.error(f"Failed to save model params for {user_id}:{model_type}: {e}")
             return False
     
+    async def save_packed_params(
+        self,
+        user_id: str,
+        model_type: str,
+        params: Dict[str, Any],
+        metadata: Optional[Dict] = None
+    ) -> bool:
+        """
+        Save model parameters in the compact packed format.
+
+        NumPy array values are stored as float32; other values must be JSON
+        serializable. Packed parameters take precedence over JSON ones on load.
+
+        Args:
+            user_id: User identifier
+            model_type: Type of model ('completion', 'bandit', etc.)
+            params: Model parameters to save
+            metadata: Optional metadata (version, timestamp, etc.)
+
+        Returns:
+            Success status
+        """
+        try:
+            packed = pack_params({**params, '_metadata': metadata or {}})
+            key = f"{user_id}:{model_type}:packed"
+
+            if self.backend == "db":
+                return await self._save_packed_to_db(key, packed)
+            elif self.backend == "file":
+                return await self._save_packed_to_file(key, packed)
+            elif self.backend == "memory":
+                self.memory_store[key] = {
+                    'packed': packed,
+                    'metadata': metadata or {},
+                    'updated_at': datetime.now().isoformat(),
+                    'model_type': model_type
+                }
+                return True
+            else:
+                raise ValueError(f"Unknown backend: {self.backend}")
+
+        except Exception as e:
+            logger.error(f"Failed to save packed params for {user_id}:{model_type}: {e}")
+            return False
+
     async def load_model_params(
         self, 
         user_id: str, 
@@ -97,23 +151,51 @@ class ModelStore:
         Returns:
             Model parameters or None if not found
         """
+        loaded = await self.load_many([user_id], model_type)
+        return loaded.get(user_id)
+
+    async def load_many(
+        self,
+        user_ids: List[str],
+        model_type: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load model parameters for many users at once.
+
+        The database backend fetches all users in a few bulk queries and the
+        file backend memory-maps packed files, so cold starts and batch jobs
+        avoid one round trip and one JSON parse per user.
+
+        Args:
+            user_ids: User identifiers
+            model_type: Type of model to load
+
+        Returns:
+            Parameters keyed by user_id; users without a saved model are omitted
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+
         try:
-            key = f"{user_id}:{model_type}"
-            
             if self.backend == "db":
-                store_data = await self._load_from_db(key)
+                return await self._load_many_from_db(user_ids, model_type)
             elif self.backend == "file":
-                store_data = await self._load_from_file(key)
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, self._load_many_from_files, user_ids, model_type
+                )
             elif self.backend == "memory":
-                store_data = self.memory_store.get(key)
+                return {
+                    user_id: params
+                    for user_id in user_ids
+                    if (params := self._load_from_memory(user_id, model_type)) is not None
+                }
             else:
                 raise ValueError(f"Unknown backend: {self.backend}")
-                
-            return store_data.get('params') if store_data else None
-            
+
         except Exception as e:
-            logger.error(f"Failed to load model params for {user_id}:{model_type}: {e}")
-            return None
+            logger.error(f"Failed to load {model_type} params for {len(user_ids)} users: {e}")
+            return {}
     
     async def save_model_object(
         self, 
@@ -245,7 +327,7 @@ class ModelStore:
             Success status
         """
         try:
-            keys_to_delete = [f"{user_id}:{model_type}"]
+            keys_to_delete = [f"{user_id}:{model_type}", f"{user_id}:{model_type}:packed"]
             if include_blob:
                 keys_to_delete.append(f"{user_id}:{model_type}:blob")
             
@@ -261,7 +343,50 @@ class ModelStore:
             logger.error(f"Failed to delete model for {user_id}:{model_type}: {e}")
             return False
     
+    def _load_from_memory(self, user_id: str, model_type: str) -> Optional[Dict[str, Any]]:
+        """Load one user's params from the memory backend, preferring packed."""
+        packed = self.memory_store.get(f"{user_id}:{model_type}:packed")
+        if packed:
+            return _decode_packed(packed['packed'])
+        store_data = self.memory_store.get(f"{user_id}:{model_type}")
+        return store_data.get('params') if store_data else None
+
     # File system backend methods
+    async def _save_packed_to_file(self, key: str, packed: bytes) -> bool:
+        """Save packed params, replacing the file atomically so mapped readers stay valid."""
+        file_path = self.base_path / f"{key}.bin"
+        tmp_path = self.base_path / f"{key}.bin.tmp"
+
+        def _write():
+            with open(tmp_path, 'wb') as f:
+                f.write(packed)
+            os.replace(tmp_path, file_path)
+
+        await asyncio.get_event_loop().run_in_executor(None, _write)
+        return True
+
+    def _load_many_from_files(
+        self, user_ids: List[str], model_type: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load params from files: packed files are memory-mapped, JSON is the fallback."""
+        loaded = {}
+        for user_id in user_ids:
+            key = f"{user_id}:{model_type}"
+            packed_path = self.base_path / f"{key}:packed.bin"
+            json_path = self.base_path / f"{key}.json"
+
+            if packed_path.exists() and packed_path.stat().st_size > 0:
+                with open(packed_path, 'rb') as f:
+                    # Decoded arrays keep the mapping alive after the file is closed
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                loaded[user_id] = _decode_packed(mapped)
+            elif json_path.exists():
+                with open(json_path, 'r') as f:
+                    store_data = json.load(f)
+                if store_data and store_data.get('params') is not None:
+                    loaded[user_id] = store_data['params']
+        return loaded
+
     async def _save_to_file(self, key: str, data: Dict) -> bool:
         """Save data to file system."""
         file_path = self.base_path / f"{key}.json"
@@ -273,19 +398,6 @@ class ModelStore:
         await asyncio.get_event_loop().run_in_executor(None, _write)
         return True
     
-    async def _load_from_file(self, key: str) -> Optional[Dict]:
-        """Load data from file system."""
-        file_path = self.base_path / f"{key}.json"
-        
-        if not file_path.exists():
-            return None
-        
-        def _read():
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        
-        return await asyncio.get_event_loop().run_in_executor(None, _read)
-    
     async def _save_blob_to_file(self, key: str, data: Dict) -> bool:
         """Save blob data to file system."""
         file_path = self.base_path / f"{key}.pkl"
@@ -311,13 +423,101 @@ class ModelStore:
         return await asyncio.get_event_loop().run_in_executor(None, _read)
     
     # Database backend methods (stubbed for now)
+    async def _save_packed_to_db(self, key: str, packed: bytes) -> bool:
+        """Save packed params to database as base64 text."""
+        try:
+            from app.config.database.supabase import get_async_supabase
+
+            supabase = get_async_supabase()
+
+            storage_data = {
+                "key": key,
+                "data": base64.b64encode(packed).decode(),
+                "created_at": datetime.utcnow().isoformat(),
+                "updated_at": datetime.utcnow().isoformat(),
+                "data_type": "learning_packed",
+                "size_bytes": len(packed),
+                "encoding": "packed"
+            }
+
+            # Try to update first, then insert if not exists
+            try:
+                response = await supabase.table("learning_data").update({
+                    "data": storage_data["data"],
+                    "updated_at": storage_data["updated_at"],
+                    "size_bytes": storage_data["size_bytes"],
+                    "encoding": storage_data["encoding"]
+                }).eq("key", key).execute()
+
+                if not response.data:
+                    response = await supabase.table("learning_data").insert(storage_data).execute()
+
+            except Exception:
+                response = await supabase.table("learning_data").insert(storage_data).execute()
+
+            if response.data:
+                logger.info(f"Saved packed learning data to database: {key} ({len(packed)} bytes)")
+                return True
+            else:
+                logger.error(f"Failed to save packed learning data: {key}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Database packed save failed for {key}: {e}, falling back to memory")
+            self.memory_store[key] = {'packed': packed}
+            return True
+
+    async def _load_many_from_db(
+        self, user_ids: List[str], model_type: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load packed and JSON params for many users with bulk key queries."""
+        try:
+            from app.config.database.supabase import get_async_supabase
+
+            supabase = get_async_supabase()
+
+            packed_rows = {}
+            json_rows = {}
+            for i in range(0, len(user_ids), DB_BATCH_SIZE):
+                batch = user_ids[i:i + DB_BATCH_SIZE]
+                keys = [f"{user_id}:{model_type}:packed" for user_id in batch]
+                keys += [f"{user_id}:{model_type}" for user_id in batch]
+
+                response = await supabase.table("learning_data").select("key, data").in_("key", keys).execute()
+                for row in response.data or []:
+                    user_id, _, suffix = row["key"].partition(f":{model_type}")
+                    if suffix == ":packed":
+                        packed_rows[user_id] = row["data"]
+                    elif not suffix:
+                        json_rows[user_id] = row["data"]
+
+            loaded = {}
+            for user_id in user_ids:
+                if user_id in packed_rows:
+                    loaded[user_id] = _decode_packed(base64.b64decode(packed_rows[user_id]))
+                elif user_id in json_rows:
+                    params = json.loads(json_rows[user_id]).get('params')
+                    if params is not None:
+                        loaded[user_id] = params
+
+            logger.info(f"Loaded {len(loaded)}/{len(user_ids)} {model_type} models from database")
+            return loaded
+
+        except Exception as e:
+            logger.error(f"Database bulk load failed for {model_type}: {e}, falling back to memory")
+            return {
+                user_id: params
+                for user_id in user_ids
+                if (params := self._load_from_memory(user_id, model_type)) is not None
+            }
+
     async def _save_to_db(self, key: str, data: Dict) -> bool:
         """Save data to database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
             import json
             
-            supabase = get_supabase()
+            supabase = get_async_supabase()
             
             # Prepare data for storage
             storage_data = {
@@ -331,7 +531,7 @@ class ModelStore:
             
             # Try to update first, then insert if not exists
             try:
-                response = supabase.table("learning_data").update({
+                response = await supabase.table("learning_data").update({
                     "data": storage_data["data"],
                     "updated_at": storage_data["updated_at"],
                     "size_bytes": storage_data["size_bytes"]
@@ -339,11 +539,11 @@ class ModelStore:
                 
                 if not response.data:
                     # Record doesn't exist, insert new one
-                    response = supabase.table("learning_data").insert(storage_data).execute()
+                    response = await supabase.table("learning_data").insert(storage_data).execute()
                 
             except Exception:
                 # Fallback to insert (might be first time)
-                response = supabase.table("learning_data").insert(storage_data).execute()
+                response = await supabase.table("learning_data").insert(storage_data).execute()
             
             if response.data:
                 logger.info(f"Saved learning data to database: {key}")
@@ -357,37 +557,14 @@ class ModelStore:
             self.memory_store[key] = data
             return True
     
-    async def _load_from_db(self, key: str) -> Optional[Dict]:
-        """Load data from database."""
-        try:
-            from app.config.database.supabase import get_supabase
-            import json
-            
-            supabase = get_supabase()
-            
-            # Load from database
-            response = supabase.table("learning_data").select("data").eq("key", key).single().execute()
-            
-            if response.data:
-                data = json.loads(response.data["data"])
-                logger.info(f"Loaded learning data from database: {key}")
-                return data
-            else:
-                logger.info(f"No learning data found in database for key: {key}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Database load failed for {key}: {e}, falling back to memory")
-            return self.memory_store.get(key)
-    
     async def _save_blob_to_db(self, key: str, data: Dict) -> bool:
         """Save blob data to database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
             import json
             import base64
             
-            supabase = get_supabase()
+            supabase = get_async_supabase()
             
             # For large blob data, we might want to compress or use external storage
             # For now, we'll store as base64 encoded JSON
@@ -407,7 +584,7 @@ class ModelStore:
             
             # Try to update first, then insert if not exists
             try:
-                response = supabase.table("learning_data").update({
+                response = await supabase.table("learning_data").update({
                     "data": storage_data["data"],
                     "updated_at": storage_data["updated_at"],
                     "size_bytes": storage_data["size_bytes"]
@@ -415,11 +592,11 @@ class ModelStore:
                 
                 if not response.data:
                     # Record doesn't exist, insert new one
-                    response = supabase.table("learning_data").insert(storage_data).execute()
+                    response = await supabase.table("learning_data").insert(storage_data).execute()
                 
             except Exception:
                 # Fallback to insert (might be first time)
-                response = supabase.table("learning_data").insert(storage_data).execute()
+                response = await supabase.table("learning_data").insert(storage_data).execute()
             
             if response.data:
                 logger.info(f"Saved learning blob to database: {key} ({storage_data['size_bytes']} bytes)")
@@ -436,14 +613,14 @@ class ModelStore:
     async def _load_blob_from_db(self, key: str) -> Optional[Dict]:
         """Load blob data from database."""
         try:
-            from app.config.database.supabase import get_supabase
+            from app.config.database.supabase import get_async_supabase
             import json
             import base64
             
-            supabase = get_supabase()
+            supabase = get_async_supabase()
             
             # Load from database
-            response = supabase.table("learning_data").select("data, encoding").eq("key", key).single().execute()
+            response = await supabase.table("learning_data").select("data, encoding").eq("key", key).single().execute()
             
             if response.data:
                 encoded_data = response.data["data"]
@@ -468,6 +645,13 @@ class ModelStore:
             return self.memory_store.get(key)
 
 
+def _decode_packed(buffer) -> Dict[str, Any]:
+    """Decode packed params without the embedded metadata."""
+    params = unpack_params(buffer)
+    params.pop('_metadata', None)
+    return params
+
+
 # Global model store instance
 _model_store = None
 
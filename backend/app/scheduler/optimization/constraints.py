@@ -291,25 +291,18 @@ def add_daily_caps(
     max_daily_slots = int(prefs.max_daily_effort_minutes / time_index.granularity_minutes)
     n_tasks = max(t_idx for t_idx, _ in x.keys()) + 1 if x else 0
     
-    # Get unique dates in horizon
-    dates = list(set(slot.date() for slot in time_index.slots))
-    
-    for date in dates:
-        # Get all slots for this date
-        day_start = datetime.combine(date, datetime.min.time())
-        day_slots = time_index.get_day_indices(day_start)
-        
+    for day_start, day_end in time_index.day_ranges:
         # Sum all task assignments for this day
         daily_vars = []
         for t_idx in range(n_tasks):
-            for s_idx in day_slots:
-                if s_idx < len(time_index) and (t_idx, s_idx) in x:
+            for s_idx in range(day_start, day_end):
+                if (t_idx, s_idx) in x:
                     daily_vars.append(x[(t_idx, s_idx)])
         
         if daily_vars:
             model.Add(sum(daily_vars) <= max_daily_slots)
     
-    logger.debug(f"Added daily caps for {len(dates)} days")
+    logger.debug(f"Added daily caps for {len(time_index.day_ranges)} days")
 
 
 def add_spacing_for_exam(
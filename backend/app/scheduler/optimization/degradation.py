@@ -0,0 +1,59 @@
+"""
+Load-shedding profile for model building.
+
+Translates the SLO gate's coarsening parameters into the variable families
+and objective terms the solver builds, so a degraded request produces a
+smaller CP-SAT model rather than the same model with a shorter time limit.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class DegradationProfile:
+    """Which optional model components to build."""
+    soft_constraints: bool = True      # Context-switch and fragmentation penalties
+    preferences: bool = True           # Late-night and avoid-window penalties
+    completion_prediction: bool = True  # ML completion probabilities in utilities
+
+    @classmethod
+    def from_coarsening(cls, coarsening: Optional[Dict[str, Any]]) -> 'DegradationProfile':
+        """Build a profile from SLOGate coarsening parameters."""
+        coarsening = coarsening or {}
+        return cls(
+            soft_constraints=not coarsening.get('disable_soft_constraints', False),
+            preferences=not coarsening.get('disable_preference_optimization', False),
+            completion_prediction=not (
+                coarsening.get('disable_completion_prediction', False)
+                or coarsening.get('disable_ml_features', False)
+                or coarsening.get('use_simple_utilities', False)
+            )
+        )
+
+    @property
+    def degraded(self) -> bool:
+        """Whether any component is disabled."""
+        return bool(self.disabled_components)
+
+    @property
+    def disabled_components(self) -> List[str]:
+        """Names of the disabled components."""
+        return [
+            name for name, enabled in (
+                ('soft_constraints', self.soft_constraints),
+                ('preferences', self.preferences),
+                ('completion_prediction', self.completion_prediction)
+            )
+            if not enabled
+        ]
+
+
+def model_size(model) -> Dict[str, int]:
+    """Variable, constraint and objective term counts of a built CP-SAT model."""
+    proto = model.Proto()
+    return {
+        'n_variables': len(proto.variables),
+        'n_constraints': len(proto.constraints),
+        'n_objective_terms': len(proto.objective.vars)
+    }
@@ -12,6 +12,7 @@ import numpy as np
 from heapq import heappush, heappop
 
 from ..core.domain import Task, BusyEvent, Preferences, ScheduleBlock, ScheduleSolution
+from ..core.utility_matrix import UtilityMatrix, UtilityInput, as_utility_matrix
 from .time_index import TimeIndex
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ class GreedyScheduler:
         tasks: List[Task],
         free_slots: List[int],
         prefs: Preferences,
-        util_matrix: Dict[str, Dict[int, float]],
+        util_matrix: UtilityInput,
         time_index: TimeIndex
     ) -> ScheduleSolution:
         """
@@ -51,6 +52,7 @@ class GreedyScheduler:
             Schedule solution with assigned blocks
         """
         start_time = datetime.now()
+        util_matrix = as_utility_matrix(util_matrix, [task.id for task in tasks], len(time_index))
         
         # Sort tasks by priority
         prioritized_tasks = self._prioritize_tasks(tasks, time_index)
@@ -142,7 +144,7 @@ class GreedyScheduler:
         self,
         task: Task,
         available_slots: set,
-        util_matrix: Dict[str, Dict[int, float]],
+        util_matrix: UtilityMatrix,
         time_index: TimeIndex,
         prefs: Preferences
     ) -> List[ScheduleBlock]:
@@ -249,7 +251,7 @@ class GreedyScheduler:
         self,
         task: Task,
         blocks: List[List[int]],
-        util_matrix: Dict[str, Dict[int, float]],
+        util_matrix: UtilityMatrix,
         time_index: TimeIndex,
         prefs: Preferences
     ) -> List[Tuple[float, List[int]]]:
@@ -267,13 +269,12 @@ class GreedyScheduler:
             List of (score, block) tuples, sorted by score descending
         """
         scored_blocks = []
-        task_utils = util_matrix.get(task.id, {})
         
         for block in blocks:
             score = 0.0
             
             # Base utility score
-            block_utility = sum(task_utils.get(slot_idx, 0.0) for slot_idx in block)
+            block_utility = util_matrix.block_utility(task.id, block)
             score += block_utility
             
             # Time preference bonuses/penalties
@@ -455,7 +456,7 @@ def greedy_fill(
     tasks: List[Task],
     free_slots: List[int],
     prefs: Preferences,
-    util_matrix: Dict[str, Dict[int, float]],
+    util_matrix: UtilityInput,
     time_index: TimeIndex
 ) -> ScheduleSolution:
     """
@@ -0,0 +1,467 @@
+"""
+Interval-variable CP-SAT formulation for the scheduler.
+
+Represents each task's work as a small number of optional interval blocks
+instead of one boolean per (task, slot) pair, so model size grows with the
+number of tasks and days rather than with tasks x slots.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+try:
+    from ortools.sat.python import cp_model
+    ORTOOLS_AVAILABLE = True
+except ImportError:
+    ORTOOLS_AVAILABLE = False
+
+from ..core.domain import Task, BusyEvent, Preferences
+from .time_index import TimeIndex
+from .degradation import DegradationProfile
+
+logger = logging.getLogger(__name__)
+
+# Objective scaling shared with the slot formulation (OR-Tools works with integers)
+OBJECTIVE_SCALE = 1000
+
+# Late night threshold used by the slot formulation's penalty
+LATE_NIGHT_HOUR = 22
+
+
+@dataclass
+class IntervalBlock:
+    """Decision variables for one optional work block of a task."""
+    start: Any
+    end: Any
+    size: Any
+    presence: Any
+    interval: Any
+    effective: Any
+    value: Any
+    fixed: bool = False
+
+
+class IntervalModelBuilder:
+    """
+    Builds a CP-SAT model where task work is a set of optional intervals.
+
+    Each task gets up to ``max_blocks_per_task`` ordered optional blocks whose
+    sizes respect the task's min/max block length. Busy calendar events become
+    fixed intervals in a single ``AddNoOverlap`` together with all task blocks,
+    blocks are confined to a single day so daily effort caps reduce to one
+    linear constraint per day, and per-slot utilities and penalties are folded
+    into prefix sums read through ``AddElement`` on block start/end.
+    """
+
+    def __init__(self, max_blocks_per_task: int = 8):
+        """
+        Initialize interval model builder.
+
+        Args:
+            max_blocks_per_task: Upper bound on optional blocks created per task
+        """
+        self.max_blocks_per_task = max_blocks_per_task
+
+    def build(
+        self,
+        model: cp_model.CpModel,
+        tasks: List[Task],
+        busy_events: List[BusyEvent],
+        prefs: Preferences,
+        time_index: TimeIndex,
+        learned: Dict[str, Any],
+        profile: Optional[DegradationProfile] = None
+    ) -> Dict[str, Any]:
+        """
+        Add variables, constraints and objective to the model.
+
+        Args:
+            model: Empty CP-SAT model
+            tasks: Tasks to schedule
+            busy_events: Calendar events that block time
+            prefs: User preferences and constraints
+            time_index: Time discretization
+            learned: ML-derived utilities and penalty weights
+            profile: Load-shedding profile; disabled penalty families are not built
+
+        Returns:
+            Variable registry consumed by solution extraction
+        """
+        n_slots = len(time_index)
+        granularity = time_index.granularity_minutes
+        weights = learned.get('weights', {})
+        profile = profile or DegradationProfile()
+
+        day_ranges = self._get_day_ranges(time_index)
+        late_mask = self._late_night_mask(time_index)
+
+        blocks: Dict[int, List[IntervalBlock]] = {}
+        all_intervals = []
+        objective_terms = []
+        day_loads: Dict[int, List] = {d: [] for d in range(len(day_ranges))}
+
+        soft_scale = OBJECTIVE_SCALE if profile.soft_constraints else 0
+        context_switch_weight = int(weights.get('context_switch', 2.0) * soft_scale)
+        fragmentation_weight = int(weights.get('fragmentation', 1.2) * soft_scale)
+
+        for t_idx, task in enumerate(tasks):
+            required_slots = int(np.ceil(task.estimated_minutes / granularity))
+            min_slots = max(1, min(int(np.ceil(task.min_block_minutes / granularity)), required_slots))
+            max_slots = max(min_slots, int(task.max_block_minutes / granularity))
+
+            lo, hi = self._task_window(task, time_index)
+            prefix = self._task_prefix(task, time_index, learned, late_mask, profile.preferences)
+
+            task_blocks = self._create_pinned_blocks(
+                model, t_idx, task, time_index, prefix, day_ranges, day_loads
+            )
+            pinned_slots = sum(b.size for b in task_blocks)
+
+            n_blocks = max(
+                int(np.ceil(max(required_slots - pinned_slots, 0) / max_slots)),
+                min(int(np.ceil(required_slots / min_slots)), self.max_blocks_per_task)
+            )
+
+            previous: Optional[IntervalBlock] = None
+            for k in range(n_blocks):
+                block = self._create_block(
+                    model, t_idx, k, lo, hi, min_slots, max_slots, prefix,
+                    day_ranges, day_loads
+                )
+
+                # Symmetry breaking: blocks are used in order and do not overlap
+                if previous is not None:
+                    model.AddImplication(block.presence, previous.presence)
+                    model.Add(block.start >= previous.end).OnlyEnforceIf(block.presence)
+
+                    if fragmentation_weight > 0:
+                        objective_terms.append(-fragmentation_weight * block.presence)
+
+                if context_switch_weight > 0:
+                    objective_terms.append(-context_switch_weight * block.presence)
+
+                task_blocks.append(block)
+                previous = block
+
+            # Task completion: assign enough total time
+            model.Add(sum(b.effective for b in task_blocks) >= required_slots)
+
+            objective_terms.extend(b.value for b in task_blocks)
+            all_intervals.extend(b.interval for b in task_blocks)
+            blocks[t_idx] = task_blocks
+
+        # Busy events become fixed intervals sharing the no-overlap resource
+        blocked_slots = time_index.filter_busy_slots(busy_events)
+        for run in time_index.get_contiguous_blocks([s for s in blocked_slots if s < n_slots]):
+            all_intervals.append(
+                model.NewFixedSizeIntervalVar(run[0], len(run), f"busy_{run[0]}")
+            )
+
+        # Slot capacity: at most one task (or busy event) at a time
+        model.AddNoOverlap(all_intervals)
+
+        # Precedence constraints
+        task_id_to_idx = {task.id: i for i, task in enumerate(tasks)}
+        for t_idx, task in enumerate(tasks):
+            for prereq_id in task.prerequisites:
+                prereq_idx = task_id_to_idx.get(prereq_id)
+                if prereq_idx is None or not blocks[t_idx]:
+                    continue
+                first_start = self._first_start(model, t_idx, blocks[t_idx], n_slots)
+                for prereq_block in blocks[prereq_idx]:
+                    constraint = model.Add(prereq_block.end <= first_start)
+                    if not prereq_block.fixed:
+                        constraint.OnlyEnforceIf(prereq_block.presence)
+
+        # Daily effort caps
+        if prefs.max_daily_effort_minutes > 0:
+            caps = daily_cap_slots(prefs, time_index, learned.get('frozen_minutes'))
+            for d, loads in day_loads.items():
+                if loads:
+                    model.Add(sum(loads) <= caps[d])
+
+        if objective_terms:
+            model.Maximize(sum(objective_terms))
+
+        logger.debug(
+            f"Interval model built: {sum(len(b) for b in blocks.values())} blocks, "
+            f"{len(all_intervals)} intervals, {len(day_ranges)} days"
+        )
+
+        return {'blocks': blocks}
+
+    def _create_block(
+        self,
+        model: cp_model.CpModel,
+        t_idx: int,
+        k: int,
+        lo: int,
+        hi: int,
+        min_slots: int,
+        max_slots: int,
+        prefix: List[int],
+        day_ranges: List[Tuple[int, int]],
+        day_loads: Dict[int, List]
+    ) -> IntervalBlock:
+        """Create one optional block confined to a single day."""
+        suffix = f"{t_idx}_{k}"
+        start = model.NewIntVar(lo, hi, f"start_{suffix}")
+        end = model.NewIntVar(lo, hi, f"end_{suffix}")
+        size = model.NewIntVar(min_slots, max_slots, f"size_{suffix}")
+        presence = model.NewBoolVar(f"present_{suffix}")
+        interval = model.NewOptionalIntervalVar(start, size, end, presence, f"block_{suffix}")
+
+        # Size counted towards task completion (zero when the block is absent)
+        effective = model.NewIntVar(0, max_slots, f"eff_{suffix}")
+        model.Add(effective == size).OnlyEnforceIf(presence)
+        model.Add(effective == 0).OnlyEnforceIf(presence.Not())
+
+        # Confine the block to one day so it contributes to exactly one daily cap
+        day_choices = []
+        for d, (day_start, day_end) in enumerate(day_ranges):
+            if day_end - day_start < min_slots or day_end <= lo or day_start >= hi:
+                continue
+            in_day = model.NewBoolVar(f"day_{suffix}_{d}")
+            model.Add(start >= day_start).OnlyEnforceIf(in_day)
+            model.Add(end <= day_end).OnlyEnforceIf(in_day)
+
+            load = model.NewIntVar(0, max_slots, f"load_{suffix}_{d}")
+            model.Add(load == effective).OnlyEnforceIf(in_day)
+            model.Add(load == 0).OnlyEnforceIf(in_day.Not())
+            day_loads[d].append(load)
+            day_choices.append(in_day)
+
+        if day_choices:
+            model.Add(sum(day_choices) == presence)
+        else:
+            model.Add(presence == 0)
+
+        value = self._block_value(model, suffix, start, end, presence, prefix)
+
+        return IntervalBlock(
+            start=start, end=end, size=size, presence=presence,
+            interval=interval, effective=effective, value=value
+        )
+
+    def _create_pinned_blocks(
+        self,
+        model: cp_model.CpModel,
+        t_idx: int,
+        task: Task,
+        time_index: TimeIndex,
+        prefix: List[int],
+        day_ranges: List[Tuple[int, int]],
+        day_loads: Dict[int, List]
+    ) -> List[IntervalBlock]:
+        """Create mandatory fixed blocks for pinned time slots."""
+        pinned = []
+        n_slots = len(time_index)
+
+        for p_idx, pin in enumerate(task.pinned_slots):
+            start_time = pin.get('start')
+            end_time = pin.get('end')
+            if not (start_time and end_time):
+                continue
+
+            indices = [
+                s for s in time_index.window_to_indices(start_time, end_time, inclusive_end=True)
+                if s < n_slots
+            ]
+            if not indices:
+                continue
+
+            start_idx, size = indices[0], len(indices)
+            interval = model.NewFixedSizeIntervalVar(start_idx, size, f"pinned_{t_idx}_{p_idx}")
+            value = prefix[start_idx + size] - prefix[start_idx]
+
+            for d, (day_start, day_end) in enumerate(day_ranges):
+                overlap = min(start_idx + size, day_end) - max(start_idx, day_start)
+                if overlap > 0:
+                    day_loads[d].append(overlap)
+
+            pinned.append(IntervalBlock(
+                start=start_idx, end=start_idx + size, size=size, presence=1,
+                interval=interval, effective=size, value=value, fixed=True
+            ))
+
+        return pinned
+
+    def _block_value(
+        self,
+        model: cp_model.CpModel,
+        suffix: str,
+        start: Any,
+        end: Any,
+        presence: Any,
+        prefix: List[int]
+    ) -> Any:
+        """Objective contribution of a block as prefix[end] - prefix[start]."""
+        low, high = min(prefix), max(prefix)
+        if low == high:
+            return 0
+
+        prefix_start = model.NewIntVar(low, high, f"pstart_{suffix}")
+        prefix_end = model.NewIntVar(low, high, f"pend_{suffix}")
+        model.AddElement(start, prefix, prefix_start)
+        model.AddElement(end, prefix, prefix_end)
+
+        value = model.NewIntVar(low - high, high - low, f"value_{suffix}")
+        model.Add(value == prefix_end - prefix_start).OnlyEnforceIf(presence)
+        model.Add(value == 0).OnlyEnforceIf(presence.Not())
+        return value
+
+    def _first_start(
+        self,
+        model: cp_model.CpModel,
+        t_idx: int,
+        task_blocks: List[IntervalBlock],
+        n_slots: int
+    ) -> Any:
+        """Earliest start over the present blocks of a task."""
+        first_start = model.NewIntVar(0, n_slots, f"first_start_{t_idx}")
+        for block in task_blocks:
+            constraint = model.Add(first_start <= block.start)
+            if not block.fixed:
+                constraint.OnlyEnforceIf(block.presence)
+        return first_start
+
+    def _task_window(self, task: Task, time_index: TimeIndex) -> Tuple[int, int]:
+        """Allowed [start, end) slot range from earliest start and deadline."""
+        n_slots = len(time_index)
+        lo, hi = 0, n_slots
+
+        if task.earliest_start:
+            earliest_idx = time_index.datetime_to_index(task.earliest_start)
+            if earliest_idx is not None:
+                lo = min(earliest_idx, n_slots)
+
+        if task.deadline:
+            deadline_idx = time_index.datetime_to_index(task.deadline)
+            if deadline_idx is not None:
+                hi = deadline_idx
+
+        return lo, max(lo, hi)
+
+    def _task_prefix(
+        self,
+        task: Task,
+        time_index: TimeIndex,
+        learned: Dict[str, Any],
+        late_mask: np.ndarray,
+        preferences: bool = True
+    ) -> List[int]:
+        """Prefix sums of the scaled per-slot objective value for a task."""
+        n_slots = len(time_index)
+        weights = learned.get('weights', {})
+        preference_scale = OBJECTIVE_SCALE if preferences else 0
+        task_utils = learned['util'].row(task.id)
+
+        values = np.zeros(n_slots, dtype=np.int64)
+        if task_utils is not None:
+            # Signed, like the slot formulation's utility terms
+            utilities = task_utils[:n_slots]
+            values[:len(utilities)] += (utilities * OBJECTIVE_SCALE).astype(np.int64)
+
+        late_night_weight = int(weights.get('late_night', 3.0) * preference_scale)
+        if late_night_weight > 0:
+            values -= late_night_weight * late_mask
+
+        avoid_window_weight = int(weights.get('avoid_window', 1.5) * preference_scale)
+        if avoid_window_weight > 0 and task.avoid_windows:
+            for s_idx in range(n_slots):
+                slot_dt = time_index.index_to_datetime(s_idx)
+                if slot_dt is not None and any(
+                    _datetime_in_window(slot_dt, window) for window in task.avoid_windows
+                ):
+                    values[s_idx] -= avoid_window_weight
+
+        prefix = np.concatenate(([0], np.cumsum(values)))
+        return [int(v) for v in prefix]
+
+    def _late_night_mask(self, time_index: TimeIndex) -> np.ndarray:
+        """Per-slot 0/1 mask of late night slots."""
+        return (time_index.slot_hours >= LATE_NIGHT_HOUR).astype(np.int64)
+
+    def _get_day_ranges(self, time_index: TimeIndex) -> List[Tuple[int, int]]:
+        """Half-open slot ranges for each calendar day in the horizon."""
+        return list(time_index.day_ranges)
+
+
+def daily_cap_slots(
+    prefs: Preferences,
+    time_index: TimeIndex,
+    frozen_minutes: Optional[Dict[Any, int]] = None
+) -> List[int]:
+    """
+    Slots of work allowed per day of the index under the daily effort cap.
+
+    Args:
+        prefs: Preferences with max_daily_effort_minutes
+        time_index: Grid whose days are capped
+        frozen_minutes: Minutes per local date already taken by work the
+            solve keeps as-is (incremental replans), charged to the cap
+
+    Returns:
+        Cap in slots, one per entry of time_index.day_ranges
+    """
+    frozen_minutes = frozen_minutes or {}
+    return [
+        int(max(0, prefs.max_daily_effort_minutes - frozen_minutes.get(day, 0)) / time_index.granularity_minutes)
+        for day in time_index.dates
+    ]
+
+
+def extract_interval_assignments(
+    solver: cp_model.CpSolver,
+    blocks: Dict[int, List[IntervalBlock]]
+) -> Dict[int, List[int]]:
+    """
+    Read assigned slot indices per task from a solved interval model.
+
+    Args:
+        solver: Solver that produced a feasible solution
+        blocks: Block registry returned by IntervalModelBuilder.build
+
+    Returns:
+        Mapping task index -> sorted assigned slot indices
+    """
+    assignments = {}
+    for t_idx, task_blocks in blocks.items():
+        slots = []
+        for block in task_blocks:
+            if block.fixed:
+                slots.extend(range(block.start, block.end))
+            elif solver.Value(block.presence):
+                slots.extend(range(solver.Value(block.start), solver.Value(block.end)))
+        assignments[t_idx] = sorted(set(slots))
+    return assignments
+
+
+def _datetime_in_window(dt: datetime, window: Dict) -> bool:
+    """Check if datetime falls within a time window."""
+    dow = window.get('dow')
+    start_time = window.get('start')
+    end_time = window.get('end')
+
+    if dow is not None and dt.weekday() != dow:
+        return False
+
+    if start_time and end_time:
+        dt_time = dt.time()
+        try:
+            start = datetime.strptime(start_time, '%H:%M').time()
+            end = datetime.strptime(end_time, '%H:%M').time()
+
+            if start <= end:
+                return start <= dt_time <= end
+            else:
+                # Overnight window
+                return dt_time >= start or dt_time <= end
+        except ValueError:
+            return False
+
+    return True
@@ -16,6 +16,7 @@ except ImportError:
     ORTOOLS_AVAILABLE = False
 
 from ..core.domain import Task, Preferences
+from ..core.utility_matrix import UtilityMatrix
 from .time_index import TimeIndex
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ def build_objective(
     model: cp_model.CpModel,
     x: Dict[Tuple[int, int], Any],
     tasks: List[Task],
-    util_matrix: Dict[str, Dict[int, float]],
+    util_matrix: UtilityMatrix,
     penalties: Dict[str, List],
     weights: Dict[str, float]
 ) -> None:
@@ -38,7 +39,7 @@ def build_objective(
         model: CP-SAT model
         x: Decision variables x[task_idx, slot_idx]
         tasks: List of tasks being scheduled
-        util_matrix: Utility values util_matrix[task_id][slot_idx]
+        util_matrix: Utility values per (task, slot)
         penalties: Penalty variables by type
         weights: Penalty weights
     """
@@ -81,7 +82,7 @@ def build_objective(
 def build_utility_terms(
     x: Dict[Tuple[int, int], Any],
     tasks: List[Task],
-    util_matrix: Dict[str, Dict[int, float]]
+    util_matrix: UtilityMatrix
 ) -> List:
     """
     Build utility maximization terms.
@@ -97,13 +98,15 @@ def build_utility_terms(
     utility_terms = []
     
     for t_idx, task in enumerate(tasks):
-        task_utils = util_matrix.get(task.id, {})
+        task_utils = util_matrix.row(task.id)
+        if task_utils is None:
+            continue
         
-        for slot_idx, utility in task_utils.items():
-            if (t_idx, slot_idx) in x and utility > 0:
-                # Scale utility to integer (OR-Tools prefers integers)
-                scaled_utility = int(utility * 1000)
-                utility_terms.append(scaled_utility * x[(t_idx, slot_idx)])
+        # Scale utility to integer (OR-Tools prefers integers)
+        scaled_utils = (task_utils * 1000).astype(np.int64)
+        for slot_idx in np.flatnonzero(scaled_utils > 0):
+            if (t_idx, int(slot_idx)) in x:
+                utility_terms.append(int(scaled_utils[slot_idx]) * x[(t_idx, int(slot_idx))])
     
     return utility_terms
 
@@ -143,6 +146,12 @@ def create_context_switch_penalties(
     """
     Create penalty variables for context switching between different tasks.
     
+    Creates one switch indicator per adjacent slot pair. A switch into
+    slot s+1 occurs when task t holds s+1 while slot s is occupied by some
+    other task: switch[s] >= x[t, s+1] + occupied[s] - x[t, s] - 1. The
+    indicators are only bounded from below, so they must carry a positive
+    penalty weight; the encoding is O(n_slots * n_tasks) in size.
+    
     Args:
         model: CP-SAT model
         x: Decision variables
@@ -158,31 +167,37 @@ def create_context_switch_penalties(
     penalty_vars = []
     n_slots = len(time_index)
     n_tasks = len(tasks)
+
+    if n_tasks < 2:
+        return penalty_vars
+    
+    # Occupancy of each slot across all tasks
+    occupied = {}
+    for s_idx in range(n_slots):
+        slot_vars = [x[(t_idx, s_idx)] for t_idx in range(n_tasks) if (t_idx, s_idx) in x]
+        if slot_vars:
+            occupied[s_idx] = model.NewIntVar(0, len(slot_vars), f"occupied_{s_idx}")
+            model.Add(occupied[s_idx] == sum(slot_vars))
     
     # For each pair of adjacent time slots
     for s_idx in range(n_slots - 1):
         current_slot = s_idx
         next_slot = s_idx + 1
+
+        if current_slot not in occupied or next_slot not in occupied:
+            continue
         
-        # For each pair of different tasks
-        for t1_idx in range(n_tasks):
-            for t2_idx in range(n_tasks):
-                if t1_idx == t2_idx:
-                    continue  # No penalty for same task
-                
-                if ((t1_idx, current_slot) not in x or 
-                    (t2_idx, next_slot) not in x):
-                    continue
-                
-                # Create switch penalty variable
-                switch_var = model.NewBoolVar(f"switch_{t1_idx}_{t2_idx}_{s_idx}")
-                
-                # switch_var = 1 iff task t1 in current slot AND task t2 in next slot
-                model.Add(switch_var <= x[(t1_idx, current_slot)])
-                model.Add(switch_var <= x[(t2_idx, next_slot)])
-                model.Add(switch_var >= x[(t1_idx, current_slot)] + x[(t2_idx, next_slot)] - 1)
-                
-                penalty_vars.append(switch_var)
+        switch_var = model.NewBoolVar(f"switch_{s_idx}")
+        
+        for t_idx in range(n_tasks):
+            if (t_idx, next_slot) not in x:
+                continue
+            
+            # Same task continuing from the current slot cancels its own occupancy
+            same_task = x[(t_idx, current_slot)] if (t_idx, current_slot) in x else 0
+            model.Add(switch_var >= x[(t_idx, next_slot)] + occupied[current_slot] - same_task - 1)
+        
+        penalty_vars.append(switch_var)
     
     return penalty_vars
 
@@ -6,7 +6,8 @@ respecting hard constraints and minimizing soft constraint violations.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import numpy as np
 
@@ -35,7 +36,10 @@ except ImportError:
         INT32_MAX = 2147483647
 
 from ..core.domain import Task, BusyEvent, Preferences, ScheduleBlock, ScheduleSolution
+from ..core.utility_matrix import as_utility_matrix
 from .time_index import TimeIndex
+from .interval_model import IntervalModelBuilder, daily_cap_slots, extract_interval_assignments
+from .degradation import DegradationProfile, model_size
 from ...core.utils.timezone_utils import get_timezone_manager
 
 logger = logging.getLogger(__name__)
@@ -53,7 +57,10 @@ class SchedulerSolver:
         self,
         time_limit_seconds: int = 10,
         num_search_workers: int = 4,
-        random_seed: int = 42
+        random_seed: int = 42,
+        formulation: str = "slot",
+        max_blocks_per_task: int = 8,
+        context_switch_encoding: str = "linear"
     ):
         """
         Initialize scheduler solver.
@@ -62,18 +69,63 @@ class SchedulerSolver:
             time_limit_seconds: Maximum solve time
             num_search_workers: Number of parallel search workers
             random_seed: Random seed for reproducibility
+            formulation: Model formulation ('slot' booleans or 'interval' blocks)
+            max_blocks_per_task: Block budget per task for the interval formulation
+            context_switch_encoding: 'linear' per-slot indicators or legacy 'pairwise'
         """
         if not ORTOOLS_AVAILABLE:
             raise ImportError("OR-Tools is required for SchedulerSolver")
+        if formulation not in ("slot", "interval"):
+            raise ValueError(f"Unknown solver formulation: {formulation}")
+        if context_switch_encoding not in ("linear", "pairwise"):
+            raise ValueError(f"Unknown context switch encoding: {context_switch_encoding}")
             
         self.time_limit_seconds = time_limit_seconds
         self.num_search_workers = num_search_workers
         self.random_seed = random_seed
+        self.formulation = formulation
+        self.max_blocks_per_task = max_blocks_per_task
+        self.context_switch_encoding = context_switch_encoding
         self.timezone_manager = get_timezone_manager()
 
         # Solution tracking
         self.best_solution = None
         self.solution_callback = None
+
+        # Active CP-SAT solver, used to stop a running search
+        self._active_solver = None
+        self._stop_requested = False
+
+    def get_options(self) -> Dict[str, Any]:
+        """Constructor options, used to recreate this solver in a worker process."""
+        return {
+            'time_limit_seconds': self.time_limit_seconds,
+            'num_search_workers': self.num_search_workers,
+            'random_seed': self.random_seed,
+            'formulation': self.formulation,
+            'max_blocks_per_task': self.max_blocks_per_task,
+            'context_switch_encoding': self.context_switch_encoding
+        }
+
+    @classmethod
+    def from_config(cls, config) -> 'SchedulerSolver':
+        """
+        Create solver from a SolverConfig.
+
+        Args:
+            config: Solver configuration section of SchedulerConfig
+
+        Returns:
+            Configured solver instance
+        """
+        return cls(
+            time_limit_seconds=config.time_limit_seconds,
+            num_search_workers=config.num_search_workers,
+            random_seed=config.random_seed,
+            formulation=config.formulation,
+            max_blocks_per_task=config.max_blocks_per_task,
+            context_switch_encoding=config.context_switch_encoding
+        )
         
     def build(
         self,
@@ -91,12 +143,24 @@ class SchedulerSolver:
             busy_events: Calendar events that block time
             prefs: User preferences and constraints
             time_index: Time discretization
-            learned: ML-derived utilities and penalties
+            learned: ML-derived utilities and penalties; 'coarsening' holds the
+                SLO gate's load-shedding parameters and 'frozen_minutes' the
+                per-date work an incremental replan keeps, charged to daily caps
             
         Returns:
             CP-SAT model ready for solving
         """
         model = cp_model.CpModel()
+
+        # Utilities are read as one (task x slot) array aligned with tasks
+        learned = dict(learned)
+        learned['util'] = as_utility_matrix(
+            learned.get('util'), [task.id for task in tasks], len(time_index)
+        )
+        profile = DegradationProfile.from_coarsening(learned.get('coarsening'))
+
+        if self.formulation == "interval":
+            return self._build_interval(model, tasks, busy_events, prefs, time_index, learned, profile)
         
         # Problem dimensions
         n_tasks = len(tasks)
@@ -117,7 +181,8 @@ class SchedulerSolver:
             'time_index': time_index,
             'prefs': prefs,
             'busy_events': busy_events,
-            'learned': learned
+            'learned': learned,
+            'profile': profile
         }
         
         # Build constraints
@@ -127,12 +192,42 @@ class SchedulerSolver:
         # Build objective
         self._build_objective(model)
         
+        self.variables['model_size'] = model_size(model)
+        return model
+
+    def _build_interval(
+        self,
+        model: cp_model.CpModel,
+        tasks: List[Task],
+        busy_events: List[BusyEvent],
+        prefs: Preferences,
+        time_index: TimeIndex,
+        learned: Dict[str, Any],
+        profile: DegradationProfile
+    ) -> cp_model.CpModel:
+        """Build the model using optional interval blocks per task."""
+        builder = IntervalModelBuilder(max_blocks_per_task=self.max_blocks_per_task)
+        registry = builder.build(model, tasks, busy_events, prefs, time_index, learned, profile)
+
+        self.variables = {
+            'x': {},
+            'blocks': registry['blocks'],
+            'tasks': tasks,
+            'time_index': time_index,
+            'prefs': prefs,
+            'busy_events': busy_events,
+            'learned': learned,
+            'profile': profile,
+            'model_size': model_size(model)
+        }
+
         return model
     
     def solve(
         self, 
         model: cp_model.CpModel,
-        hints: Optional[Dict] = None
+        hints: Optional[Dict] = None,
+        on_solution: Optional[Callable[[ScheduleSolution], None]] = None
     ) -> ScheduleSolution:
         """
         Solve the scheduling model.
@@ -140,6 +235,8 @@ class SchedulerSolver:
         Args:
             model: CP-SAT model to solve
             hints: Optional solution hints for warm start
+            on_solution: Receives improving intermediate solutions, on the
+                solver's thread
             
         Returns:
             Schedule solution with blocks and metadata
@@ -153,16 +250,23 @@ class SchedulerSolver:
         solver.parameters.log_search_progress = False
         
         # Add solution callback to track best solution
-        callback = SolutionCallback(self.variables)
+        callback = SolutionCallback(self.variables, on_solution, self._extract_solution)
         
         # Apply hints if provided
+        hinted_variables = 0
         if hints:
-            self._apply_hints(model, hints)
+            hinted_variables = self._apply_hints(model, hints)
         
         start_time = datetime.now()
         
         # Solve
-        status = solver.Solve(model, callback)
+        self._active_solver = solver
+        if self._stop_requested:
+            solver.parameters.max_time_in_seconds = 0.0
+        try:
+            status = solver.Solve(model, callback)
+        finally:
+            self._active_solver = None
         
         solve_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
         
@@ -186,6 +290,19 @@ class SchedulerSolver:
                 }
             )
         
+        # Report what was actually built, so load shedding is observable
+        solution.diagnostics['model_size'] = self.variables['model_size']
+        profile = self.variables['profile']
+        if profile.degraded:
+            solution.diagnostics['degraded_components'] = profile.disabled_components
+
+        if hints:
+            solution.diagnostics['warm_start'] = {
+                'hints_kept': hints.get('kept', 0),
+                'hints_dropped': hints.get('dropped', 0),
+                'hinted_variables': hinted_variables
+            }
+        
         logger.info(
             f"Solver finished: {solution.solver_status}, "
             f"feasible={solution.feasible}, "
@@ -195,6 +312,12 @@ class SchedulerSolver:
         
         return solution
     
+    def stop(self):
+        """Stop the running search; the best solution found so far is returned."""
+        self._stop_requested = True
+        if self._active_solver is not None:
+            self._active_solver.StopSearch()
+    
     def _add_hard_constraints(self, model: cp_model.CpModel):
         """Add hard constraints that must be satisfied."""
         x = self.variables['x']
@@ -317,20 +440,14 @@ class SchedulerSolver:
         time_index = self.variables['time_index']
         prefs = self.variables['prefs']
         
-        max_daily_slots = int(prefs.max_daily_effort_minutes / time_index.granularity_minutes)
+        caps = daily_cap_slots(prefs, time_index, self.variables['learned'].get('frozen_minutes'))
         
-        # Get unique dates in horizon
-        dates = list(set(slot.date() for slot in time_index.slots))
-        
-        for date in dates:
-            day_slots = time_index.get_day_indices(datetime.combine(date, datetime.min.time()))
-            
+        for (day_start, day_end), max_daily_slots in zip(time_index.day_ranges, caps):
             # Sum all task assignments for this day
             daily_vars = []
             for t_idx in range(len(tasks)):
-                for s_idx in day_slots:
-                    if s_idx < len(time_index):
-                        daily_vars.append(x[(t_idx, s_idx)])
+                for s_idx in range(day_start, day_end):
+                    daily_vars.append(x[(t_idx, s_idx)])
             
             if daily_vars:
                 model.Add(sum(daily_vars) <= max_daily_slots)
@@ -367,20 +484,16 @@ class SchedulerSolver:
         learned = self.variables['learned']
         
         # Extract utilities and weights
-        util_matrix = learned.get('util', {})
+        util_matrix = learned['util']
         weights = learned.get('weights', {})
         
         objective_terms = []
         
-        # 1. Utility terms (to maximize)
-        for t_idx, task in enumerate(tasks):
-            task_utils = util_matrix.get(task.id, {})
-            for s_idx in range(len(time_index)):
-                utility = task_utils.get(s_idx, 0.0)
-                if utility > 0:
-                    # Scale utility to integer (OR-Tools works with integers)
-                    scaled_utility = int(utility * 1000)
-                    objective_terms.append(scaled_utility * x[(t_idx, s_idx)])
+        # 1. Utility terms (to maximize), scaled to integers for OR-Tools
+        scaled_utilities = (util_matrix.values * 1000).astype(np.int64)
+        # Negative utilities are kept: they mark slots the task should avoid
+        for t_idx, s_idx in zip(*np.nonzero(scaled_utilities)):
+            objective_terms.append(int(scaled_utilities[t_idx, s_idx]) * x[(int(t_idx), int(s_idx))])
         
         # 2. Penalty terms (to minimize)
         penalty_terms = self._build_penalty_terms(model)
@@ -403,29 +516,34 @@ class SchedulerSolver:
         time_index = self.variables['time_index']
         prefs = self.variables['prefs']
         weights = self.variables['learned'].get('weights', {})
+        profile = self.variables['profile']
         
         penalty_terms = []
         
+        # Under load shedding, disabled families are not built at all
+        soft_scale = 1000 if profile.soft_constraints else 0
+        preference_scale = 1000 if profile.preferences else 0
+        
         # 1. Context switch penalties
-        context_switch_weight = int(weights.get('context_switch', 2.0) * 1000)
+        context_switch_weight = int(weights.get('context_switch', 2.0) * soft_scale)
         if context_switch_weight > 0:
             switches = self._create_context_switch_vars(model)
             penalty_terms.extend([context_switch_weight * switch for switch in switches])
         
         # 2. Avoid window penalties
-        avoid_window_weight = int(weights.get('avoid_window', 1.5) * 1000)
+        avoid_window_weight = int(weights.get('avoid_window', 1.5) * preference_scale)
         if avoid_window_weight > 0:
             avoid_violations = self._create_avoid_window_vars(model)
             penalty_terms.extend([avoid_window_weight * violation for violation in avoid_violations])
         
         # 3. Late night penalties
-        late_night_weight = int(weights.get('late_night', 3.0) * 1000)
+        late_night_weight = int(weights.get('late_night', 3.0) * preference_scale)
         if late_night_weight > 0:
             late_vars = self._create_late_night_vars(model)
             penalty_terms.extend([late_night_weight * var for var in late_vars])
         
         # 4. Fragmentation penalties
-        fragmentation_weight = int(weights.get('fragmentation', 1.2) * 1000)
+        fragmentation_weight = int(weights.get('fragmentation', 1.2) * soft_scale)
         if fragmentation_weight > 0:
             frag_vars = self._create_fragmentation_vars(model)
             penalty_terms.extend([fragmentation_weight * var for var in frag_vars])
@@ -433,7 +551,47 @@ class SchedulerSolver:
         return penalty_terms
     
     def _create_context_switch_vars(self, model: cp_model.CpModel) -> List:
-        """Create variables for context switching penalties."""
+        """
+        Create variables for context switching penalties.
+
+        Uses one switch indicator per adjacent slot pair. With at most one
+        task per slot, a switch into slot s+1 happens when some task t holds
+        s+1 while the occupancy of slot s comes from a different task, i.e.
+        switch[s] >= x[t, s+1] + occupied[s] - x[t, s] - 1. This needs
+        O(n_slots) variables and O(n_slots * n_tasks) constraints instead of
+        one variable per (slot, task, task) triple.
+        """
+        if self.context_switch_encoding == "pairwise":
+            return self._create_pairwise_context_switch_vars(model)
+
+        x = self.variables['x']
+        tasks = self.variables['tasks']
+        n_slots = len(self.variables['time_index'])
+        n_tasks = len(tasks)
+        
+        switch_vars = []
+
+        if n_tasks < 2:
+            return switch_vars
+
+        occupied = [
+            model.NewIntVar(0, n_tasks, f"occupied_{s_idx}") for s_idx in range(n_slots)
+        ]
+        for s_idx in range(n_slots):
+            model.Add(occupied[s_idx] == sum(x[(t_idx, s_idx)] for t_idx in range(n_tasks)))
+
+        for s_idx in range(n_slots - 1):
+            switch_var = model.NewBoolVar(f"switch_{s_idx}")
+            for t_idx in range(n_tasks):
+                model.Add(
+                    switch_var >= x[(t_idx, s_idx + 1)] + occupied[s_idx] - x[(t_idx, s_idx)] - 1
+                )
+            switch_vars.append(switch_var)
+        
+        return switch_vars
+
+    def _create_pairwise_context_switch_vars(self, model: cp_model.CpModel) -> List:
+        """Legacy encoding with one switch variable per (slot, task, task) triple."""
         x = self.variables['x']
         tasks = self.variables['tasks']
         n_slots = len(self.variables['time_index'])
@@ -557,10 +715,76 @@ class SchedulerSolver:
         
         return True
     
-    def _apply_hints(self, model: cp_model.CpModel, hints: Dict):
-        """Apply solution hints for warm start."""
-        # TODO: Implement solution hints
-        pass
+    def _apply_hints(self, model: cp_model.CpModel, hints: Dict) -> int:
+        """
+        Apply solution hints for warm start.
+        
+        Args:
+            model: Built CP-SAT model
+            hints: Output of build_warm_start_hints; 'assignments' maps
+                task IDs to previously assigned slot indices
+            
+        Returns:
+            Number of hinted variables
+        """
+        assignments = hints.get('assignments', {})
+        if not assignments:
+            return 0
+        
+        model.ClearHints()
+        tasks = self.variables['tasks']
+        
+        if self.formulation == "interval":
+            return self._apply_interval_hints(model, tasks, assignments)
+        
+        x = self.variables['x']
+        n_slots = len(self.variables['time_index'])
+        n_hinted = 0
+        
+        # Hint the full row of each previously scheduled task; other tasks stay free
+        for t_idx, task in enumerate(tasks):
+            hinted_slots = set(assignments.get(task.id, ()))
+            if not hinted_slots:
+                continue
+            for s_idx in range(n_slots):
+                model.AddHint(x[(t_idx, s_idx)], 1 if s_idx in hinted_slots else 0)
+                n_hinted += 1
+        
+        return n_hinted
+    
+    def _apply_interval_hints(
+        self,
+        model: cp_model.CpModel,
+        tasks: List[Task],
+        assignments: Dict[str, List[int]]
+    ) -> int:
+        """Hint interval blocks from contiguous runs of previously assigned slots."""
+        time_index = self.variables['time_index']
+        blocks = self.variables['blocks']
+        n_hinted = 0
+        
+        for t_idx, task in enumerate(tasks):
+            hinted_slots = assignments.get(task.id)
+            if not hinted_slots:
+                continue
+            
+            runs = time_index.get_contiguous_blocks(hinted_slots)
+            free_blocks = [b for b in blocks.get(t_idx, []) if not b.fixed]
+            
+            # Blocks are used in order, so runs map onto the first blocks
+            for k, block in enumerate(free_blocks):
+                if k < len(runs):
+                    run = runs[k]
+                    model.AddHint(block.presence, 1)
+                    model.AddHint(block.start, run[0])
+                    model.AddHint(block.size, len(run))
+                    model.AddHint(block.end, run[-1] + 1)
+                    n_hinted += 4
+                else:
+                    model.AddHint(block.presence, 0)
+                    n_hinted += 1
+        
+        return n_hinted
     
     def _extract_solution(
         self, 
@@ -572,17 +796,26 @@ class SchedulerSolver:
         x = self.variables['x']
         tasks = self.variables['tasks']
         time_index = self.variables['time_index']
+        util_matrix = self.variables['learned']['util']
         
         blocks = []
         unscheduled_tasks = []
+
+        if self.formulation == "interval":
+            assignments = extract_interval_assignments(solver, self.variables['blocks'])
+        else:
+            assignments = None
         
         for t_idx, task in enumerate(tasks):
-            task_slots = []
-            
-            # Find assigned slots for this task
-            for s_idx in range(len(time_index)):
-                if solver.Value(x[(t_idx, s_idx)]) == 1:
-                    task_slots.append(s_idx)
+            if assignments is not None:
+                task_slots = assignments.get(t_idx, [])
+            else:
+                task_slots = []
+
+                # Find assigned slots for this task
+                for s_idx in range(len(time_index)):
+                    if solver.Value(x[(t_idx, s_idx)]) == 1:
+                        task_slots.append(s_idx)
             
             if task_slots:
                 # Group into contiguous blocks
@@ -592,9 +825,7 @@ class SchedulerSolver:
                     start_time, end_time = time_index.indices_to_window(group)
                     
                     # Get utility score for first slot (representative)
-                    util_matrix = self.variables['learned'].get('util', {})
-                    task_utils = util_matrix.get(task.id, {})
-                    utility_score = task_utils.get(group[0], 0.0)
+                    utility_score = float(util_matrix.values[t_idx, group[0]])
                     
                     block = ScheduleBlock(
                         task_id=task.id,
@@ -617,7 +848,8 @@ class SchedulerSolver:
             solve_time_ms=solve_time_ms,
             unscheduled_tasks=unscheduled_tasks,
             diagnostics={
-                'n_variables': len(x),
+                'formulation': self.formulation,
+                'n_variables': self.variables['model_size']['n_variables'],
                 'n_constraints': solver.NumConstraints() if hasattr(solver, 'NumConstraints') else 0,
                 'objective_bound': solver.BestObjectiveBound() if hasattr(solver, 'BestObjectiveBound') else 0
             }
@@ -670,13 +902,27 @@ class SchedulerSolver:
 
 
 class SolutionCallback(cp_model.CpSolverSolutionCallback):
-    """Callback to track best solution during solving."""
+    """Callback to track best solution during solving, optionally streaming it."""
+
+    # Improvements closer together than this are not streamed; the final
+    # solution always follows
+    MIN_STREAM_INTERVAL_SECONDS = 0.1
     
-    def __init__(self, variables: Dict):
+    def __init__(
+        self,
+        variables: Dict,
+        on_solution: Optional[Callable[[ScheduleSolution], None]] = None,
+        extract: Optional[Callable] = None
+    ):
         cp_model.CpSolverSolutionCallback.__init__(self)
         self.variables = variables
+        self.on_solution = on_solution
+        self.extract = extract
         self.solution_count = 0
+        self.streamed_count = 0
         self.best_objective = float('-inf')
+        self._started = time.monotonic()
+        self._last_streamed: Optional[float] = None
         
     def on_solution_callback(self):
         """Called when a new solution is found."""
@@ -685,6 +931,22 @@ class SolutionCallback(cp_model.CpSolverSolutionCallback):
         
         if objective > self.best_objective:
             self.best_objective = objective
-            
-        # Could store solution details here if needed
+            if self.on_solution is not None and self.extract is not None:
+                self._stream()
+
+    def _stream(self):
+        """Hand the current solution to the streaming consumer."""
+        now = time.monotonic()
+        if self._last_streamed is not None and now - self._last_streamed < self.MIN_STREAM_INTERVAL_SECONDS:
+            return
+        self._last_streamed = now
+
+        try:
+            # The callback exposes Value/ObjectiveValue like a finished solver
+            solution = self.extract(self, self, int((now - self._started) * 1000))
+            solution.solver_status = "improving"
+            self.on_solution(solution)
+            self.streamed_count += 1
+        except Exception as e:
+            logger.debug(f"Failed to stream intermediate solution: {e}")
 
@@ -0,0 +1,467 @@
+"""
+Process pool for running CP-SAT solves off the asyncio event loop.
+
+Solves are CPU bound and can run for the full solver time limit, so they are
+shipped as self-contained problems to a bounded pool of worker processes.
+The event loop only awaits the result, queued or running solves can be
+cancelled per request, and queue depth is exported through scheduler telemetry.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.domain import Task, BusyEvent, Preferences, ScheduleSolution
+
+logger = logging.getLogger(__name__)
+
+
+class SolveCancelledError(Exception):
+    """Raised when a pooled solve is cancelled before producing a result."""
+    pass
+
+
+@dataclass
+class SolveProblem:
+    """
+    Self-contained, picklable scheduling problem for a pool worker.
+
+    The time grid is described by its parameters rather than a TimeIndex
+    instance so it can be rebuilt cheaply inside the worker.
+    """
+    tasks: List[Task]
+    busy_events: List[BusyEvent]
+    prefs: Preferences
+    timezone: str
+    start_dt: datetime
+    end_dt: datetime
+    granularity_minutes: int
+    learned: Dict[str, Any]
+    solver_options: Dict[str, Any] = field(default_factory=dict)
+    hints: Optional[Dict] = None
+    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    @classmethod
+    def from_time_index(
+        cls,
+        tasks: List[Task],
+        busy_events: List[BusyEvent],
+        prefs: Preferences,
+        time_index,
+        learned: Dict[str, Any],
+        solver_options: Optional[Dict[str, Any]] = None,
+        hints: Optional[Dict] = None,
+        request_id: Optional[str] = None
+    ) -> 'SolveProblem':
+        """Create a problem from an in-process TimeIndex."""
+        return cls(
+            tasks=tasks,
+            busy_events=busy_events,
+            prefs=prefs,
+            timezone=time_index.timezone.zone,
+            start_dt=time_index.start_dt,
+            end_dt=time_index.end_dt,
+            granularity_minutes=time_index.granularity_minutes,
+            learned=learned,
+            solver_options=solver_options or {},
+            hints=hints,
+            request_id=request_id or str(uuid.uuid4())
+        )
+
+
+def solve_problem(
+    problem: SolveProblem,
+    cancel_event=None,
+    on_solution: Optional[Callable[[ScheduleSolution], None]] = None
+) -> ScheduleSolution:
+    """
+    Build and solve a problem in the current process.
+
+    Used as the pool worker entry point and as the in-process fallback.
+
+    Args:
+        problem: Problem to solve
+        cancel_event: Optional event-like object; when set the search stops
+        on_solution: Receives improving intermediate solutions, on the
+            solver's thread
+
+    Returns:
+        Schedule solution
+    """
+    from .solver import SchedulerSolver
+    from .time_index import TimeIndex
+
+    time_index = TimeIndex(
+        timezone=problem.timezone,
+        start_dt=problem.start_dt,
+        end_dt=problem.end_dt,
+        granularity_minutes=problem.granularity_minutes
+    )
+    solver = SchedulerSolver(**problem.solver_options)
+    model = solver.build(problem.tasks, problem.busy_events, problem.prefs, time_index, problem.learned)
+
+    done = threading.Event()
+    if cancel_event is not None:
+        def watch_cancellation():
+            while not done.is_set():
+                if cancel_event.wait(0.1):
+                    solver.stop()
+                    return
+
+        threading.Thread(target=watch_cancellation, daemon=True).start()
+
+    try:
+        return solver.solve(model, hints=problem.hints, on_solution=on_solution)
+    finally:
+        done.set()
+
+
+def _pool_worker(problem: SolveProblem, cancel_event=None, progress=None) -> Dict[str, Any]:
+    """Worker entry point returning the solution with timing metadata."""
+    started_at = time.time()
+    if cancel_event is not None and cancel_event.is_set():
+        return {'cancelled': True, 'started_at': started_at, 'finished_at': started_at}
+
+    try:
+        solution = solve_problem(problem, cancel_event, progress.put if progress is not None else None)
+    finally:
+        if progress is not None:
+            progress.put(None)
+    return {
+        'solution': solution,
+        'cancelled': cancel_event is not None and cancel_event.is_set(),
+        'started_at': started_at,
+        'finished_at': time.time()
+    }
+
+
+def _forward_progress(progress, future: Future, on_solution: Callable[[ScheduleSolution], None]):
+    """Relay intermediate solutions from a worker until it is done."""
+    while True:
+        try:
+            solution = progress.get(timeout=0.1)
+        except queue.Empty:
+            if future.done():
+                return
+            continue
+        except Exception as e:
+            logger.debug(f"Stopped relaying intermediate solutions: {e}")
+            return
+
+        if solution is None:
+            return
+        try:
+            on_solution(solution)
+        except Exception as e:
+            logger.debug(f"Intermediate solution consumer failed: {e}")
+
+
+def _warm_up() -> int:
+    """Import solver modules inside a freshly started worker."""
+    from . import solver  # noqa: F401
+    return os.getpid()
+
+
+@dataclass
+class _PendingSolve:
+    """Book-keeping for a submitted solve."""
+    future: Future
+    cancel_event: Any
+    submitted_at: float
+    progress: Any = None  # Manager queue of intermediate solutions
+
+
+class SolverPool:
+    """
+    Bounded process pool executing scheduling solves.
+
+    Each worker runs one CP-SAT solve at a time. Requests beyond the number
+    of workers queue inside the executor; ``queue_depth`` reports how many
+    are waiting. Solves can be cancelled by request id, which drops queued
+    work and stops running searches at the next poll.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        start_method: str = "spawn",
+        enable_cancellation: bool = True
+    ):
+        """
+        Initialize solver pool.
+
+        Args:
+            max_workers: Worker processes per node (default: one per CPU)
+            start_method: multiprocessing start method for workers
+            enable_cancellation: Whether running solves can be stopped remotely
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.start_method = start_method
+        self.enable_cancellation = enable_cancellation
+
+        self._context = multiprocessing.get_context(start_method)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingSolve] = {}
+
+        # Counters
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self._queue_wait_ms_total = 0.0
+        self._solve_ms_total = 0.0
+
+    def start(self, warm: bool = True):
+        """
+        Start worker processes.
+
+        Args:
+            warm: Pre-spawn all workers and import solver modules in them
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self._context
+                )
+                if self.enable_cancellation and self._manager is None:
+                    self._manager = self._context.Manager()
+
+        if warm:
+            futures = [self._executor.submit(_warm_up) for _ in range(self.max_workers)]
+            pids = {f.result() for f in futures}
+            logger.info(f"Solver pool started with {len(pids)} warm workers")
+
+    def shutdown(self, wait: bool = True):
+        """Stop worker processes and cancel outstanding solves."""
+        with self._lock:
+            for request_id in list(self._pending):
+                self._cancel_locked(request_id)
+            executor, self._executor = self._executor, None
+            manager, self._manager = self._manager, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+    async def solve(
+        self,
+        problem: SolveProblem,
+        timeout: Optional[float] = None,
+        on_solution: Optional[Callable[[ScheduleSolution], None]] = None
+    ) -> ScheduleSolution:
+        """
+        Solve a problem in the pool without blocking the event loop.
+
+        Args:
+            problem: Serialized scheduling problem
+            timeout: Optional wall-clock limit including queue time
+            on_solution: Receives improving intermediate solutions, on a
+                relay thread (needs the pool's manager, i.e. cancellation)
+
+        Returns:
+            Schedule solution
+
+        Raises:
+            SolveCancelledError: If the solve was cancelled
+        """
+        if self._executor is None:
+            self.start(warm=False)
+
+        request_id = problem.request_id
+        pending = self._submit(problem, stream=on_solution is not None)
+        if pending.progress is not None:
+            threading.Thread(
+                target=_forward_progress, args=(pending.progress, pending.future, on_solution),
+                daemon=True
+            ).start()
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(pending.future), timeout)
+        except asyncio.TimeoutError:
+            self.cancel(request_id)
+            raise
+        except asyncio.CancelledError:
+            if self.cancel(request_id):
+                # Caller went away: stop the work it was waiting for
+                raise
+            # Dropped from the queue through cancel(request_id)
+            raise SolveCancelledError(f"Solve {request_id} was cancelled")
+        except BrokenProcessPool:
+            self._record_failure(request_id)
+            self._reset_executor()
+            raise
+        except Exception:
+            self._record_failure(request_id)
+            raise
+
+        return self._record_result(request_id, pending, result)
+
+    def cancel(self, request_id: str) -> bool:
+        """
+        Cancel a queued or running solve.
+
+        Args:
+            request_id: Request id of the submitted problem
+
+        Returns:
+            True if a pending solve was found
+        """
+        with self._lock:
+            return self._cancel_locked(request_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current pool statistics."""
+        with self._lock:
+            outstanding = len(self._pending)
+        finished = max(1, self.completed)
+
+        return {
+            'max_workers': self.max_workers,
+            'running': self._executor is not None,
+            'outstanding': outstanding,
+            'in_flight': min(outstanding, self.max_workers),
+            'queue_depth': max(0, outstanding - self.max_workers),
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'cancelled': self.cancelled,
+            'avg_queue_wait_ms': self._queue_wait_ms_total / finished,
+            'avg_solve_ms': self._solve_ms_total / finished
+        }
+
+    def _submit(self, problem: SolveProblem, stream: bool = False) -> _PendingSolve:
+        """Submit a problem to the executor."""
+        with self._lock:
+            cancel_event = self._manager.Event() if self._manager is not None else None
+            progress = self._manager.Queue() if stream and self._manager is not None else None
+            future = self._executor.submit(_pool_worker, problem, cancel_event, progress)
+            pending = _PendingSolve(
+                future=future, cancel_event=cancel_event, submitted_at=time.time(), progress=progress
+            )
+            self._pending[problem.request_id] = pending
+            self.submitted += 1
+
+        self._publish_gauges()
+        return pending
+
+    def _cancel_locked(self, request_id: str) -> bool:
+        """Cancel a pending solve; caller holds the lock."""
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return False
+
+        if not pending.future.cancel() and pending.cancel_event is not None:
+            try:
+                pending.cancel_event.set()
+            except Exception as e:
+                logger.warning(f"Failed to signal cancellation for {request_id}: {e}")
+
+        self.cancelled += 1
+        self._count('scheduler.solver_pool.cancelled')
+        return True
+
+    def _record_result(self, request_id: str, pending: _PendingSolve, result: Dict[str, Any]) -> ScheduleSolution:
+        """Update metrics for a finished solve and unwrap its solution."""
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+        if result.get('cancelled'):
+            raise SolveCancelledError(f"Solve {request_id} was cancelled")
+
+        queue_wait_ms = max(0.0, (result['started_at'] - pending.submitted_at) * 1000)
+        solve_ms = (result['finished_at'] - result['started_at']) * 1000
+
+        self.completed += 1
+        self._queue_wait_ms_total += queue_wait_ms
+        self._solve_ms_total += solve_ms
+
+        solution = result['solution']
+        solution.diagnostics['solver_pool'] = {
+            'queue_wait_ms': int(queue_wait_ms),
+            'worker_solve_ms': int(solve_ms)
+        }
+
+        self._histogram('scheduler.solver_pool.queue_wait_ms', queue_wait_ms)
+        self._publish_gauges()
+        return solution
+
+    def _record_failure(self, request_id: str):
+        """Update metrics for a failed solve."""
+        with self._lock:
+            self._pending.pop(request_id, None)
+        self.failed += 1
+        self._count('scheduler.solver_pool.failed')
+        self._publish_gauges()
+
+    def _reset_executor(self):
+        """Replace a broken executor so later requests can proceed."""
+        logger.error("Solver pool broken, restarting workers")
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _publish_gauges(self):
+        """Export queue gauges to scheduler telemetry."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            stats = self.get_stats()
+            metrics = get_metrics()
+            metrics.gauge('scheduler.solver_pool.queue_depth', stats['queue_depth'])
+            metrics.gauge('scheduler.solver_pool.in_flight', stats['in_flight'])
+        except Exception as e:
+            logger.debug(f"Failed to publish solver pool gauges: {e}")
+
+    def _count(self, name: str):
+        """Increment a telemetry counter."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            get_metrics().counter(name)
+        except Exception as e:
+            logger.debug(f"Failed to publish solver pool counter: {e}")
+
+    def _histogram(self, name: str, value: float):
+        """Record a telemetry histogram value."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            get_metrics().histogram(name, value)
+        except Exception as e:
+            logger.debug(f"Failed to publish solver pool histogram: {e}")
+
+
+# Global solver pool
+_solver_pool: Optional[SolverPool] = None
+
+
+def get_solver_pool() -> SolverPool:
+    """Get global solver pool configured from SolverConfig."""
+    global _solver_pool
+    if _solver_pool is None:
+        from ..core.config import get_config
+        config = get_config().solver
+        _solver_pool = SolverPool(
+            max_workers=config.pool_workers or None,
+            start_method=config.pool_start_method
+        )
+    return _solver_pool
+
+
+def shutdown_solver_pool(wait: bool = True):
+    """Shut down the global solver pool if it was started."""
+    global _solver_pool
+    if _solver_pool is not None:
+        _solver_pool.shutdown(wait=wait)
+        _solver_pool = None
@@ -4,8 +4,10 @@ Time discretization and indexing for the scheduler.
 Provides efficient mapping between continuous time and discrete scheduling slots.
 """
 
-from datetime import datetime, timedelta, time
-from typing import List, Dict, Tuple, Set, Optional
+from datetime import datetime, timedelta, time, date as date_type
+from functools import cached_property
+from typing import Any, Callable, List, Dict, Tuple, Set, Optional, Union
+import numpy as np
 import pytz
 from ..core.domain import BusyEvent, Preferences
 from ...core.utils.timezone_utils import get_timezone_manager
@@ -16,7 +18,10 @@ class TimeIndex:
     Manages discretized time slots for scheduling optimization.
     
     Converts continuous time into discrete slots of fixed granularity
-    (e.g., 15 or 30 minutes) within a specified horizon.
+    (e.g., 15 or 30 minutes) within a specified horizon. Slots are integer
+    offsets from the horizon start in epoch seconds, so datetime to slot
+    conversion is arithmetic, and per-slot calendar attributes (hour,
+    weekday, local day) are precomputed as arrays.
     """
     
     def __init__(
@@ -38,6 +43,7 @@ class TimeIndex:
         self.timezone = pytz.timezone(timezone)
         self.granularity_minutes = granularity_minutes
         self.granularity_delta = timedelta(minutes=granularity_minutes)
+        self.granularity_seconds = granularity_minutes * 60
         self.timezone_manager = get_timezone_manager()
 
         # Ensure timezone-aware datetimes using timezone manager
@@ -46,24 +52,74 @@ class TimeIndex:
             
         self.start_dt = start_dt
         self.end_dt = end_dt
+        self.start_ts = start_dt.timestamp()
+        
+        # Slot start times as epoch seconds
+        n_slots = max(0, int(np.ceil((end_dt.timestamp() - self.start_ts) / self.granularity_seconds)))
+        self.slot_timestamps = self.start_ts + np.arange(n_slots, dtype=np.int64) * self.granularity_seconds
         
         # Generate all time slots
         self.slots = self._generate_slots()
         
-        # Create bidirectional mapping
-        self.slot_to_index = {slot: idx for idx, slot in enumerate(self.slots)}
-        self.index_to_slot = {idx: slot for idx, slot in enumerate(self.slots)}
+        # Per-slot local calendar attributes
+        self.slot_hours = np.fromiter((slot.hour for slot in self.slots), dtype=np.int64, count=n_slots)
+        self.slot_minutes_of_day = self.slot_hours * 60 + np.fromiter(
+            (slot.minute for slot in self.slots), dtype=np.int64, count=n_slots
+        )
+        self.slot_weekdays = np.fromiter((slot.weekday() for slot in self.slots), dtype=np.int64, count=n_slots)
+        
+        # Local calendar days: ordered dates, per-slot day number and half-open slot ranges
+        slot_dates = [slot.date() for slot in self.slots]
+        self.dates: List[date_type] = list(dict.fromkeys(slot_dates))
+        self._date_to_day = {day: d for d, day in enumerate(self.dates)}
+        self.slot_days = np.fromiter(
+            (self._date_to_day[day] for day in slot_dates), dtype=np.int64, count=n_slots
+        )
+        day_starts = np.searchsorted(self.slot_days, np.arange(len(self.dates)), side='left')
+        day_ends = np.searchsorted(self.slot_days, np.arange(len(self.dates)), side='right')
+        self.day_ranges: List[Tuple[int, int]] = list(zip(day_starts.tolist(), day_ends.tolist()))
+        
+        self._workday_masks: Dict[Tuple[str, str], np.ndarray] = {}
+        self._busy_mask_cache: Dict[bytes, np.ndarray] = {}
+        self._artifacts: Dict[Any, Any] = {}
+        
+        # Instances are shared across requests through the time index cache
+        for array in (
+            self.slot_timestamps, self.slot_hours, self.slot_minutes_of_day,
+            self.slot_weekdays, self.slot_days
+        ):
+            array.flags.writeable = False
         
     def _generate_slots(self) -> List[datetime]:
         """Generate all discrete time slots within the horizon."""
-        slots = []
-        current = self.start_dt
+        return [
+            datetime.fromtimestamp(float(ts), self.timezone)
+            for ts in self.slot_timestamps
+        ]
+    
+    def memoize(self, key: Any, builder: Callable[[], Any]) -> Any:
+        """
+        Return a derived slot-level artifact, building it on first use.
         
-        while current < self.end_dt:
-            slots.append(current)
-            current += self.granularity_delta
-            
-        return slots
+        Artifacts live as long as the index, so grid-only data (time
+        features, slot contexts) is shared by every request that reuses
+        a cached index. Builders must not depend on per-user state beyond
+        what is in the key.
+        """
+        try:
+            return self._artifacts[key]
+        except KeyError:
+            return self._artifacts.setdefault(key, builder())
+    
+    @cached_property
+    def slot_to_index(self) -> Dict[datetime, int]:
+        """Mapping from slot start datetime to slot index."""
+        return {slot: idx for idx, slot in enumerate(self.slots)}
+    
+    @cached_property
+    def index_to_slot(self) -> Dict[int, datetime]:
+        """Mapping from slot index to slot start datetime."""
+        return dict(enumerate(self.slots))
     
     def datetime_to_index(self, dt: datetime) -> Optional[int]:
         """
@@ -77,24 +133,22 @@ class TimeIndex:
         """
         if dt.tzinfo is None:
             dt = self.timezone.localize(dt)
-            
+        
         # Round down to nearest slot boundary
-        slot_dt = self._round_to_slot(dt)
-        return self.slot_to_index.get(slot_dt)
+        index = int((dt.timestamp() - self.start_ts) // self.granularity_seconds)
+        if 0 <= index < len(self.slots):
+            return index
+        return None
     
     def index_to_datetime(self, index: int) -> Optional[datetime]:
         """Convert slot index to datetime."""
-        return self.index_to_slot.get(index)
+        if 0 <= index < len(self.slots):
+            return self.slots[index]
+        return None
     
-    def _round_to_slot(self, dt: datetime) -> datetime:
-        """Round datetime down to nearest slot boundary."""
-        # Get minutes since start of day
-        minutes_since_start = (dt - self.start_dt).total_seconds() / 60
-        
-        # Round down to granularity boundary
-        slot_minutes = int(minutes_since_start // self.granularity_minutes) * self.granularity_minutes
-        
-        return self.start_dt + timedelta(minutes=slot_minutes)
+    def _offsets(self, timestamps: np.ndarray) -> np.ndarray:
+        """Slot offsets (unclipped, may be out of range) for epoch seconds."""
+        return np.floor_divide(timestamps - self.start_ts, self.granularity_seconds).astype(np.int64)
     
     def window_to_indices(
         self, 
@@ -145,17 +199,62 @@ class TimeIndex:
         
         return start_time, end_time
     
-    def get_day_indices(self, date: datetime) -> List[int]:
-        """Get all slot indices for a specific day."""
-        # Start of day in user timezone
-        day_start = self.timezone.localize(
-            datetime.combine(date.date(), time.min)
-        )
-        day_end = day_start + timedelta(days=1)
+    def subindex(self, start_dt: datetime, end_dt: datetime) -> 'TimeIndex':
+        """
+        Time index over a window of this horizon.
+        
+        The window is widened to whole slots and clipped to the horizon, so
+        slot boundaries of the sub-index line up with this index.
+        
+        Args:
+            start_dt: Window start
+            end_dt: Window end
+            
+        Returns:
+            TimeIndex on the same grid covering the window
+        """
+        n_slots = len(self.slots)
+        start_offset = (start_dt.timestamp() - self.start_ts) / self.granularity_seconds
+        end_offset = (end_dt.timestamp() - self.start_ts) / self.granularity_seconds
+        start_idx = int(np.clip(np.floor(start_offset), 0, n_slots))
+        end_idx = int(np.clip(np.ceil(end_offset), start_idx, n_slots))
+        
+        window_start = self.slots[start_idx] if start_idx < n_slots else self.end_dt
+        window_end = self.slots[end_idx] if end_idx < n_slots else self.end_dt
+        return TimeIndex(self.timezone.zone, window_start, window_end, self.granularity_minutes)
+    
+    def get_day_indices(self, date: Union[datetime, date_type]) -> List[int]:
+        """Get all slot indices for a specific local day (clipped to the horizon)."""
+        day = date.date() if isinstance(date, datetime) else date
+        d = self._date_to_day.get(day)
+        if d is None:
+            return []
+        start, end = self.day_ranges[d]
+        return list(range(start, end))
+    
+    def workday_mask(self, prefs: Preferences) -> np.ndarray:
+        """
+        Boolean mask of slots within workday hours.
         
-        return self.window_to_indices(day_start, day_end)
+        Args:
+            prefs: User preferences with workday bounds
+            
+        Returns:
+            Array of shape (n_slots,)
+        """
+        key = (prefs.workday_start, prefs.workday_end)
+        mask = self._workday_masks.get(key)
+        if mask is None:
+            start_time = time.fromisoformat(prefs.workday_start)
+            end_time = time.fromisoformat(prefs.workday_end)
+            start_minute = start_time.hour * 60 + start_time.minute
+            end_minute = end_time.hour * 60 + end_time.minute
+            mask = (self.slot_minutes_of_day >= start_minute) & (self.slot_minutes_of_day < end_minute)
+            mask.flags.writeable = False
+            self._workday_masks[key] = mask
+        return mask
     
-    def get_workday_indices(self, date: datetime, prefs: Preferences) -> List[int]:
+    def get_workday_indices(self, date: Union[datetime, date_type], prefs: Preferences) -> List[int]:
         """
         Get slot indices for workday hours on a specific day.
         
@@ -166,19 +265,58 @@ class TimeIndex:
         Returns:
             List of slot indices within workday hours
         """
-        # Parse workday times
-        start_time = time.fromisoformat(prefs.workday_start)
-        end_time = time.fromisoformat(prefs.workday_end)
+        day = date.date() if isinstance(date, datetime) else date
+        d = self._date_to_day.get(day)
+        if d is None:
+            return []
+        start, end = self.day_ranges[d]
+        return (start + np.flatnonzero(self.workday_mask(prefs)[start:end])).tolist()
+    
+    def busy_mask(self, busy_events: List[BusyEvent]) -> np.ndarray:
+        """
+        Boolean mask of slots blocked by hard busy events.
         
-        # Create datetime bounds
-        day_start = self.timezone.localize(
-            datetime.combine(date.date(), start_time)
-        )
-        day_end = self.timezone.localize(
-            datetime.combine(date.date(), end_time)
+        Each event blocks the slots from the one containing its start up to
+        and including the one containing its end, clipped to the horizon.
+        Computed as a sweep over event boundaries and cached per event set.
+        
+        Args:
+            busy_events: List of calendar events
+            
+        Returns:
+            Array of shape (n_slots,)
+        """
+        n_slots = len(self.slots)
+        hard_events = [event for event in busy_events if event.hard]
+        if not hard_events or n_slots == 0:
+            return np.zeros(n_slots, dtype=bool)
+        
+        bounds = np.array(
+            [(event.start.timestamp(), event.end.timestamp()) for event in hard_events],
+            dtype=np.float64
         )
+        key = bounds.tobytes()
+        cached = self._busy_mask_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        starts = self._offsets(bounds[:, 0])
+        ends = self._offsets(bounds[:, 1])
+        overlapping = (ends >= 0) & (starts < n_slots) & (starts <= ends)
+        starts = np.clip(starts[overlapping], 0, n_slots - 1)
+        ends = np.clip(ends[overlapping], 0, n_slots - 1)
         
-        return self.window_to_indices(day_start, day_end)
+        # +1 at each event start, -1 after each event end; covered where the running sum is positive
+        sweep = np.zeros(n_slots + 1, dtype=np.int64)
+        np.add.at(sweep, starts, 1)
+        np.add.at(sweep, ends + 1, -1)
+        mask = np.cumsum(sweep[:-1]) > 0
+        mask.flags.writeable = False
+        
+        if len(self._busy_mask_cache) >= 32:
+            self._busy_mask_cache.clear()
+        self._busy_mask_cache[key] = mask
+        return mask
     
     def filter_busy_slots(self, busy_events: List[BusyEvent]) -> Set[int]:
         """
@@ -190,18 +328,7 @@ class TimeIndex:
         Returns:
             Set of blocked slot indices
         """
-        blocked_slots = set()
-        
-        for event in busy_events:
-            if event.hard:  # Only hard events block scheduling
-                event_indices = self.window_to_indices(
-                    event.start, 
-                    event.end, 
-                    inclusive_end=True
-                )
-                blocked_slots.update(event_indices)
-        
-        return blocked_slots
+        return set(np.flatnonzero(self.busy_mask(busy_events)).tolist())
     
     def get_free_slots(
         self, 
@@ -220,28 +347,16 @@ class TimeIndex:
         Returns:
             List of available slot indices
         """
-        if dates is None:
-            # Get all unique dates in horizon
-            dates = list(set(slot.date() for slot in self.slots))
-        
-        free_slots = []
-        blocked_slots = self.filter_busy_slots(busy_events)
-        
-        for date in dates:
-            day_slots = self.get_workday_indices(
-                datetime.combine(date, time.min), 
-                prefs
-            )
-            
-            # Filter out blocked slots
-            available_slots = [
-                slot_idx for slot_idx in day_slots 
-                if slot_idx not in blocked_slots
+        free = self.workday_mask(prefs) & ~self.busy_mask(busy_events)
+        
+        if dates is not None:
+            days = [
+                self._date_to_day.get(day.date() if isinstance(day, datetime) else day)
+                for day in dates
             ]
-            
-            free_slots.extend(available_slots)
+            free &= np.isin(self.slot_days, [d for d in days if d is not None])
         
-        return sorted(free_slots)
+        return np.flatnonzero(free).tolist()
     
     def get_contiguous_blocks(self, slot_indices: List[int]) -> List[List[int]]:
         """
@@ -253,26 +368,12 @@ class TimeIndex:
         Returns:
             List of contiguous blocks (each block is a list of consecutive indices)
         """
-        if not slot_indices:
+        if len(slot_indices) == 0:
             return []
         
-        sorted_indices = sorted(slot_indices)
-        blocks = []
-        current_block = [sorted_indices[0]]
-        
-        for i in range(1, len(sorted_indices)):
-            if sorted_indices[i] == sorted_indices[i-1] + 1:
-                # Consecutive slot
-                current_block.append(sorted_indices[i])
-            else:
-                # Gap found, start new block
-                blocks.append(current_block)
-                current_block = [sorted_indices[i]]
-        
-        # Add final block
-        blocks.append(current_block)
-        
-        return blocks
+        sorted_indices = np.sort(np.asarray(slot_indices, dtype=np.int64))
+        breaks = np.flatnonzero(np.diff(sorted_indices) != 1) + 1
+        return [block.tolist() for block in np.split(sorted_indices, breaks)]
     
     def block_duration_minutes(self, block_indices: List[int]) -> int:
         """Get duration of a contiguous block in minutes."""
@@ -288,21 +389,27 @@ class TimeIndex:
         Returns:
             Dictionary with slot context (hour, day_of_week, etc.)
         """
-        slot_dt = self.index_to_datetime(slot_idx)
-        if slot_dt is None:
+        if not 0 <= slot_idx < len(self.slots):
             return {}
-            
-        return {
-            'datetime': slot_dt,
-            'hour': slot_dt.hour,
-            'minute': slot_dt.minute,
-            'day_of_week': slot_dt.weekday(),  # Monday=0, Sunday=6
-            'is_weekend': slot_dt.weekday() >= 5,
-            'is_morning': slot_dt.hour < 12,
-            'is_afternoon': 12 <= slot_dt.hour < 18,
-            'is_evening': slot_dt.hour >= 18,
-            'week_of_year': slot_dt.isocalendar()[1]
-        }
+        
+        return dict(self.memoize('slot_contexts', self._build_slot_contexts)[slot_idx])
+    
+    def _build_slot_contexts(self) -> List[Dict]:
+        """Slot context dictionaries for every slot."""
+        contexts = []
+        for slot_dt in self.slots:
+            contexts.append({
+                'datetime': slot_dt,
+                'hour': slot_dt.hour,
+                'minute': slot_dt.minute,
+                'day_of_week': slot_dt.weekday(),  # Monday=0, Sunday=6
+                'is_weekend': slot_dt.weekday() >= 5,
+                'is_morning': slot_dt.hour < 12,
+                'is_afternoon': 12 <= slot_dt.hour < 18,
+                'is_evening': slot_dt.hour >= 18,
+                'week_of_year': slot_dt.isocalendar()[1]
+            })
+        return contexts
     
     @property
     def total_slots(self) -> int:
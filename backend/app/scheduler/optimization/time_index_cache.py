@@ -0,0 +1,172 @@
+"""
+Cross-request cache of time indexes.
+
+A TimeIndex depends only on timezone, horizon bounds and granularity, so
+users in the same timezone scheduling the same day share one instance
+together with its precomputed slot arrays and memoized slot-level
+artifacts (slot contexts, time features).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import pytz
+
+from .time_index import TimeIndex
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, float, float, int]
+
+
+class TimeIndexCache:
+    """
+    LRU cache of TimeIndex instances with a time-to-live.
+
+    Entries are keyed on (timezone, start, end, granularity). Cached
+    indexes are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0):
+        """
+        Initialize time index cache.
+
+        Args:
+            max_entries: Maximum number of cached indexes
+            ttl_seconds: Seconds before an entry is rebuilt
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[CacheKey, Tuple[float, TimeIndex]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(
+        self,
+        timezone: str,
+        start_dt: datetime,
+        end_dt: datetime,
+        granularity_minutes: int = 30
+    ) -> TimeIndex:
+        """
+        Get a cached time index or build and cache a new one.
+
+        Args:
+            timezone: Target timezone (e.g., 'America/New_York')
+            start_dt: Start of scheduling horizon (timezone-aware)
+            end_dt: End of scheduling horizon (timezone-aware)
+            granularity_minutes: Slot duration in minutes
+
+        Returns:
+            Shared TimeIndex for these parameters
+        """
+        key = self._make_key(timezone, start_dt, end_dt, granularity_minutes)
+        now = time.monotonic()
+
+        with self._lock:
+            time_index = None
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, cached = entry
+                if now - created_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    time_index = cached
+                else:
+                    del self._entries[key]
+                    self.expirations += 1
+            if time_index is None:
+                self.misses += 1
+
+        if time_index is not None:
+            self._record("hit")
+            return time_index
+
+        # Build outside the lock; a concurrent miss on the same key just builds twice
+        time_index = TimeIndex(timezone, start_dt, end_dt, granularity_minutes)
+
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (now, time_index)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+
+        self._record("miss")
+        for _ in range(evicted):
+            self._record("eviction")
+        return time_index
+
+    def clear(self):
+        """Drop all cached indexes."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            'size': size,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hit_rate
+        }
+
+    def _make_key(
+        self, timezone: str, start_dt: datetime, end_dt: datetime, granularity_minutes: int
+    ) -> CacheKey:
+        """Cache key; naive datetimes are keyed in the target timezone."""
+        if start_dt.tzinfo is None:
+            start_dt = pytz.timezone(timezone).localize(start_dt)
+        if end_dt.tzinfo is None:
+            end_dt = pytz.timezone(timezone).localize(end_dt)
+        return (timezone, start_dt.timestamp(), end_dt.timestamp(), granularity_minutes)
+
+    def _record(self, outcome: str):
+        """Export a lookup outcome and the current hit rate to scheduler telemetry."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            metrics = get_metrics()
+            metrics.counter(f"scheduler.time_index_cache.{outcome}")
+            metrics.gauge("scheduler.time_index_cache.hit_rate", self.hit_rate)
+        except Exception as e:
+            logger.debug(f"Failed to publish time index cache metrics: {e}")
+
+
+# Global cache instance
+_time_index_cache: Optional[TimeIndexCache] = None
+
+
+def get_time_index_cache() -> TimeIndexCache:
+    """Get global time index cache sized from the scheduler cache config."""
+    global _time_index_cache
+    if _time_index_cache is None:
+        from ..core.config import get_config
+        cache_config = get_config().cache
+        _time_index_cache = TimeIndexCache(
+            max_entries=cache_config.time_index_max_entries,
+            ttl_seconds=cache_config.time_index_ttl_minutes * 60
+        )
+    return _time_index_cache
@@ -17,6 +17,7 @@ from .slo_gates import (
     get_slo_gate,
     configure_slo_gate
 )
+from .slo_state import RedisSLOState, SLOSnapshot
 
 __all__ = [
     'SLOGate',
@@ -27,5 +28,7 @@ __all__ = [
     'SLOStatus',
     'SLOViolationError',
     'get_slo_gate',
-    'configure_slo_gate'
+    'configure_slo_gate',
+    'RedisSLOState',
+    'SLOSnapshot'
 ]
\ No newline at end of file
@@ -63,6 +63,11 @@ class SLOConfig:
     throughput_window_minutes: int = 1
     quality_window_minutes: int = 10
 
+    # Shared state (multi-worker deployments)
+    shared_state_cache_ms: int = 500           # Reuse of a fetched fleet snapshot
+    shared_state_max_staleness_seconds: float = 10.0  # Beyond this, use local metrics
+    active_request_timeout_seconds: int = 300  # In-flight entries of crashed workers expire
+
 
 @dataclass
 class PerformanceMetrics:
@@ -99,10 +104,19 @@ class SLOGate:
     applies coarsening strategies when SLOs are breached.
     """
 
-    def __init__(self, config: SLOConfig = None):
-        """Initialize SLO gate with configuration."""
+    def __init__(self, config: SLOConfig = None, shared_state=None):
+        """
+        Initialize SLO gate with configuration.
+
+        Args:
+            config: SLO thresholds and windows
+            shared_state: Fleet-wide state (e.g. RedisSLOState); when set,
+                levels and admission follow the whole fleet's traffic
+        """
         self.config = config or SLOConfig()
         self.timezone_manager = get_timezone_manager()
+        self.shared_state = shared_state
+        self._last_snapshot = None
 
         # Performance tracking
         self.metrics_history: deque = deque(maxlen=1000)
@@ -145,7 +159,7 @@ class SLOGate:
 
         # Check if we should reject the request due to overload
         if self.current_status.level == SLOLevel.RED:
-            concurrent_count = len(self.active_requests)
+            concurrent_count = self._concurrent_requests()
             if concurrent_count >= self.config.max_concurrent_requests:
                 raise SLOViolationError(
                     f"Too many concurrent requests ({concurrent_count}), rejecting"
@@ -154,6 +168,8 @@ class SLOGate:
         # Track request start
         request_id = request.job_id or f"req_{int(time.time() * 1000)}"
         self.active_requests[request_id] = time.time()
+        if self.shared_state is not None:
+            self.shared_state.request_started(request_id)
 
         # Get coarsening parameters
         coarsening_params = self._get_coarsening_parameters()
@@ -206,6 +222,11 @@ class SLOGate:
         )
 
         self.metrics_history.append(metrics)
+        if self.shared_state is not None:
+            self.shared_state.request_finished(
+                request_id, latency_ms, metrics.feasible, blocks_scheduled,
+                total_tasks, metrics.error_occurred
+            )
 
         logger.debug(
             f"Recorded metrics for {request_id}: "
@@ -213,8 +234,20 @@ class SLOGate:
             f"blocks={blocks_scheduled}/{total_tasks}"
         )
 
+    def release_request(self, request_id: str):
+        """Stop tracking a request that finished without doing work (e.g. served from cache)."""
+        if self.active_requests.pop(request_id, None) is not None and self.shared_state is not None:
+            self.shared_state.request_cancelled(request_id)
+
     async def _update_slo_status(self):
         """Update current SLO status based on recent metrics."""
+        if self.shared_state is not None:
+            snapshot = await self.shared_state.get_snapshot()
+            if snapshot is not None:
+                if snapshot is not self._last_snapshot:
+                    self._update_from_snapshot(snapshot)
+                return
+
         if not self.metrics_history:
             return
 
@@ -252,6 +285,31 @@ class SLOGate:
             feasibility_rate = 1.0
             blocks_ratio = 1.0
 
+        self._set_status(p95, p99, feasibility_rate, blocks_ratio, len(latency_metrics))
+
+    def _update_from_snapshot(self, snapshot):
+        """Update SLO status from fleet-wide metrics and publish the level."""
+        self._last_snapshot = snapshot
+        # Count this evaluation locally on top of the fleet count; the shared
+        # count itself is only advanced by publish_level
+        self.consecutive_violations = snapshot.consecutive_violations
+
+        self._set_status(
+            snapshot.percentile(0.95), snapshot.percentile(0.99),
+            snapshot.feasibility_rate, snapshot.blocks_ratio, snapshot.latency_requests
+        )
+        level = self.current_status.level
+        self.shared_state.publish_level(level.value, level != SLOLevel.GREEN)
+
+    def _set_status(
+        self,
+        p95: float,
+        p99: float,
+        feasibility_rate: float,
+        blocks_ratio: float,
+        throughput: float
+    ):
+        """Derive the SLO level from windowed metrics."""
         # Determine SLO level
         violations = []
 
@@ -288,7 +346,7 @@ class SLOGate:
             violations=violations,
             recommendations=self.coarsening_strategies.get(level, []),
             current_latency_p95=p95,
-            current_throughput=len(latency_metrics),
+            current_throughput=throughput,
             current_feasibility_rate=feasibility_rate,
             auto_coarsening_enabled=level != SLOLevel.GREEN
         )
@@ -300,6 +358,14 @@ class SLOGate:
                 f"(violations: {len(violations)}, consecutive: {self.consecutive_violations})"
             )
 
+    def _concurrent_requests(self) -> int:
+        """In-flight requests across the fleet, or in this process without shared state."""
+        local = len(self.active_requests)
+        snapshot = self._last_snapshot
+        if self.shared_state is not None and snapshot is not None:
+            return max(local, snapshot.concurrent_requests)
+        return local
+
     def _get_windowed_metrics(
         self, now: datetime, window: timedelta
     ) -> List[PerformanceMetrics]:
@@ -368,9 +434,10 @@ class SLOGate:
                 'current_latency_p95': self.current_status.current_latency_p95,
                 'avg_latency_5min': avg_latency,
                 'error_rate_5min': error_rate,
-                'concurrent_requests': len(self.active_requests),
+                'concurrent_requests': self._concurrent_requests(),
                 'metrics_collected': len(self.metrics_history)
-            }
+            },
+            'shared_state': self.shared_state.get_stats() if self.shared_state else {'backend': 'local'}
         }
 
 
@@ -382,16 +449,39 @@ class SLOViolationError(Exception):
 # Global SLO gate instance
 _slo_gate = None
 
+def _create_shared_state(config: SLOConfig):
+    """Redis-backed SLO state when the scheduler cache uses Redis."""
+    from ..core.config import get_config
+    cache_config = get_config().cache
+    if cache_config.backend != "redis" or not cache_config.slo_shared_state:
+        return None
+
+    try:
+        from .slo_state import RedisSLOState
+        return RedisSLOState.from_url(
+            cache_config.redis_url,
+            latency_window_minutes=config.latency_window_minutes,
+            quality_window_minutes=config.quality_window_minutes,
+            cache_ms=config.shared_state_cache_ms,
+            max_staleness_seconds=config.shared_state_max_staleness_seconds,
+            active_request_timeout_seconds=config.active_request_timeout_seconds
+        )
+    except Exception as e:
+        logger.warning(f"Shared SLO state unavailable, using per-process state: {e}")
+        return None
+
+
 def get_slo_gate() -> SLOGate:
     """Get global SLO gate instance."""
     global _slo_gate
     if _slo_gate is None:
-        _slo_gate = SLOGate()
+        config = SLOConfig()
+        _slo_gate = SLOGate(config, _create_shared_state(config))
     return _slo_gate
 
 
-def configure_slo_gate(config: SLOConfig):
+def configure_slo_gate(config: SLOConfig, shared_state=None):
     """Configure global SLO gate with custom settings."""
     global _slo_gate
-    _slo_gate = SLOGate(config)
+    _slo_gate = SLOGate(config, shared_state)
 
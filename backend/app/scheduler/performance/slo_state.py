@@ -0,0 +1,366 @@
+"""
+Fleet-wide SLO gate state.
+
+Each API worker runs its own SLOGate, so with many workers the gate only
+sees its own slice of traffic. RedisSLOState keeps the signals the gate
+decides on in Redis instead: per-minute bucketed latency histograms and
+quality counters, the set of in-flight requests and the current SLO level.
+Writes are single atomic Lua calls issued in the background, and each
+process reuses a fetched snapshot for a short time so the pre-request check
+stays in memory.
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def _latency_bounds(first_ms: float = 10.0, growth: float = 1.25, last_ms: float = 600000.0) -> List[int]:
+    """Geometric bucket upper bounds; adjacent buckets differ by 25%."""
+    count = int(math.ceil(math.log(last_ms / first_ms) / math.log(growth)))
+    return [int(round(first_ms * growth ** i)) for i in range(count + 1)]
+
+
+# Upper bounds (ms) of the latency histogram buckets; larger values land in
+# an overflow bucket reported as the last bound
+LATENCY_BUCKETS_MS = _latency_bounds()
+
+
+def latency_bucket(latency_ms: float) -> int:
+    """Histogram bucket index for a latency."""
+    return bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+
+
+def histogram_quantile(counts: List[int], q: float) -> float:
+    """
+    Latency at quantile q of a bucketed histogram.
+
+    Uses the same rank as the in-process gate (sorted[int(n * q)]) and
+    reports the upper bound of the bucket holding it.
+    """
+    n = sum(counts)
+    if n == 0:
+        return 0.0
+
+    rank = min(int(n * q), n - 1)
+    cumulative = 0
+    for index, count in enumerate(counts):
+        cumulative += count
+        if cumulative > rank:
+            return float(LATENCY_BUCKETS_MS[min(index, len(LATENCY_BUCKETS_MS) - 1)])
+    return float(LATENCY_BUCKETS_MS[-1])
+
+
+@dataclass
+class SLOSnapshot:
+    """Fleet-wide SLO signals as of one fetch."""
+    latency_counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    requests: int = 0           # Requests completed in the quality window
+    feasible: int = 0
+    blocks_scheduled: int = 0
+    total_tasks: int = 0
+    errors: int = 0
+    concurrent_requests: int = 0
+    consecutive_violations: int = 0
+    fetched_at: float = 0.0
+
+    @property
+    def latency_requests(self) -> int:
+        """Requests completed in the latency window."""
+        return sum(self.latency_counts)
+
+    def percentile(self, q: float) -> float:
+        """Latency (ms) at quantile q."""
+        return histogram_quantile(self.latency_counts, q)
+
+    @property
+    def feasibility_rate(self) -> float:
+        """Share of feasible requests in the quality window."""
+        return self.feasible / self.requests if self.requests else 1.0
+
+    @property
+    def blocks_ratio(self) -> float:
+        """Scheduled blocks per requested task in the quality window."""
+        return self.blocks_scheduled / max(1, self.total_tasks) if self.requests else 1.0
+
+
+# Request start: drop in-flight entries left by crashed workers, then add
+_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[3])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return redis.call('ZCARD', KEYS[1])
+"""
+
+# Request end: leave the in-flight set and count into the minute's histogram
+_RECORD_SCRIPT = """
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+redis.call('HINCRBY', KEYS[1], 'n', 1)
+redis.call('HINCRBY', KEYS[1], 'ok', ARGV[3])
+redis.call('HINCRBY', KEYS[1], 'blk', ARGV[4])
+redis.call('HINCRBY', KEYS[1], 'tasks', ARGV[5])
+redis.call('HINCRBY', KEYS[1], 'err', ARGV[6])
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+return 1
+"""
+
+# Level update: reset the violation count, or count this evaluation unless
+# another worker already counted one within the evaluation interval, so the
+# count advances at one gate's pace however many workers evaluate
+_LEVEL_SCRIPT = """
+local now = tonumber(ARGV[3])
+if ARGV[2] == '0' then
+    redis.call('HSET', KEYS[1], 'consecutive', 0)
+    redis.call('HDEL', KEYS[1], 'counted_at')
+else
+    local counted_at = tonumber(redis.call('HGET', KEYS[1], 'counted_at') or '0')
+    if now - counted_at >= tonumber(ARGV[4]) then
+        redis.call('HINCRBY', KEYS[1], 'consecutive', 1)
+        redis.call('HSET', KEYS[1], 'counted_at', now)
+    end
+end
+redis.call('HSET', KEYS[1], 'level', ARGV[1], 'updated_at', now)
+return tonumber(redis.call('HGET', KEYS[1], 'consecutive'))
+"""
+
+
+class RedisSLOState:
+    """
+    SLO gate state shared through Redis.
+
+    Key layout under the prefix:
+        {prefix}:w:{minute}  hash of latency bucket counts (b0..bN) and
+                             quality counters (n, ok, blk, tasks, err)
+        {prefix}:active      sorted set of in-flight request ids by start time
+        {prefix}:level       hash with the current level and consecutive
+                             violation count
+    """
+
+    def __init__(
+        self,
+        client,
+        key_prefix: str = "scheduler:slo",
+        latency_window_minutes: int = 5,
+        quality_window_minutes: int = 10,
+        cache_ms: int = 500,
+        max_staleness_seconds: float = 10.0,
+        active_request_timeout_seconds: int = 300
+    ):
+        """
+        Initialize shared SLO state.
+
+        Args:
+            client: redis.asyncio client created with decode_responses=True
+            key_prefix: Prefix of all keys
+            latency_window_minutes: Window for latency percentiles
+            quality_window_minutes: Window for feasibility and block ratios
+            cache_ms: How long a fetched snapshot is reused before a
+                background refresh
+            max_staleness_seconds: Snapshots older than this are not used,
+                so the gate falls back to its local metrics
+            active_request_timeout_seconds: In-flight entries older than this
+                are treated as abandoned
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+        self.latency_window_minutes = latency_window_minutes
+        self.quality_window_minutes = quality_window_minutes
+        self.cache_seconds = cache_ms / 1000
+        self.max_staleness_seconds = max_staleness_seconds
+        self.active_request_timeout_seconds = active_request_timeout_seconds
+
+        self._acquire = client.register_script(_ACQUIRE_SCRIPT)
+        self._record = client.register_script(_RECORD_SCRIPT)
+        self._level = client.register_script(_LEVEL_SCRIPT)
+
+        self._snapshot: Optional[SLOSnapshot] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        self._failed_at: Optional[float] = None
+        self._background: Set[asyncio.Task] = set()
+
+        self.refreshes = 0
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisSLOState':
+        """Create shared state with its own connection pool."""
+        import redis.asyncio as redis
+        return cls(redis.from_url(url, decode_responses=True), **kwargs)
+
+    @property
+    def _active_key(self) -> str:
+        return f"{self.key_prefix}:active"
+
+    @property
+    def _level_key(self) -> str:
+        return f"{self.key_prefix}:level"
+
+    def _window_key(self, minute: int) -> str:
+        return f"{self.key_prefix}:w:{minute}"
+
+    async def get_snapshot(self) -> Optional[SLOSnapshot]:
+        """
+        Current fleet snapshot.
+
+        Serves the cached snapshot while fresh, and a stale one while a
+        background refresh runs; only the first call waits on Redis, and
+        after a failed first fetch calls are not retried for a while.
+
+        Returns:
+            Snapshot, or None if Redis is unavailable
+        """
+        now = time.monotonic()
+        snapshot = self._snapshot
+
+        if snapshot is None:
+            # Do not hold every request on an unreachable Redis
+            if self._failed_at is not None and now - self._failed_at < self.max_staleness_seconds:
+                return None
+            await self._refresh_once()
+            return self._snapshot
+
+        age = now - snapshot.fetched_at
+        if age >= self.cache_seconds and self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._refresh_once())
+            self._refreshing.add_done_callback(self._refresh_done)
+
+        return snapshot if age < self.max_staleness_seconds else None
+
+    def request_started(self, request_id: str):
+        """Add a request to the fleet's in-flight set (in the background)."""
+        now = time.time()
+        self._spawn(self._acquire(
+            keys=[self._active_key],
+            args=[
+                request_id, now, now - self.active_request_timeout_seconds,
+                self.active_request_timeout_seconds * 2
+            ]
+        ))
+        # Reflect our own request before the next refresh
+        if self._snapshot is not None:
+            self._snapshot.concurrent_requests += 1
+
+    def request_finished(
+        self,
+        request_id: str,
+        latency_ms: float,
+        feasible: bool,
+        blocks_scheduled: int,
+        total_tasks: int,
+        error: bool
+    ):
+        """Record a completed request (in the background)."""
+        minute = int(time.time() // 60)
+        ttl = (max(self.latency_window_minutes, self.quality_window_minutes) + 1) * 60
+        self._spawn(self._record(
+            keys=[self._window_key(minute), self._active_key],
+            args=[
+                request_id, f"b{latency_bucket(latency_ms)}", int(feasible),
+                blocks_scheduled, total_tasks, int(error), ttl
+            ]
+        ))
+        if self._snapshot is not None and self._snapshot.concurrent_requests > 0:
+            self._snapshot.concurrent_requests -= 1
+
+    def request_cancelled(self, request_id: str):
+        """Remove a request from the in-flight set without recording it."""
+        self._spawn(self.client.zrem(self._active_key, request_id))
+        if self._snapshot is not None and self._snapshot.concurrent_requests > 0:
+            self._snapshot.concurrent_requests -= 1
+
+    def publish_level(self, level: str, violated: bool):
+        """
+        Store the level this process derived from the latest snapshot.
+
+        The consecutive violation count is advanced or reset in the same
+        script, so concurrent workers never overwrite each other's counts.
+        """
+        self._spawn(self._level(
+            keys=[self._level_key],
+            args=[level, int(violated), time.time(), self.cache_seconds]
+        ))
+
+    async def close(self):
+        """Wait for pending writes."""
+        if self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Shared state statistics."""
+        snapshot = self._snapshot
+        return {
+            'backend': 'redis',
+            'available': snapshot is not None
+            and time.monotonic() - snapshot.fetched_at < self.max_staleness_seconds,
+            'fleet_concurrent_requests': snapshot.concurrent_requests if snapshot else None,
+            'fleet_requests': snapshot.requests if snapshot else None,
+            'refreshes': self.refreshes,
+            'errors': self.errors
+        }
+
+    async def _refresh_once(self):
+        """Fetch a new snapshot, keeping the old one on failure."""
+        try:
+            self._snapshot = await self._fetch()
+            self._failed_at = None
+            self.refreshes += 1
+        except Exception as e:
+            self._failed_at = time.monotonic()
+            self.errors += 1
+            logger.warning(f"Failed to fetch shared SLO state: {e}")
+
+    def _refresh_done(self, _):
+        self._refreshing = None
+
+    async def _fetch(self) -> SLOSnapshot:
+        """Read the windows, in-flight count and level in one pipeline."""
+        current = int(time.time() // 60)
+        n_minutes = max(self.latency_window_minutes, self.quality_window_minutes)
+
+        pipe = self.client.pipeline(transaction=False)
+        for offset in range(n_minutes):
+            pipe.hgetall(self._window_key(current - offset))
+        pipe.zcount(self._active_key, time.time() - self.active_request_timeout_seconds, '+inf')
+        pipe.hgetall(self._level_key)
+        results = await pipe.execute()
+
+        windows, concurrent, level = results[:n_minutes], results[n_minutes], results[n_minutes + 1]
+
+        snapshot = SLOSnapshot(concurrent_requests=int(concurrent), fetched_at=time.monotonic())
+        for offset, window in enumerate(windows):
+            if not window:
+                continue
+            if offset < self.latency_window_minutes:
+                for name, count in window.items():
+                    if name.startswith('b'):
+                        index = min(int(name[1:]), len(snapshot.latency_counts) - 1)
+                        snapshot.latency_counts[index] += int(count)
+            if offset < self.quality_window_minutes:
+                snapshot.requests += int(window.get('n', 0))
+                snapshot.feasible += int(window.get('ok', 0))
+                snapshot.blocks_scheduled += int(window.get('blk', 0))
+                snapshot.total_tasks += int(window.get('tasks', 0))
+                snapshot.errors += int(window.get('err', 0))
+
+        if level:
+            snapshot.consecutive_violations = int(level.get('consecutive', 0))
+        return snapshot
+
+    def _spawn(self, coro):
+        """Run a write without blocking the request path."""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._write_done)
+
+    def _write_done(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            logger.warning(f"Failed to update shared SLO state: {task.exception()}")
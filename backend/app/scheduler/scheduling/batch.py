@@ -0,0 +1,293 @@
+"""
+Batched multi-user scheduling.
+
+Serves nightly and morning replans for many users in one run: inputs are
+bulk-loaded for the whole batch, time grids are shared through the time
+index cache, and solves are spread over the solver pool in earliest-deadline
+order with a bounded number of users in flight.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import BatchConfig, get_config
+from ..io.dto import ScheduleRequest, ScheduleResponse
+from ..monitoring.telemetry import get_metrics
+from ...core.utils.timezone_utils import get_timezone_manager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchScheduleResult:
+    """Outcome of a batched scheduling run."""
+    responses: Dict[str, ScheduleResponse] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)        # Solve raised or returned infeasible
+    timed_out: List[str] = field(default_factory=list)     # Exceeded per-user time budget
+    skipped: List[str] = field(default_factory=list)       # Deadline passed before start
+    load_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def n_users(self) -> int:
+        """Users in the batch."""
+        return len(self.responses) + len(self.timed_out) + len(self.skipped)
+
+    @property
+    def users_per_second(self) -> float:
+        """Throughput of the whole run, including input loading."""
+        return self.n_users / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Run-level metrics."""
+        return {
+            'users': self.n_users,
+            'succeeded': len(self.responses) - len(self.failed),
+            'failed': len(self.failed),
+            'timed_out': len(self.timed_out),
+            'skipped': len(self.skipped),
+            'load_seconds': self.load_seconds,
+            'elapsed_seconds': self.elapsed_seconds,
+            'users_per_second': self.users_per_second
+        }
+
+
+class BatchScheduler:
+    """
+    Schedules many users in one run.
+
+    Each user still goes through SchedulerService.schedule, so SLO gates,
+    idempotency, incremental replans and persistence behave exactly as for
+    single requests; only input loading and solve dispatch are batched.
+    """
+
+    def __init__(self, service=None, config: Optional[BatchConfig] = None):
+        """
+        Initialize batch scheduler.
+
+        Args:
+            service: Scheduler service (global service if None)
+            config: Batch configuration (scheduler config if None)
+        """
+        self._service = service
+        self.config = config or get_config().batch
+        self.timezone_manager = get_timezone_manager()
+
+    @property
+    def service(self):
+        """Lazy import to avoid circular dependency."""
+        if self._service is None:
+            from ..core.service import get_scheduler_service
+            self._service = get_scheduler_service()
+        return self._service
+
+    async def schedule_batch(
+        self,
+        requests: List[ScheduleRequest],
+        deadline: Optional[datetime] = None
+    ) -> BatchScheduleResult:
+        """
+        Schedule a batch of users.
+
+        Users are started in earliest-deadline-first order. A request's own
+        deadline comes from ``options['deadline']`` (datetime or ISO string)
+        and falls back to the batch deadline.
+
+        Args:
+            requests: One scheduling request per user
+            deadline: Time by which all schedules should be ready
+
+        Returns:
+            Batch result with per-user responses and run metrics
+        """
+        started = time.perf_counter()
+        result = BatchScheduleResult()
+
+        # One request per user; the last one wins
+        by_user = {request.user_id: request for request in requests}
+        if not by_user:
+            return result
+
+        inputs = await self._load_inputs(list(by_user.values()))
+        result.load_seconds = time.perf_counter() - started
+
+        # Scheduling on partial inputs would replace a good schedule with a wrong one
+        for user_id in [user_id for user_id in by_user if user_id not in inputs]:
+            logger.error(f"Batch scheduling failed for user {user_id}: inputs did not load")
+            result.responses[user_id] = self._error_response(
+                by_user.pop(user_id), "Scheduling inputs failed to load", "InputLoadError"
+            )
+            result.failed.append(user_id)
+            self._count("failed")
+
+        deadlines = {
+            user_id: self._request_deadline(request, deadline) for user_id, request in by_user.items()
+        }
+        # Earliest deadline first; users without a deadline go last
+        ordered = sorted(
+            by_user.values(),
+            key=lambda request: (
+                deadlines[request.user_id] is None,
+                deadlines[request.user_id].timestamp() if deadlines[request.user_id] else 0.0
+            )
+        )
+
+        semaphore = asyncio.Semaphore(self._max_concurrency())
+
+        async def run_one(request: ScheduleRequest):
+            async with semaphore:
+                await self._schedule_user(
+                    request, inputs[request.user_id], deadlines[request.user_id], result
+                )
+
+        await asyncio.gather(*(run_one(request) for request in ordered))
+
+        result.elapsed_seconds = time.perf_counter() - started
+        self._record_run(result)
+
+        run_metrics = result.get_metrics()
+        logger.info(
+            f"Batch scheduled {run_metrics['users']} users in {result.elapsed_seconds:.1f}s "
+            f"({result.users_per_second:.2f} users/s): {run_metrics['succeeded']} ok, "
+            f"{run_metrics['failed']} failed, {run_metrics['timed_out']} timed out, "
+            f"{run_metrics['skipped']} skipped"
+        )
+        return result
+
+    async def _load_inputs(
+        self, requests: List[ScheduleRequest]
+    ) -> Dict[str, Tuple[List, List, Any, List]]:
+        """
+        Bulk-load tasks, events, preferences and history for every user.
+
+        Users missing from any loader's result failed to load and are left out.
+        """
+        repo = self.service.repo
+        user_ids = [request.user_id for request in requests]
+        horizon_days = max(request.horizon_days for request in requests)
+
+        loads = [
+            repo.load_tasks_many(user_ids, horizon_days),
+            repo.load_calendar_busy_many(user_ids, horizon_days),
+            repo.load_preferences_many(user_ids),
+            repo.load_history_many(user_ids, self.config.history_days)
+        ]
+        # Learned models are bulk-loaded alongside the inputs
+        model_registry = getattr(self.service, 'model_registry', None)
+        if model_registry is not None:
+            loads.append(model_registry.preload(user_ids))
+
+        tasks, events, prefs, history = (await asyncio.gather(*loads))[:4]
+
+        return {
+            user_id: (tasks[user_id], events[user_id], prefs[user_id], history[user_id])
+            for user_id in user_ids
+            if all(user_id in loaded for loaded in (tasks, events, prefs, history))
+        }
+
+    async def _schedule_user(
+        self,
+        request: ScheduleRequest,
+        inputs: Tuple[List, List, Any, List],
+        deadline: Optional[datetime],
+        result: BatchScheduleResult
+    ):
+        """Schedule one user within its time budget and record the outcome."""
+        user_id = request.user_id
+        timeout = self.config.per_user_timeout_seconds
+
+        if deadline is not None:
+            remaining = deadline.timestamp() - time.time()
+            if remaining <= 0:
+                logger.warning(f"Skipping user {user_id}: batch deadline already passed")
+                result.skipped.append(user_id)
+                self._count("skipped")
+                return
+            timeout = min(timeout, remaining)
+
+        try:
+            response = await asyncio.wait_for(
+                self.service.schedule(request, enhanced_observability=False, inputs=inputs),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Scheduling user {user_id} exceeded its {timeout:.1f}s budget")
+            result.timed_out.append(user_id)
+            self._count("timed_out")
+            return
+        except Exception as e:
+            logger.error(f"Batch scheduling failed for user {user_id}: {e}", exc_info=True)
+            response = self._error_response(request, str(e), type(e).__name__)
+
+        result.responses[user_id] = response
+        if response.feasible:
+            self._count("succeeded")
+        else:
+            result.failed.append(user_id)
+            self._count("failed")
+
+    def _error_response(
+        self, request: ScheduleRequest, error: str, error_type: str
+    ) -> ScheduleResponse:
+        """Infeasible response recording why a user was not scheduled."""
+        return ScheduleResponse(
+            job_id=request.job_id,
+            feasible=False,
+            blocks=[],
+            metrics={'error': error, 'error_type': error_type},
+            explanations={'error': f"Scheduling failed: {error}"}
+        )
+
+    def _request_deadline(
+        self, request: ScheduleRequest, batch_deadline: Optional[datetime]
+    ) -> Optional[datetime]:
+        """Deadline for one request, made timezone-aware."""
+        deadline = (request.options or {}).get('deadline', batch_deadline)
+        if deadline is None:
+            return None
+        if isinstance(deadline, str):
+            deadline = datetime.fromisoformat(deadline.replace('Z', '+00:00'))
+        return self.timezone_manager.ensure_timezone_aware(deadline)
+
+    def _max_concurrency(self) -> int:
+        """Users in flight at once: the configured cap or one per pool worker."""
+        if self.config.max_concurrency:
+            return self.config.max_concurrency
+        pool = getattr(self.service, 'solver_pool', None)
+        if pool is not None:
+            return pool.max_workers
+        return os.cpu_count() or 1
+
+    def _count(self, outcome: str):
+        """Count a per-user outcome."""
+        try:
+            get_metrics().counter(f"scheduler.batch.{outcome}")
+        except Exception as e:
+            logger.debug(f"Failed to record batch metric: {e}")
+
+    def _record_run(self, result: BatchScheduleResult):
+        """Export run-level metrics."""
+        try:
+            metrics = get_metrics()
+            metrics.histogram("scheduler.batch.users", result.n_users)
+            metrics.histogram("scheduler.batch.elapsed_seconds", result.elapsed_seconds)
+            metrics.gauge("scheduler.batch.users_per_second", result.users_per_second)
+        except Exception as e:
+            logger.debug(f"Failed to record batch metrics: {e}")
+
+
+# Global batch scheduler instance
+_batch_scheduler: Optional[BatchScheduler] = None
+
+
+def get_batch_scheduler() -> BatchScheduler:
+    """Get global batch scheduler instance."""
+    global _batch_scheduler
+    if _batch_scheduler is None:
+        _batch_scheduler = BatchScheduler()
+    return _batch_scheduler
@@ -0,0 +1,162 @@
+"""
+Per-user coalescing of scheduling requests.
+
+Bursts of requests for one user (dragging several blocks, calendar webhook
+storms) each start a full solve although only the last result matters. The
+coalescer runs at most one request per key at a time and keeps at most one
+queued: a newer request replaces the queued one, and everyone waiting on
+the superseded or in-flight request is answered with the newest result.
+In-flight solves are never cancelled, since they may already be persisting
+their schedule.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class _Pending(Generic[T]):
+    """The newest queued request for a key and everyone waiting on it."""
+    run: Callable[[], Awaitable[T]]
+    owner: asyncio.Future
+    waiters: List[asyncio.Future] = field(default_factory=list)
+
+
+@dataclass
+class _KeyState(Generic[T]):
+    """Requests for one key."""
+    pending: Optional[_Pending[T]] = None
+    inflight: List[asyncio.Future] = field(default_factory=list)
+
+
+class RequestCoalescer(Generic[T]):
+    """
+    Latest-wins request coalescer.
+
+    Each key has at most one request running; requests arriving meanwhile
+    collapse into a single follow-up run of the newest one.
+    """
+
+    def __init__(self, share: Optional[Callable[[T], T]] = None):
+        """
+        Initialize coalescer.
+
+        Args:
+            share: Derives the result handed to callers whose own request
+                did not run (e.g. a copy marked as coalesced)
+        """
+        self.share = share or (lambda result: result)
+        self._states: Dict[Hashable, _KeyState[T]] = {}
+
+        self.requests = 0
+        self.executions = 0
+        self.superseded = 0
+
+    async def submit(self, key: Hashable, run: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request, or wait for a newer one for the same key.
+
+        Args:
+            key: Requests with equal keys are coalesced (e.g. one per user)
+            run: Produces the result
+
+        Returns:
+            The result of this request, or of the newest request that
+            superseded it
+        """
+        self.requests += 1
+        future = asyncio.get_running_loop().create_future()
+
+        state = self._states.get(key)
+        if state is None:
+            state = _KeyState(pending=_Pending(run=run, owner=future, waiters=[future]))
+            self._states[key] = state
+            asyncio.ensure_future(self._drain(key, state))
+        else:
+            if state.pending is None:
+                state.pending = _Pending(run=run, owner=future)
+            else:
+                # The queued request will never run; its callers take ours
+                self.superseded += 1
+                self._count("superseded")
+                state.pending.run = run
+                state.pending.owner = future
+            state.pending.waiters.append(future)
+
+            # Only the newest result matters to callers of the in-flight solve too
+            state.pending.waiters.extend(state.inflight)
+            state.inflight = []
+
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Coalescing statistics."""
+        return {
+            'requests': self.requests,
+            'executions': self.executions,
+            'superseded': self.superseded,
+            'active_keys': len(self._states),
+            'coalescing_ratio': self.coalescing_ratio
+        }
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Fraction of requests answered without a run of their own."""
+        return 1.0 - self.executions / self.requests if self.requests else 0.0
+
+    async def _drain(self, key: Hashable, state: _KeyState[T]):
+        """Run the key's requests one at a time until none is queued."""
+        try:
+            while state.pending is not None:
+                pending, state.pending = state.pending, None
+                if all(waiter.done() for waiter in pending.waiters):
+                    # Every caller went away before it started
+                    continue
+
+                state.inflight = pending.waiters
+                self.executions += 1
+                self._publish()
+                try:
+                    result, error = await pending.run(), None
+                except Exception as e:
+                    result, error = None, e
+
+                waiters, state.inflight = state.inflight, []
+                for waiter in waiters:
+                    if waiter.done():
+                        continue
+                    if error is not None:
+                        waiter.set_exception(error)
+                    elif waiter is pending.owner:
+                        waiter.set_result(result)
+                    else:
+                        waiter.set_result(self.share(result))
+        finally:
+            self._states.pop(key, None)
+            # Only reached with waiters left if the drain itself was cancelled
+            leftover = state.inflight + (state.pending.waiters if state.pending else [])
+            for waiter in leftover:
+                if not waiter.done():
+                    waiter.cancel()
+
+    def _count(self, outcome: str):
+        """Count a coalescing event."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            get_metrics().counter(f"scheduler.coalescer.{outcome}")
+        except Exception as e:
+            logger.debug(f"Failed to record coalescer metric: {e}")
+
+    def _publish(self):
+        """Export the coalescing ratio."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            get_metrics().gauge("scheduler.coalescer.ratio", self.coalescing_ratio)
+        except Exception as e:
+            logger.debug(f"Failed to record coalescer metric: {e}")
@@ -0,0 +1,307 @@
+"""
+Lazily built schedule explanations.
+
+Explanations, constraint analysis, quality breakdowns and alternatives take
+longer than the rest of the response and are rarely opened. Scheduling
+responses therefore only carry a handle: the work to build the explanation
+is registered here under the response's job id and runs on the first fetch
+(or in the background right after the response), once per job.
+
+With a Redis client the explanation is built in the background by the
+worker that solved the job and published under its job id, so any worker
+can serve the handle and no worker keeps solve inputs once it is built.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """One job's explanation, from registration to result."""
+    user_id: str
+    created_at: float
+    compute: Optional[Callable[[], Awaitable[Dict[str, Any]]]]
+    task: Optional[asyncio.Task] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.result is not None:
+            return "ready"
+        if self.error is not None:
+            return "failed"
+        return "computing" if self.task is not None else "pending"
+
+
+class ExplanationStore:
+    """
+    LRU of explanation jobs with a time-to-live.
+
+    An entry holds the closure that builds the explanation until it has
+    run, then only the result, so evicting idle jobs also frees the solve
+    inputs they captured. With Redis the entry is dropped once its result
+    is published, and fetches for jobs built elsewhere read the published
+    record.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 1800.0,
+        redis_client=None,
+        wait_seconds: float = 30.0,
+        key_prefix: str = "scheduler:expl"
+    ):
+        """
+        Initialize explanation store.
+
+        Args:
+            max_entries: Maximum number of jobs kept in this process
+            ttl_seconds: Seconds a job's explanation stays fetchable
+            redis_client: redis.asyncio client; explanations are only
+                served by the registering process if None
+            wait_seconds: How long a fetch waits for a build running on
+                another worker
+            key_prefix: Prefix of Redis keys
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis_client
+        self.wait_seconds = wait_seconds
+        self.key_prefix = key_prefix
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+
+        self.registered = 0
+        self.fetched = 0
+        self.computed = 0
+        self.failed = 0
+        self.evictions = 0
+
+    def register(
+        self,
+        job_id: str,
+        user_id: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        precompute: bool = False
+    ):
+        """
+        Register how to build a job's explanation.
+
+        Args:
+            job_id: Job id returned with the schedule
+            user_id: Owner; fetches by other users are refused
+            compute: Builds the explanation payload
+            precompute: Start building in the background now; always
+                done with Redis, since other workers cannot build it
+        """
+        entry = _Entry(user_id=user_id, created_at=time.monotonic(), compute=compute)
+        self._entries[job_id] = entry
+        self._entries.move_to_end(job_id)
+        self.registered += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        if precompute or self.redis is not None:
+            self._start(job_id, entry)
+
+    def status(self, job_id: str, user_id: str) -> Optional[str]:
+        """Status of a job's explanation, or None if unknown or expired."""
+        entry = self._lookup(job_id, user_id)
+        return entry.status if entry is not None else None
+
+    def drop_unknown_handle(self, metrics: Dict[str, Any], user_id: str) -> bool:
+        """
+        Remove an explanation handle this process cannot serve.
+
+        Without Redis the build closure only lives in the worker that solved
+        the job, so a response replayed from the idempotency cache elsewhere
+        (or once the entry expired) would carry a handle that only 404s.
+
+        Returns:
+            True if a handle was removed
+        """
+        handle = metrics.get('explanation_handle')
+        if handle is None or self.redis is not None:
+            return False
+        if self.status(handle['job_id'], user_id) is not None:
+            return False
+        del metrics['explanation_handle']
+        return True
+
+    async def get(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job's explanation, building it on first use.
+
+        Concurrent fetches of one job share a single build.
+
+        Returns:
+            Dict with job_id, status ('ready', 'failed', or 'computing' when
+            another worker's build outlasts wait_seconds) and the
+            explanation or error; None if the job is unknown or expired
+        """
+        entry = self._lookup(job_id, user_id)
+        if entry is None:
+            if self.redis is None:
+                return None
+            return await self._get_published(job_id, user_id)
+
+        self.fetched += 1
+        if entry.status in ("pending", "computing"):
+            # A caller going away must not cancel the shared build
+            await asyncio.shield(self._start(job_id, entry))
+
+        if entry.result is not None:
+            return {'job_id': job_id, 'status': 'ready', 'explanation': entry.result}
+        return {'job_id': job_id, 'status': 'failed', 'error': entry.error}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics."""
+        return {
+            'backend': 'redis' if self.redis is not None else 'memory',
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'registered': self.registered,
+            'fetched': self.fetched,
+            'computed': self.computed,
+            'failed': self.failed,
+            'evictions': self.evictions,
+            'fetch_ratio': self.fetched / self.registered if self.registered else 0.0
+        }
+
+    def _lookup(self, job_id: str, user_id: str) -> Optional[_Entry]:
+        """Live entry owned by the user."""
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at >= self.ttl_seconds:
+            del self._entries[job_id]
+            return None
+        if entry.user_id != user_id:
+            return None
+        self._entries.move_to_end(job_id)
+        return entry
+
+    def _start(self, job_id: str, entry: _Entry) -> asyncio.Task:
+        """Start the build once."""
+        if entry.task is None:
+            entry.task = asyncio.ensure_future(self._build(job_id, entry))
+        return entry.task
+
+    async def _build(self, job_id: str, entry: _Entry):
+        """Run the build, keeping only its outcome."""
+        if self.redis is not None:
+            # Other workers can see the job from here on
+            await self._publish(job_id, {'user_id': entry.user_id, 'status': 'computing'})
+        # Let the scheduling response go out before the analysis starts
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        try:
+            entry.result = await entry.compute()
+            self.computed += 1
+            self._record("computed", (time.perf_counter() - started) * 1000)
+        except Exception as e:
+            logger.warning(f"Failed to build schedule explanation: {e}", exc_info=True)
+            entry.error = str(e)
+            self.failed += 1
+            self._record("failed")
+        finally:
+            entry.compute = None
+
+        if self.redis is not None:
+            if entry.result is not None:
+                record = {'user_id': entry.user_id, 'status': 'ready', 'explanation': entry.result}
+            else:
+                record = {'user_id': entry.user_id, 'status': 'failed', 'error': entry.error}
+            if await self._publish(job_id, record) and self._entries.get(job_id) is entry:
+                # Served from Redis from now on
+                del self._entries[job_id]
+
+    async def _publish(self, job_id: str, record: Dict[str, Any]) -> bool:
+        """Write a job's record to Redis for the rest of its time-to-live."""
+        try:
+            await self.redis.set(
+                self._key(job_id), json.dumps(record, default=str), ex=int(self.ttl_seconds)
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish explanation for job {job_id}: {e}")
+            return False
+
+    async def _get_published(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """A job's explanation built by another worker, waiting while it builds."""
+        deadline = time.monotonic() + self.wait_seconds
+        delay = 0.05
+        while True:
+            try:
+                payload = await self.redis.get(self._key(job_id))
+            except Exception as e:
+                logger.warning(f"Explanation lookup failed for job {job_id}: {e}")
+                return None
+            if payload is None:
+                return None
+
+            record = json.loads(payload)
+            if record['user_id'] != user_id:
+                return None
+            if record['status'] != 'computing' or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        self.fetched += 1
+        del record['user_id']
+        return {'job_id': job_id, **record}
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}"
+
+    def _record(self, outcome: str, build_ms: Optional[float] = None):
+        """Export a build outcome to scheduler telemetry."""
+        try:
+            from ..monitoring.telemetry import get_metrics
+            metrics = get_metrics()
+            metrics.counter(f"scheduler.explanations.{outcome}")
+            if build_ms is not None:
+                metrics.histogram("scheduler.explanations.build_ms", build_ms)
+        except Exception as e:
+            logger.debug(f"Failed to record explanation metric: {e}")
+
+
+# Global store instance
+_explanation_store: Optional[ExplanationStore] = None
+
+
+def get_explanation_store() -> ExplanationStore:
+    """Get global explanation store, shared through Redis when the cache backend is redis."""
+    global _explanation_store
+    if _explanation_store is None:
+        from ..core.config import get_config
+        cache_config = get_config().cache
+
+        redis_client = None
+        if cache_config.backend == "redis":
+            try:
+                import redis.asyncio as redis
+                redis_client = redis.from_url(cache_config.redis_url)
+            except Exception as e:
+                logger.warning(f"Redis explanation store unavailable, using process memory: {e}")
+
+        _explanation_store = ExplanationStore(
+            max_entries=cache_config.explanation_max_entries,
+            ttl_seconds=cache_config.explanation_ttl_minutes * 60,
+            redis_client=redis_client
+        )
+    return _explanation_store
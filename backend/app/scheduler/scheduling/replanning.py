@@ -7,11 +7,11 @@ preventing unnecessary disruption while maintaining schedule quality.
 
 import logging
 from typing import List, Dict, Optional, Set, Tuple, Any
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
-from ..core.domain import Task, ScheduleBlock, Preferences, BusyEvent
+from ..core.domain import Task, ScheduleBlock, Preferences, BusyEvent, ScheduleSolution
 from ..optimization.time_index import TimeIndex
 from ...core.utils.timezone_utils import get_timezone_manager, safe_datetime_comparison
 
@@ -77,6 +77,29 @@ class ReplanResult:
     stability_ratio: float                          # Fraction of blocks remaining stable
 
 
+@dataclass
+class IncrementalPlan:
+    """Reduced problem for re-solving only the disrupted part of a schedule."""
+    time_index: TimeIndex                           # Horizon shrunk to the disrupted window
+    tasks: List[Task]                               # Tasks to re-solve
+    busy_events: List[BusyEvent]                    # Calendar events plus frozen blocks
+    frozen_blocks: List[ScheduleBlock]              # Existing blocks kept unchanged
+    existing_blocks: List[ScheduleBlock]            # Existing blocks within the full horizon
+    replan_result: ReplanResult                     # Scope analysis the plan was derived from
+    frozen_minutes: Dict[date, int] = field(default_factory=dict)  # Frozen work per local date, for daily caps
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary of the reduction for diagnostics."""
+        return {
+            'window_start': self.time_index.start_dt.isoformat(),
+            'window_end': self.time_index.end_dt.isoformat(),
+            'window_slots': len(self.time_index),
+            'tasks_resolved': len(self.tasks),
+            'blocks_frozen': len(self.frozen_blocks),
+            'frozen_minutes': sum(self.frozen_minutes.values())
+        }
+
+
 class ReplanningController:
     """
     Intelligent controller for managing replanning scope and constraints.
@@ -237,6 +260,200 @@ class ReplanningController:
         is_valid = len(violations) == 0
         return is_valid, violations
 
+    def plan_incremental_replan(
+        self,
+        existing_blocks: List[ScheduleBlock],
+        tasks: List[Task],
+        busy_events: List[BusyEvent],
+        preferences: Preferences,
+        time_index: TimeIndex,
+        scope: ReplanScope = ReplanScope.MODERATE,
+        custom_constraints: Optional[ReplanConstraint] = None,
+        disrupted_window: Optional[Tuple[datetime, datetime]] = None
+    ) -> Optional[IncrementalPlan]:
+        """
+        Reduce a replan to the part of the schedule that is actually disrupted.
+
+        Tasks are re-solved when they have no existing block (new or missed
+        work), when one of their blocks now overlaps a hard calendar event, or
+        when they are move candidates inside the disrupted window. Every other
+        existing block is frozen and handed to the solver as a hard busy event.
+
+        Args:
+            existing_blocks: Current schedule blocks
+            tasks: Tasks that still need scheduling
+            busy_events: Calendar conflicts
+            preferences: User preferences
+            time_index: Full scheduling horizon
+            scope: Overall replanning scope
+            custom_constraints: Additional constraints
+            disrupted_window: Known disrupted time range (e.g. a changed event)
+
+        Returns:
+            Incremental plan, or None when a full re-solve is required
+        """
+        if scope == ReplanScope.COMPLETE:
+            return None
+
+        horizon_start, horizon_end = time_index.start_dt, time_index.end_dt
+        existing = [
+            block for block in existing_blocks
+            if block.end > horizon_start and block.start < horizon_end
+        ]
+        if not existing:
+            return None
+
+        replan_result = self.analyze_replanning_scope(
+            existing, tasks, busy_events, preferences, scope, custom_constraints, time_index
+        )
+        max_move_hours = self._get_scope_constraints(scope).max_move_distance_hours
+        if custom_constraints and custom_constraints.max_move_distance_hours:
+            max_move_hours = custom_constraints.max_move_distance_hours
+
+        blocks_by_task: Dict[str, List[ScheduleBlock]] = {}
+        for block in existing:
+            blocks_by_task.setdefault(block.task_id, []).append(block)
+        hard_events = [event for event in busy_events if event.hard]
+
+        unplaced: List[Task] = []
+        disrupted: List[Task] = []
+        for task in tasks:
+            blocks = blocks_by_task.get(task.id)
+            if not blocks:
+                unplaced.append(task)
+            elif task.id not in replan_result.protected_blocks and any(
+                self._overlaps_event(block, hard_events) for block in blocks
+            ):
+                disrupted.append(task)
+
+        # Disrupted window: explicit range and conflicting blocks, widened by
+        # the scope's move distance; move candidates are re-solved inside it
+        window_starts: List[datetime] = []
+        window_ends: List[datetime] = []
+        if disrupted_window:
+            window_starts.append(disrupted_window[0])
+            window_ends.append(disrupted_window[1])
+        for task in disrupted:
+            window_starts.extend(block.start for block in blocks_by_task[task.id])
+            window_ends.extend(block.end for block in blocks_by_task[task.id])
+
+        resolve_ids = {task.id for task in unplaced + disrupted}
+        if window_starts:
+            if max_move_hours is None:
+                move_start, move_end = horizon_start, horizon_end
+            else:
+                move_start = min(window_starts) - timedelta(hours=max_move_hours)
+                move_end = max(window_ends) + timedelta(hours=max_move_hours)
+            window_starts, window_ends = [move_start], [move_end]
+
+            for task_id in replan_result.move_candidates:
+                blocks = blocks_by_task.get(task_id, [])
+                if (task_id not in replan_result.protected_blocks and blocks and
+                        all(b.start >= move_start and b.end <= move_end for b in blocks)):
+                    resolve_ids.add(task_id)
+
+        # Unplaced tasks (new or missed work) fill gaps up to their deadline
+        tz_manager = get_timezone_manager()
+        for task in unplaced:
+            window_starts.append(horizon_start)
+            if task.deadline:
+                window_ends.append(min(tz_manager.ensure_timezone_aware(task.deadline), horizon_end))
+            else:
+                window_ends.append(horizon_end)
+
+        if window_starts:
+            window_start = max(min(window_starts), horizon_start)
+            window_end = min(max(window_ends), horizon_end)
+        else:
+            window_start = window_end = horizon_start
+
+        task_ids = {task.id for task in tasks}
+        frozen_blocks = [
+            block for block in existing
+            if block.task_id not in resolve_ids and
+            (block.task_id in task_ids or block.task_id in replan_result.protected_blocks)
+        ]
+        frozen_events = [
+            BusyEvent(
+                id=f"frozen_{block.task_id}_{int(block.start.timestamp())}",
+                source="pulse",
+                start=block.start,
+                end=block.end,
+                title="Scheduled block",
+                hard=True,
+                metadata={'task_id': block.task_id, 'frozen': True}
+            )
+            for block in frozen_blocks
+            if block.end > window_start and block.start < window_end
+        ]
+
+        window_index = time_index.subindex(window_start, window_end)
+        plan = IncrementalPlan(
+            time_index=window_index,
+            tasks=[task for task in tasks if task.id in resolve_ids],
+            busy_events=list(busy_events) + frozen_events,
+            frozen_blocks=frozen_blocks,
+            existing_blocks=existing,
+            replan_result=replan_result,
+            frozen_minutes=self._minutes_by_day(frozen_blocks, window_index)
+        )
+
+        logger.info(
+            f"Incremental replan: re-solving {len(plan.tasks)} of {len(tasks)} tasks "
+            f"over {len(plan.time_index)} of {len(time_index)} slots, "
+            f"{len(frozen_blocks)} blocks frozen"
+        )
+        return plan
+
+    def merge_incremental_solution(
+        self,
+        plan: IncrementalPlan,
+        solution: ScheduleSolution
+    ) -> ScheduleSolution:
+        """
+        Combine an incremental solve with the blocks it left frozen.
+
+        Args:
+            plan: Plan the solution was produced from
+            solution: Solution over the reduced problem
+
+        Returns:
+            Full-horizon solution
+        """
+        blocks = sorted(plan.frozen_blocks + solution.blocks, key=lambda b: (b.start, b.task_id))
+        diagnostics = dict(solution.diagnostics)
+        diagnostics['incremental'] = plan.get_stats()
+        return replace(solution, blocks=blocks, diagnostics=diagnostics)
+
+    def _minutes_by_day(self, blocks: List[ScheduleBlock], time_index: TimeIndex) -> Dict[date, int]:
+        """
+        Minutes of the blocks per local date of the index.
+
+        Frozen blocks anywhere on a day of the window, not only inside it,
+        count toward that day's effort cap, as they would in a full solve.
+        """
+        tz_manager = get_timezone_manager()
+        days = set(time_index.dates)
+        minutes: Dict[date, int] = {}
+        for block in blocks:
+            start = tz_manager.ensure_timezone_aware(block.start).astimezone(time_index.timezone)
+            end = tz_manager.ensure_timezone_aware(block.end).astimezone(time_index.timezone)
+            while start < end:
+                next_day = time_index.timezone.localize(
+                    datetime.combine(start.date() + timedelta(days=1), time.min)
+                )
+                part_end = min(end, next_day)
+                if start.date() in days:
+                    minutes[start.date()] = minutes.get(start.date(), 0) + int(
+                        (part_end - start).total_seconds() // 60
+                    )
+                start = part_end
+        return minutes
+
+    def _overlaps_event(self, block: ScheduleBlock, events: List[BusyEvent]) -> bool:
+        """Whether a block overlaps any of the given events."""
+        return any(block.start < event.end and event.start < block.end for event in events)
+
     def _create_scope_presets(self) -> Dict[ReplanScope, ReplanConstraint]:
         """Create default constraint presets for each scope level."""
         return {
@@ -278,8 +495,14 @@ class ReplanningController:
         }
 
     def _get_scope_constraints(self, scope: ReplanScope) -> ReplanConstraint:
-        """Get base constraints for a scope level."""
-        return self.scope_presets.get(scope, self.scope_presets[ReplanScope.MODERATE])
+        """Get base constraints for a scope level (a copy; presets are shared)."""
+        preset = self.scope_presets.get(scope, self.scope_presets[ReplanScope.MODERATE])
+        return replace(
+            preset,
+            frozen_periods=list(preset.frozen_periods),
+            protected_task_ids=set(preset.protected_task_ids),
+            protected_block_ids=set(preset.protected_block_ids)
+        )
 
     def _merge_constraints(
         self,
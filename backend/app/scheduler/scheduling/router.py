@@ -5,6 +5,7 @@ Provides REST API endpoints for scheduling operations, status monitoring,
 and configuration management.
 """
 
+import json
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
@@ -12,7 +13,7 @@ import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
 
 from ..core.service import get_scheduler_service, SchedulerService
@@ -20,8 +21,9 @@ from ..io.dto import (
     ScheduleRequest, ScheduleResponse, ScheduleJobStatus,
     TaskUpdateRequest, PreferencesUpdateRequest, FeedbackRequest,
     DiagnosticsRequest, DiagnosticsResponse, ConfigUpdateRequest,
-    SchedulerHealth
+    SchedulerHealth, BatchScheduleRequest, BatchScheduleResponse
 )
+from .batch import BatchScheduler
 from ..core.config import get_config, get_config_manager
 from ..monitoring.telemetry import get_metrics, get_tracer, get_telemetry_health, monitor_performance
 from ..adapt.rescheduler import get_reschedule_metrics
@@ -79,8 +81,9 @@ async def run_scheduling(
             context={"request": request.dict(), "user_id": request.user_id}
         )
 
-        # Start background learning update if successful
-        if response.feasible and not request.dry_run:
+        # Start background learning update if successful; a response shared
+        # with superseded requests is learned from once, by its own request
+        if response.feasible and not request.dry_run and not response.metrics.get('coalesced'):
             background_tasks.add_task(
                 _update_learning_models,
                 scheduler,
@@ -134,6 +137,62 @@ async def preview_schedule(
         raise HTTPException(status_code=500, detail="Preview generation failed")
 
 
+@scheduler_router.post("/preview/stream")
+async def stream_schedule_preview(
+    request: ScheduleRequest,
+    scheduler: SchedulerService = Depends(get_scheduler)
+) -> StreamingResponse:
+    """
+    Preview a schedule as server-sent events.
+
+    Sends a "solution" event as soon as a first schedule exists and again
+    for each improvement the solver finds, then a "final" event with the
+    finished schedule. Nothing is persisted.
+    """
+    async def events():
+        try:
+            async for update in scheduler.schedule_stream(request):
+                response = update['response']
+                if update['event'] == 'final':
+                    response = verification_middleware.verify_and_track(
+                        response,
+                        context={"preview": True, "stream": True, "user_id": request.user_id}
+                    )
+                payload = {
+                    'sequence': update['sequence'],
+                    'source': update['source'],
+                    'response': response.model_dump(mode='json')
+                }
+                yield f"event: {update['event']}\ndata: {json.dumps(payload)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming schedule preview failed: {e}", exc_info=True)
+            yield f"event: error\ndata: {json.dumps({'detail': 'Preview generation failed'})}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@scheduler_router.get("/explanations/{job_id}")
+async def get_schedule_explanation(
+    job_id: str,
+    user_id: str = Query(..., description="User the job was scheduled for"),
+    scheduler: SchedulerService = Depends(get_scheduler)
+) -> Dict[str, Any]:
+    """
+    Get the explanations, quality analysis and alternatives of a scheduled job.
+
+    Built on the first request for the job from the handle returned in the
+    schedule response's metrics, then served from the cache until it expires.
+    """
+    explanation = await scheduler.get_explanation(job_id, user_id)
+    if explanation is None:
+        raise HTTPException(status_code=404, detail="Explanation not found or expired")
+    return explanation
+
+
 @scheduler_router.post("/reschedule", response_model=ScheduleResponse)
 @monitor_performance("reschedule")
 async def reschedule_missed_tasks(
@@ -163,6 +222,55 @@ async def reschedule_missed_tasks(
         raise HTTPException(status_code=500, detail="Rescheduling failed")
 
 
+@scheduler_router.post("/batch", response_model=BatchScheduleResponse)
+@monitor_performance("schedule_batch")
+async def run_batch_scheduling(
+    request: BatchScheduleRequest,
+    scheduler: SchedulerService = Depends(get_scheduler)
+) -> BatchScheduleResponse:
+    """
+    Schedule many users in one run.
+    
+    Inputs are bulk-loaded for the whole batch and solves are spread over
+    the solver pool in deadline order.
+    """
+    config = get_config()
+    if not config.batch.enabled:
+        raise HTTPException(status_code=503, detail="Batch scheduling is disabled")
+    if request.horizon_days > config.max_horizon_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"horizon_days cannot exceed {config.max_horizon_days}"
+        )
+
+    try:
+        user_requests = [
+            ScheduleRequest(
+                user_id=user_id,
+                horizon_days=request.horizon_days,
+                dry_run=request.dry_run,
+                options=dict(request.options)
+            )
+            for user_id in request.user_ids
+        ]
+
+        result = await BatchScheduler(service=scheduler).schedule_batch(
+            user_requests, deadline=request.deadline
+        )
+
+        return BatchScheduleResponse(
+            feasible={user_id: response.feasible for user_id, response in result.responses.items()},
+            failed=result.failed,
+            timed_out=result.timed_out,
+            skipped=result.skipped,
+            metrics=result.get_metrics()
+        )
+
+    except Exception as e:
+        logger.error(f"Batch scheduling failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Batch scheduling failed")
+
+
 @scheduler_router.post("/feedback")
 @monitor_performance("feedback_processing")
 async def submit_feedback(
@@ -0,0 +1,54 @@
+"""
+Anytime scheduling support.
+
+CP-SAT finds a feasible schedule long before it proves the best one. A
+SolutionStream carries the solutions of one request, the greedy schedule
+first and then every improvement reported by the solver callback, from
+whichever thread produces them to the async consumer that streams them to
+the client.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from ..core.domain import ScheduleSolution
+
+
+class SolutionStream:
+    """Thread-safe hand-off of intermediate solutions to the event loop."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+
+        # Set once utilities and weights are known, for building responses
+        self.weights: Dict[str, float] = {}
+        self.penalty_context: Dict[str, Any] = {}
+        self.published = 0
+
+    def publish(self, solution: ScheduleSolution, source: str = "cp_sat"):
+        """Queue a solution; callable from any thread."""
+        if not self._closed:
+            self._loop.call_soon_threadsafe(self._put, (source, solution))
+
+    def close(self):
+        """End the stream once the solve has finished."""
+        self._loop.call_soon_threadsafe(self._put, None)
+
+    def _put(self, item: Optional[Tuple[str, ScheduleSolution]]):
+        if self._closed:
+            return
+        if item is None:
+            self._closed = True
+        else:
+            self.published += 1
+        self._queue.put_nowait(item)
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, ScheduleSolution]]:
+        """Yield (source, solution) pairs until the stream is closed."""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            yield item
@@ -116,6 +116,9 @@ class AlternativeSolution:
     better_at: List[str] = field(default_factory=list)  # Areas where this is better
     worse_at: List[str] = field(default_factory=list)   # Areas where this is worse
 
+    # Task fields the strategy changed -> ids of the tasks it changed them for
+    relaxations: Dict[str, List[str]] = field(default_factory=dict)
+
 
 @dataclass
 class ScheduleExplanations:
@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional
 
 from ..core.domain import BusyEvent, Preferences, ScheduleSolution, Task
 from ..io.dto import ScheduleRequest, ScheduleResponse
-from ..service import SchedulerService
+from ..core.service import SchedulerService
 from .invariants import check_invariants
 
 logger = logging.getLogger(__name__)
@@ -13,9 +13,13 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
+import pytz
+
 from ..core.domain import BusyEvent, Task
 from ..io.dto import ScheduleRequest, ScheduleResponse
-from ..service import SchedulerService
+from ..core.service import SchedulerService
+from ..optimization.solver import SchedulerSolver
+from ..optimization.time_index import TimeIndex
 from .fixtures import (
     create_test_preferences,
     create_test_task,
@@ -73,6 +77,20 @@ class StabilityTestResult:
     stability_score: float  # Overall stability metric (0-1)
 
 
+@dataclass
+class EncodingBenchmarkResult:
+    """Model size and solve time for one context-switch encoding."""
+    encoding: str
+    n_tasks: int
+    n_slots: int
+    n_variables: int
+    n_constraints: int
+    build_time_ms: int
+    solve_time_ms: int
+    feasible: bool
+    objective_value: float
+
+
 class PerformanceBenchmark:
     """
     Performance benchmarking for scheduler algorithms.
@@ -532,6 +550,147 @@ class StabilityTester:
         return hash("|".join(signature_parts))
 
 
+class ContextSwitchEncodingBenchmark:
+    """
+    Compares solver model size and solve time across context-switch encodings.
+
+    Builds the same slot-formulation problem with the legacy pairwise
+    encoding (one variable per slot x task x task) and the linear per-slot
+    encoding, then reports variable counts, build and solve times.
+    """
+
+    def __init__(
+        self,
+        time_limit_seconds: int = 10,
+        num_search_workers: int = 4,
+        seed: int = 42
+    ):
+        """
+        Initialize encoding benchmark.
+
+        Args:
+            time_limit_seconds: Solver time limit per run
+            num_search_workers: Parallel CP-SAT workers per run
+            seed: Seed for generated task durations and utilities
+        """
+        self.time_limit_seconds = time_limit_seconds
+        self.num_search_workers = num_search_workers
+        self.seed = seed
+
+    def run(
+        self,
+        n_tasks_list: List[int],
+        horizon_days: int = 7,
+        granularity_minutes: int = 30,
+        encodings: tuple = ("pairwise", "linear"),
+        solve: bool = True
+    ) -> List[EncodingBenchmarkResult]:
+        """
+        Benchmark each encoding for every task count.
+
+        Args:
+            n_tasks_list: Task counts to benchmark
+            horizon_days: Scheduling horizon length
+            granularity_minutes: Slot size
+            encodings: Encodings to compare
+            solve: Whether to solve the model or only build it
+
+        Returns:
+            One result per (task count, encoding)
+        """
+        results = []
+
+        for n_tasks in n_tasks_list:
+            tasks, prefs, time_index, learned = self._generate_problem(
+                n_tasks, horizon_days, granularity_minutes
+            )
+
+            for encoding in encodings:
+                solver = SchedulerSolver(
+                    time_limit_seconds=self.time_limit_seconds,
+                    num_search_workers=self.num_search_workers,
+                    random_seed=self.seed,
+                    context_switch_encoding=encoding
+                )
+
+                build_start = time.time()
+                model = solver.build(tasks, [], prefs, time_index, learned)
+                build_time_ms = int((time.time() - build_start) * 1000)
+
+                proto = model.Proto()
+                feasible, objective_value, solve_time_ms = False, 0.0, 0
+                if solve:
+                    solution = solver.solve(model)
+                    feasible = solution.feasible
+                    objective_value = solution.objective_value
+                    solve_time_ms = solution.solve_time_ms
+
+                result = EncodingBenchmarkResult(
+                    encoding=encoding,
+                    n_tasks=n_tasks,
+                    n_slots=len(time_index),
+                    n_variables=len(proto.variables),
+                    n_constraints=len(proto.constraints),
+                    build_time_ms=build_time_ms,
+                    solve_time_ms=solve_time_ms,
+                    feasible=feasible,
+                    objective_value=objective_value
+                )
+                results.append(result)
+
+                logger.info(
+                    f"Encoding {encoding}: {n_tasks} tasks x {result.n_slots} slots, "
+                    f"{result.n_variables} vars, build={build_time_ms}ms, solve={solve_time_ms}ms"
+                )
+
+        return results
+
+    def format_report(self, results: List[EncodingBenchmarkResult]) -> str:
+        """Render results as a fixed-width table."""
+        lines = [
+            f"{'encoding':<10} {'tasks':>6} {'slots':>6} {'variables':>10} "
+            f"{'constraints':>12} {'build_ms':>9} {'solve_ms':>9} {'objective':>10}"
+        ]
+        for r in results:
+            lines.append(
+                f"{r.encoding:<10} {r.n_tasks:>6} {r.n_slots:>6} {r.n_variables:>10} "
+                f"{r.n_constraints:>12} {r.build_time_ms:>9} {r.solve_time_ms:>9} "
+                f"{r.objective_value:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def _generate_problem(
+        self,
+        n_tasks: int,
+        horizon_days: int,
+        granularity_minutes: int
+    ) -> tuple:
+        """Generate a reproducible scheduling problem."""
+        rng = random.Random(self.seed)
+
+        start = pytz.UTC.localize(datetime(2025, 1, 6, 8, 0))
+        time_index = TimeIndex("UTC", start, start + timedelta(days=horizon_days), granularity_minutes)
+        prefs = create_test_preferences(granularity_minutes=granularity_minutes)
+
+        tasks = []
+        for i in range(n_tasks):
+            tasks.append(create_test_task(
+                task_id=f"bench_{i}",
+                duration_minutes=rng.choice([30, 60, 90]),
+                min_block_minutes=granularity_minutes
+            ))
+
+        learned = {
+            'util': {
+                task.id: {s_idx: rng.random() for s_idx in range(len(time_index))}
+                for task in tasks
+            },
+            'weights': {}
+        }
+
+        return tasks, prefs, time_index, learned
+
+
 # Predefined benchmark scenarios
 def create_benchmark_scenarios() -> Dict[str, Callable[[int], List[Task]]]:
     """Create predefined benchmark scenarios for common patterns."""
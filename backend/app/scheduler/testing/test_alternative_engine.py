@@ -0,0 +1,132 @@
+"""
+Tests for parallel what-if alternatives.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytz
+
+from app.scheduler.core.domain import Preferences, ScheduleBlock, ScheduleSolution
+from app.scheduler.core.utility_matrix import UtilityMatrix
+from app.scheduler.explanation.alternative_engine import ParallelAlternativeEngine
+from app.scheduler.explanation.alternative_generator import AlternativeParameters, AlternativeStrategy
+from app.scheduler.io.dto import ScheduleRequest
+from app.scheduler.optimization.solver_pool import SolveProblem, solve_problem
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.testing.fixtures import create_test_task
+
+
+def make_inputs(n_tasks=3):
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    time_index = TimeIndex("UTC", start, start + timedelta(days=1), 30)
+    tasks = [
+        create_test_task(f"task_{i}", duration_minutes=90, min_block_minutes=30, max_block_minutes=120)
+        for i in range(n_tasks)
+    ]
+    values = np.array([
+        [1.0 + (s * (i + 1)) % 7 for s in range(len(time_index))] for i in range(n_tasks)
+    ])
+    util = UtilityMatrix([task.id for task in tasks], values)
+    prefs = Preferences(timezone="UTC")
+    weights = {'context_switch': 2.0, 'fragmentation': 1.2}
+    context = {'time_index': time_index, 'utilities': util}
+    options = {'time_limit_seconds': 2, 'num_search_workers': 2}
+    return tasks, prefs, time_index, util, weights, context, options
+
+
+class TestParallelAlternativeEngine:
+    """Alternatives are real, concurrent solves of modified problems."""
+
+    async def test_alternatives_are_solved_and_ranked(self):
+        tasks, prefs, time_index, util, weights, context, options = make_inputs()
+        main = solve_problem(SolveProblem.from_time_index(
+            tasks, [], prefs, time_index, {'util': util, 'weights': weights},
+            solver_options=options
+        ))
+        assert main.feasible
+
+        engine = ParallelAlternativeEngine(time_budget_seconds=2.0)
+        started = time.perf_counter()
+        alternatives = await engine.generate_alternatives(
+            main, ScheduleRequest(user_id="u1"), tasks, [], prefs, weights, context,
+            options, max_alternatives=3
+        )
+        elapsed = time.perf_counter() - started
+
+        assert len(alternatives) == 3
+        # Solved side by side: well under three sequential budgets
+        assert elapsed < 4.5
+        scores = [alt.quality_metrics.quality_score for alt in alternatives]
+        assert scores == sorted(scores, reverse=True)
+
+        shorter = next(alt for alt in alternatives if alt.solution_id == "alt_shorter_blocks")
+        assert shorter.blocks
+        assert all(block.duration_minutes <= 30 for block in shorter.blocks)
+        assert {block.task_id for block in shorter.blocks} == {task.id for task in tasks}
+
+    def test_derived_problem_is_warm_started_copy(self):
+        tasks, prefs, time_index, util, weights, context, options = make_inputs(n_tasks=2)
+        main = solve_problem(SolveProblem.from_time_index(
+            tasks, [], prefs, time_index, {'util': util, 'weights': weights}, solver_options=options
+        ))
+        engine = ParallelAlternativeEngine()
+
+        parameters = engine.generator._get_strategy_parameters(AlternativeStrategy.LONGER_BLOCKS, main)
+        alt_tasks, problem = engine.derive_problem(
+            parameters, tasks, [], prefs, time_index, util, weights, options, main
+        )
+        assert all(task.min_block_minutes == 60 for task in alt_tasks)
+        assert all(task.min_block_minutes == 30 for task in tasks)
+        assert problem.hints['kept'] == len(main.blocks)
+
+        parameters = engine.generator._get_strategy_parameters(AlternativeStrategy.MINIMAL_FRAGMENTATION, main)
+        _, problem = engine.derive_problem(
+            parameters, tasks, [], prefs, time_index, util, weights, options, main
+        )
+        assert problem.learned['weights']['fragmentation'] == weights['fragmentation'] * 2
+        # Each alternative is pickled to the pool; the penalty context stays behind
+        assert set(problem.learned) == {'util', 'weights', 'coarsening'}
+
+        # The time grid never excludes weekends, so there is nothing to solve
+        assert engine.derive_problem(
+            AlternativeParameters(strategy=AlternativeStrategy.WEEKEND_INCLUDED),
+            tasks, [], prefs, time_index, util, weights, options, main
+        ) is None
+
+    def test_alternatives_are_scored_against_the_original_tasks(self):
+        tasks, prefs, time_index, util, weights, context, options = make_inputs(n_tasks=2)
+        main = solve_problem(SolveProblem.from_time_index(
+            tasks, [], prefs, time_index, {'util': util, 'weights': weights}, solver_options=options
+        ))
+        engine = ParallelAlternativeEngine()
+        request = ScheduleRequest(user_id="u1")
+        main_quality = engine.generator._calculate_alternative_quality(
+            main.blocks, request, AlternativeParameters(strategy=None), tasks=tasks
+        )
+
+        parameters = engine.generator._get_strategy_parameters(AlternativeStrategy.FLEXIBLE_DURATION, main)
+        alt_tasks, _ = engine.derive_problem(
+            parameters, tasks, [], prefs, time_index, util, weights, options, main
+        )
+        # A schedule that completes the shortened tasks
+        start = time_index.start_dt + timedelta(hours=1)
+        solution = ScheduleSolution(feasible=True, blocks=[
+            ScheduleBlock(
+                task.id, start + timedelta(hours=2 * i),
+                start + timedelta(hours=2 * i, minutes=task.estimated_minutes)
+            )
+            for i, task in enumerate(alt_tasks)
+        ])
+        alternative = engine._describe(
+            SimpleNamespace(blocks=main.blocks, quality_metrics=main_quality),
+            parameters, solution, request, tasks, alt_tasks
+        )
+
+        # The shortened tasks are complete, the real ones are not
+        assert main_quality.tasks_scheduled_ratio == 1.0
+        assert alternative.quality_metrics.tasks_scheduled_ratio == 0.0
+        assert alternative.quality_metrics.quality_score < main_quality.quality_score
+        assert alternative.relaxations == {'estimated_minutes': ["task_0", "task_1"]}
@@ -0,0 +1,55 @@
+"""
+Tests for batched completion inference.
+"""
+
+import asyncio
+import numpy as np
+
+from app.scheduler.learning.batch_inference import (
+    CompletionInferenceBatcher, predict_completion_many
+)
+from app.scheduler.learning.completion_model import CompletionModel
+from app.scheduler.learning.model_store import ModelStore
+
+
+async def fitted_model(seed, n_features=8):
+    rng = np.random.RandomState(seed)
+    X = rng.normal(loc=seed, size=(60, n_features))
+    y = (X[:, 0] + rng.normal(size=60) > seed).astype(int)
+    model = CompletionModel(store=ModelStore(backend="memory"), random_state=seed)
+    await model.fit_batch(X, y)
+    return model
+
+
+def features(seed, n_rows, n_features=8, dtype=np.float64):
+    return np.random.RandomState(100 + seed).normal(size=(n_rows, n_features)).astype(dtype)
+
+
+class TestBatchInference:
+    """Batched results must match CompletionModel.predict exactly."""
+
+    async def test_bit_identical_to_predict(self):
+        models = [await fitted_model(seed) for seed in range(5)]
+        models.append(CompletionModel(store=ModelStore(backend="memory")))  # unfitted
+        blocks = [
+            features(0, 240), features(1, 240), features(2, 96),
+            features(3, 240, dtype=np.float32), features(4, 240, n_features=5), features(5, 240)
+        ]
+
+        batched = await predict_completion_many(models, blocks)
+
+        for model, X, probs in zip(models, blocks, batched):
+            np.testing.assert_array_equal(probs, await model.predict(X))
+
+    async def test_batcher_coalesces_concurrent_requests(self):
+        models = [await fitted_model(seed) for seed in range(4)]
+        batcher = CompletionInferenceBatcher()
+
+        results = await asyncio.gather(*(
+            batcher.predict(model, features(i, 48)) for i, model in enumerate(models)
+        ))
+
+        assert batcher.batches == 1
+        assert batcher.requests == 4
+        for i, (model, probs) in enumerate(zip(models, results)):
+            np.testing.assert_array_equal(probs, await model.predict(features(i, 48)))
@@ -0,0 +1,159 @@
+"""
+Tests for batched multi-user scheduling.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytz
+
+from app.scheduler.core.config import BatchConfig
+from app.scheduler.core.domain import Preferences
+from app.scheduler.io.dto import ScheduleRequest, ScheduleResponse
+from app.scheduler.io.repositories import task_repository
+from app.scheduler.io.repositories.base_repository import fetch_all_rows
+from app.scheduler.io.repositories.task_repository import TaskRepository
+from app.scheduler.scheduling.batch import BatchScheduler
+
+
+class FakeRepository:
+    """Bulk loaders that record how often they are called."""
+
+    def __init__(self, unloaded=()):
+        self.calls = []
+        self.unloaded = set(unloaded)
+
+    async def load_tasks_many(self, user_ids, horizon_days):
+        self.calls.append('tasks')
+        return {user_id: [f"task_{user_id}"] for user_id in user_ids}
+
+    async def load_calendar_busy_many(self, user_ids, horizon_days):
+        self.calls.append('events')
+        # Users whose batch failed are left out of the result
+        return {user_id: [] for user_id in user_ids if user_id not in self.unloaded}
+
+    async def load_preferences_many(self, user_ids):
+        self.calls.append('prefs')
+        return {user_id: Preferences(timezone="UTC") for user_id in user_ids}
+
+    async def load_history_many(self, user_ids, horizon_days=60):
+        self.calls.append('history')
+        return {user_id: [] for user_id in user_ids}
+
+
+class FakeService:
+    """Scheduler service stand-in that records the order users are scheduled in."""
+
+    def __init__(self, delays=None, unloaded=()):
+        self.repo = FakeRepository(unloaded)
+        self.solver_pool = None
+        self.delays = delays or {}
+        self.started = []
+
+    async def schedule(self, request, enhanced_observability=True, inputs=None):
+        self.started.append((request.user_id, inputs))
+        await asyncio.sleep(self.delays.get(request.user_id, 0))
+        return ScheduleResponse(feasible=True, blocks=[], metrics={}, explanations={})
+
+
+def make_request(user_id, deadline=None):
+    options = {'deadline': deadline.isoformat()} if deadline else {}
+    return ScheduleRequest(user_id=user_id, options=options)
+
+
+class TestBatchScheduler:
+    """Bulk loading, deadline ordering and per-user budgets."""
+
+    async def test_bulk_loads_once_and_runs_earliest_deadline_first(self):
+        service = FakeService()
+        batch = BatchScheduler(service=service, config=BatchConfig(max_concurrency=1))
+        now = datetime.now(pytz.UTC)
+
+        result = await batch.schedule_batch([
+            make_request("late", now + timedelta(hours=2)),
+            make_request("no_deadline"),
+            make_request("early", now + timedelta(hours=1)),
+        ])
+
+        assert sorted(service.repo.calls) == ['events', 'history', 'prefs', 'tasks']
+        assert [user_id for user_id, _ in service.started] == ["early", "late", "no_deadline"]
+        assert service.started[0][1][0] == ["task_early"]
+
+        metrics = result.get_metrics()
+        assert metrics['users'] == 3
+        assert metrics['succeeded'] == 3
+        assert metrics['users_per_second'] > 0
+
+    async def test_timeouts_and_missed_deadlines(self):
+        service = FakeService(delays={"slow": 1.0})
+        batch = BatchScheduler(
+            service=service, config=BatchConfig(max_concurrency=2, per_user_timeout_seconds=0.1)
+        )
+        now = datetime.now(pytz.UTC)
+
+        result = await batch.schedule_batch([
+            make_request("slow"),
+            make_request("missed", now - timedelta(minutes=1)),
+            make_request("fast"),
+        ])
+
+        assert result.timed_out == ["slow"]
+        assert result.skipped == ["missed"]
+        assert list(result.responses) == ["fast"]
+
+
+    async def test_users_whose_inputs_failed_to_load_are_failed(self):
+        service = FakeService(unloaded={"broken"})
+        batch = BatchScheduler(service=service, config=BatchConfig(max_concurrency=2))
+
+        result = await batch.schedule_batch([make_request("broken"), make_request("ok")])
+
+        assert [user_id for user_id, _ in service.started] == ["ok"]
+        assert result.failed == ["broken"]
+        assert result.responses["broken"].metrics['error_type'] == "InputLoadError"
+        assert result.get_metrics()['succeeded'] == 1
+
+
+class TestBulkLoaders:
+    """Bulk loaders query in batches and leave out users whose batch failed."""
+
+    async def test_tasks_are_loaded_per_batch(self, monkeypatch):
+        monkeypatch.setattr(task_repository, "DB_BATCH_SIZE", 2)
+        repo = TaskRepository(SimpleNamespace(backend_type="database"))
+        batches = []
+
+        async def fetch_pending_rows(user_ids, end_date):
+            batches.append(list(user_ids))
+            if "u3" in user_ids:
+                raise ConnectionError("request too large")
+            return []
+
+        monkeypatch.setattr(repo, "_fetch_pending_rows", fetch_pending_rows)
+
+        tasks = await repo.load_tasks_many(["u1", "u2", "u3", "u4", "u5"], horizon_days=7)
+
+        assert batches == [["u1", "u2"], ["u3", "u4"], ["u5"]]
+        assert tasks == {"u1": [], "u2": [], "u5": []}
+
+    async def test_rows_are_read_past_the_response_cap(self):
+        rows = [{"id": f"t{i:04d}"} for i in range(2500)]
+        pages = []
+
+        class CappedQuery:
+            """PostgREST select that truncates responses at 1000 rows."""
+
+            def order(self, column):
+                return self
+
+            def range(self, start, end):
+                self.bounds = (start, end)
+                return self
+
+            async def execute(self):
+                pages.append(self.bounds)
+                start, end = self.bounds
+                return SimpleNamespace(data=rows[start:min(end + 1, start + 1000)])
+
+        assert await fetch_all_rows(CappedQuery) == rows
+        assert pages == [(0, 999), (1000, 1999), (2000, 2999)]
@@ -0,0 +1,97 @@
+"""
+Tests for per-user request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from app.scheduler.core.scheduler_service.scheduler_service import _coalescing_key
+from app.scheduler.io.dto import ScheduleRequest
+from app.scheduler.scheduling.coalescer import RequestCoalescer
+
+
+class Solver:
+    """Records which requests were actually run."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.ran = []
+
+    def request(self, name):
+        async def run():
+            self.ran.append(name)
+            await asyncio.sleep(self.delay)
+            return {'name': name}
+        return run
+
+
+class TestRequestCoalescer:
+    """Latest request wins; everyone gets its result."""
+
+    async def test_burst_runs_first_and_newest(self):
+        coalescer = RequestCoalescer(share=lambda result: {**result, 'coalesced': True})
+        solver = Solver()
+
+        first = asyncio.ensure_future(coalescer.submit("u1", solver.request("r1")))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.ensure_future(coalescer.submit("u1", solver.request(f"r{i}")))
+            for i in range(2, 6)
+        ]
+        results = await asyncio.gather(first, *rest)
+
+        # r1 was in flight; r2..r4 were superseded by r5 before it started
+        assert solver.ran == ["r1", "r5"]
+        assert [r['name'] for r in results] == ["r5"] * 5
+        assert not results[-1].get('coalesced')
+        assert all(r['coalesced'] for r in results[:-1])
+
+        stats = coalescer.get_stats()
+        assert stats['requests'] == 5 and stats['executions'] == 2 and stats['superseded'] == 3
+        assert stats['coalescing_ratio'] == pytest.approx(0.6)
+        assert stats['active_keys'] == 0
+
+    async def test_users_are_independent(self):
+        coalescer = RequestCoalescer()
+        solver = Solver()
+
+        results = await asyncio.gather(*(
+            coalescer.submit(user, solver.request(user)) for user in ("u1", "u2", "u3")
+        ))
+        assert sorted(solver.ran) == ["u1", "u2", "u3"]
+        assert [r['name'] for r in results] == ["u1", "u2", "u3"]
+
+    async def test_error_reaches_every_waiter(self):
+        coalescer = RequestCoalescer()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("solve failed")
+
+        first = asyncio.ensure_future(coalescer.submit("u1", Solver().request("r1")))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(coalescer.submit("u1", fail))
+
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        # The key is free again afterwards
+        assert (await coalescer.submit("u1", Solver(0).request("r3")))['name'] == "r3"
+
+
+class TestCoalescingKey:
+    """Only requests with the same effective parameters share a solve."""
+
+    def test_job_id_is_ignored_but_parameters_are_not(self):
+        base = _coalescing_key(ScheduleRequest(user_id="u1", job_id="a"), True)
+
+        assert _coalescing_key(ScheduleRequest(user_id="u1", job_id="b"), True) == base
+        assert _coalescing_key(ScheduleRequest(user_id="u1"), False) != base
+        for params in (
+            {'horizon_days': 3},
+            {'lock_existing': False},
+            {'replan_scope': 'aggressive'},
+            {'options': {'incremental': True}},
+        ):
+            assert _coalescing_key(ScheduleRequest(user_id="u1", job_id="a", **params), True) != base
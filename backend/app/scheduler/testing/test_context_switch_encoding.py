@@ -0,0 +1,33 @@
+"""
+Tests for the linear context-switch encoding in the slot formulation.
+"""
+
+import pytest
+
+from app.scheduler.testing.performance import ContextSwitchEncodingBenchmark
+
+
+class TestContextSwitchEncoding:
+    """Linear encoding matches the pairwise one at a fraction of the size."""
+
+    @pytest.fixture
+    def benchmark(self):
+        return ContextSwitchEncodingBenchmark(time_limit_seconds=30, num_search_workers=8)
+
+    def test_same_optimum_on_small_problem(self, benchmark):
+        results = benchmark.run([3], horizon_days=1, granularity_minutes=30)
+        by_encoding = {r.encoding: r for r in results}
+
+        assert by_encoding["linear"].feasible and by_encoding["pairwise"].feasible
+        assert by_encoding["linear"].objective_value == pytest.approx(
+            by_encoding["pairwise"].objective_value
+        )
+
+    def test_variable_count_is_linear_in_tasks(self, benchmark):
+        results = benchmark.run([4, 8], horizon_days=1, solve=False)
+        linear = {r.n_tasks: r.n_variables for r in results if r.encoding == "linear"}
+        pairwise = {r.n_tasks: r.n_variables for r in results if r.encoding == "pairwise"}
+
+        assert linear[8] < pairwise[8]
+        # Doubling tasks roughly doubles the linear model, the pairwise one grows quadratically
+        assert linear[8] / linear[4] < pairwise[8] / pairwise[4]
@@ -0,0 +1,90 @@
+"""
+Tests for load-shedding in the solver model builder.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.domain import Preferences
+from app.scheduler.optimization.degradation import DegradationProfile
+from app.scheduler.optimization.solver import SchedulerSolver
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.testing.fixtures import create_test_task
+
+RED_COARSENING = {
+    'disable_soft_constraints': True,
+    'disable_preference_optimization': True,
+    'disable_completion_prediction': True,
+}
+
+
+@pytest.fixture
+def problem():
+    """Three tasks over one day, including late-night slots."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    time_index = TimeIndex("UTC", start, start + timedelta(hours=16), 30)
+    tasks = [create_test_task(f"task_{i}", duration_minutes=60) for i in range(3)]
+    util = {task.id: {s: 1.0 for s in range(len(time_index))} for task in tasks}
+    return tasks, [], Preferences(timezone="UTC"), time_index, util
+
+
+class TestDegradationProfile:
+    """Coarsening flags map to disabled model components."""
+
+    def test_from_coarsening(self):
+        assert not DegradationProfile.from_coarsening({}).degraded
+
+        profile = DegradationProfile.from_coarsening(RED_COARSENING)
+        assert profile.disabled_components == [
+            'soft_constraints', 'preferences', 'completion_prediction'
+        ]
+
+
+class TestDegradedModels:
+    """Each flag makes the built model smaller and is reported."""
+
+    @pytest.mark.parametrize("formulation", ["slot", "interval"])
+    def test_red_coarsening_shrinks_model(self, problem, formulation):
+        tasks, events, prefs, time_index, util = problem
+
+        def build(coarsening):
+            solver = SchedulerSolver(time_limit_seconds=2, formulation=formulation)
+            learned = {'util': util, 'weights': {}, 'coarsening': coarsening}
+            model = solver.build(tasks, events, prefs, time_index, learned)
+            return solver, model
+
+        full_solver, _ = build({})
+        red_solver, red_model = build(RED_COARSENING)
+        full_size = full_solver.variables['model_size']
+        red_size = red_solver.variables['model_size']
+
+        assert red_size['n_objective_terms'] < full_size['n_objective_terms']
+        if formulation == "slot":
+            assert red_size['n_variables'] < full_size['n_variables']
+            assert red_size['n_constraints'] < full_size['n_constraints']
+
+        solution = red_solver.solve(red_model)
+        assert solution.feasible
+        assert solution.diagnostics['model_size'] == red_size
+        assert 'soft_constraints' in solution.diagnostics['degraded_components']
+
+    def test_soft_and_preference_flags_are_independent(self, problem):
+        tasks, events, prefs, time_index, util = problem
+        sizes, objectives = {}, {}
+        for name, coarsening in [
+            ('full', {}),
+            ('no_soft', {'disable_soft_constraints': True}),
+            ('no_prefs', {'disable_preference_optimization': True}),
+        ]:
+            solver = SchedulerSolver(time_limit_seconds=2)
+            model = solver.build(tasks, events, prefs, time_index, {'util': util, 'coarsening': coarsening})
+            sizes[name] = solver.variables['model_size']
+            objectives[name] = sorted(model.Proto().objective.coeffs)
+
+        # Soft constraints own auxiliary variables; preferences only reweight slot variables
+        assert sizes['no_soft']['n_variables'] < sizes['full']['n_variables']
+        assert sizes['no_prefs']['n_variables'] == sizes['full']['n_variables']
+        assert objectives['no_prefs'] != objectives['full']
+        assert objectives['no_soft'] != objectives['full']
@@ -0,0 +1,131 @@
+"""
+Tests for lazily built schedule explanations.
+"""
+
+import asyncio
+
+from app.scheduler.scheduling.explanations import ExplanationStore
+
+
+class Builder:
+    """Counts explanation builds."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("analysis failed")
+        return {'summary': 'ok'}
+
+
+class TestExplanationStore:
+    """Explanations are built once, on demand, for their owner."""
+
+    async def test_built_once_on_first_fetch(self):
+        store = ExplanationStore()
+        build = Builder()
+        store.register("job1", "u1", build)
+
+        await asyncio.sleep(0.02)
+        assert build.calls == 0
+        assert store.status("job1", "u1") == "pending"
+
+        results = await asyncio.gather(*(store.get("job1", "u1") for _ in range(3)))
+        assert build.calls == 1
+        assert all(r == {'job_id': 'job1', 'status': 'ready', 'explanation': {'summary': 'ok'}} for r in results)
+
+        assert (await store.get("job1", "u1"))['status'] == "ready"
+        assert build.calls == 1
+        assert store.get_stats()['computed'] == 1
+
+    async def test_precompute_failure_and_ownership(self):
+        store = ExplanationStore()
+        build = Builder(fail=True)
+        store.register("job1", "u1", build, precompute=True)
+
+        await asyncio.sleep(0.05)
+        assert build.calls == 1
+        assert await store.get("job1", "u2") is None
+        assert await store.get("job1", "u1") == {
+            'job_id': 'job1', 'status': 'failed', 'error': 'analysis failed'
+        }
+        assert build.calls == 1
+
+    async def test_expiry_and_eviction(self):
+        store = ExplanationStore(max_entries=2, ttl_seconds=0.05)
+        for job in ("a", "b", "c"):
+            store.register(job, "u1", Builder())
+
+        assert await store.get("a", "u1") is None
+        assert store.get_stats()['evictions'] == 1
+        assert (await store.get("c", "u1"))['status'] == "ready"
+
+        await asyncio.sleep(0.06)
+        assert await store.get("c", "u1") is None
+
+    async def test_handles_from_other_workers_are_dropped(self):
+        solving_worker, other_worker = ExplanationStore(), ExplanationStore()
+        solving_worker.register("job1", "u1", Builder())
+        handle = {'job_id': 'job1', 'path': "/schedule/explanations/job1"}
+
+        # The same cached response served on both workers
+        kept, dropped = {'explanation_handle': dict(handle)}, {'explanation_handle': dict(handle)}
+        assert not solving_worker.drop_unknown_handle(kept, "u1")
+        assert other_worker.drop_unknown_handle(dropped, "u1")
+
+        assert kept == {'explanation_handle': handle}
+        assert dropped == {}
+        assert not other_worker.drop_unknown_handle({}, "u1")
+
+
+class FakeRedis:
+    """The Redis commands the explanation store uses, over a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode()
+        return True
+
+
+class TestSharedExplanations:
+    """With Redis, any worker serves a job's explanation."""
+
+    async def test_other_worker_serves_the_published_explanation(self):
+        redis = FakeRedis()
+        solving_worker = ExplanationStore(redis_client=redis)
+        other_worker = ExplanationStore(redis_client=redis, wait_seconds=1.0)
+        build = Builder()
+        solving_worker.register("job1", "u1", build)
+        # The schedule response goes out
+        await asyncio.sleep(0)
+
+        # Fetched while the solving worker is still building
+        result = await other_worker.get("job1", "u1")
+
+        assert result == {'job_id': 'job1', 'status': 'ready', 'explanation': {'summary': 'ok'}}
+        assert build.calls == 1
+        # The solving worker no longer holds the inputs
+        assert solving_worker.get_stats()['size'] == 0
+        assert await solving_worker.get("job1", "u1") == result
+        assert await other_worker.get("job1", "u2") is None
+        assert await other_worker.get("job2", "u1") is None
+
+    async def test_slow_build_reports_computing(self):
+        redis = FakeRedis()
+        solving_worker = ExplanationStore(redis_client=redis)
+        other_worker = ExplanationStore(redis_client=redis, wait_seconds=0.0)
+        solving_worker.register("job1", "u1", Builder())
+        await asyncio.sleep(0)
+
+        assert await other_worker.get("job1", "u1") == {'job_id': 'job1', 'status': 'computing'}
+        assert not other_worker.drop_unknown_handle({'explanation_handle': {'job_id': 'job1'}}, "u1")
+        await asyncio.sleep(0.02)
@@ -0,0 +1,119 @@
+"""
+Tests for the asyncpg read fast path behind the scheduler repositories.
+"""
+
+import sys
+import types
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.config.core.settings import get_settings
+from app.database import fast_reads
+from app.scheduler.io.repositories.event_repository import EventRepository
+from app.scheduler.io.repositories.history_repository import HistoryRepository
+from app.scheduler.io.repositories.task_repository import TaskRepository
+
+POOL_MODULE = "app.agents.infrastructure.performance.connection_pooling"
+
+
+class FakePool:
+    """Records statements and answers them like asyncpg would (typed values)."""
+
+    def __init__(self, rows=None, fail=False):
+        self.rows = rows or {}
+        self.fail = fail
+        self.statements = []
+
+    async def execute_query(self, query, *args):
+        self.statements.append((query, args))
+        if self.fail:
+            raise ConnectionError("pool down")
+        table = query.split("FROM")[1].split()[0]
+        return self.rows.get(table, [])
+
+
+def install_pool(monkeypatch, pool):
+    async def get_connection_pool():
+        return pool
+
+    module = types.ModuleType(POOL_MODULE)
+    module.get_connection_pool = get_connection_pool
+    monkeypatch.setitem(sys.modules, POOL_MODULE, module)
+    monkeypatch.setattr(get_settings(), "DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setattr(fast_reads, "_fast_reads", None)
+
+
+class TestFastReads:
+    """Hot reads use the pool and keep the REST path as a fallback."""
+
+    async def test_disabled_without_database_url(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "DATABASE_URL", None)
+        backend = fast_reads.FastReadBackend()
+        assert await backend.fetch_pending_tasks(["u1"], datetime.utcnow()) is None
+
+    async def test_repositories_decode_typed_rows(self, monkeypatch):
+        user_id = uuid.uuid4()
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 5, 10, tzinfo=timezone.utc)
+        pool = FakePool({
+            "calendar_events": [{
+                "id": uuid.uuid4(), "user_id": user_id, "title": "Standup",
+                "start_time": start, "end_time": end, "provider": "google"
+            }],
+            "tasks": [],
+            "task_completions": [{
+                "task_id": uuid.uuid4(), "user_id": user_id, "completed_at": end,
+                "actual_minutes": 45
+            }],
+        })
+        install_pool(monkeypatch, pool)
+        storage = SimpleNamespace(backend_type="database")
+
+        events = await EventRepository(storage).load_calendar_busy_many([str(user_id)], 7)
+        (event,) = events[str(user_id)]
+        assert event.start == start and event.end == end
+        assert isinstance(event.id, str)
+
+        history = await HistoryRepository(storage).load_history_many([str(user_id)], 30)
+        assert history[str(user_id)][0].completed_at == end
+
+        # Parameters are bound, never formatted into the statement
+        query, args = pool.statements[0]
+        assert "$1" in query and args[0] == [str(user_id)]
+        assert all(arg.tzinfo is not None for arg in args[1:])
+
+    async def test_jsonb_text_is_decoded_for_the_task_loader(self, monkeypatch):
+        user_id = uuid.uuid4()
+        pool = FakePool({
+            "tasks": [{
+                "id": uuid.uuid4(), "user_id": user_id, "title": "Essay",
+                "estimated_minutes": 90, "due_date": datetime(2026, 1, 9, tzinfo=timezone.utc),
+                "created_at": datetime(2026, 1, 2, tzinfo=timezone.utc),
+                "updated_at": datetime(2026, 1, 3, tzinfo=timezone.utc),
+                # Without a jsonb codec asyncpg hands back the JSON text
+                "preferred_windows": '[{"dow": 1, "start": "09:00", "end": "12:00"}]',
+                "avoid_windows": '[]',
+                "pinned_slots": '[]',
+            }],
+        })
+        install_pool(monkeypatch, pool)
+
+        (row,) = await fast_reads.get_fast_reads().fetch_pending_tasks([str(user_id)], datetime.utcnow())
+        assert row["avoid_windows"] == [] and row["preferred_windows"][0]["dow"] == 1
+
+        storage = SimpleNamespace(backend_type="database")
+        tasks = await TaskRepository(storage).load_tasks_many([str(user_id)], 7)
+        (task,) = tasks[str(user_id)]
+        assert task.preferred_windows == [{"dow": 1, "start": "09:00", "end": "12:00"}]
+        assert task.avoid_windows == [] and task.pinned_slots == []
+
+    async def test_pool_failure_backs_off_to_rest(self, monkeypatch):
+        pool = FakePool(fail=True)
+        install_pool(monkeypatch, pool)
+        backend = fast_reads.get_fast_reads()
+
+        assert await backend.fetch_completions(["u1"], datetime.utcnow(), datetime.utcnow()) is None
+        assert await backend.fetch_completions(["u1"], datetime.utcnow(), datetime.utcnow()) is None
+        assert len(pool.statements) == 1
+        assert backend.get_stats()["backing_off"]
@@ -0,0 +1,82 @@
+"""
+Tests for the vectorized feature extractor.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.domain import BusyEvent, CompletionEvent, Preferences
+from app.scheduler.core.features import FeatureConfig, FeatureExtractor
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.testing.fixtures import create_test_task
+
+
+@pytest.fixture
+def inputs():
+    """Three tasks over two days with one meeting and some history."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 0, 0))
+    time_index = TimeIndex("UTC", start, start + timedelta(days=2), 30)
+    tasks = [create_test_task(f"task_{i}", duration_minutes=60 * (i + 1)) for i in range(3)]
+    tasks[1].preferred_windows = [{'dow': 0, 'start': '09:00', 'end': '11:00'}]
+    events = [
+        BusyEvent(
+            id="meeting", source="google", title="Meeting",
+            start=start + timedelta(hours=10), end=start + timedelta(hours=11)
+        )
+    ]
+    history = [
+        CompletionEvent("task_0", start - timedelta(days=i), start if i % 2 else None)
+        for i in range(10)
+    ]
+    return tasks, time_index, Preferences(timezone="UTC"), events, history
+
+
+class TestFeatureExtractor:
+    """Feature matrix layout and values."""
+
+    def test_matrix_covers_every_task_slot_pair(self, inputs):
+        tasks, time_index, prefs, events, history = inputs
+
+        matrix, names, metadata = FeatureExtractor().extract_features(
+            tasks, time_index, prefs, events, history
+        )
+
+        assert matrix.shape == (len(tasks) * len(time_index), len(names))
+        assert metadata['n_features'] == len(names) == len(set(names))
+
+        # Row task_idx * n_slots + slot_idx holds that task's features
+        n_slots = len(time_index)
+        duration = names.index('duration_norm')
+        assert matrix[2 * n_slots + 5, duration] == pytest.approx(1.0)
+        assert matrix[0 * n_slots + 5, duration] == pytest.approx(1 / 3)
+
+    def test_slot_and_context_values(self, inputs):
+        tasks, time_index, prefs, events, history = inputs
+        matrix, names, _ = FeatureExtractor().extract_features(
+            tasks, time_index, prefs, events, history
+        )
+        n_slots = len(time_index)
+        ten_am = 20
+
+        row = matrix[n_slots + ten_am]
+        assert row[names.index('hour_norm')] == pytest.approx(10 / 23)
+        assert row[names.index('in_preferred')] == 1.0
+        assert row[names.index('is_blocked')] == 1.0
+        assert row[names.index('calendar_density')] == pytest.approx(0.25)
+        assert matrix[ten_am, names.index('in_preferred')] == 0.0
+
+        # 4 of the 8 events from the last seven days were completed
+        assert matrix[0, names.index('recent_performance')] == pytest.approx(0.5)
+
+    def test_float32_option(self, inputs):
+        tasks, time_index, prefs, events, history = inputs
+        extractor = FeatureExtractor(FeatureConfig(use_float32=True))
+
+        matrix, _, _ = extractor.extract_features(tasks, time_index, prefs, events, history)
+        reference, _, _ = FeatureExtractor().extract_features(tasks, time_index, prefs, events, history)
+
+        assert matrix.dtype == np.float32
+        np.testing.assert_allclose(matrix, reference, rtol=1e-6)
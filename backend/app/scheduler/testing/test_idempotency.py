@@ -0,0 +1,166 @@
+"""
+Tests for the idempotency store and single-flight solving.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app.scheduler.core.domain import Preferences
+from app.scheduler.io.dto import ScheduleBlock, ScheduleRequest, ScheduleResponse
+from app.scheduler.io.idempotency import IdempotencyManager
+from app.scheduler.io.repositories.task_repository import TaskRepository
+from app.scheduler.testing.fixtures import create_test_task
+
+
+class FakeRedis:
+    """The few Redis commands the idempotency store uses, over a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    def register_script(self, script):
+        async def release(keys, args):
+            if self.data.get(keys[0]) == args[0]:
+                del self.data[keys[0]]
+                return 1
+            return 0
+        return release
+
+
+def make_response(job_id="job"):
+    return ScheduleResponse(
+        job_id=job_id,
+        feasible=True,
+        blocks=[ScheduleBlock(
+            task_id="t1", title="Task", start="2026-01-05T09:00:00+00:00",
+            end="2026-01-05T10:00:00+00:00"
+        )],
+        metrics={'objective': 1.0},
+        explanations={}
+    )
+
+
+class SlowSolver:
+    """Counts solves; each takes a moment so duplicates overlap."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return make_response()
+
+
+@pytest.fixture
+def inputs():
+    tasks = [create_test_task("t1"), create_test_task("t2")]
+    return tasks, [], Preferences(timezone="UTC"), []
+
+
+class TestEffectHash:
+    """The hash follows the effective inputs."""
+
+    def test_input_changes_change_hash(self, inputs):
+        manager = IdempotencyManager()
+        request = ScheduleRequest(user_id="u1")
+        tasks, events, prefs, history = inputs
+        base = manager.generate_effect_hash(request, inputs)
+
+        assert manager.generate_effect_hash(request, inputs) == base
+        assert manager.generate_effect_hash(ScheduleRequest(user_id="u1", job_id="retry"), inputs) == base
+
+        tasks[0].updated_at += timedelta(seconds=1)
+        assert manager.generate_effect_hash(request, inputs) != base
+
+        changed_prefs = (tasks, events, Preferences(timezone="UTC", workday_start="09:00"), history)
+        assert manager.generate_effect_hash(request, changed_prefs) != manager.generate_effect_hash(request, inputs)
+
+    def test_same_db_row_hashes_the_same(self):
+        manager = IdempotencyManager()
+        request = ScheduleRequest(user_id="u1")
+        repo = TaskRepository(None)
+        row = {
+            "id": "t1", "user_id": "u1", "title": "Essay", "estimated_minutes": 90,
+            "created_at": "2026-01-02T08:00:00+00:00", "updated_at": "2026-01-03T08:00:00+00:00",
+        }
+
+        def load():
+            return [repo._task_from_row(dict(row))], [], Preferences(timezone="UTC"), []
+
+        base = manager.generate_effect_hash(request, load())
+        assert manager.generate_effect_hash(request, load()) == base
+
+        row["updated_at"] = "2026-01-04T08:00:00Z"
+        assert manager.generate_effect_hash(request, load()) != base
+
+
+class TestSingleFlight:
+    """Duplicates are served from one solve."""
+
+    async def test_concurrent_duplicates_solve_once(self, inputs):
+        manager = IdempotencyManager()
+        request = ScheduleRequest(user_id="u1")
+        solve = SlowSolver()
+
+        responses = await asyncio.gather(*(
+            manager.run_once(request, solve, inputs=inputs) for _ in range(5)
+        ))
+        assert solve.calls == 1
+        assert all(r.blocks[0].task_id == "t1" for r in responses)
+        assert manager.coalesced == 4
+
+        # Later retries come from the cache
+        await manager.run_once(request, solve, inputs=inputs)
+        assert solve.calls == 1 and manager.hits == 1
+
+    async def test_dry_runs_and_failures_are_not_cached(self, inputs):
+        manager = IdempotencyManager()
+        solve = SlowSolver()
+
+        dry_run = ScheduleRequest(user_id="u1", dry_run=True)
+        await manager.run_once(dry_run, solve, inputs=inputs)
+        await manager.run_once(dry_run, solve, inputs=inputs)
+        assert solve.calls == 2
+
+        async def fail():
+            raise RuntimeError("solver crashed")
+
+        request = ScheduleRequest(user_id="u1")
+        results = await asyncio.gather(
+            manager.run_once(request, fail, inputs=inputs),
+            manager.run_once(request, solve, inputs=inputs),
+            return_exceptions=True
+        )
+        # The waiter solves itself once the first request fails
+        assert isinstance(results[0], RuntimeError)
+        assert results[1].feasible and solve.calls == 3
+
+    async def test_workers_share_redis_lock_and_responses(self, inputs):
+        redis = FakeRedis()
+        workers = [IdempotencyManager(redis_client=redis) for _ in range(3)]
+        request = ScheduleRequest(user_id="u1")
+        solve = SlowSolver()
+
+        responses = await asyncio.gather(*(
+            worker.run_once(request, solve, inputs=inputs) for worker in workers
+        ))
+        assert solve.calls == 1
+        assert all(r.feasible for r in responses)
+        # Lock released; the compressed response stays cached
+        assert [key for key in redis.data if ':lock:' in key] == []
+        assert any(':resp:' in key for key in redis.data)
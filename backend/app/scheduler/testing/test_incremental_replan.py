@@ -0,0 +1,168 @@
+"""
+Tests for incremental replanning of the disrupted window.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.domain import BusyEvent, Preferences, ScheduleBlock, ScheduleSolution
+from app.scheduler.core.scheduler_service.scheduler_service import SchedulerService
+from app.scheduler.core.utility_matrix import UtilityMatrix
+from app.scheduler.io.dto import ScheduleRequest
+from app.scheduler.optimization.solver import SchedulerSolver
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.scheduling.replanning import ReplanningController, ReplanScope
+from app.scheduler.testing.fixtures import create_test_task
+from app.scheduler.utils.determinism import get_deterministic_scheduler
+
+
+@pytest.fixture
+def schedule():
+    """Two-day horizon a few days out with three scheduled tasks."""
+    today = datetime.now(pytz.UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today + timedelta(days=3)
+    time_index = TimeIndex("UTC", start, start + timedelta(days=2), 30)
+    tasks = [create_test_task(f"task_{i}", duration_minutes=60) for i in range(3)]
+    blocks = [
+        ScheduleBlock("task_0", start + timedelta(hours=9), start + timedelta(hours=10)),
+        ScheduleBlock("task_1", start + timedelta(hours=14), start + timedelta(hours=15)),
+        ScheduleBlock("task_2", start + timedelta(hours=34), start + timedelta(hours=35)),
+    ]
+    # A new meeting lands on top of task_0
+    events = [
+        BusyEvent(
+            id="meeting", source="google", title="Meeting",
+            start=start + timedelta(hours=9, minutes=30), end=start + timedelta(hours=10, minutes=30)
+        )
+    ]
+    return start, time_index, tasks, blocks, events
+
+
+class TestIncrementalReplan:
+    """Plan reduction and merging of incremental solves."""
+
+    def test_calendar_change_resolves_only_disrupted_window(self, schedule):
+        start, time_index, tasks, blocks, events = schedule
+
+        plan = ReplanningController().plan_incremental_replan(
+            blocks, tasks, events, Preferences(timezone="UTC"), time_index,
+            scope=ReplanScope.MINIMAL
+        )
+
+        # MINIMAL allows moves of up to one hour around the conflicting block
+        assert [task.id for task in plan.tasks] == ["task_0"]
+        assert plan.time_index.start_dt == start + timedelta(hours=8)
+        assert plan.time_index.end_dt == start + timedelta(hours=11)
+        assert [block.task_id for block in plan.frozen_blocks] == ["task_1", "task_2"]
+        assert plan.get_stats()['window_slots'] == 6
+
+    def test_missed_task_widens_window_to_its_deadline(self, schedule):
+        start, time_index, tasks, blocks, events = schedule
+        missed = create_test_task("missed", duration_minutes=60)
+
+        plan = ReplanningController().plan_incremental_replan(
+            blocks, tasks + [missed], [], Preferences(timezone="UTC"), time_index,
+            scope=ReplanScope.MINIMAL
+        )
+
+        assert [task.id for task in plan.tasks] == ["missed"]
+        assert len(plan.frozen_blocks) == 3
+        assert len(plan.time_index) == len(time_index)
+        frozen_events = [event for event in plan.busy_events if event.metadata.get('frozen')]
+        assert len(frozen_events) == 3
+
+    def test_complete_scope_is_not_incremental(self, schedule):
+        _, time_index, tasks, blocks, events = schedule
+
+        assert ReplanningController().plan_incremental_replan(
+            blocks, tasks, events, Preferences(timezone="UTC"), time_index,
+            scope=ReplanScope.COMPLETE
+        ) is None
+
+    def test_merged_solution_keeps_frozen_blocks(self, schedule):
+        start, time_index, tasks, blocks, events = schedule
+        controller = ReplanningController()
+        prefs = Preferences(timezone="UTC")
+        plan = controller.plan_incremental_replan(
+            blocks, tasks, events, prefs, time_index, scope=ReplanScope.MINIMAL
+        )
+
+        window = plan.time_index
+        util = UtilityMatrix.full([task.id for task in plan.tasks], len(window))
+        solver = SchedulerSolver(time_limit_seconds=3, num_search_workers=1)
+        model = solver.build(plan.tasks, plan.busy_events, prefs, window, {'util': util, 'weights': {}})
+        solution = controller.merge_incremental_solution(plan, solver.solve(model))
+
+        assert solution.feasible
+        moved = [block for block in solution.blocks if block.task_id == "task_0"]
+        assert sum(block.duration_minutes for block in moved) >= 60
+        assert all(not (b.start < events[0].end and events[0].start < b.end) for b in moved)
+        assert solution.diagnostics['incremental']['blocks_frozen'] == 2
+
+        stability = get_deterministic_scheduler().calculate_stability_metrics(solution, blocks)
+        assert stability['blocks_removed'] == 0
+        assert stability['blocks_moved'] <= 1
+
+    def test_frozen_work_counts_toward_daily_caps(self, schedule):
+        start, time_index, tasks, blocks, _ = schedule
+        controller = ReplanningController()
+        prefs = Preferences(timezone="UTC", max_daily_effort_minutes=150)
+        missed = create_test_task("missed", duration_minutes=60)
+        plan = controller.plan_incremental_replan(
+            blocks, tasks + [missed], [], prefs, time_index, scope=ReplanScope.MINIMAL
+        )
+
+        first_day, second_day = time_index.dates
+        assert plan.frozen_minutes == {first_day: 120, second_day: 60}
+
+        window = plan.time_index
+        util = UtilityMatrix.full([task.id for task in plan.tasks], len(window))
+        solver = SchedulerSolver(time_limit_seconds=3, num_search_workers=1)
+        learned = {'util': util, 'weights': {}, 'frozen_minutes': plan.frozen_minutes}
+        model = solver.build(plan.tasks, plan.busy_events, prefs, window, learned)
+        solution = controller.merge_incremental_solution(plan, solver.solve(model))
+
+        assert solution.feasible and not solution.unscheduled_tasks
+        per_day = {}
+        for block in solution.blocks:
+            per_day[block.start.date()] = per_day.get(block.start.date(), 0) + block.duration_minutes
+        # A full solve never puts more than 150 minutes on a day; neither may the replan
+        assert per_day[first_day] <= 150
+        assert sum(per_day.values()) == 240
+
+
+class TestIncrementalFallback:
+    """Work the window cannot place is re-solved over the full horizon."""
+
+    @pytest.mark.parametrize("window_solution, reason", [
+        (ScheduleSolution(feasible=False, blocks=[]), "infeasible"),
+        (ScheduleSolution(feasible=True, blocks=[], unscheduled_tasks=["task_0"]), "unscheduled_tasks"),
+    ])
+    async def test_unplaced_work_triggers_full_solve(self, schedule, window_solution, reason):
+        start, time_index, tasks, blocks, events = schedule
+        prefs = Preferences(timezone="UTC")
+        service = SchedulerService.__new__(SchedulerService)
+        service.replanning_controller = ReplanningController()
+        plan = service.replanning_controller.plan_incremental_replan(
+            blocks, tasks, events, prefs, time_index, scope=ReplanScope.MINIMAL
+        )
+        solved = []
+        full = ScheduleSolution(feasible=True, blocks=[
+            ScheduleBlock(task.id, start + timedelta(hours=12 + i), start + timedelta(hours=13 + i))
+            for i, task in enumerate(tasks)
+        ])
+
+        async def optimize(request, tasks, events, prefs, history, time_index, *args, **kwargs):
+            solved.append((len(tasks), len(time_index)))
+            return (window_solution if len(solved) == 1 else full), {}, {}
+
+        service._optimize = optimize
+        solution, _, _ = await service._solve_incremental(
+            ScheduleRequest(user_id="u1"), plan, tasks, events, prefs, [], time_index, {}, blocks
+        )
+
+        assert solved == [(1, len(plan.time_index)), (3, len(time_index))]
+        assert solution is full
+        assert solution.diagnostics['incremental_fallback']['reason'] == reason
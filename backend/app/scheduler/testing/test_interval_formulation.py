@@ -0,0 +1,108 @@
+"""
+Tests for the interval-variable solver formulation.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.config import SolverConfig
+from app.scheduler.core.domain import BusyEvent, Preferences
+from app.scheduler.optimization.solver import SchedulerSolver
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.testing.fixtures import create_test_task
+
+
+@pytest.fixture
+def horizon():
+    """Two-day horizon starting on a Monday morning."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    return start, TimeIndex("UTC", start, start + timedelta(days=2), 30)
+
+
+@pytest.fixture
+def problem(horizon):
+    """Small problem with a busy event, deadlines and a daily cap."""
+    start, time_index = horizon
+    tasks = [
+        create_test_task(f"task_{i}", duration_minutes=90, min_block_minutes=30, max_block_minutes=60)
+        for i in range(3)
+    ]
+    tasks[0].deadline = start + timedelta(hours=12)
+    events = [
+        BusyEvent(
+            id="lecture", source="google", title="Lecture",
+            start=start + timedelta(hours=1), end=start + timedelta(hours=3)
+        )
+    ]
+    prefs = Preferences(timezone="UTC", max_daily_effort_minutes=240)
+    util = {task.id: {s: 1.0 for s in range(len(time_index))} for task in tasks}
+    return tasks, events, prefs, time_index, {'util': util, 'weights': {}}
+
+
+class TestIntervalFormulation:
+    """Interval formulation produces valid ScheduleSolutions."""
+
+    def test_from_config_selects_formulation(self):
+        solver = SchedulerSolver.from_config(SolverConfig(formulation="interval"))
+        assert solver.formulation == "interval"
+
+    def test_invalid_formulation_rejected(self):
+        with pytest.raises(ValueError):
+            SolverConfig(formulation="bogus").validate()
+
+    def test_solution_respects_hard_constraints(self, problem):
+        tasks, events, prefs, time_index, learned = problem
+        solver = SchedulerSolver(time_limit_seconds=3, formulation="interval")
+
+        solution = solver.solve(solver.build(tasks, events, prefs, time_index, learned))
+
+        assert solution.feasible
+        assert solution.diagnostics['formulation'] == "interval"
+        assert not solution.unscheduled_tasks
+
+        scheduled = {}
+        for block in solution.blocks:
+            scheduled[block.task_id] = scheduled.get(block.task_id, 0) + block.duration_minutes
+            # No overlap with the busy event
+            assert block.end <= events[0].start or block.start >= events[0].end
+        for task in tasks:
+            assert scheduled[task.id] >= task.estimated_minutes
+
+        # Deadline
+        assert all(b.end <= tasks[0].deadline for b in solution.blocks if b.task_id == tasks[0].id)
+
+        # Daily cap and no double booking
+        per_day = {}
+        ordered = sorted(solution.blocks, key=lambda b: b.start)
+        for previous, current in zip(ordered, ordered[1:]):
+            assert previous.end <= current.start
+        for block in solution.blocks:
+            per_day[block.start.date()] = per_day.get(block.start.date(), 0) + block.duration_minutes
+        assert all(minutes <= prefs.max_daily_effort_minutes for minutes in per_day.values())
+
+    def test_model_smaller_than_slot_formulation(self, problem):
+        tasks, events, prefs, time_index, learned = problem
+
+        slot_solver = SchedulerSolver(formulation="slot")
+        slot_model = slot_solver.build(tasks, events, prefs, time_index, learned)
+        interval_solver = SchedulerSolver(formulation="interval")
+        interval_model = interval_solver.build(tasks, events, prefs, time_index, learned)
+
+        assert len(interval_model.Proto().variables) < len(slot_model.Proto().variables)
+
+    @pytest.mark.parametrize("formulation", ["slot", "interval"])
+    def test_negative_utilities_steer_placement(self, horizon, formulation):
+        start, time_index = horizon
+        task = create_test_task("task_0", duration_minutes=60, min_block_minutes=30, max_block_minutes=60)
+        first_day = time_index.datetime_to_index(start + timedelta(days=1))
+        util = {task.id: {s: -1.0 if s < first_day else 0.0 for s in range(len(time_index))}}
+        solver = SchedulerSolver(time_limit_seconds=3, formulation=formulation)
+
+        solution = solver.solve(solver.build(
+            [task], [], Preferences(timezone="UTC"), time_index, {'util': util, 'weights': {}}
+        ))
+
+        assert solution.feasible and solution.blocks
+        assert all(block.start >= start + timedelta(days=1) for block in solution.blocks)
@@ -0,0 +1,107 @@
+"""
+Tests for the per-user model registry.
+"""
+
+import asyncio
+import pytest
+
+from app.scheduler.learning.bandits import WeightTuner
+from app.scheduler.learning.completion_model import CompletionModel
+from app.scheduler.learning.model_registry import ModelRegistry
+from app.scheduler.learning.model_store import ModelStore
+
+
+@pytest.fixture
+def store():
+    return ModelStore(backend="memory")
+
+
+def make_registry(store, **kwargs):
+    return ModelRegistry(
+        model_factory=lambda: CompletionModel(store=store),
+        tuner_factory=lambda: WeightTuner(store=store),
+        **kwargs
+    )
+
+
+class TestModelRegistry:
+    """Residency, isolation and write-back."""
+
+    async def test_users_get_separate_resident_models(self, store):
+        registry = make_registry(store)
+
+        first, second, again = await asyncio.gather(
+            registry.get("alice"), registry.get("bob"), registry.get("alice")
+        )
+
+        assert first is again
+        assert first.tuner is not second.tuner
+        assert (await registry.get("bob")) is second
+        stats = registry.get_stats()
+        assert stats['misses'] == 2
+        assert stats['resident_users'] == 2
+
+    async def test_lru_eviction_by_user_count(self, store):
+        registry = make_registry(store, max_users=2)
+
+        for user_id in ("a", "b", "a", "c"):
+            await registry.get(user_id)
+
+        assert "a" in registry and "c" in registry
+        assert "b" not in registry
+        assert registry.evictions == 1
+
+    async def test_dirty_models_are_written_back(self, store):
+        registry = make_registry(store, writeback_delay_seconds=60)
+        entry = await registry.get("alice")
+        entry.tuner.arms[0].update(1.0)
+
+        registry.mark_dirty("alice")
+        assert entry.dirty
+        assert registry.get_stats()['pending_writebacks'] == 1
+
+        # Eviction saves immediately instead of waiting for the delay
+        registry.evict("alice")
+        await registry.flush()
+        assert registry.writebacks == 1
+
+        reloaded = await registry.get("alice")
+        assert reloaded is not entry
+        assert reloaded.tuner.arms[0].num_pulls == 1
+
+    async def test_resident_models_pick_up_saves_from_other_workers(self, store):
+        registry = make_registry(store, revalidate_seconds=0)
+        other = make_registry(store)
+        entry = await registry.get("alice")
+
+        updated = await other.get("alice")
+        updated.tuner.arms[0].update(1.0)
+        other.mark_dirty("alice")
+        other.evict("alice")
+        await other.flush()
+
+        assert (await registry.get("alice")) is entry
+        assert entry.tuner.arms[0].num_pulls == 1
+        assert registry.refreshes == 1
+
+    async def test_stale_write_back_does_not_overwrite_a_newer_save(self, store):
+        registry = make_registry(store, writeback_delay_seconds=60)
+        other = make_registry(store)
+        stale = await registry.get("alice")
+        newer = await other.get("alice")
+
+        newer.tuner.arms[1].update(1.0)
+        other.mark_dirty("alice")
+        other.evict("alice")
+        await other.flush()
+
+        stale.tuner.arms[0].update(1.0)
+        registry.mark_dirty("alice")
+        registry.evict("alice")
+        await registry.flush()
+
+        assert registry.conflicts == 1
+        assert stale.tuner.arms[1].num_pulls == 1
+        reloaded = await make_registry(store).get("alice")
+        assert reloaded.tuner.arms[1].num_pulls == 1
+        assert reloaded.tuner.arms[0].num_pulls == 0
@@ -0,0 +1,148 @@
+"""
+Tests for packed model serialization and bulk loading.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+from app.config.database import supabase as supabase_module
+from app.scheduler.learning.bandits import WeightTuner
+from app.scheduler.learning.completion_model import CompletionModel
+from app.scheduler.learning.model_codec import is_packed, pack_params, unpack_params
+from app.scheduler.learning.model_registry import ModelRegistry
+from app.scheduler.learning.model_store import ModelStore
+
+
+class FakeLearningData:
+    """Async PostgREST builder over an in-memory learning_data table."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.action = None
+        self.keys = None
+
+    def select(self, columns):
+        self.action = ("select", None)
+        return self
+
+    def update(self, values):
+        self.action = ("update", values)
+        return self
+
+    def insert(self, row):
+        self.action = ("insert", row)
+        return self
+
+    def eq(self, field, value):
+        self.keys = [value]
+        return self
+
+    def in_(self, field, values):
+        self.keys = list(values)
+        return self
+
+    async def execute(self):
+        kind, values = self.action
+        if kind == "insert":
+            self.rows[values["key"]] = dict(values)
+            return SimpleNamespace(data=[values])
+        matched = [self.rows[key] for key in self.keys if key in self.rows]
+        if kind == "update":
+            for row in matched:
+                row.update(values)
+        return SimpleNamespace(data=matched)
+
+
+async def fitted_model(store, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.normal(size=(40, 6))
+    y = (X[:, 0] > 0).astype(int)
+    model = CompletionModel(store=store)
+    await model.fit_batch(X, y, feature_names=[f"f{i}" for i in range(6)])
+    return model, X
+
+
+class TestModelCodec:
+    """Packed layout round trip."""
+
+    def test_round_trip(self):
+        params = {
+            'coef': np.arange(12, dtype=np.float64).reshape(2, 6),
+            'bias': np.array([0.5]),
+            'feature_names': ['a', 'b'],
+            'is_fitted': True
+        }
+
+        packed = pack_params(params)
+        decoded = unpack_params(packed)
+
+        assert is_packed(packed)
+        assert decoded['coef'].dtype == np.float32
+        np.testing.assert_array_equal(decoded['coef'], params['coef'])
+        assert decoded['feature_names'] == ['a', 'b']
+        assert decoded['is_fitted'] is True
+
+
+class TestModelStore:
+    """Packed saves, legacy fallback and bulk loads."""
+
+    @pytest.mark.parametrize("backend", ["memory", "file"])
+    async def test_packed_completion_model_round_trip(self, backend, tmp_path):
+        store = ModelStore(backend=backend, base_path=str(tmp_path))
+        model, X = await fitted_model(store)
+
+        assert await model.save("alice")
+        restored = CompletionModel(store=store)
+        assert await restored.load("alice")
+
+        assert restored.feature_names == model.feature_names
+        np.testing.assert_allclose(
+            await restored.predict(X), await model.predict(X), rtol=1e-4, atol=1e-6
+        )
+
+    async def test_db_backend_round_trip(self, monkeypatch):
+        rows = {}
+        client = SimpleNamespace(table=lambda name: FakeLearningData(rows))
+        monkeypatch.setattr(supabase_module, "get_async_supabase", lambda: client)
+        model, X = await fitted_model(ModelStore(backend="db"))
+
+        assert await model.save("alice")
+        assert set(rows) == {"alice:completion:packed"}
+
+        # A fresh store has nothing in memory to fall back on
+        restored = CompletionModel(store=ModelStore(backend="db"))
+        assert await restored.load("alice")
+        np.testing.assert_allclose(
+            await restored.predict(X), await model.predict(X), rtol=1e-4, atol=1e-6
+        )
+
+    async def test_load_many_mixes_packed_and_legacy_json(self, tmp_path):
+        store = ModelStore(backend="file", base_path=str(tmp_path))
+        for seed, user_id in enumerate(["a", "b"]):
+            model, _ = await fitted_model(store, seed)
+            await model.save(user_id)
+        await store.save_model_params("c", "completion", {'model_coef': [[1.0]], 'feature_names': []})
+
+        loaded = await store.load_many(["a", "b", "c", "missing"], "completion")
+
+        assert set(loaded) == {"a", "b", "c"}
+        assert isinstance(loaded["a"]["model_coef"], np.ndarray)
+        assert loaded["c"]["model_coef"] == [[1.0]]
+
+    async def test_registry_preload_uses_bulk_loads(self):
+        store = ModelStore(backend="memory")
+        model, _ = await fitted_model(store)
+        await model.save("alice")
+        registry = ModelRegistry(
+            model_factory=lambda: CompletionModel(store=store),
+            tuner_factory=lambda: WeightTuner(store=store)
+        )
+
+        assert await registry.preload(["alice", "bob", "alice"]) == 2
+
+        entry = await registry.get("alice")
+        assert entry.model.is_fitted
+        assert registry.hits == 1
+        assert "bob" in registry
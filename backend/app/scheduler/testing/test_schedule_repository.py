@@ -0,0 +1,106 @@
+"""
+Tests for persisting and reading back scheduler runs on the database backend.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.config.database import supabase as supabase_module
+from app.scheduler.core.domain import ScheduleBlock, ScheduleSolution
+from app.scheduler.io.repositories.schedule_repository import ScheduleRepository
+
+
+class FakeQuery:
+    """Async PostgREST builder over in-memory tables."""
+
+    def __init__(self, tables, table):
+        self.tables = tables
+        self.table = table
+        self.filters = []
+        self.write = None
+        self.order_by = None
+        self.limit_to = None
+
+    def select(self, columns):
+        return self
+
+    def insert(self, rows):
+        self.write = ("insert", rows if isinstance(rows, list) else [rows])
+        return self
+
+    def upsert(self, rows, on_conflict="id"):
+        self.write = ("upsert", rows)
+        return self
+
+    def eq(self, field, value):
+        self.filters.append(lambda row: row.get(field) == value)
+        return self
+
+    def gte(self, field, value):
+        self.filters.append(lambda row: row[field] >= value)
+        return self
+
+    def lte(self, field, value):
+        self.filters.append(lambda row: row[field] <= value)
+        return self
+
+    def order(self, field, desc=False):
+        self.order_by = (field, desc)
+        return self
+
+    def limit(self, count):
+        self.limit_to = count
+        return self
+
+    async def execute(self):
+        rows = self.tables.setdefault(self.table, {})
+        if self.write:
+            for row in self.write[1]:
+                rows[row.get("id", len(rows))] = dict(row)
+            return SimpleNamespace(data=self.write[1])
+
+        data = [row for row in rows.values() if all(check(row) for check in self.filters)]
+        if self.order_by:
+            data.sort(key=lambda row: row[self.order_by[0]], reverse=self.order_by[1])
+        return SimpleNamespace(data=data[:self.limit_to] if self.limit_to else data)
+
+
+class FakeClient:
+    def __init__(self):
+        self.tables = {}
+
+    def table(self, name):
+        return FakeQuery(self.tables, name)
+
+
+def solution(*blocks):
+    return ScheduleSolution(feasible=True, blocks=list(blocks))
+
+
+class TestLatestSchedule:
+    """Only the newest run counts as the previous schedule."""
+
+    async def test_two_runs_return_only_the_latest(self, monkeypatch):
+        client = FakeClient()
+        monkeypatch.setattr(supabase_module, "get_async_supabase", lambda: client)
+        repo = ScheduleRepository(SimpleNamespace(backend_type="database"))
+
+        start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=2)
+        kept = ScheduleBlock(task_id="t1", start=start, end=start + timedelta(hours=1))
+        moved = ScheduleBlock(task_id="t2", start=start + timedelta(hours=1), end=start + timedelta(hours=2))
+
+        await repo.persist_schedule("u1", solution(kept, moved), job_id="run-1")
+        # Stamp the first run as older; in production the runs are minutes apart
+        for row in client.tables["schedule_blocks"].values():
+            row["created_at"] = "2000-01-01T00:00:00"
+
+        moved_later = ScheduleBlock(task_id="t2", start=start + timedelta(hours=3), end=start + timedelta(hours=4))
+        await repo.persist_schedule("u1", solution(kept, moved_later), job_id="run-2")
+
+        latest = await repo.get_latest_schedule("u1", days_back=1)
+
+        assert sorted((block.task_id, block.start) for block in latest) == [
+            ("t1", kept.start), ("t2", moved_later.start)
+        ]
+        # The superseded t2 block is still stored but belongs to run-1
+        assert len(await repo.get_recent_schedules("u1", days_back=1, include_upcoming=True)) == 3
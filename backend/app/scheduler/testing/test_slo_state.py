@@ -0,0 +1,154 @@
+"""
+Tests for fleet-wide SLO gate state.
+"""
+
+import pytest
+
+from app.scheduler.io.dto import ScheduleRequest
+from app.scheduler.performance import (
+    RedisSLOState, SLOConfig, SLOGate, SLOLevel, SLOSnapshot, SLOViolationError
+)
+from app.scheduler.performance.slo_state import (
+    LATENCY_BUCKETS_MS, histogram_quantile, latency_bucket
+)
+
+
+class FakeSharedState:
+    """Shared state serving a fixed fleet snapshot."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.started = []
+        self.finished = []
+        self.published = []
+
+    async def get_snapshot(self):
+        return self.snapshot
+
+    def request_started(self, request_id):
+        self.started.append(request_id)
+
+    def request_finished(self, request_id, *args):
+        self.finished.append(request_id)
+
+    def request_cancelled(self, request_id):
+        self.finished.append(request_id)
+
+    def publish_level(self, level, violated):
+        self.published.append((level, violated))
+
+    def get_stats(self):
+        return {'backend': 'fake'}
+
+
+class ScriptRecorder:
+    """Redis client that records script calls instead of running them."""
+
+    def __init__(self):
+        self.calls = []
+
+    def register_script(self, script):
+        async def run(keys, args):
+            self.calls.append((script, keys, args))
+        return run
+
+    async def hset(self, *args, **kwargs):
+        raise AssertionError("level updates must go through a script")
+
+
+def fleet_snapshot(latency_ms, count, concurrent=0):
+    """Snapshot of `count` feasible requests at one latency."""
+    snapshot = SLOSnapshot(
+        requests=count, feasible=count, blocks_scheduled=count, total_tasks=count,
+        concurrent_requests=concurrent
+    )
+    snapshot.latency_counts[latency_bucket(latency_ms)] = count
+    return snapshot
+
+
+class TestLatencyHistogram:
+    """Bucketed percentiles match the gate's rank convention."""
+
+    def test_quantile_is_bucket_upper_bound(self):
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        counts[latency_bucket(100)] = 94
+        counts[latency_bucket(9000)] = 6
+
+        assert histogram_quantile(counts, 0.5) >= 100
+        assert histogram_quantile(counts, 0.95) >= 9000
+        # Upper bounds are within one 25% bucket of the true value
+        assert histogram_quantile(counts, 0.95) <= 9000 * 1.25
+        assert histogram_quantile([0] * len(counts), 0.95) == 0.0
+
+    def test_overflow_bucket(self):
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        counts[latency_bucket(10 ** 9)] = 1
+        assert histogram_quantile(counts, 0.99) == LATENCY_BUCKETS_MS[-1]
+
+
+class TestSharedGate:
+    """The gate decides on fleet-wide signals when shared state is set."""
+
+    @pytest.fixture
+    def config(self):
+        return SLOConfig(p95_latency_ms=3000, p99_latency_ms=5000, max_concurrent_requests=2)
+
+    async def test_fleet_latency_sets_level(self, config):
+        shared = FakeSharedState(fleet_snapshot(4000, 50))
+        gate = SLOGate(config, shared)
+
+        context = await gate.check_slo_before_request(ScheduleRequest(user_id="u1", job_id="j1"))
+
+        # This process has no local history, yet sees the fleet's latency
+        assert len(gate.metrics_history) == 0
+        assert context['slo_level'] == SLOLevel.YELLOW
+        assert context['coarsening_params']
+        assert shared.started == ["j1"]
+        assert shared.published == [("yellow", True)]
+        assert gate.consecutive_violations == 1
+
+        await gate.record_request_completion("j1", None, ScheduleRequest(user_id="u1"))
+        assert shared.finished == ["j1"]
+
+    async def test_fleet_concurrency_rejects_under_red(self, config):
+        snapshot = fleet_snapshot(4000, 50, concurrent=5)
+        snapshot.feasible = 0
+        snapshot.blocks_scheduled = 0
+        gate = SLOGate(config, FakeSharedState(snapshot))
+
+        with pytest.raises(SLOViolationError):
+            await gate.check_slo_before_request(ScheduleRequest(user_id="u1", job_id="j1"))
+        assert gate.current_status.level == SLOLevel.RED
+
+    async def test_falls_back_to_local_metrics(self, config):
+        gate = SLOGate(config, FakeSharedState(None))
+
+        context = await gate.check_slo_before_request(ScheduleRequest(user_id="u1", job_id="j1"))
+        assert context['slo_level'] == SLOLevel.GREEN
+        assert gate.get_health_status()['metrics']['concurrent_requests'] == 1
+
+    async def test_fleet_violation_count_carries_across_workers(self, config):
+        snapshot = fleet_snapshot(4000, 50)
+        snapshot.consecutive_violations = 2
+        shared = FakeSharedState(snapshot)
+        gate = SLOGate(config, shared)
+
+        await gate.check_slo_before_request(ScheduleRequest(user_id="u1", job_id="j1"))
+        assert gate.consecutive_violations == 3
+
+        shared.snapshot = fleet_snapshot(100, 50)
+        await gate.check_slo_before_request(ScheduleRequest(user_id="u1", job_id="j2"))
+        assert gate.consecutive_violations == 0
+        assert shared.published == [("yellow", True), ("green", False)]
+
+    async def test_level_and_count_are_written_by_one_script(self):
+        client = ScriptRecorder()
+        state = RedisSLOState(client, key_prefix="slo")
+
+        state.publish_level("orange", True)
+        await state.close()
+
+        [(script, keys, args)] = client.calls
+        assert "HINCRBY" in script and keys == ["slo:level"]
+        assert args[:2] == ["orange", 1]
+        assert state.errors == 0
@@ -0,0 +1,109 @@
+"""
+Tests for the process-pool solver executor.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.domain import Preferences
+from app.scheduler.optimization.solver_pool import (
+    SolveCancelledError, SolveProblem, SolverPool, solve_problem
+)
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.scheduling.streaming import SolutionStream
+from app.scheduler.testing.fixtures import create_test_task
+
+
+def make_problem(time_limit_seconds: int = 2, n_tasks: int = 2, days: int = 1) -> SolveProblem:
+    """Solvable problem; small by default."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    time_index = TimeIndex("UTC", start, start + timedelta(days=days), 30)
+    tasks = [create_test_task(f"task_{i}", duration_minutes=60) for i in range(n_tasks)]
+    util = {task.id: {s: 1.0 + (s * (i + 1)) % 7 for s in range(len(time_index))} for i, task in enumerate(tasks)}
+    return SolveProblem.from_time_index(
+        tasks, [], Preferences(timezone="UTC"), time_index,
+        {'util': util, 'weights': {}},
+        solver_options={'time_limit_seconds': time_limit_seconds, 'num_search_workers': 1}
+    )
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = SolverPool(max_workers=1, start_method="spawn")
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+class TestSolverPool:
+    """Solver pool runs solves in worker processes."""
+
+    def test_in_process_solve(self):
+        solution = solve_problem(make_problem())
+        assert solution.feasible
+
+    @pytest.mark.asyncio
+    async def test_pool_solve_returns_solution(self, pool):
+        solution = await pool.solve(make_problem())
+
+        assert solution.feasible
+        assert {b.task_id for b in solution.blocks} == {"task_0", "task_1"}
+        assert 'solver_pool' in solution.diagnostics
+        assert pool.get_stats()['completed'] >= 1
+
+    @pytest.mark.asyncio
+    async def test_queued_solve_can_be_cancelled(self, pool):
+        running = make_problem(time_limit_seconds=10, n_tasks=12, days=5)
+        queued = make_problem()
+
+        running_task = asyncio.create_task(pool.solve(running))
+        queued_task = asyncio.create_task(pool.solve(queued))
+        await asyncio.sleep(0.2)
+
+        assert pool.get_stats()['queue_depth'] == 1
+        assert pool.cancel(queued.request_id)
+        assert pool.cancel(running.request_id)
+
+        with pytest.raises(SolveCancelledError):
+            await queued_task
+        with pytest.raises(SolveCancelledError):
+            await running_task
+
+        assert pool.get_stats()['outstanding'] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_streams_intermediate_solutions(self, pool):
+        stream = SolutionStream()
+        solving = asyncio.create_task(pool.solve(make_problem(n_tasks=6, days=2), on_solution=stream.publish))
+        solving.add_done_callback(lambda _: stream.close())
+
+        updates = [solution async for _, solution in stream]
+        final = await solving
+
+        assert updates and all(u.feasible and u.solver_status == "improving" for u in updates)
+        assert final.objective_value >= updates[-1].objective_value
+
+
+class TestSolutionStreaming:
+    """Improving solutions reach the caller before the solve returns."""
+
+    @pytest.mark.asyncio
+    async def test_in_process_solve_streams_from_solver_thread(self):
+        stream = SolutionStream()
+        problem = make_problem(n_tasks=6, days=2)
+
+        async def solve():
+            try:
+                return await asyncio.to_thread(solve_problem, problem, None, stream.publish)
+            finally:
+                stream.close()
+
+        solving = asyncio.create_task(solve())
+        source, first = await anext(aiter(stream))
+        final = await solving
+
+        assert source == "cp_sat" and first.feasible and first.blocks
+        assert final.feasible and final.objective_value >= first.objective_value
@@ -0,0 +1,78 @@
+"""
+Tests for the array-backed time index.
+"""
+
+import pytest
+from datetime import datetime, timedelta, date
+
+import pytz
+
+from app.scheduler.core.domain import BusyEvent, Preferences
+from app.scheduler.optimization.time_index import TimeIndex
+
+
+@pytest.fixture
+def time_index():
+    """Horizon from Monday 10:00 to Wednesday 12:00 in 30 minute slots."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 10, 0))
+    return TimeIndex("UTC", start, start + timedelta(days=2, hours=2), 30)
+
+
+def event(time_index, start_hours, end_hours, hard=True):
+    return BusyEvent(
+        id=f"e_{start_hours}", source="google", title="Event",
+        start=time_index.start_dt + timedelta(hours=start_hours),
+        end=time_index.start_dt + timedelta(hours=end_hours),
+        hard=hard
+    )
+
+
+class TestTimeIndex:
+    """Slot arithmetic, day ranges and busy masks."""
+
+    def test_datetime_to_index_is_arithmetic(self, time_index):
+        start = time_index.start_dt
+
+        assert time_index.datetime_to_index(start) == 0
+        assert time_index.datetime_to_index(start + timedelta(minutes=59)) == 1
+        assert time_index.datetime_to_index(start - timedelta(minutes=1)) is None
+        assert time_index.datetime_to_index(time_index.end_dt) is None
+        assert time_index.index_to_datetime(3) == start + timedelta(minutes=90)
+        assert time_index.slot_to_index[time_index.slots[5]] == 5
+
+    def test_partial_days_have_ranges(self, time_index):
+        assert time_index.dates == [date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7)]
+        # 10:00-24:00, full day, 00:00-12:00
+        assert time_index.day_ranges == [(0, 28), (28, 76), (76, 100)]
+        assert time_index.get_day_indices(datetime(2026, 1, 7)) == list(range(76, 100))
+        assert time_index.get_day_indices(date(2026, 1, 9)) == []
+
+    def test_workday_indices(self, time_index):
+        prefs = Preferences(timezone="UTC", workday_start="09:00", workday_end="17:00")
+
+        first_day = time_index.get_workday_indices(datetime(2026, 1, 5), prefs)
+        assert first_day == list(range(0, 14))  # 10:00-17:00
+        assert time_index.get_workday_indices(datetime(2026, 1, 6), prefs) == list(range(46, 62))
+
+    def test_busy_mask_matches_event_windows(self, time_index):
+        events = [
+            event(time_index, 1, 2),
+            event(time_index, 1.5, 3),            # overlaps the first
+            event(time_index, 5, 6, hard=False),  # soft events do not block
+            event(time_index, -2, 0.5),           # starts before the horizon
+        ]
+
+        blocked = time_index.filter_busy_slots(events)
+
+        # End slots are inclusive, events outside the horizon are clipped
+        assert blocked == {0, 1, 2, 3, 4, 5, 6}
+        assert time_index.busy_mask(events).sum() == len(blocked)
+
+    def test_free_slots_and_contiguous_blocks(self, time_index):
+        prefs = Preferences(timezone="UTC", workday_start="09:00", workday_end="17:00")
+
+        free = time_index.get_free_slots([event(time_index, 1, 2)], prefs, dates=[datetime(2026, 1, 5)])
+
+        assert free == [0, 1, 5, 6, 7, 8, 9, 10, 11, 12, 13]
+        assert time_index.get_contiguous_blocks(free) == [[0, 1], list(range(5, 14))]
+        assert time_index.get_contiguous_blocks([]) == []
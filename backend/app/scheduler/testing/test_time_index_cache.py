@@ -0,0 +1,80 @@
+"""
+Tests for the cross-request time index cache.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytz
+
+from app.scheduler.core.domain import Preferences
+from app.scheduler.core.features import FeatureExtractor
+from app.scheduler.optimization.time_index_cache import TimeIndexCache
+from app.scheduler.testing.fixtures import create_test_task
+
+
+@pytest.fixture
+def start():
+    return pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+
+
+class TestTimeIndexCache:
+    """Hits, expiry, eviction and shared slot artifacts."""
+
+    def test_hit_returns_shared_instance(self, start):
+        cache = TimeIndexCache()
+        end = start + timedelta(days=1)
+
+        first = cache.get("UTC", start, end, 30)
+        second = cache.get("UTC", start, end, 30)
+        other = cache.get("UTC", start, end, 15)
+
+        assert first is second
+        assert other is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+        assert not first.slot_timestamps.flags.writeable
+
+    def test_ttl_expiry(self, start, monkeypatch):
+        cache = TimeIndexCache(ttl_seconds=60)
+        clock = [1000.0]
+        monkeypatch.setattr("app.scheduler.optimization.time_index_cache.time.monotonic", lambda: clock[0])
+
+        first = cache.get("UTC", start, start + timedelta(days=1))
+        clock[0] += 61
+        second = cache.get("UTC", start, start + timedelta(days=1))
+
+        assert second is not first
+        assert cache.expirations == 1
+
+    def test_lru_eviction(self, start):
+        cache = TimeIndexCache(max_entries=2)
+        days = [start + timedelta(days=i) for i in range(3)]
+
+        first = cache.get("UTC", days[0], days[0] + timedelta(days=1))
+        cache.get("UTC", days[1], days[1] + timedelta(days=1))
+        cache.get("UTC", days[0], days[0] + timedelta(days=1))  # refresh first
+        cache.get("UTC", days[2], days[2] + timedelta(days=1))  # evicts second
+
+        assert cache.evictions == 1
+        assert cache.get_stats()['size'] == 2
+        assert cache.get("UTC", days[0], days[0] + timedelta(days=1)) is first
+
+    def test_slot_artifacts_are_memoized(self, start):
+        cache = TimeIndexCache()
+        time_index = cache.get("UTC", start, start + timedelta(days=1))
+        prefs = Preferences(timezone="UTC")
+        tasks = [create_test_task("task_0")]
+
+        context = time_index.get_slot_context(4)
+        context['hour'] = -1  # callers get a copy
+        assert time_index.get_slot_context(4)['hour'] == 10
+
+        extractor = FeatureExtractor()
+        first, _, _ = extractor.extract_features(tasks, time_index, prefs, [], [])
+        n_artifacts = len(time_index._artifacts)
+        second, _, _ = extractor.extract_features(tasks, time_index, prefs, [], [])
+
+        assert len(time_index._artifacts) == n_artifacts
+        np.testing.assert_array_equal(first, second)
@@ -0,0 +1,92 @@
+"""
+Tests for the array-backed utility matrix.
+"""
+
+import pickle
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.scheduler.core.domain import Preferences
+from app.scheduler.core.scheduler_service.utility_calculator import UtilityCalculator
+from app.scheduler.core.utility_matrix import UtilityMatrix, as_utility_matrix
+from app.scheduler.optimization.fallback import greedy_fill
+from app.scheduler.optimization.solver import SchedulerSolver
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.testing.fixtures import create_test_task
+
+
+@pytest.fixture
+def time_index():
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    return TimeIndex("UTC", start, start + timedelta(days=1), 30)
+
+
+class TestUtilityMatrix:
+    """Construction, lookup and normalization."""
+
+    def test_dict_round_trip(self):
+        util = {"a": {0: 1.0, 2: 3.0}, "b": {1: 2.0, 99: 5.0}}
+        matrix = UtilityMatrix.from_dict(util, n_slots=3)
+
+        assert matrix.values.shape == (2, 3)
+        assert matrix.get("a", 2) == 3.0
+        assert matrix.get("b", 0) == 0.0
+        assert matrix.get("missing", 0, default=-1.0) == -1.0
+        assert matrix.block_utility("a", [0, 1, 2]) == 4.0
+        assert matrix.to_dict()["b"] == {0: 0.0, 1: 2.0, 2: 0.0}
+
+    def test_alignment_and_pickle(self):
+        matrix = UtilityMatrix(["a", "b"], np.arange(6, dtype=float).reshape(2, 3))
+
+        aligned = as_utility_matrix(matrix, ["b", "c"], 3)
+        assert aligned.task_ids == ["b", "c"]
+        np.testing.assert_array_equal(aligned.values, [[3, 4, 5], [0, 0, 0]])
+        assert as_utility_matrix(matrix, ["a", "b"], 3) is matrix
+
+        restored = pickle.loads(pickle.dumps(matrix))
+        assert restored.task_index == matrix.task_index
+        np.testing.assert_array_equal(restored.values, matrix.values)
+
+    def test_normalization(self):
+        matrix = UtilityMatrix(["a", "b"], np.array([[1.0, 3.0], [2.0, 2.0]]))
+
+        np.testing.assert_allclose(matrix.normalized("minmax").values, [[0, 1], [0.5, 0.5]])
+        np.testing.assert_allclose(matrix.normalized("sum").values, [[0.25, 0.75], [0.5, 0.5]])
+        with pytest.raises(ValueError):
+            matrix.normalized("bogus")
+
+
+class TestUtilityConsumers:
+    """Calculator, greedy scheduler and solver work on the matrix directly."""
+
+    def test_simple_utilities(self, time_index):
+        tasks = [create_test_task("task_0"), create_test_task("task_1")]
+        tasks[1].deadline = time_index.start_dt + timedelta(hours=4)
+
+        matrix = UtilityCalculator().build_simple_utilities(tasks, time_index)
+
+        assert matrix.values.shape == (2, len(time_index))
+        # 08:00 is extended hours, 09:00 working hours
+        assert matrix.get("task_0", 0) == pytest.approx(1.2)
+        assert matrix.get("task_0", 2) == pytest.approx(1.5)
+        # Four hours before the deadline the bonus is capped at 2.0
+        assert matrix.get("task_1", 0) == pytest.approx(3.2)
+
+    def test_greedy_and_solver_prefer_high_utility(self, time_index):
+        task = create_test_task("task_0", duration_minutes=60)
+        matrix = UtilityMatrix.full([task.id], len(time_index))
+        matrix.values[0, 10:12] = 5.0
+
+        greedy = greedy_fill([task], list(range(len(time_index))), Preferences(timezone="UTC"), matrix, time_index)
+        assert greedy.blocks[0].start == time_index.index_to_datetime(10)
+
+        solver = SchedulerSolver(time_limit_seconds=3, num_search_workers=1)
+        model = solver.build([task], [], Preferences(timezone="UTC"), time_index, {'util': matrix, 'weights': {}})
+        solution = solver.solve(model)
+
+        assert solution.feasible
+        assert [b.start for b in solution.blocks] == [time_index.index_to_datetime(10)]
+        assert solution.blocks[0].utility_score == pytest.approx(5.0)
@@ -0,0 +1,94 @@
+"""
+Tests for warm-starting the solver from a previous schedule.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.config.database import supabase as supabase_module
+from app.scheduler.core.domain import BusyEvent, Preferences, ScheduleBlock, ScheduleSolution
+from app.scheduler.io.repositories.schedule_repository import ScheduleRepository
+from app.scheduler.optimization.solver import SchedulerSolver
+from app.scheduler.optimization.time_index import TimeIndex
+from app.scheduler.optimization.warm_start import build_warm_start_hints
+from app.scheduler.testing.fixtures import create_test_task
+from app.scheduler.testing.test_schedule_repository import FakeClient
+
+
+@pytest.fixture
+def problem():
+    """One-day problem with two tasks."""
+    start = pytz.UTC.localize(datetime(2026, 1, 5, 8, 0))
+    time_index = TimeIndex("UTC", start, start + timedelta(days=1), 30)
+    tasks = [create_test_task(f"task_{i}", duration_minutes=60) for i in range(2)]
+    util = {task.id: {s: 1.0 for s in range(len(time_index))} for task in tasks}
+    return start, tasks, time_index, {'util': util, 'weights': {}}
+
+
+class TestWarmStartHints:
+    """Previous blocks are mapped onto the new time grid."""
+
+    def test_kept_and_dropped_counts(self, problem):
+        start, tasks, time_index, _ = problem
+        previous = [
+            ScheduleBlock("task_0", start + timedelta(hours=1), start + timedelta(hours=2)),
+            ScheduleBlock("removed_task", start, start + timedelta(hours=1)),
+            ScheduleBlock("task_1", start - timedelta(days=2), start - timedelta(days=2, hours=-1)),
+            ScheduleBlock("task_1", start + timedelta(hours=4), start + timedelta(hours=5)),
+        ]
+        events = [
+            BusyEvent(
+                id="meeting", source="google", title="Meeting",
+                start=start + timedelta(hours=4), end=start + timedelta(hours=5)
+            )
+        ]
+
+        hints = build_warm_start_hints(previous, tasks, time_index, events)
+
+        assert hints['kept'] == 1
+        assert hints['dropped'] == 3
+        assert hints['assignments'] == {"task_0": [2, 3]}
+
+    @pytest.mark.parametrize("formulation", ["slot", "interval"])
+    def test_solver_reports_warm_start(self, problem, formulation):
+        start, tasks, time_index, learned = problem
+        previous = [
+            ScheduleBlock("task_0", start + timedelta(hours=1), start + timedelta(hours=2)),
+            ScheduleBlock("task_1", start + timedelta(hours=3), start + timedelta(hours=4)),
+        ]
+        hints = build_warm_start_hints(previous, tasks, time_index)
+
+        solver = SchedulerSolver(time_limit_seconds=3, num_search_workers=1, formulation=formulation)
+        model = solver.build(tasks, [], Preferences(timezone="UTC"), time_index, learned)
+        solution = solver.solve(model, hints=hints)
+
+        assert solution.feasible
+        warm_start = solution.diagnostics['warm_start']
+        assert warm_start['hints_kept'] == 2
+        assert warm_start['hints_dropped'] == 0
+        assert warm_start['hinted_variables'] > 0
+
+    async def test_hints_come_from_the_latest_run_only(self, problem, monkeypatch):
+        _, tasks, _, _ = problem
+        # Persisted schedules are read back relative to now
+        start = datetime.now(pytz.UTC).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+        time_index = TimeIndex("UTC", start, start + timedelta(days=1), 30)
+        client = FakeClient()
+        monkeypatch.setattr(supabase_module, "get_async_supabase", lambda: client)
+        repo = ScheduleRepository(type("Storage", (), {"backend_type": "database"})())
+
+        first = [ScheduleBlock("task_0", start + timedelta(hours=1), start + timedelta(hours=2))]
+        await repo.persist_schedule("u1", ScheduleSolution(feasible=True, blocks=first), job_id="run-1")
+        for row in client.tables["schedule_blocks"].values():
+            row["created_at"] = "2000-01-01T00:00:00"
+        second = [ScheduleBlock("task_0", start + timedelta(hours=6), start + timedelta(hours=7))]
+        await repo.persist_schedule("u1", ScheduleSolution(feasible=True, blocks=second), job_id="run-2")
+
+        previous = await repo.get_latest_schedule("u1", days_back=7)
+        hints = build_warm_start_hints(previous, tasks, time_index)
+
+        # The superseded 09:00 placement must not be hinted alongside 14:00
+        assert hints['kept'] == 1
+        assert hints['assignments'] == {"task_0": [12, 13]}
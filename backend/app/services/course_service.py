@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from app.database.repositories.user_repositories import CourseRepository, get_course_repository
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.core.utils.error_handlers import ServiceError
 
 logger = logging.getLogger(__name__)
@@ -99,6 +100,9 @@ class CourseService:
             if not updated_course:
                 raise ValueError(f"Failed to update course {course_id}")
             
+            # Course colors are baked into every task in the timeblock feed
+            await get_timeblock_feed_store().mark_changed(user_id, everything=True)
+            
             logger.info(f"Updated course {course_id} for user {user_id}")
             return updated_course
         
@@ -6,6 +6,8 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
+from app.database.timeblock_feed import get_timeblock_feed_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -504,6 +506,7 @@ class EntityResolver:
 
             if new_task:
                 logger.info(f"Created new task: {new_task['id']}")
+                await get_timeblock_feed_store().mark_changed(user_id, task_ids=[new_task['id']])
                 return {
                     'entity_type': 'task',
                     'entity_id': new_task['id'],
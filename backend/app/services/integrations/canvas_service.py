@@ -19,6 +19,7 @@ from app.database.repositories.integration_repositories import (
     CanvasIntegrationRepository,
     get_canvas_integration_repository
 )
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.services.infrastructure.cache_service import get_cache_service
 from app.services.auth.token_service import get_token_service
 from app.config.core.settings import get_settings
@@ -284,8 +285,8 @@ class CanvasService:
         try:
             # Clear existing Canvas assignments for this user from consolidated tasks table
             # TODO: Add delete_by_filters to TaskRepository
-            from app.config.database.supabase import get_supabase_client
-            supabase = get_supabase_client()
+            from app.config.database.supabase import get_async_supabase
+            supabase = get_async_supabase()
             await supabase.table("tasks").delete().eq("user_id", user_id).eq("source", "canvas").execute()
 
             # Convert assignments to consolidated tasks format
@@ -319,6 +320,9 @@ class CanvasService:
         except Exception as e:
             logger.error(f"Error storing Canvas assignments for user {user_id}: {e}")
             raise
+        finally:
+            # The old assignments may be gone even if the insert failed; rebuild the feed
+            await get_timeblock_feed_store().mark_changed(user_id, everything=True)
     
     async def _update_integration_status(self, user_id: str, assignment_count: int):
         """Update Canvas integration status in database"""
@@ -8,6 +8,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from app.database.repositories.task_repositories import TaskRepository
+from app.database.timeblock_feed import TimeblockFeedStore, get_timeblock_feed_store
 from app.core.utils.error_handlers import ServiceError
 
 logger = logging.getLogger(__name__)
@@ -16,9 +17,10 @@ logger = logging.getLogger(__name__)
 class TaskService:
     """Service for task business logic"""
 
-    def __init__(self, repository: TaskRepository = None):
+    def __init__(self, repository: TaskRepository = None, feed_store: TimeblockFeedStore = None):
         """Initialize service with repository"""
         self.repo = repository or TaskRepository()
+        self.feed_store = feed_store or get_timeblock_feed_store()
 
     async def create_task(
         self,
@@ -90,6 +92,7 @@ class TaskService:
 
             # Create task in database
             created_task = await self.repo.create(task_record)
+            await self.feed_store.mark_changed(user_id, task_ids=[created_task["id"]])
 
             logger.info(f"Created task {created_task['id']} for user {user_id}")
             return created_task
@@ -209,6 +212,8 @@ class TaskService:
             if not updated_task:
                 raise ServiceError("Task not found", "task", "update")
 
+            await self.feed_store.mark_changed(user_id, task_ids=[task_id])
+
             logger.info(f"Updated task {task_id} for user {user_id}")
             return updated_task
 
@@ -238,6 +243,8 @@ class TaskService:
             if not deleted:
                 raise ServiceError("Task not found", "task", "delete")
 
+            await self.feed_store.mark_changed(user_id, task_ids=[task_id])
+
             logger.info(f"Deleted task {task_id} for user {user_id}")
 
             return {
@@ -2,8 +2,9 @@
 Timeblock Service
 Business logic for unified calendar view (timeblocks)
 """
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -18,11 +19,26 @@ from app.database.repositories.calendar_repositories import (
     get_calendar_event_repository
 )
 from app.database.repositories.user_repositories import UserRepository, get_user_repository, CourseRepository, get_course_repository
-from app.database.repositories.task_repositories import TaskRepository
+from app.database.repositories.task_repositories import TaskRepository, get_task_repository
+from app.database.dataloader import DataLoader
+from app.database.timeblock_feed import (
+    ALL_CHANGED,
+    TimeblockFeed,
+    TimeblockFeedStore,
+    get_timeblock_feed_store
+)
 from app.core.utils.error_handlers import ServiceError
 
 logger = logging.getLogger(__name__)
 
+# Same columns as TaskRepository.get_by_id_with_course / CalendarEventRepository.get_by_external_id
+TASK_ENRICHMENT_COLUMNS = "*,courses(id,name,color,icon,canvas_course_code)"
+EVENT_ENRICHMENT_COLUMNS = (
+    "description, location, html_link, attendees, creator_email, organizer_email, "
+    "status, transparency, visibility, categories, importance, sensitivity, "
+    "recurrence, has_attachments"
+)
+
 
 class TimeblockService:
     """
@@ -30,6 +46,7 @@ class TimeblockService:
     
     Handles business logic for unified calendar view including:
     - Fetching and enriching timeblocks with metadata
+    - Maintaining the materialized per-user timeblock feed
     - Two-way calendar sync (task linking)
     - Calendar selection and configuration
     """
@@ -42,7 +59,8 @@ class TimeblockService:
         calendar_link_repo: CalendarLinkRepository = None,
         calendar_calendar_repo: CalendarCalendarRepository = None,
         calendar_event_repo: CalendarEventRepository = None,
-        task_repo: TaskRepository = None
+        task_repo: TaskRepository = None,
+        feed_store: TimeblockFeedStore = None
     ):
         """Initialize TimeblockService with optional dependencies"""
         self.timeblock_repo = timeblock_repo or TimeblocksRepository()
@@ -52,6 +70,7 @@ class TimeblockService:
         self.calendar_calendar_repo = calendar_calendar_repo or CalendarCalendarRepository()
         self.calendar_event_repo = calendar_event_repo or CalendarEventRepository()
         self.task_repo = task_repo or TaskRepository()
+        self.feed_store = feed_store or get_timeblock_feed_store()
 
     async def get_timeblocks(
         self,
@@ -62,7 +81,9 @@ class TimeblockService:
         """
         Get unified timeblocks with full enriched metadata
         
-        Fetches timeblocks from the v_timeblocks view and enriches them with:
+        Timeblocks come from the user's materialized feed, or from the
+        v_timeblocks view when the feed cannot serve the range (see
+        get_timeblock_feed), enriched with:
         - Premium status for readonly determination
         - Course colors for tasks
         - Calendar link IDs
@@ -77,52 +98,57 @@ class TimeblockService:
         Returns:
             List of enriched timeblock dictionaries
             
+        Raises:
+            ServiceError: If operation fails
+        """
+        items, _ = await self.get_timeblock_feed(user_id, start_time, end_time)
+        return items
+
+    async def get_timeblock_feed(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get enriched timeblocks and the feed version they were served from
+        
+        Ranges inside the feed window are served from the user's materialized
+        feed after applying the changes recorded since it was last read. Other
+        ranges, or any range while Redis is unavailable, are built live from
+        the v_timeblocks view and carry no version.
+        
+        Args:
+            user_id: User ID
+            start_time: Start of time window (timezone-aware)
+            end_time: End of time window (timezone-aware)
+        
+        Returns:
+            Tuple of enriched timeblocks and feed version (None if built live)
+            
         Raises:
             ServiceError: If operation fails
         """
         try:
+            feed = await self._current_feed(user_id, start_time, end_time)
+            if feed is not None:
+                items = feed.items(start_time, end_time)
+                logger.info(f"[Timeblocks] Serving {len(items)} items from feed v{feed.version} for user {user_id}")
+                return items, feed.version
+
             # Fetch base timeblocks
             rows = await self.timeblock_repo.fetch_timeblocks(user_id, start_time, end_time)
             
             logger.info(f"[Timeblocks] Fetched {len(rows)} raw rows for user {user_id}")
             
             if not rows:
-                return []
+                return [], None
 
-            # Get user premium status
-            is_premium = await self.user_repo.is_premium(user_id)
-            
-            # Get course colors
-            courses = await self.course_repo.get_by_user_id(user_id)
-            course_colors = {c["id"]: c.get("color") for c in courses}
-            
-            # Get calendar links
-            links = await self.calendar_link_repo.get_by_user_id(user_id)
-            task_links = {link["task_id"]: link["id"] for link in links if link.get("task_id")}
-            event_links = {
-                (link["provider"], link["provider_event_id"]): link["id"]
-                for link in links if link.get("provider_event_id")
-            }
-            
-            # Get primary write calendar
-            primary_write_cal = await self.calendar_calendar_repo.get_primary_write_calendar(user_id)
-            primary_write_cal_id = primary_write_cal["provider_calendar_id"] if primary_write_cal else None
-            
-            # Enrich each timeblock
-            enriched_items = []
-            for row in rows:
-                enriched = await self._enrich_timeblock(
-                    row,
-                    is_premium,
-                    course_colors,
-                    task_links,
-                    event_links,
-                    primary_write_cal_id
-                )
-                enriched_items.append(enriched)
+            context = await self._load_enrichment_context(user_id)
+            enriched_items = await self._enrich_rows(rows, context)
             
             logger.info(f"[Timeblocks] Returning {len(enriched_items)} enriched items")
-            return enriched_items
+            return enriched_items, None
         
         except Exception as e:
             logger.error(f"Failed to get timeblocks for user {user_id}: {e}", exc_info=True)
@@ -133,6 +159,153 @@ class TimeblockService:
                 details={"user_id": user_id, "start_time": start_time, "end_time": end_time}
             )
 
+    async def _current_feed(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> Optional[TimeblockFeed]:
+        """
+        The user's feed with pending changes applied, or None to serve live
+        
+        A missing or expired feed, one that no longer covers the range, or a
+        change to the enrichment inputs triggers a rebuild; changed tasks and
+        events only have their own rows rebuilt.
+        """
+        window_start, window_end = self.feed_store.window()
+        if start_time < window_start or end_time > window_end:
+            return None
+
+        changes = await self.feed_store.take_changes(user_id)
+        if changes is None:
+            return None
+
+        feed, saved_version = await self.feed_store.load(user_id)
+        try:
+            if feed is None or ALL_CHANGED in changes or not feed.covers(start_time, end_time):
+                feed = await self._materialize_feed(user_id, window_start, window_end)
+            elif changes:
+                await self._patch_feed(user_id, feed, changes)
+            else:
+                return feed
+        except Exception as e:
+            # The changes taken above are lost with the feed; the next read rebuilds
+            logger.warning(f"Failed to refresh timeblock feed for user {user_id}: {e}", exc_info=True)
+            await self.feed_store.discard(user_id)
+            return None
+
+        feed.version = await self.feed_store.next_version(user_id)
+        if feed.version is not None and not await self.feed_store.save(user_id, feed, saved_version):
+            # A concurrent read saved first and its feed lacks these changes
+            await self.feed_store.restore_changes(user_id, changes)
+        return feed
+
+    async def _materialize_feed(
+        self,
+        user_id: str,
+        window_start: datetime,
+        window_end: datetime
+    ) -> TimeblockFeed:
+        """Build a user's whole feed for the window"""
+        rows, context, calendars = await asyncio.gather(
+            self.timeblock_repo.fetch_timeblocks(user_id, window_start, window_end, strict=True),
+            self._load_enrichment_context(user_id),
+            self.calendar_calendar_repo.get_by_user_id(user_id)
+        )
+        # Row refreshes query the view directly, which does not filter these
+        context["active_calendar_ids"] = [
+            calendar["provider_calendar_id"] for calendar in calendars if calendar.get("is_active")
+        ]
+
+        items = await self._enrich_rows(rows, context)
+        feed = TimeblockFeed(
+            version=0,
+            window_start=window_start.timestamp(),
+            window_end=window_end.timestamp(),
+            context=context
+        )
+        feed.replace((), (), zip(rows, items))
+
+        logger.info(f"[Timeblocks] Materialized feed of {len(items)} items for user {user_id}")
+        return feed
+
+    async def _patch_feed(self, user_id: str, feed: TimeblockFeed, changes: Set[str]):
+        """Rebuild the rows of the tasks and events that changed"""
+        task_ids = sorted(change[len("task:"):] for change in changes if change.startswith("task:"))
+        event_ids = sorted(change[len("event:"):] for change in changes if change.startswith("event:"))
+
+        rows = await self.timeblock_repo.fetch_timeblocks_for_sources(
+            user_id,
+            datetime.fromtimestamp(feed.window_start, timezone.utc),
+            datetime.fromtimestamp(feed.window_end, timezone.utc),
+            task_ids=task_ids,
+            provider_event_ids=event_ids
+        )
+        active_calendar_ids = set(feed.context["active_calendar_ids"])
+        rows = [
+            row for row in rows
+            if row["source"] != "calendar" or row.get("provider_calendar_id") in active_calendar_ids
+        ]
+
+        items = await self._enrich_rows(rows, feed.context)
+        feed.replace(task_ids, event_ids, zip(rows, items))
+
+        logger.info(
+            f"[Timeblocks] Patched feed for user {user_id}: "
+            f"{len(task_ids)} tasks, {len(event_ids)} events, {len(items)} items"
+        )
+
+    async def _load_enrichment_context(self, user_id: str) -> Dict[str, Any]:
+        """
+        Per-user enrichment inputs, loaded concurrently
+        
+        Kept JSON-serializable so the feed can store it with its rows.
+        """
+        is_premium, courses, links, primary_write_cal = await asyncio.gather(
+            self.user_repo.is_premium(user_id),
+            self.course_repo.get_by_user_id(user_id),
+            self.calendar_link_repo.get_by_user_id(user_id),
+            self.calendar_calendar_repo.get_primary_write_calendar(user_id)
+        )
+
+        return {
+            "is_premium": is_premium,
+            "course_colors": {c["id"]: c.get("color") for c in courses},
+            "task_links": {link["task_id"]: link["id"] for link in links if link.get("task_id")},
+            "event_links": [
+                [link["provider"], link["provider_event_id"], link["id"]]
+                for link in links if link.get("provider_event_id")
+            ],
+            "primary_write_calendar_id": primary_write_cal["provider_calendar_id"] if primary_write_cal else None,
+        }
+
+    async def _enrich_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Enrich timeblock rows together, in order"""
+        event_links = {(provider, event_id): link_id for provider, event_id, link_id in context["event_links"]}
+
+        # The loaders batch the per-row task and event lookups into one query each
+        task_loader = self.task_repo.loader(columns=TASK_ENRICHMENT_COLUMNS)
+        event_loader = self.calendar_event_repo.loader(
+            field="external_id", columns=EVENT_ENRICHMENT_COLUMNS
+        )
+        return list(await asyncio.gather(*(
+            self._enrich_timeblock(
+                row,
+                context["is_premium"],
+                context["course_colors"],
+                context["task_links"],
+                event_links,
+                context["primary_write_calendar_id"],
+                task_loader,
+                event_loader
+            )
+            for row in rows
+        )))
+
     async def _enrich_timeblock(
         self,
         row: Dict[str, Any],
@@ -140,7 +313,9 @@ class TimeblockService:
         course_colors: Dict[str, str],
         task_links: Dict[str, str],
         event_links: Dict[tuple, str],
-        primary_write_cal_id: Optional[str]
+        primary_write_cal_id: Optional[str],
+        task_loader: Optional[DataLoader] = None,
+        event_loader: Optional[DataLoader] = None
     ) -> Dict[str, Any]:
         """
         Enrich a single timeblock with full metadata
@@ -152,6 +327,8 @@ class TimeblockService:
             task_links: Mapping of task_id -> link_id
             event_links: Mapping of (provider, provider_event_id) -> link_id
             primary_write_cal_id: Primary write calendar ID
+            task_loader: Batching loader for task rows (by ID)
+            event_loader: Batching loader for calendar event rows (by external ID)
         
         Returns:
             Enriched timeblock dictionary
@@ -190,10 +367,10 @@ class TimeblockService:
         
         # Enrich based on source type
         if row["source"] == "task":
-            task_data = await self._enrich_task(row["task_id"], course_colors)
+            task_data = await self._enrich_task(row["task_id"], course_colors, task_loader)
             enriched.update(task_data)
         elif row["source"] == "calendar":
-            event_data = await self._enrich_calendar_event(row.get("provider_event_id"))
+            event_data = await self._enrich_calendar_event(row.get("provider_event_id"), event_loader)
             enriched.update(event_data)
         
         return enriched
@@ -201,12 +378,16 @@ class TimeblockService:
     async def _enrich_task(
         self,
         task_id: str,
-        course_colors: Dict[str, str]
+        course_colors: Dict[str, str],
+        task_loader: Optional[DataLoader] = None
     ) -> Dict[str, Any]:
         """Fetch and format task-specific metadata"""
         try:
             # Fetch full task with course info
-            task = await self.task_repo.get_by_id_with_course(task_id)
+            if task_loader is not None:
+                task = await task_loader.load(task_id)
+            else:
+                task = await self.task_repo.get_by_id_with_course(task_id)
             
             if not task:
                 return {}
@@ -234,14 +415,18 @@ class TimeblockService:
 
     async def _enrich_calendar_event(
         self,
-        provider_event_id: Optional[str]
+        provider_event_id: Optional[str],
+        event_loader: Optional[DataLoader] = None
     ) -> Dict[str, Any]:
         """Fetch and format calendar event metadata"""
         try:
             if not provider_event_id:
                 return {}
             
-            event = await self.calendar_event_repo.get_by_external_id(provider_event_id)
+            if event_loader is not None:
+                event = await event_loader.load(provider_event_id)
+            else:
+                event = await self.calendar_event_repo.get_by_external_id(provider_event_id)
             
             if not event:
                 return {}
@@ -320,6 +505,9 @@ class TimeblockService:
             if not result.get("success"):
                 raise ValueError(result.get("error", "Failed to link task"))
             
+            # New link changes readonly and linkId across the feed
+            await self.feed_store.mark_changed(user_id, everything=True)
+            
             return {
                 "success": True,
                 "message": f"Task {result.get('action', 'linked')}",
@@ -388,6 +576,7 @@ class TimeblockService:
             
             # Delete link
             await self.calendar_link_repo.delete_by_id(link["id"])
+            await self.feed_store.mark_changed(user_id, everything=True)
             
             return {
                 "success": True,
@@ -439,6 +628,7 @@ class TimeblockService:
             
             # Set new primary
             await self.calendar_calendar_repo.set_primary_write(calendar_id)
+            await self.feed_store.mark_changed(user_id, everything=True)
             
             return {
                 "success": True,
@@ -483,6 +673,8 @@ class TimeblockService:
             for calendar_id in calendar_ids:
                 await self.calendar_calendar_repo.activate_calendar(calendar_id, user_id)
             
+            await self.feed_store.mark_changed(user_id, everything=True)
+            
             return {
                 "success": True,
                 "message": f"Updated {len(calendar_ids)} active calendars"
@@ -560,6 +752,8 @@ class TimeblockService:
                     operation="create_timeblock"
                 )
             
+            await self._record_timeblock_change(user_id, created)
+            
             logger.info(f"Created timeblock {created.get('id')} for user {user_id}")
             return created
         
@@ -612,6 +806,8 @@ class TimeblockService:
                 logger.warning(f"Timeblock {timeblock_id} not found for user {user_id}")
                 return None
             
+            await self._record_timeblock_change(user_id, updated)
+            
             logger.info(f"Updated timeblock {timeblock_id} for user {user_id}")
             return updated
         
@@ -647,6 +843,7 @@ class TimeblockService:
             deleted = await self.timeblock_repo.delete_timeblock(timeblock_id, user_id)
             
             if deleted:
+                await self._record_timeblock_change(user_id, None)
                 logger.info(f"Deleted timeblock {timeblock_id} for user {user_id}")
             else:
                 logger.warning(f"Timeblock {timeblock_id} not found for user {user_id}")
@@ -662,6 +859,15 @@ class TimeblockService:
                 details={"timeblock_id": timeblock_id, "user_id": user_id}
             )
 
+    async def _record_timeblock_change(self, user_id: str, timeblock: Optional[Dict[str, Any]]):
+        """Record a timeblocks table write in the user's feed"""
+        task_id = (timeblock or {}).get("task_id")
+        if task_id:
+            await self.feed_store.mark_changed(user_id, task_ids=[task_id])
+        else:
+            # Deleted or standalone blocks cannot be traced to feed rows
+            await self.feed_store.mark_changed(user_id, everything=True)
+
     async def get_timeblock(
         self,
         timeblock_id: str,
@@ -740,6 +946,7 @@ def get_timeblock_service() -> TimeblockService:
         calendar_link_repo=get_calendar_link_repository(),
         calendar_calendar_repo=get_calendar_calendar_repository(),
         calendar_event_repo=get_calendar_event_repository(),
-        task_repo=get_task_repository()
+        task_repo=get_task_repository(),
+        feed_store=get_timeblock_feed_store()
     )
 
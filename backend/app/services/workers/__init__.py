@@ -12,6 +12,7 @@ from .notification_job_runner import NotificationJobRunner, NotificationJobs, ge
 from .canvas_job_runner import CanvasJobRunner, get_canvas_job_runner
 from .usage_job_runner import UsageJobRunner, get_usage_job_runner
 from .focus_job_runner import FocusJobRunner, get_focus_job_runner
+from .replan_job_runner import ReplanJobRunner, get_replan_job_runner
 
 __all__ = [
     "CalendarBackgroundWorker",
@@ -27,4 +28,6 @@ __all__ = [
     "get_usage_job_runner",
     "FocusJobRunner",
     "get_focus_job_runner",
+    "ReplanJobRunner",
+    "get_replan_job_runner",
 ]
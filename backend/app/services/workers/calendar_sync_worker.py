@@ -9,7 +9,7 @@ from uuid import UUID
 import asyncio
 
 from app.config.core.settings import get_settings
-from app.config.database.supabase import get_supabase_client
+from app.config.database.supabase import get_async_supabase
 from app.integrations.providers.google import GoogleCalendarClient
 from app.integrations.providers.google.mapping import (
     gcal_to_cache_row,
@@ -18,15 +18,26 @@ from app.integrations.providers.google.mapping import (
     extract_pulseplan_task_id
 )
 from app.integrations.providers.base import SyncTokenInvalid, PreconditionFailed, ProviderError
+from app.database.repositories.calendar_repositories import get_calendar_event_repository
+from app.database.repositories.task_repositories import get_task_repository
+from app.database.timeblock_feed import get_timeblock_feed_store
 
 logger = logging.getLogger(__name__)
 
+# Unique key of a cached provider event
+EVENT_CONFLICT_KEY = "calendar_id_ref,external_id"
+
+# Concurrent task writes while reconciling one page
+TASK_UPDATE_CONCURRENCY = 10
+
 
 class CalendarSyncWorker:
     """Worker for calendar sync operations"""
 
     def __init__(self):
-        self.supabase = get_supabase_client()
+        self.db = get_async_supabase()
+        self.event_repo = get_calendar_event_repository()
+        self.task_repo = get_task_repository()
         self.google_client = GoogleCalendarClient()
 
     async def discover_calendars(self, user_id: str, provider: str = "google") -> Dict[str, Any]:
@@ -44,7 +55,7 @@ class CalendarSyncWorker:
 
         try:
             # Get active OAuth token for this provider
-            token_response = self.supabase.table("oauth_tokens").select("*").eq("user_id", user_id).eq("provider", provider).eq("is_active", True).limit(1).execute()
+            token_response = await self.db.table("oauth_tokens").select("*").eq("user_id", user_id).eq("provider", provider).eq("is_active", True).limit(1).execute()
 
             if not token_response.data:
                 return {
@@ -62,7 +73,7 @@ class CalendarSyncWorker:
             discovered_count = 0
             for cal in calendars:
                 # Check if calendar already exists
-                existing = self.supabase.table("calendar_calendars").select("*").eq("user_id", user_id).eq("provider", provider).eq("provider_calendar_id", cal["provider_calendar_id"]).execute()
+                existing = await self.db.table("calendar_calendars").select("*").eq("user_id", user_id).eq("provider", provider).eq("provider_calendar_id", cal["provider_calendar_id"]).execute()
 
                 calendar_data = {
                     "user_id": user_id,
@@ -77,16 +88,16 @@ class CalendarSyncWorker:
 
                 if existing.data:
                     # Update existing
-                    self.supabase.table("calendar_calendars").update(calendar_data).eq("id", existing.data[0]["id"]).execute()
+                    await self.db.table("calendar_calendars").update(calendar_data).eq("id", existing.data[0]["id"]).execute()
                 else:
                     # Insert new - check if this should be primary write
-                    primary_check = self.supabase.table("calendar_calendars").select("id").eq("user_id", user_id).eq("is_primary_write", True).execute()
+                    primary_check = await self.db.table("calendar_calendars").select("id").eq("user_id", user_id).eq("is_primary_write", True).execute()
 
                     if not primary_check.data and cal.get("is_primary"):
                         # This is the user's primary calendar and they have no primary write set
                         calendar_data["is_primary_write"] = True
 
-                    self.supabase.table("calendar_calendars").insert(calendar_data).execute()
+                    await self.db.table("calendar_calendars").insert(calendar_data).execute()
 
                 discovered_count += 1
 
@@ -119,7 +130,7 @@ class CalendarSyncWorker:
 
         try:
             # Get calendar details
-            calendar_response = self.supabase.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
+            calendar_response = await self.db.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
 
             if not calendar_response.data:
                 return {
@@ -148,10 +159,10 @@ class CalendarSyncWorker:
         except SyncTokenInvalid:
             logger.warning(f"Sync token invalid for calendar {calendar_id}, resetting")
             # Clear sync token and re-sync window
-            self.supabase.table("calendar_calendars").update({"sync_token": None}).eq("id", calendar_id).execute()
+            await self.db.table("calendar_calendars").update({"sync_token": None}).eq("id", calendar_id).execute()
 
             # Retry with window sync
-            calendar_response = self.supabase.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
+            calendar_response = await self.db.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
             calendar = calendar_response.data
             time_min = datetime.utcnow() - timedelta(days=30)
             time_max = datetime.utcnow() + timedelta(days=90)
@@ -167,6 +178,7 @@ class CalendarSyncWorker:
     async def _pull_with_sync_token(self, calendar_id: str, provider_calendar_id: str, sync_token: str) -> Dict[str, Any]:
         """Pull events using sync token (incremental)."""
         calendar_uuid = UUID(calendar_id)
+        user_id = await self._get_calendar_user_id(calendar_id)
         events_updated = 0
         events_created = 0
         events_deleted = 0
@@ -180,26 +192,18 @@ class CalendarSyncWorker:
                 page_token=page_token
             )
 
-            # Process events
-            for event in result["events"]:
-                if event.get("status") == "cancelled":
-                    # Mark as cancelled
-                    await self._mark_event_cancelled(calendar_id, event["id"])
-                    events_deleted += 1
-                else:
-                    # Upsert event
-                    created = await self._upsert_event(calendar_id, event)
-                    if created:
-                        events_created += 1
-                    else:
-                        events_updated += 1
+            # Process the page in bulk
+            page = await self._ingest_page(calendar_id, user_id, result["events"])
+            events_created += page["created"]
+            events_updated += page["updated"]
+            events_deleted += page["cancelled"]
 
             # Check for next page
             page_token = result.get("next_page_token")
             if not page_token:
                 # Update sync token
                 if result.get("next_sync_token"):
-                    self.supabase.table("calendar_calendars").update({
+                    await self.db.table("calendar_calendars").update({
                         "sync_token": result["next_sync_token"]
                     }).eq("id", calendar_id).execute()
                 break
@@ -214,6 +218,7 @@ class CalendarSyncWorker:
     async def _pull_window(self, calendar_id: str, provider_calendar_id: str, time_min: datetime, time_max: datetime) -> Dict[str, Any]:
         """Pull events within a time window."""
         calendar_uuid = UUID(calendar_id)
+        user_id = await self._get_calendar_user_id(calendar_id)
         events_synced = 0
 
         page_token = None
@@ -226,20 +231,16 @@ class CalendarSyncWorker:
                 page_token=page_token
             )
 
-            # Process events
-            for event in result["events"]:
-                if event.get("status") == "cancelled":
-                    await self._mark_event_cancelled(calendar_id, event["id"])
-                else:
-                    await self._upsert_event(calendar_id, event)
-                    events_synced += 1
+            # Process the page in bulk
+            page = await self._ingest_page(calendar_id, user_id, result["events"])
+            events_synced += page["created"] + page["updated"]
 
             # Check for next page
             page_token = result.get("next_page_token")
             if not page_token:
                 # Save sync token for future incremental syncs
                 if result.get("next_sync_token"):
-                    self.supabase.table("calendar_calendars").update({
+                    await self.db.table("calendar_calendars").update({
                         "sync_token": result["next_sync_token"]
                     }).eq("id", calendar_id).execute()
                 break
@@ -249,95 +250,140 @@ class CalendarSyncWorker:
             "events_synced": events_synced
         }
 
-    async def _upsert_event(self, calendar_id: str, gcal_event: Dict[str, Any]) -> bool:
+    async def _get_calendar_user_id(self, calendar_id: str) -> str:
+        """Owner of a calendar (looked up once per sync, not per event)."""
+        calendar_response = await self.db.table("calendar_calendars").select("user_id").eq("id", calendar_id).single().execute()
+        return calendar_response.data["user_id"]
+
+    async def _ingest_page(self, calendar_id: str, user_id: str, gcal_events: List[Dict[str, Any]]) -> Dict[str, int]:
         """
-        Upsert a calendar event into cache.
+        Write one page of provider events to the cache.
+
+        Live events become one bulk upsert keyed on (calendar_id_ref, external_id),
+        cancelled events one bulk cancel; linked tasks of updated events are then
+        reconciled in a second batched pass. Everything touched is recorded in
+        the user's timeblock feed.
 
         Returns:
-            True if created, False if updated
+            Counts of created, updated and cancelled events
         """
-        calendar_response = self.supabase.table("calendar_calendars").select("user_id").eq("id", calendar_id).single().execute()
-        user_id = calendar_response.data["user_id"]
-
-        # Convert to cache row
-        cache_row = gcal_to_cache_row(gcal_event, user_id, calendar_id)
+        # Later entries for the same event win; one upsert cannot touch a row twice
+        latest = {event["id"]: event for event in gcal_events}
+        live = [event for event in latest.values() if event.get("status") != "cancelled"]
+        cancelled_ids = [event_id for event_id, event in latest.items() if event.get("status") == "cancelled"]
+
+        existing = await self.event_repo.get_many(
+            [event["id"] for event in live],
+            field="external_id",
+            columns="id",
+            filters={"calendar_id_ref": calendar_id}
+        )
 
-        # Check if event exists
-        existing = self.supabase.table("calendar_events").select("id").eq("calendar_id_ref", calendar_id).eq("external_id", gcal_event["id"]).execute()
+        if live:
+            await self.event_repo.upsert_many(
+                [gcal_to_cache_row(event, user_id, calendar_id) for event in live],
+                on_conflict=EVENT_CONFLICT_KEY
+            )
 
-        if existing.data:
-            # Update
-            self.supabase.table("calendar_events").update(cache_row).eq("id", existing.data[0]["id"]).execute()
+        unlinked = False
+        if cancelled_ids:
+            unlinked = await self._cancel_events(calendar_id, cancelled_ids)
+
+        # Calendar-side changes to already cached events may need to flow into tasks
+        updated = [event for event in live if event["id"] in existing]
+        updated_task_ids = []
+        if updated:
+            updated_task_ids = await self._reconcile_tasks(calendar_id, updated)
+
+        # Removed links change the feed's enrichment inputs, not just these rows
+        await get_timeblock_feed_store().mark_changed(
+            user_id,
+            task_ids=updated_task_ids,
+            event_ids=list(latest),
+            everything=unlinked
+        )
 
-            # Check if linked to a task - update task if calendar wins
-            await self._handle_calendar_update(calendar_id, gcal_event)
-            return False
-        else:
-            # Insert
-            self.supabase.table("calendar_events").insert(cache_row).execute()
-            return True
+        return {
+            "created": len(live) - len(updated),
+            "updated": len(updated),
+            "cancelled": len(cancelled_ids)
+        }
 
-    async def _mark_event_cancelled(self, calendar_id: str, event_id: str):
-        """Mark an event as cancelled and unlink any tasks."""
+    async def _cancel_events(self, calendar_id: str, event_ids: List[str]) -> bool:
+        """Mark events as cancelled and unlink their tasks, one query each; True if any were linked."""
         # Update cache
-        self.supabase.table("calendar_events").update({
+        await self.db.table("calendar_events").update({
             "is_cancelled": True,
-            "last_synced": datetime.utcnow().isoformat()
-        }).eq("calendar_id_ref", calendar_id).eq("external_id", event_id).execute()
-
-        # Unlink any calendar_links
-        link_response = self.supabase.table("calendar_links").select("*").eq("calendar_id", calendar_id).eq("provider_event_id", event_id).execute()
-
-        if link_response.data:
-            link = link_response.data[0]
-            # Delete link (task remains but unscheduled)
-            self.supabase.table("calendar_links").delete().eq("id", link["id"]).execute()
-            logger.info(f"Unlinked task {link['task_id']} from deleted event {event_id}")
-
-    async def _handle_calendar_update(self, calendar_id: str, gcal_event: Dict[str, Any]):
-        """Handle updates from calendar (conflict resolution)."""
-        # Check if event is linked to a task
-        link_response = self.supabase.table("calendar_links").select("*").eq("calendar_id", calendar_id).eq("provider_event_id", gcal_event["id"]).execute()
-
-        if not link_response.data:
-            return
+            "synced_at": datetime.utcnow().isoformat()
+        }).eq("calendar_id_ref", calendar_id).in_("external_id", event_ids).execute()
+
+        # Delete links (tasks remain but unscheduled)
+        link_response = await self.db.table("calendar_links").delete().eq(
+            "calendar_id", calendar_id
+        ).in_("provider_event_id", event_ids).execute()
+
+        for link in link_response.data or []:
+            logger.info(f"Unlinked task {link['task_id']} from deleted event {link['provider_event_id']}")
+
+        return bool(link_response.data)
+
+    async def _reconcile_tasks(self, calendar_id: str, gcal_events: List[Dict[str, Any]]) -> List[str]:
+        """Apply calendar updates to linked tasks (conflict resolution), batched per page; returns updated task IDs."""
+        links = await self.db.table("calendar_links").select("*").eq(
+            "calendar_id", calendar_id
+        ).in_("provider_event_id", [event["id"] for event in gcal_events]).execute()
+        if not links.data:
+            return []
+
+        links_by_event = {link["provider_event_id"]: link for link in links.data}
+        tasks = await self.task_repo.get_many([link["task_id"] for link in links.data])
+
+        task_updates = []
+        pulled_link_ids = []
+        for gcal_event in gcal_events:
+            link = links_by_event.get(gcal_event["id"])
+            if not link or link["task_id"] not in tasks:
+                continue
+
+            # Apply conflict resolution based on source_of_truth
+            source_of_truth = link.get("source_of_truth", "latest_update")
+
+            if source_of_truth == "calendar":
+                # Calendar always wins
+                task_updates.append((link["task_id"], gcal_event))
+            elif source_of_truth == "latest_update":
+                # If event was updated after our last push, calendar wins
+                event_updated = datetime.fromisoformat(gcal_event.get("updated", "").replace("Z", "+00:00"))
+                last_pushed = link.get("last_pushed_at")
 
-        link = link_response.data[0]
+                if last_pushed:
+                    last_pushed_dt = datetime.fromisoformat(last_pushed.replace("Z", "+00:00"))
+                    if event_updated > last_pushed_dt:
+                        task_updates.append((link["task_id"], gcal_event))
+                        pulled_link_ids.append(link["id"])
 
-        # Get task
-        task_response = self.supabase.table("tasks").select("*").eq("id", link["task_id"]).single().execute()
-        if not task_response.data:
-            return
+        # Task updates differ per row, so they run concurrently rather than as one statement
+        semaphore = asyncio.Semaphore(TASK_UPDATE_CONCURRENCY)
 
-        task = task_response.data
+        async def update(task_id: str, gcal_event: Dict[str, Any]):
+            async with semaphore:
+                await self._update_task_from_event(task_id, gcal_event)
 
-        # Apply conflict resolution based on source_of_truth
-        source_of_truth = link.get("source_of_truth", "latest_update")
+        await asyncio.gather(*(update(task_id, gcal_event) for task_id, gcal_event in task_updates))
 
-        if source_of_truth == "calendar":
-            # Calendar always wins
-            await self._update_task_from_event(link["task_id"], gcal_event)
-        elif source_of_truth == "latest_update":
-            # Compare timestamps
-            event_updated = datetime.fromisoformat(gcal_event.get("updated", "").replace("Z", "+00:00"))
-            task_updated = datetime.fromisoformat(task["updated_at"].replace("Z", "+00:00"))
-            last_pushed = link.get("last_pushed_at")
+        if pulled_link_ids:
+            await self.db.table("calendar_links").update({
+                "last_pulled_at": datetime.utcnow().isoformat()
+            }).in_("id", pulled_link_ids).execute()
 
-            if last_pushed:
-                last_pushed_dt = datetime.fromisoformat(last_pushed.replace("Z", "+00:00"))
-                # If event was updated after our last push, calendar wins
-                if event_updated > last_pushed_dt:
-                    await self._update_task_from_event(link["task_id"], gcal_event)
-                    self.supabase.table("calendar_links").update({
-                        "last_pulled_at": datetime.utcnow().isoformat()
-                    }).eq("id", link["id"]).execute()
+        return [task_id for task_id, _ in task_updates]
 
     async def _update_task_from_event(self, task_id: str, gcal_event: Dict[str, Any]):
         """Update a task from a calendar event."""
         task_update = gcal_to_task_update(gcal_event)
         task_update["updated_at"] = datetime.utcnow().isoformat()
 
-        self.supabase.table("tasks").update(task_update).eq("id", task_id).execute()
+        await self.db.table("tasks").update(task_update).eq("id", task_id).execute()
         logger.info(f"Updated task {task_id} from calendar event")
 
     async def push_from_task(self, task_id: str) -> Dict[str, Any]:
@@ -354,7 +400,7 @@ class CalendarSyncWorker:
 
         try:
             # Get task
-            task_response = self.supabase.table("tasks").select("*").eq("id", task_id).single().execute()
+            task_response = await self.db.table("tasks").select("*").eq("id", task_id).single().execute()
             if not task_response.data:
                 return {"success": False, "error": "Task not found"}
 
@@ -362,12 +408,12 @@ class CalendarSyncWorker:
             user_id = task["user_id"]
 
             # Check if user is premium
-            user_response = self.supabase.table("users").select("subscription_status").eq("id", user_id).single().execute()
+            user_response = await self.db.table("users").select("subscription_status").eq("id", user_id).single().execute()
             if not user_response.data or user_response.data.get("subscription_status") not in ["active", "premium"]:
                 return {"success": False, "error": "Premium subscription required for two-way sync"}
 
             # Get primary write calendar
-            primary_cal_response = self.supabase.table("calendar_calendars").select("*").eq("user_id", user_id).eq("is_primary_write", True).execute()
+            primary_cal_response = await self.db.table("calendar_calendars").select("*").eq("user_id", user_id).eq("is_primary_write", True).execute()
 
             if not primary_cal_response.data:
                 return {"success": False, "error": "No primary write calendar configured"}
@@ -375,7 +421,7 @@ class CalendarSyncWorker:
             primary_calendar = primary_cal_response.data[0]
 
             # Check if task already linked
-            link_response = self.supabase.table("calendar_links").select("*").eq("task_id", task_id).execute()
+            link_response = await self.db.table("calendar_links").select("*").eq("task_id", task_id).execute()
 
             if link_response.data:
                 # Update existing event
@@ -404,7 +450,7 @@ class CalendarSyncWorker:
         )
 
         # Create link
-        self.supabase.table("calendar_links").insert({
+        await self.db.table("calendar_links").insert({
             "user_id": task["user_id"],
             "task_id": task["id"],
             "calendar_id": calendar["id"],
@@ -416,7 +462,7 @@ class CalendarSyncWorker:
 
         # Cache the event
         cache_row = gcal_to_cache_row(result, task["user_id"], calendar["id"])
-        self.supabase.table("calendar_events").insert(cache_row).execute()
+        await self.db.table("calendar_events").insert(cache_row).execute()
 
         logger.info(f"Created provider event for task {task['id']}")
 
@@ -433,7 +479,7 @@ class CalendarSyncWorker:
 
         try:
             # Get current event etag for concurrency control
-            event_response = self.supabase.table("calendar_events").select("etag").eq("calendar_id_ref", calendar["id"]).eq("external_id", link["provider_event_id"]).execute()
+            event_response = await self.db.table("calendar_events").select("etag").eq("calendar_id_ref", calendar["id"]).eq("external_id", link["provider_event_id"]).execute()
 
             etag = event_response.data[0]["etag"] if event_response.data else None
 
@@ -447,13 +493,13 @@ class CalendarSyncWorker:
             )
 
             # Update link timestamp
-            self.supabase.table("calendar_links").update({
+            await self.db.table("calendar_links").update({
                 "last_pushed_at": datetime.utcnow().isoformat()
             }).eq("id", link["id"]).execute()
 
             # Update cache
             cache_row = gcal_to_cache_row(result, task["user_id"], calendar["id"])
-            self.supabase.table("calendar_events").update(cache_row).eq("calendar_id_ref", calendar["id"]).eq("external_id", link["provider_event_id"]).execute()
+            await self.db.table("calendar_events").update(cache_row).eq("calendar_id_ref", calendar["id"]).eq("external_id", link["provider_event_id"]).execute()
 
             logger.info(f"Updated provider event for task {task['id']}")
 
@@ -476,7 +522,7 @@ class CalendarSyncWorker:
                 event_dict=gcal_event
             )
 
-            self.supabase.table("calendar_links").update({
+            await self.db.table("calendar_links").update({
                 "last_pushed_at": datetime.utcnow().isoformat()
             }).eq("id", link["id"]).execute()
 
@@ -500,7 +546,7 @@ class CalendarSyncWorker:
         logger.info("Ensuring watch channel for calendar %s (force=%s)", calendar_id, force)
 
         try:
-            calendar_response = self.supabase.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
+            calendar_response = await self.db.table("calendar_calendars").select("*").eq("id", calendar_id).single().execute()
             if not calendar_response.data:
                 return {"success": False, "error": "Calendar not found"}
 
@@ -547,7 +593,7 @@ class CalendarSyncWorker:
                 ttl_days=7
             )
 
-            self.supabase.table("calendar_calendars").update({
+            await self.db.table("calendar_calendars").update({
                 "watch_channel_id": watch_result["channel_id"],
                 "watch_resource_id": watch_result["resource_id"],
                 "watch_expiration_at": watch_result["expiration"].isoformat()
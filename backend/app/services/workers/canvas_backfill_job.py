@@ -14,6 +14,7 @@ except ImportError:
     httpx = None
 
 from app.config.database.supabase import get_supabase_client
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.services.integrations.canvas_token_service import get_canvas_token_service
 from app.database.models import (
     TaskModel, ExternalSource, ExternalCursorModel, AssignmentImportModel,
@@ -572,6 +573,10 @@ class CanvasBackfillJob:
                         logger.error(f"Failed batch sample: {batch[0] if batch else 'No tasks in batch'}")
                         errors.append(f"Task batch upsert: {str(e)}")
 
+            # Imported tasks may bring new courses, so the feed is rebuilt rather than patched
+            if upserted_count:
+                await get_timeblock_feed_store().mark_changed(user_id, everything=True)
+
             # Mark staging assignments as processed
             if processed_ids:
                 self.supabase.table("assignment_import").update({
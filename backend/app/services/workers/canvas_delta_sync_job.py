@@ -12,7 +12,9 @@ try:
 except ImportError:
     httpx = None
 
-from app.config.database.supabase import get_supabase_client
+from app.config.database.supabase import get_async_supabase
+from app.database.repositories.task_repositories import get_task_repository
+from app.database.timeblock_feed import get_timeblock_feed_store
 from app.services.integrations.canvas_token_service import get_canvas_token_service
 from app.database.models import TaskModel, ExternalSource, ExternalCursorModel
 
@@ -23,7 +25,8 @@ class CanvasDeltaSyncJob:
     """Delta sync job for incremental Canvas updates"""
 
     def __init__(self):
-        self.supabase = get_supabase_client()
+        self.supabase = get_async_supabase()
+        self.task_repo = get_task_repository()
         self.token_service = get_canvas_token_service()
 
     async def execute_delta_sync(self, user_id: str) -> Dict[str, Any]:
@@ -109,6 +112,10 @@ class CanvasDeltaSyncJob:
             )
             results["assignments_deleted"] = deleted_count
 
+            # Synced tasks may bring new courses, so the feed is rebuilt rather than patched
+            if results["assignments_updated"] or results["assignments_created"] or deleted_count:
+                await get_timeblock_feed_store().mark_changed(user_id, everything=True)
+
             # Update delta sync timestamp
             await self._update_last_delta_sync(user_id, now_timestamp)
 
@@ -214,6 +221,14 @@ class CanvasDeltaSyncJob:
             created_count = 0
             errors = []
 
+            # Look up the existing task of every assignment in one query
+            existing_tasks = await self.task_repo.get_many(
+                [str(assignment["id"]) for assignment in assignments],
+                field="external_id",
+                filters={"user_id": user_id, "external_source": "canvas"}
+            )
+            new_tasks = []
+
             # Process each assignment
             for assignment_data in assignments:
                 try:
@@ -222,9 +237,7 @@ class CanvasDeltaSyncJob:
                     assignment_data["course_code"] = course.get("course_code", "")
 
                     # Check if assignment exists in our system
-                    existing_task = await self._get_existing_task(
-                        user_id, str(assignment_data["id"])
-                    )
+                    existing_task = existing_tasks.get(str(assignment_data["id"]))
 
                     if existing_task:
                         # Update existing task if Canvas version is newer
@@ -237,16 +250,23 @@ class CanvasDeltaSyncJob:
                             )
                             updated_count += 1
                     else:
-                        # Create new task
-                        await self._create_task_from_assignment(
-                            user_id, assignment_data
+                        # Create new task (inserted with the others below)
+                        new_tasks.append(
+                            await self._assignment_to_task_data(user_id, assignment_data)
                         )
-                        created_count += 1
 
                 except Exception as e:
                     logger.error(f"Error processing assignment {assignment_data.get('id')}: {e}")
                     errors.append(f"Assignment {assignment_data.get('id')}: {str(e)}")
 
+            if new_tasks:
+                try:
+                    await self.task_repo.bulk_create(new_tasks)
+                    created_count += len(new_tasks)
+                except Exception as e:
+                    logger.error(f"Error creating {len(new_tasks)} tasks for course {course_id}: {e}")
+                    errors.append(f"Creating {len(new_tasks)} tasks: {str(e)}")
+
             return {
                 "updated": updated_count,
                 "created": created_count,
@@ -318,17 +338,6 @@ class CanvasDeltaSyncJob:
             logger.error(f"Error fetching updated assignments for course {course_id}: {e}")
             raise
 
-    async def _get_existing_task(self, user_id: str, canvas_id: str) -> Optional[Dict[str, Any]]:
-        """Get existing task by external Canvas ID"""
-        try:
-            response = await self.supabase.table("tasks").select("*").eq(
-                "user_id", user_id
-            ).eq("external_source", "canvas").eq("external_id", canvas_id).single().execute()
-
-            return response.data
-        except Exception:
-            return None
-
     async def _update_task_from_assignment(
         self,
         task_id: str,
@@ -346,22 +355,6 @@ class CanvasDeltaSyncJob:
             logger.error(f"Error updating task {task_id}: {e}")
             raise
 
-    async def _create_task_from_assignment(
-        self,
-        user_id: str,
-        assignment_data: Dict[str, Any]
-    ):
-        """Create new task from Canvas assignment"""
-        try:
-            # Convert assignment to task
-            task_data = await self._assignment_to_task_data(user_id, assignment_data)
-
-            await self.supabase.table("tasks").insert(task_data).execute()
-
-        except Exception as e:
-            logger.error(f"Error creating task from assignment {assignment_data.get('id')}: {e}")
-            raise
-
     async def _assignment_to_task_updates(
         self,
         assignment_data: Dict[str, Any],
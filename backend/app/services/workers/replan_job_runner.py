@@ -0,0 +1,138 @@
+"""Morning replan job runner used by the replan scheduler.
+
+Finds users whose local morning replan is due and schedules them together
+through the batched scheduler, with each user's deadline set to their local
+replan hour.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytz
+
+from app.config.database.supabase import get_async_supabase
+
+logger = logging.getLogger(__name__)
+
+# The replan scheduler ticks at this interval; every UTC offset is a multiple of it
+REPLAN_TICK_MINUTES = 15
+
+# Users read per query; PostgREST caps unpaginated selects at its max-rows setting
+USERS_PAGE_SIZE = 1000
+
+
+class ReplanJobRunner:
+    """Executes morning replan jobs independent of any scheduler."""
+
+    def __init__(self, *, supabase=None, batch_scheduler=None) -> None:
+        self._supabase = supabase
+        self._batch_scheduler = batch_scheduler
+
+    @property
+    def supabase(self):
+        if self._supabase is None:
+            self._supabase = get_async_supabase()
+        return self._supabase
+
+    @property
+    def batch_scheduler(self):
+        """Lazy import to avoid circular dependency."""
+        if self._batch_scheduler is None:
+            from app.scheduler.scheduling.batch import get_batch_scheduler
+            self._batch_scheduler = get_batch_scheduler()
+        return self._batch_scheduler
+
+    async def run_morning_replans(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Replan every user whose local replan window starts in this tick."""
+        from app.scheduler.core.config import get_config
+        from app.scheduler.io.dto import ScheduleRequest
+
+        config = get_config().batch
+        if not config.enabled:
+            return {'users': 0}
+
+        now = now or datetime.now(pytz.UTC)
+        users_by_timezone = await self._get_users_by_timezone()
+
+        requests: List[ScheduleRequest] = []
+        for tz_name, user_ids in users_by_timezone.items():
+            deadline = self._due_deadline(tz_name, now, config.replan_local_hour, config.replan_lead_minutes)
+            if deadline is None:
+                continue
+            requests.extend(
+                ScheduleRequest(
+                    user_id=user_id,
+                    horizon_days=get_config().default_horizon_days,
+                    options={'trigger': 'morning_replan', 'deadline': deadline.isoformat()}
+                )
+                for user_id in user_ids
+            )
+
+        if not requests:
+            logger.debug("No users due for morning replan")
+            return {'users': 0}
+
+        logger.info(f"Starting morning replan for {len(requests)} users")
+        result = await self.batch_scheduler.schedule_batch(requests)
+        return result.get_metrics()
+
+    async def _get_users_by_timezone(self) -> Dict[str, List[str]]:
+        """Group user ids by their timezone, reading users one page at a time."""
+        users_by_timezone: Dict[str, List[str]] = defaultdict(list)
+        offset = 0
+
+        while True:
+            try:
+                response = await self.supabase.table("users").select("id, timezone").order(
+                    "id"
+                ).range(offset, offset + USERS_PAGE_SIZE - 1).execute()
+            except Exception as e:
+                logger.error(f"Error loading users for morning replan at offset {offset}: {e}")
+                break
+
+            users = response.data or []
+            for user in users:
+                users_by_timezone[user.get("timezone") or "UTC"].append(user["id"])
+            if len(users) < USERS_PAGE_SIZE:
+                break
+            offset += USERS_PAGE_SIZE
+
+        return dict(users_by_timezone)
+
+    def _due_deadline(
+        self, tz_name: str, now: datetime, replan_hour: int, lead_minutes: int
+    ) -> Optional[datetime]:
+        """Local replan deadline if this tick is the one that should start it."""
+        try:
+            tz = pytz.timezone(tz_name)
+        except pytz.UnknownTimeZoneError:
+            logger.warning(f"Unknown timezone {tz_name}, skipping morning replan")
+            return None
+
+        local_now = now.astimezone(tz)
+        deadline = tz.localize(
+            datetime(local_now.year, local_now.month, local_now.day, replan_hour)
+        )
+        if deadline <= local_now:
+            deadline = tz.localize(
+                datetime.combine(local_now.date() + timedelta(days=1), deadline.time())
+            )
+
+        minutes_left = (deadline - local_now).total_seconds() / 60
+        if lead_minutes - REPLAN_TICK_MINUTES < minutes_left <= lead_minutes:
+            return deadline
+        return None
+
+
+_replan_job_runner: Optional[ReplanJobRunner] = None
+
+
+def get_replan_job_runner() -> ReplanJobRunner:
+    global _replan_job_runner
+    if _replan_job_runner is None:
+        _replan_job_runner = ReplanJobRunner()
+    return _replan_job_runner
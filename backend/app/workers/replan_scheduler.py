@@ -0,0 +1,64 @@
+"""
+Morning replan scheduler - thin wrapper for APScheduler integration.
+
+This module provides APScheduler job registration while delegating all
+business logic to ReplanJobRunner.
+"""
+import logging
+from typing import Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+from app.services.workers.replan_job_runner import REPLAN_TICK_MINUTES, get_replan_job_runner
+
+logger = logging.getLogger(__name__)
+
+
+class ReplanScheduler:
+    """Thin scheduler that delegates work to ReplanJobRunner."""
+
+    def __init__(self):
+        self.scheduler = AsyncIOScheduler()
+        self.job_runner = get_replan_job_runner()
+
+    async def start(self):
+        """Start the replan scheduler and register jobs"""
+        logger.info("Starting morning replan scheduler...")
+
+        # Every tick picks up the timezones whose local replan window starts now
+        self.scheduler.add_job(
+            func=self.run_morning_replans,
+            trigger=CronTrigger(minute=f"*/{REPLAN_TICK_MINUTES}"),
+            id="scheduler_morning_replan",
+            name="Morning Replan Batch Job",
+            replace_existing=True,
+            max_instances=1,
+        )
+
+        self.scheduler.start()
+        logger.info("Morning replan scheduler started successfully")
+
+    async def stop(self):
+        """Stop the scheduler"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Morning replan scheduler stopped")
+
+    async def run_morning_replans(self):
+        """Trigger the job runner morning replan cycle."""
+        try:
+            await self.job_runner.run_morning_replans()
+        except Exception as exc:
+            logger.error(f"Morning replan failed: {exc}", exc_info=True)
+
+
+_replan_scheduler: Optional[ReplanScheduler] = None
+
+
+def get_replan_scheduler() -> ReplanScheduler:
+    """Get global replan scheduler instance."""
+    global _replan_scheduler
+    if _replan_scheduler is None:
+        _replan_scheduler = ReplanScheduler()
+    return _replan_scheduler
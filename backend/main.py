@@ -114,6 +114,18 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Canvas sync scheduler failed to start: {e}")
 
+        # Start morning replan scheduler (batched multi-user scheduling)
+        logger.info("Starting morning replan scheduler...")
+        try:
+            from app.workers.replan_scheduler import get_replan_scheduler
+            replan_scheduler = get_replan_scheduler()
+            await replan_scheduler.start()
+
+            app.state.replan_scheduler = replan_scheduler
+            logger.info("Morning replan scheduler started")
+        except Exception as e:
+            logger.warning(f"Morning replan scheduler failed to start: {e}")
+
         # Schedule usage aggregation jobs
         logger.info("Scheduling usage aggregation jobs...")
         try:
@@ -129,6 +141,19 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Usage aggregation jobs failed to schedule: {e}")
 
+        # Pre-fork scheduler solver worker processes
+        logger.info("Starting scheduler solver pool...")
+        try:
+            from app.scheduler.core.config import get_config as get_scheduler_config
+            from app.scheduler.optimization.solver_pool import get_solver_pool
+
+            if get_scheduler_config().solver.pool_enabled:
+                solver_pool = get_solver_pool()
+                await asyncio.to_thread(solver_pool.start)
+                logger.info(f"Scheduler solver pool started with {solver_pool.max_workers} workers")
+        except Exception as e:
+            logger.warning(f"Scheduler solver pool failed to start (solves will start it lazily): {e}")
+
         # Dialog system removed - replaced by unified agent system
         logger.info("Using unified agent system (dialog system deprecated)")
 
@@ -219,6 +244,42 @@ async def lifespan(app: FastAPI):
                     logger.info("Canvas sync scheduler stopped")
             except Exception as e:
                 logger.warning(f"Error stopping Canvas sync scheduler: {e}")
+
+            # Stop morning replan scheduler
+            logger.info("Stopping morning replan scheduler...")
+            try:
+                if hasattr(app.state, 'replan_scheduler'):
+                    await app.state.replan_scheduler.stop()
+                    logger.info("Morning replan scheduler stopped")
+            except Exception as e:
+                logger.warning(f"Error stopping morning replan scheduler: {e}")
+            
+            # Write back resident scheduler models
+            logger.info("Flushing scheduler models...")
+            try:
+                from app.scheduler.core.scheduler_service.scheduler_service import flush_scheduler_models
+                await flush_scheduler_models()
+                logger.info("Scheduler models flushed")
+            except Exception as e:
+                logger.warning(f"Error flushing scheduler models: {e}")
+            
+            # Stop scheduler solver pool
+            logger.info("Stopping scheduler solver pool...")
+            try:
+                from app.scheduler.optimization.solver_pool import shutdown_solver_pool
+                await asyncio.to_thread(shutdown_solver_pool, False)
+                logger.info("Scheduler solver pool stopped")
+            except Exception as e:
+                logger.warning(f"Error stopping scheduler solver pool: {e}")
+            
+            # Close pooled Supabase HTTP connections
+            logger.info("Closing Supabase connections...")
+            try:
+                from app.config.database.supabase import close_async_supabase
+                await close_async_supabase()
+                logger.info("Supabase connections closed")
+            except Exception as e:
+                logger.warning(f"Error closing Supabase connections: {e}")
             
             # Close Redis connections
             logger.info("Closing Redis connections...")
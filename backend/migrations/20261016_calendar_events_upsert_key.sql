@@ -0,0 +1,14 @@
+-- Unique key for bulk calendar event ingestion
+-- CalendarSyncWorker upserts each page of provider events with
+-- on_conflict=(calendar_id_ref, external_id), which needs a matching unique index.
+
+-- 1) Drop duplicate cache rows, keeping the most recently synced one
+delete from public.calendar_events ce
+using public.calendar_events newer
+where ce.calendar_id_ref = newer.calendar_id_ref
+  and ce.external_id = newer.external_id
+  and (ce.synced_at, ce.id) < (newer.synced_at, newer.id);
+
+-- 2) Unique key on (calendar, provider event)
+create unique index if not exists uq_calendar_events_calendar_external
+  on public.calendar_events(calendar_id_ref, external_id);
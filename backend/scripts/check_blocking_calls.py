@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Blocking Database Call Check.
+
+Flags synchronous ``.execute()`` calls made directly inside ``async def``
+functions under app/. Each one blocks the worker's event loop for a full
+database round trip; use the async client (``await ....execute()``) or wrap
+the call in ``run_blocking`` instead.
+
+Existing offenders are recorded per file in blocking_calls_baseline.json so
+they can be migrated gradually; the check fails when a file gains new ones.
+
+Usage:
+    python scripts/check_blocking_calls.py [--update-baseline]
+"""
+
+import ast
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+project_root = Path(__file__).parent.parent
+APP_DIR = project_root / "app"
+BASELINE_PATH = Path(__file__).parent / "blocking_calls_baseline.json"
+
+
+def find_blocking_calls(source: str) -> List[Tuple[int, str]]:
+    """Return (line, function name) of un-awaited ``.execute()`` calls in async defs."""
+    tree = ast.parse(source)
+    found = []
+
+    def visit(node: ast.AST, async_fn: str = None, awaited: bool = False):
+        if isinstance(node, ast.AsyncFunctionDef):
+            async_fn = node.name
+        elif isinstance(node, (ast.FunctionDef, ast.Lambda)):
+            # Nested sync code (e.g. handed to a thread) does not run on the loop
+            async_fn = None
+
+        if (
+            async_fn
+            and not awaited
+            and isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "execute"
+            and not node.args
+            and not node.keywords
+        ):
+            found.append((node.lineno, async_fn))
+
+        for child in ast.iter_child_nodes(node):
+            visit(child, async_fn, isinstance(node, ast.Await) and child is node.value)
+
+    visit(tree)
+    return found
+
+
+def scan(app_dir: Path = APP_DIR) -> Dict[str, List[Tuple[int, str]]]:
+    """Scan all modules under app_dir, keyed by path relative to the project root."""
+    results = {}
+    for path in sorted(app_dir.rglob("*.py")):
+        try:
+            calls = find_blocking_calls(path.read_text(encoding="utf-8"))
+        except SyntaxError:
+            continue
+        if calls:
+            results[str(path.relative_to(project_root))] = calls
+    return results
+
+
+def load_baseline() -> Dict[str, int]:
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
+
+
+def main() -> int:
+    results = scan()
+
+    if "--update-baseline" in sys.argv:
+        baseline = {path: len(calls) for path, calls in results.items()}
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline updated: {sum(baseline.values())} blocking calls in {len(baseline)} files")
+        return 0
+
+    baseline = load_baseline()
+    failures = []
+    for path, calls in results.items():
+        allowed = baseline.get(path, 0)
+        if len(calls) > allowed:
+            failures.append((path, calls, allowed))
+
+    if failures:
+        print("Blocking .execute() calls inside async functions:")
+        for path, calls, allowed in failures:
+            print(f"  {path}: {len(calls)} (baseline {allowed})")
+            for line, fn in calls:
+                print(f"    line {line} in {fn}()")
+        print("Use the async client (await ....execute()) or run_blocking().")
+        return 1
+
+    remaining = sum(len(calls) for calls in results.values())
+    print(f"✅ No new blocking calls ({remaining} known, awaiting migration)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
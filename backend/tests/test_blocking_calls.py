@@ -0,0 +1,43 @@
+"""
+Guard against new blocking database calls inside async code.
+See scripts/check_blocking_calls.py.
+"""
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "check_blocking_calls",
+    Path(__file__).parent.parent / "scripts" / "check_blocking_calls.py",
+)
+check_blocking_calls = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_blocking_calls)
+
+
+class TestBlockingCallCheck:
+    """Test the blocking .execute() detector"""
+
+    def test_flags_only_unawaited_calls_in_async_defs(self):
+        source = '''
+async def bad(client):
+    return client.table("t").select("*").execute().data
+
+async def good(client):
+    response = await client.table("t").select("*").execute()
+    data = (await client.rpc("f", {}).execute()).data
+    return await run_blocking(lambda: client.table("t").execute())
+
+def sync_ok(client):
+    return client.table("t").execute()
+'''
+        assert check_blocking_calls.find_blocking_calls(source) == [(3, "bad")]
+
+    def test_no_new_blocking_calls(self):
+        baseline = check_blocking_calls.load_baseline()
+        for path, calls in check_blocking_calls.scan().items():
+            assert len(calls) <= baseline.get(path, 0), (
+                f"{path} has new blocking .execute() calls: {calls}"
+            )
+
+    def test_repositories_are_non_blocking(self):
+        repositories = check_blocking_calls.APP_DIR / "database"
+        assert check_blocking_calls.scan(repositories) == {}
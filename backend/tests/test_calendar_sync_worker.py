@@ -0,0 +1,204 @@
+"""
+Tests for ingesting pulled calendar event pages in bulk
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.database import base_repository
+from app.database.repositories.calendar_repositories import CalendarEventRepository
+from app.database.repositories.task_repositories import TaskRepository
+from app.services.workers import calendar_sync_worker
+from app.services.workers.calendar_sync_worker import EVENT_CONFLICT_KEY, CalendarSyncWorker
+
+CALENDAR_ID = "cal-1"
+
+
+class FakeQuery:
+    """Async PostgREST builder over in-memory tables that logs every request"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.action = "select"
+        self.payload = None
+        self.on_conflict = None
+        self.filters = []
+
+    def select(self, columns):
+        return self
+
+    def update(self, values):
+        self.action, self.payload = "update", values
+        return self
+
+    def upsert(self, rows, on_conflict="id", ignore_duplicates=False):
+        self.action, self.payload, self.on_conflict = "upsert", rows, on_conflict
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, field, value):
+        self.filters.append((field, [value]))
+        return self
+
+    def in_(self, field, values):
+        self.filters.append((field, list(values)))
+        return self
+
+    def _matches(self, row):
+        return all(row.get(field) in values for field, values in self.filters)
+
+    async def execute(self):
+        self.client.requests.append(self)
+        rows = self.client.tables.setdefault(self.table, [])
+
+        if self.action == "upsert":
+            keys = self.on_conflict.split(",")
+            for record in self.payload:
+                match = next((row for row in rows if all(row.get(k) == record[k] for k in keys)), None)
+                if match is not None:
+                    match.update(record)
+                else:
+                    rows.append(dict(record))
+            return SimpleNamespace(data=self.payload)
+
+        matched = [row for row in rows if self._matches(row)]
+        if self.action == "update":
+            for row in matched:
+                row.update(self.payload)
+        elif self.action == "delete":
+            self.client.tables[self.table] = [row for row in rows if row not in matched]
+        return SimpleNamespace(data=[dict(row) for row in matched])
+
+
+class FakeClient:
+    def __init__(self, tables):
+        self.tables = tables
+        self.requests = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def sent(self, table, action):
+        return [request for request in self.requests if request.table == table and request.action == action]
+
+
+class RecordingFeedStore:
+    def __init__(self):
+        self.changes = []
+
+    async def mark_changed(self, user_id, task_ids=(), event_ids=(), everything=False):
+        self.changes.append((user_id, sorted(task_ids), sorted(event_ids), everything))
+
+
+def gcal_event(event_id, summary="Event", status="confirmed", updated="2026-10-16T12:00:00Z"):
+    return {
+        "id": event_id,
+        "status": status,
+        "summary": summary,
+        "start": {"dateTime": "2026-10-17T09:00:00Z"},
+        "end": {"dateTime": "2026-10-17T10:00:00Z"},
+        "updated": updated,
+    }
+
+
+def cached_event(event_id):
+    return {"id": f"row-{event_id}", "calendar_id_ref": CALENDAR_ID, "external_id": event_id, "is_cancelled": False}
+
+
+@pytest.fixture
+def make_worker(monkeypatch):
+    def make(tables):
+        client = FakeClient(tables)
+        feed_store = RecordingFeedStore()
+        monkeypatch.setattr(base_repository, "get_async_supabase", lambda: client)
+        monkeypatch.setattr(calendar_sync_worker, "get_async_supabase", lambda: client)
+        monkeypatch.setattr(calendar_sync_worker, "get_calendar_event_repository", CalendarEventRepository)
+        monkeypatch.setattr(calendar_sync_worker, "get_task_repository", TaskRepository)
+        monkeypatch.setattr(calendar_sync_worker, "GoogleCalendarClient", lambda: None)
+        monkeypatch.setattr(calendar_sync_worker, "get_timeblock_feed_store", lambda: feed_store)
+        return CalendarSyncWorker(), client, feed_store
+    return make
+
+
+@pytest.mark.asyncio
+async def test_mixed_page_is_written_in_bulk(make_worker):
+    worker, client, feed_store = make_worker({
+        "calendar_events": [cached_event("kept"), cached_event("gone")],
+        "calendar_links": [
+            {"id": "link-gone", "calendar_id": CALENDAR_ID, "provider_event_id": "gone", "task_id": "task-gone"},
+        ],
+    })
+
+    counts = await worker._ingest_page(CALENDAR_ID, "u1", [
+        gcal_event("new", "Draft"),
+        gcal_event("kept", "Standup"),
+        gcal_event("gone", status="cancelled"),
+        gcal_event("new", "Final"),
+    ])
+
+    assert counts == {"created": 1, "updated": 1, "cancelled": 1}
+
+    [upsert] = client.sent("calendar_events", "upsert")
+    assert upsert.on_conflict == EVENT_CONFLICT_KEY == "calendar_id_ref,external_id"
+    # The repeated event is written once, with its last version
+    assert [(row["external_id"], row["title"]) for row in upsert.payload] == [("new", "Final"), ("kept", "Standup")]
+
+    [cancel] = client.sent("calendar_events", "update")
+    assert cancel.payload["is_cancelled"] is True
+    assert ("external_id", ["gone"]) in cancel.filters
+    events = {row["external_id"]: row for row in client.tables["calendar_events"]}
+    assert events["gone"]["is_cancelled"] is True
+    assert len(events) == 3
+
+    assert len(client.sent("calendar_links", "delete")) == 1
+    assert client.tables["calendar_links"] == []
+    # A removed link changes enrichment, so the whole feed is rebuilt
+    assert feed_store.changes == [("u1", [], ["gone", "kept", "new"], True)]
+
+
+@pytest.mark.asyncio
+async def test_cancel_without_links_keeps_the_feed_patchable(make_worker):
+    worker, client, _ = make_worker({"calendar_events": [cached_event("gone")], "calendar_links": []})
+
+    assert await worker._cancel_events(CALENDAR_ID, ["gone"]) is False
+    assert client.tables["calendar_events"][0]["is_cancelled"] is True
+
+
+@pytest.mark.asyncio
+async def test_tasks_follow_calendar_per_source_of_truth(make_worker):
+    def link(event_id, source_of_truth, last_pushed_at=None):
+        return {
+            "id": f"link-{event_id}", "calendar_id": CALENDAR_ID, "provider_event_id": event_id,
+            "task_id": f"task-{event_id}", "source_of_truth": source_of_truth, "last_pushed_at": last_pushed_at,
+        }
+
+    worker, client, _ = make_worker({
+        "calendar_links": [
+            link("cal", "calendar"),
+            link("newer", "latest_update", "2026-10-16T11:00:00+00:00"),
+            link("older", "latest_update", "2026-10-16T13:00:00+00:00"),
+            link("never", "latest_update"),
+            link("orphan", "calendar"),
+        ],
+        "tasks": [{"id": f"task-{name}", "title": name} for name in ("cal", "newer", "older", "never")],
+    })
+
+    updated = await worker._reconcile_tasks(CALENDAR_ID, [
+        gcal_event(event_id, summary=f"{event_id} moved")
+        for event_id in ("cal", "newer", "older", "never", "orphan")
+    ])
+
+    # Calendar always wins; latest_update only when the event changed after our last push
+    assert sorted(updated) == ["task-cal", "task-newer"]
+    titles = {task["id"]: task["title"] for task in client.tables["tasks"]}
+    assert titles == {"task-cal": "cal moved", "task-newer": "newer moved", "task-older": "older", "task-never": "never"}
+
+    [stamp] = client.sent("calendar_links", "update")
+    assert ("id", ["link-newer"]) in stamp.filters
+    # Links and tasks are each loaded with one query for the page
+    assert len(client.sent("calendar_links", "select")) == 1
+    assert len(client.sent("tasks", "select")) == 1
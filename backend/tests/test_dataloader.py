@@ -0,0 +1,116 @@
+"""
+Tests for request-scoped DataLoader batching and the repository batch helpers
+"""
+import asyncio
+
+import pytest
+
+from app.database.base_repository import BaseRepository
+from app.database.dataloader import DataLoader
+
+
+class FakeQuery:
+    """Minimal async PostgREST builder recording the filters it was given"""
+
+    def __init__(self, calls, rows):
+        self.calls = calls
+        self.rows = rows
+        self.filters = {}
+
+    def select(self, columns):
+        self.filters["select"] = columns
+        return self
+
+    def in_(self, field, values):
+        self.filters["in"] = (field, list(values))
+        return self
+
+    def eq(self, field, value):
+        self.filters[field] = value
+        return self
+
+    async def execute(self):
+        self.calls.append(self.filters)
+        field, values = self.filters["in"]
+        data = [row for row in self.rows if row[field] in values]
+        return type("Response", (), {"data": data})()
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def table(self, name):
+        return FakeQuery(self.calls, self.rows)
+
+
+class ItemRepository(BaseRepository):
+    @property
+    def table_name(self) -> str:
+        return "items"
+
+
+@pytest.fixture
+def repo():
+    repo = ItemRepository()
+    repo._db = FakeDB([{"id": str(i), "external_id": f"ext{i}"} for i in range(500)])
+    return repo
+
+
+class TestDataLoader:
+    """Test batching of concurrent loads"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_batch(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {key: key * 2 for key in keys if key != 3}
+
+        loader = DataLoader(batch_fn)
+        results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 3, 2]))
+
+        assert results == [2, 4, None, 4]
+        assert batches == [[1, 2, 3]]
+
+        # Cached for the loader's lifetime
+        assert await loader.load(1) == 2
+        assert len(batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        attempts = []
+
+        async def batch_fn(keys):
+            attempts.append(keys)
+            if len(attempts) == 1:
+                raise ConnectionError("down")
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_fn)
+        with pytest.raises(ConnectionError):
+            await loader.load_many([1, 2])
+        assert await loader.load_many([1, 2]) == [1, 2]
+
+
+class TestRepositoryBatching:
+    """Test get_many and loader on BaseRepository"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_chunks_in_queries(self, repo):
+        ids = [str(i) for i in range(450)] + ["missing"]
+        records = await repo.get_many(ids, filters={"user_id": "u1"})
+
+        assert len(records) == 450
+        assert len(repo._db.calls) == 3
+        assert all(call["user_id"] == "u1" for call in repo._db.calls)
+
+    @pytest.mark.asyncio
+    async def test_loader_by_other_field(self, repo):
+        loader = repo.loader(field="external_id", columns="id")
+        rows = await asyncio.gather(*(loader.load(f"ext{i}") for i in range(10)))
+
+        assert [row["id"] for row in rows] == [str(i) for i in range(10)]
+        assert repo._db.calls == [{"select": "external_id,id", "in": ("external_id", [f"ext{i}" for i in range(10)])}]
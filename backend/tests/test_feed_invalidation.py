@@ -0,0 +1,74 @@
+"""
+Tests that task writers outside the task service invalidate the timeblock feed
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.database import supabase as supabase_module
+from app.services.focus.entity_matching import entity_resolver
+from app.services.focus.entity_matching.entity_resolver import EntityResolver
+from app.services.integrations import canvas_service
+from app.services.integrations.canvas_service import CanvasService
+
+
+class RecordingFeedStore:
+    def __init__(self):
+        self.changes = []
+
+    async def mark_changed(self, user_id, task_ids=(), event_ids=(), everything=False):
+        self.changes.append((user_id, list(task_ids), everything))
+
+
+class FakeDeleteQuery:
+    def __init__(self):
+        self.deleted = False
+
+    def delete(self):
+        return self
+
+    def eq(self, field, value):
+        return self
+
+    async def execute(self):
+        self.deleted = True
+        return SimpleNamespace(data=[])
+
+
+class FailingTaskRepository:
+    async def bulk_create(self, rows):
+        raise ConnectionError("insert failed")
+
+
+@pytest.mark.asyncio
+async def test_agent_created_task_is_marked_changed(monkeypatch):
+    feed_store = RecordingFeedStore()
+    monkeypatch.setattr(entity_resolver, "get_timeblock_feed_store", lambda: feed_store)
+
+    async def create(data):
+        return {"id": "t1", **data}
+
+    repo_manager = SimpleNamespace(task_repository=SimpleNamespace(create=create))
+    resolver = EntityResolver(repo_manager, similarity_calculator=None)
+
+    result = await resolver.create_new_entity("u1", "Write essay", {"name": "Write essay"}, 90)
+
+    assert result["entity_id"] == "t1"
+    assert feed_store.changes == [("u1", ["t1"], False)]
+
+
+@pytest.mark.asyncio
+async def test_canvas_import_rebuilds_the_feed_even_when_it_fails(monkeypatch):
+    feed_store = RecordingFeedStore()
+    query = FakeDeleteQuery()
+    monkeypatch.setattr(canvas_service, "get_timeblock_feed_store", lambda: feed_store)
+    monkeypatch.setattr(canvas_service, "get_cache_service", lambda: None)
+    monkeypatch.setattr(supabase_module, "get_async_supabase", lambda: SimpleNamespace(table=lambda name: query))
+    service = CanvasService(task_repository=FailingTaskRepository())
+
+    with pytest.raises(ConnectionError):
+        await service._store_assignments("u1", [{"name": "Essay", "canvas_id": "c1"}])
+
+    # The old assignments are already gone
+    assert query.deleted
+    assert feed_store.changes == [("u1", [], True)]
@@ -0,0 +1,76 @@
+"""
+Tests for the morning replan job runner
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.workers import replan_job_runner
+from app.services.workers.replan_job_runner import ReplanJobRunner
+
+
+class FakeUsersQuery:
+    """Async PostgREST builder over a users list that records the pages read"""
+
+    def __init__(self, users, pages, fail_at=None):
+        self.users = users
+        self.pages = pages
+        self.fail_at = fail_at
+        self.bounds = None
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    async def execute(self):
+        self.pages.append(self.bounds)
+        if self.bounds[0] == self.fail_at:
+            raise ConnectionError("statement timeout")
+        start, end = self.bounds
+        return SimpleNamespace(data=self.users[start:end + 1])
+
+
+class FakeSupabase:
+    def __init__(self, users, fail_at=None):
+        self.users = users
+        self.fail_at = fail_at
+        self.pages = []
+
+    def table(self, name):
+        return FakeUsersQuery(self.users, self.pages, self.fail_at)
+
+
+@pytest.mark.asyncio
+async def test_users_are_read_page_by_page(monkeypatch):
+    monkeypatch.setattr(replan_job_runner, "USERS_PAGE_SIZE", 2)
+    users = [
+        {"id": "u1", "timezone": "UTC"},
+        {"id": "u2", "timezone": "America/Denver"},
+        {"id": "u3", "timezone": None},
+        {"id": "u4", "timezone": "America/Denver"},
+        {"id": "u5", "timezone": "UTC"},
+    ]
+    supabase = FakeSupabase(users)
+
+    users_by_timezone = await ReplanJobRunner(supabase=supabase)._get_users_by_timezone()
+
+    assert supabase.pages == [(0, 1), (2, 3), (4, 5)]
+    assert users_by_timezone == {"UTC": ["u1", "u3", "u5"], "America/Denver": ["u2", "u4"]}
+
+
+@pytest.mark.asyncio
+async def test_failed_page_keeps_the_users_already_read(monkeypatch):
+    monkeypatch.setattr(replan_job_runner, "USERS_PAGE_SIZE", 2)
+    users = [{"id": f"u{i}", "timezone": "UTC"} for i in range(5)]
+    supabase = FakeSupabase(users, fail_at=2)
+
+    users_by_timezone = await ReplanJobRunner(supabase=supabase)._get_users_by_timezone()
+
+    assert supabase.pages == [(0, 1), (2, 3)]
+    assert users_by_timezone == {"UTC": ["u0", "u1"]}
@@ -0,0 +1,177 @@
+"""
+Tests for the materialized timeblock feed and its Redis store
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database.timeblock_feed import (
+    ALL_CHANGED,
+    ITEM_FIELDS,
+    SAVE_SCRIPT,
+    TimeblockFeed,
+    TimeblockFeedStore,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the RedisClient methods the store uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key, amount=1):
+        self.values[key] = int(self.values.get(key, 0)) + amount
+        return self.values[key]
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def sadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(values)
+        return len(values)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def srem(self, key, *values):
+        self.sets.get(key, set()).difference_update(values)
+        return len(values)
+
+    def register_script(self, script):
+        assert script == SAVE_SCRIPT
+
+        async def save(keys, args):
+            feed_key, saved_key = keys
+            expected, data, version, ttl = args
+            current = self.values.get(saved_key) or "" if feed_key in self.values else ""
+            if current != expected:
+                return 0
+            self.values[feed_key], self.values[saved_key] = data, version
+            return 1
+
+        return save
+
+
+class BrokenRedis(FakeRedis):
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def mget(self, *keys):
+        raise ConnectionError("redis down")
+
+
+def at(hour):
+    return datetime(2026, 10, 16, hour, tzinfo=timezone.utc)
+
+
+def entry(item_id, hour, task_id=None, event_id=None):
+    row = {"task_id": task_id, "provider_event_id": event_id}
+    item = {"id": item_id, "source": "task" if task_id else "calendar", "title": item_id,
+            "start": at(hour).isoformat().replace("+00:00", "Z"), "end": at(hour + 1).isoformat()}
+    return row, item
+
+
+def make_feed(*entries):
+    feed = TimeblockFeed(version=1, window_start=at(0).timestamp(), window_end=at(23).timestamp(), context={})
+    feed.replace((), (), entries)
+    return feed
+
+
+def test_items_filters_range_and_keeps_order():
+    feed = make_feed(entry("b", 12, task_id="t2"), entry("a", 9, task_id="t1"), entry("c", 15, event_id="e1"))
+
+    items = feed.items(at(10), at(16))
+
+    assert [item["id"] for item in items] == ["b", "c"]
+    assert set(items[0]) == set(ITEM_FIELDS)
+    assert feed.covers(at(1), at(22))
+    assert not feed.covers(at(1), datetime(2026, 10, 17, tzinfo=timezone.utc))
+
+
+def test_replace_swaps_only_changed_sources():
+    feed = make_feed(entry("a", 9, task_id="t1"), entry("b", 12, task_id="t2"), entry("c", 15, event_id="e1"))
+
+    feed.replace(["t1"], ["e1"], [entry("a2", 16, task_id="t1")])
+
+    assert [item["id"] for item in feed.items(at(0), at(23))] == ["b", "a2"]
+
+
+def test_json_round_trip_and_format_check():
+    feed = make_feed(entry("a", 9, task_id="t1"))
+
+    restored = TimeblockFeed.from_json(feed.to_json())
+
+    assert restored.items(at(0), at(23)) == feed.items(at(0), at(23))
+    assert TimeblockFeed.from_json('{"format": 0}') is None
+
+
+@pytest.mark.asyncio
+async def test_changes_are_taken_once_and_versions_increase():
+    store = TimeblockFeedStore(client=FakeRedis())
+
+    await store.mark_changed("u1", task_ids=["t1", None], event_ids=["e1"])
+    await store.mark_changed("u1")
+
+    assert await store.take_changes("u1") == {"task:t1", "event:e1"}
+    assert await store.take_changes("u1") == set()
+
+    await store.mark_changed("u1", task_ids=["t1"], everything=True)
+    assert await store.take_changes("u1") == {ALL_CHANGED}
+
+    first = await store.next_version("u1")
+    assert first > 1
+    assert await store.next_version("u1") == first + 1
+
+
+@pytest.mark.asyncio
+async def test_saved_feed_loads_until_redis_fails():
+    client = FakeRedis()
+    store = TimeblockFeedStore(client=client)
+    feed = make_feed(entry("a", 9, task_id="t1"))
+
+    assert await store.load("u1") == (None, "")
+    assert await store.save("u1", feed, "")
+    loaded, saved_version = await store.load("u1")
+    assert loaded.items(at(0), at(23)) == feed.items(at(0), at(23))
+    assert saved_version == "1"
+
+    failing = TimeblockFeedStore(client=BrokenRedis())
+    assert await failing.load("u1") == (None, None)
+    # Backing off: no Redis calls until the retry time
+    assert await failing.take_changes("u1") is None
+
+
+@pytest.mark.asyncio
+async def test_only_the_first_of_two_concurrent_saves_wins():
+    store = TimeblockFeedStore(client=FakeRedis())
+    await store.save("u1", make_feed(entry("a", 9, task_id="t1")), "")
+
+    _, first_loaded = await store.load("u1")
+    _, second_loaded = await store.load("u1")
+    first, second = make_feed(entry("b", 10, task_id="t2")), make_feed(entry("c", 11, task_id="t3"))
+    first.version, second.version = 2, 3
+
+    assert await store.save("u1", first, first_loaded)
+    assert not await store.save("u1", second, second_loaded)
+
+    loaded, saved_version = await store.load("u1")
+    assert [item["id"] for item in loaded.items(at(0), at(23))] == ["b"]
+    assert saved_version == "2"
+
+    await store.restore_changes("u1", {"task:t3"})
+    assert await store.take_changes("u1") == {"task:t3"}
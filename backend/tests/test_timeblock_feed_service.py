@@ -0,0 +1,178 @@
+"""
+Tests for serving timeblocks from the materialized feed
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+
+from app.api.v1.endpoints.calendar_modules import timeblocks as timeblocks_endpoint
+from app.core.utils import timezone_utils
+from app.database.timeblock_feed import TimeblockFeedStore
+from app.services.timeblock_service import TimeblockService
+from tests.test_timeblock_feed import FakeRedis
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+class FakeTimeblocksRepository:
+    """v_timeblocks rows by ID, recording full and per-source fetches"""
+
+    def __init__(self):
+        self.rows = {
+            "t1": {
+                "id": "t1", "source": "task", "title": "Essay", "task_id": "t1",
+                "start_at": NOW.isoformat(), "end_at": (NOW + timedelta(hours=1)).isoformat(),
+            },
+            "g1": {
+                "id": "g1", "source": "calendar", "provider": "google", "title": "Standup",
+                "provider_event_id": "g1", "provider_calendar_id": "cal1",
+                "start_at": (NOW + timedelta(hours=2)).isoformat(),
+                "end_at": (NOW + timedelta(hours=3)).isoformat(),
+            },
+        }
+        self.full_fetches = 0
+        self.source_fetches = []
+        self.on_source_fetch = None
+
+    async def fetch_timeblocks(self, user_id, dt_from, dt_to, strict=False):
+        self.full_fetches += 1
+        return [dict(row) for row in self.rows.values()]
+
+    async def fetch_timeblocks_for_sources(self, user_id, dt_from, dt_to, task_ids=(), provider_event_ids=()):
+        self.source_fetches.append((list(task_ids), list(provider_event_ids)))
+        if self.on_source_fetch:
+            await self.on_source_fetch()
+        return [
+            dict(row) for row in self.rows.values()
+            if row.get("task_id") in task_ids or row.get("provider_event_id") in provider_event_ids
+        ]
+
+
+class FakeLoader:
+    def __init__(self, values):
+        self.values = values
+
+    async def load(self, key):
+        return self.values.get(key)
+
+
+class FakeTaskRepository:
+    def loader(self, **kwargs):
+        return FakeLoader({"t1": {"status": "todo", "course_id": None}})
+
+
+class FakeCalendarEventRepository:
+    def loader(self, **kwargs):
+        return FakeLoader({})
+
+
+class FakeUserRepository:
+    async def is_premium(self, user_id):
+        return True
+
+
+class FakeCourseRepository:
+    async def get_by_user_id(self, user_id):
+        return []
+
+
+class FakeCalendarLinkRepository:
+    async def get_by_user_id(self, user_id):
+        return []
+
+
+class FakeCalendarCalendarRepository:
+    async def get_primary_write_calendar(self, user_id):
+        return {"provider_calendar_id": "cal1"}
+
+    async def get_by_user_id(self, user_id):
+        return [{"provider_calendar_id": "cal1", "is_active": True}]
+
+
+def make_service(store):
+    return TimeblockService(
+        timeblock_repo=FakeTimeblocksRepository(),
+        user_repo=FakeUserRepository(),
+        course_repo=FakeCourseRepository(),
+        calendar_link_repo=FakeCalendarLinkRepository(),
+        calendar_calendar_repo=FakeCalendarCalendarRepository(),
+        calendar_event_repo=FakeCalendarEventRepository(),
+        task_repo=FakeTaskRepository(),
+        feed_store=store,
+    )
+
+
+RANGE = (NOW - timedelta(days=1), NOW + timedelta(days=1))
+
+
+@pytest.mark.asyncio
+async def test_feed_is_built_once_then_patched_per_source():
+    store = TimeblockFeedStore(client=FakeRedis())
+    service = make_service(store)
+    repo = service.timeblock_repo
+
+    items, first = await service.get_timeblock_feed("u1", *RANGE)
+    assert [item["id"] for item in items] == ["t1", "g1"]
+    assert (await service.get_timeblock_feed("u1", *RANGE))[1] == first
+    assert repo.full_fetches == 1
+
+    repo.rows["t1"]["title"] = "Essay draft"
+    await store.mark_changed("u1", task_ids=["t1"])
+    items, patched = await service.get_timeblock_feed("u1", *RANGE)
+
+    assert patched > first
+    assert repo.full_fetches == 1
+    assert repo.source_fetches == [(["t1"], [])]
+    assert [item["title"] for item in items] == ["Essay draft", "Standup"]
+
+
+@pytest.mark.asyncio
+async def test_losing_save_puts_its_changes_back():
+    store = TimeblockFeedStore(client=FakeRedis())
+    service = make_service(store)
+    repo = service.timeblock_repo
+    await service.get_timeblock_feed("u1", *RANGE)
+
+    async def concurrent_read_saves_first():
+        repo.on_source_fetch = None
+        feed, saved_version = await store.load("u1")
+        feed.version = await store.next_version("u1")
+        assert await store.save("u1", feed, saved_version)
+
+    repo.on_source_fetch = concurrent_read_saves_first
+    await store.mark_changed("u1", task_ids=["t1"])
+    feed = await service._current_feed("u1", *RANGE)
+
+    assert feed is not None
+    _, saved_version = await store.load("u1")
+    assert saved_version != str(feed.version)
+    assert await store.take_changes("u1") == {"task:t1"}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_feed_is_not_modified(monkeypatch):
+    class FakeTimezoneManager:
+        async def get_user_timezone(self, user_id):
+            return "UTC"
+
+    monkeypatch.setattr(timezone_utils, "get_timezone_manager", lambda: FakeTimezoneManager())
+    service = make_service(TimeblockFeedStore(client=FakeRedis()))
+    user = SimpleNamespace(user_id="u1")
+    bounds = {"from_dt": RANGE[0].isoformat(), "to_dt": RANGE[1].isoformat()}
+
+    response = Response()
+    body = await timeblocks_endpoint.get_timeblocks(
+        request=SimpleNamespace(headers={}), response=response,
+        current_user=user, service=service, **bounds
+    )
+    etag = response.headers["etag"]
+    assert len(body.items) == 2
+
+    not_modified = await timeblocks_endpoint.get_timeblocks(
+        request=SimpleNamespace(headers={"if-none-match": etag}), response=Response(),
+        current_user=user, service=service, **bounds
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag